@@ -0,0 +1,221 @@
+"""
+Banc d'essai de la lecture de LayerTraceQGIS sur des scénarios synthétiques, sans QGIS.
+
+Pour chaque scénario (N entités, M actions, répartition des types d'action), mesure :
+- la cadence de construction des actions (ActionFactory.action_from_dict), en actions par seconde,
+- la cadence de lecture (refresh de chaque tick), en ticks par seconde,
+- la latence d'un déplacement aléatoire dans le temps (go_to_tick), médiane et 95e centile en millisecondes,
+- le pic de mémoire allouée pendant le scénario (tracemalloc), en mégaoctets.
+
+Les couches QGIS sont remplacées par les fournisseurs de benchmark/qgis_stubs.py : seul le code du greffon est mesuré.
+
+Les résultats peuvent être enregistrés comme référence (--save) puis comparés aux exécutions suivantes (--check) :
+une mesure moins bonne que la référence au-delà de la tolérance est signalée et le code de sortie vaut 1.
+Les références dépendent de la machine : elles sont à réenregistrer lorsque le banc d'essai change de machine.
+Avec --repeat N, chaque scénario est exécuté N fois et la médiane de chaque mesure est retenue, ce qui évite
+d'enregistrer ou de comparer une exécution isolée (les déplacements durent quelques millisecondes).
+
+À lancer depuis la racine du dépôt :
+    python benchmark/bench_playback.py
+    python benchmark/bench_playback.py --scenario small --save
+    python benchmark/bench_playback.py --repeat 5 --save
+    python benchmark/bench_playback.py --check
+    python benchmark/bench_playback.py --entities 200 --actions 5000 --mix move=3,text=1
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import qgis_stubs
+
+qgis_stubs.install()
+
+from custom.actions.action_factory import ActionFactory
+from custom.business.layer_trace_qgis import LayerTraceQGIS
+from custom.business.map_entity import MapEntity
+from scenario import DEFAULT_MIX, generate_actions, generate_entities, parse_mix
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+DEFAULT_TOLERANCE = 0.25
+SEEKS = 20
+CONSTRUCTION_ROUNDS = 20
+
+SCENARIOS = {
+    "small": {"entities": 10, "actions": 200, "tick_end": 200},
+    "medium": {"entities": 50, "actions": 500, "tick_end": 300},
+    "large": {"entities": 200, "actions": 2_000, "tick_end": 500},
+}
+
+# Sens de chaque mesure : True si une valeur plus élevée est meilleure
+METRICS = {
+    "actions_per_second": True,
+    "ticks_per_second": True,
+    "seek_p50_ms": False,
+    "seek_p95_ms": False,
+    "peak_memory_mb": False,
+}
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    values = sorted(values)
+    return values[min(max(round(ratio * len(values)) - 1, 0), len(values) - 1)]
+
+
+def build_layer(entity_params: list[dict], action_dicts: list[dict]) -> LayerTraceQGIS:
+    LayerTraceQGIS._instance = None
+    map_entities = [MapEntity(**params) for params in entity_params]
+    return LayerTraceQGIS.get_instance(map_entities, action_dicts)
+
+
+def play(layer: LayerTraceQGIS) -> int:
+    """
+    Lit le scénario jusqu'au dernier tick et retourne le nombre de ticks lus.
+    """
+    while layer.refresh():
+        pass
+    if layer.tick <= layer.tick_end:
+        raise RuntimeError(f"Lecture interrompue au tick {layer.tick}")
+    return layer.tick
+
+
+def run(entities: int, actions: int, tick_end: int, mix: dict, seed: int) -> dict:
+    """
+    Exécute un scénario et retourne ses mesures.
+
+    Les durées sont mesurées sans tracemalloc, qui ralentit fortement l'exécution : le pic de mémoire est mesuré
+    lors d'une seconde lecture du scénario.
+    """
+    entity_params = generate_entities(entities, seed)
+    action_dicts = generate_actions(entities, actions, tick_end, mix, seed)
+
+    start = time.perf_counter()
+    for _ in range(CONSTRUCTION_ROUNDS):
+        for action_dict in action_dicts:
+            ActionFactory.action_from_dict(action_dict)
+    actions_per_second = CONSTRUCTION_ROUNDS * len(action_dicts) / (time.perf_counter() - start)
+
+    layer = build_layer(entity_params, action_dicts)
+    start = time.perf_counter()
+    ticks = play(layer)
+    ticks_per_second = ticks / (time.perf_counter() - start)
+
+    rng = random.Random(seed)
+    seeks = []
+    for _ in range(SEEKS):
+        target = rng.randint(1, layer.tick_end)
+        start = time.perf_counter()
+        layer.go_to_tick(target)
+        seeks.append((time.perf_counter() - start) * 1000)
+    layer.unload()
+
+    tracemalloc.start()
+    layer = build_layer(entity_params, action_dicts)
+    play(layer)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    layer.unload()
+
+    return {
+        "actions_per_second": actions_per_second,
+        "ticks_per_second": ticks_per_second,
+        "seek_p50_ms": percentile(seeks, 0.5),
+        "seek_p95_ms": percentile(seeks, 0.95),
+        "peak_memory_mb": peak / 1024 / 1024,
+    }
+
+
+def compare(name: str, result: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Retourne la description des mesures moins bonnes que la référence au-delà de la tolérance.
+    """
+    regressions = []
+    for metric, higher_is_better in METRICS.items():
+        reference = baseline.get(metric)
+        if not reference:
+            continue
+        ratio = result[metric] / reference
+        if (higher_is_better and ratio < 1 - tolerance) or (not higher_is_better and ratio > 1 + tolerance):
+            regressions.append(f"{name} {metric} : {result[metric]:.2f} pour une référence de {reference:.2f} ({ratio - 1:+.0%})")
+    return regressions
+
+
+def load_baselines() -> dict:
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baselines(baselines: dict):
+    with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Banc d'essai de la lecture de LayerTraceQGIS sans QGIS.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Scénario prédéfini, répétable. Par défaut small et medium.")
+    parser.add_argument("--entities", type=int, help="Nombre d'entités d'un scénario personnalisé.")
+    parser.add_argument("--actions", type=int, help="Nombre d'actions d'un scénario personnalisé.")
+    parser.add_argument("--ticks", type=int, default=500, help="Dernier tick d'un scénario personnalisé.")
+    parser.add_argument("--mix", help="Répartition des types d'action, par exemple move=3,text=1.")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur de scénario.")
+    parser.add_argument("--save", action="store_true", help="Enregistre les résultats comme référence.")
+    parser.add_argument("--check", action="store_true", help="Compare les résultats à la référence enregistrée.")
+    parser.add_argument("--repeat", type=int, default=1, help="Nombre d'exécutions de chaque scénario, la médiane de chaque mesure est retenue.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Écart relatif toléré par rapport à la référence.")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix) if args.mix else DEFAULT_MIX
+
+    scenarios = {}
+    if args.entities or args.actions:
+        name = f"custom-{args.entities or 10}x{args.actions or 200}"
+        scenarios[name] = {"entities": args.entities or 10, "actions": args.actions or 200, "tick_end": args.ticks}
+    for name in args.scenario or ([] if scenarios else ["small", "medium"]):
+        scenarios[name] = SCENARIOS[name]
+
+    baselines = load_baselines()
+    regressions = []
+    for name, scenario in scenarios.items():
+        key = name if mix is DEFAULT_MIX else f"{name}[{args.mix}]"
+        results = [
+            run(scenario["entities"], scenario["actions"], scenario["tick_end"], mix, args.seed)
+            for _ in range(max(args.repeat, 1))
+        ]
+        result = {metric: statistics.median(result[metric] for result in results) for metric in results[0]}
+
+        print(f"{key} : {scenario['entities']} entités, {scenario['actions']} actions, {scenario['tick_end']} ticks")
+        print(f"  construction des actions : {result['actions_per_second']:12.0f} actions/s")
+        print(f"  lecture                  : {result['ticks_per_second']:12.1f} ticks/s")
+        print(f"  déplacement p50 / p95    : {result['seek_p50_ms']:9.2f} ms / {result['seek_p95_ms']:.2f} ms")
+        print(f"  pic de mémoire           : {result['peak_memory_mb']:12.2f} Mo")
+
+        if args.check:
+            if key in baselines:
+                regressions += compare(key, result, baselines[key], args.tolerance)
+            else:
+                print(f"  aucune référence pour {key}")
+        if args.save:
+            baselines[key] = {metric: round(value, 3) for metric, value in result.items()}
+
+    if args.save:
+        save_baselines(baselines)
+        print(f"Références enregistrées dans {BASELINE_PATH}")
+
+    for regression in regressions:
+        print(f"RÉGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
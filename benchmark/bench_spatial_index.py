@@ -0,0 +1,93 @@
+"""
+Banc d'essai de l'index spatial SpatialIndex face au parcours linéaire de toutes les positions.
+
+Pour 10 000 et 100 000 entités réparties aléatoirement sur environ un degré carré, mesure :
+- la recherche des entités comprises dans une emprise de canevas (rectangle de 0.05 degré),
+- la recherche des entités à moins de 500 mètres d'un point,
+- la mise à jour de l'index après le déplacement de 1 % des entités.
+
+Ne dépend pas de QGIS, à lancer depuis la racine du dépôt :
+    python benchmark/bench_spatial_index.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom.business.spatial_index import SpatialIndex
+from custom.utils.utils import Utils
+
+SIZES = (10_000, 100_000)
+QUERIES = 200
+RECT_SIZE = 0.05
+RADIUS = 500
+ORIGIN = (5.0, 45.0)
+
+
+def linear_rect(positions: dict, x_min: float, y_min: float, x_max: float, y_max: float) -> list:
+    return [key for key, (x, y) in positions.items() if x_min <= x <= x_max and y_min <= y <= y_max]
+
+
+def linear_radius(positions: dict, x: float, y: float, radius: float) -> list:
+    return [key for key, (px, py) in positions.items() if Utils.haversine_distance(y, x, py, px) <= radius]
+
+
+def measure(function, arguments: list) -> float:
+    """
+    Retourne la durée moyenne (en millisecondes) d'un appel de la fonction sur chaque jeu d'arguments.
+    """
+    start = time.perf_counter()
+    for args in arguments:
+        function(*args)
+    return (time.perf_counter() - start) * 1000 / len(arguments)
+
+
+def run(size: int, rng: random.Random):
+    positions = {
+        index: (ORIGIN[0] + rng.random(), ORIGIN[1] + rng.random())
+        for index in range(size)
+    }
+
+    start = time.perf_counter()
+    spatial_index = SpatialIndex()
+    for key, (x, y) in positions.items():
+        spatial_index.update(key, x, y)
+    build = (time.perf_counter() - start) * 1000
+
+    rects = []
+    points = []
+    for _ in range(QUERIES):
+        x, y = ORIGIN[0] + rng.random(), ORIGIN[1] + rng.random()
+        rects.append((x, y, x + RECT_SIZE, y + RECT_SIZE))
+        points.append((x, y, RADIUS))
+
+    for args in rects[:5]:
+        assert sorted(spatial_index.query_rect(*args)) == sorted(linear_rect(positions, *args))
+    for args in points[:5]:
+        assert sorted(spatial_index.query_radius(*args)) == sorted(linear_radius(positions, *args))
+
+    moved = rng.sample(range(size), size // 100)
+    start = time.perf_counter()
+    for key in moved:
+        x, y = positions[key]
+        spatial_index.update(key, x + 0.001, y + 0.001)
+    update = (time.perf_counter() - start) * 1000
+
+    linear_radius_points = points[:max(QUERIES // 20, 1)]
+    print(f"{size} entités")
+    print(f"  construction de l'index      : {build:9.2f} ms")
+    print(f"  mise à jour de 1 %           : {update:9.2f} ms")
+    print(f"  rectangle  linéaire / index  : {measure(lambda *a: linear_rect(positions, *a), rects):9.3f} ms / {measure(spatial_index.query_rect, rects):9.3f} ms")
+    print(f"  rayon      linéaire / index  : {measure(lambda *a: linear_radius(positions, *a), linear_radius_points):9.3f} ms / {measure(spatial_index.query_radius, points):9.3f} ms")
+
+
+def main():
+    rng = random.Random(0)
+    for size in SIZES:
+        run(size, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Modules QGIS et PyQt de substitution pour exécuter LayerTraceQGIS sans QGIS.
+
+Les bancs d'essai mesurent le code du greffon et non le rendu de QGIS : les couches mémoire sont remplacées par des
+fournisseurs qui n'enregistrent rien, les entités QGIS et leurs géométries par des classes minimales, et tous les
+autres objets (symboles, rendus, étiquettes, canevas) par un objet neutre qui accepte tout appel sans effet.
+
+Contrairement à unittest.mock.MagicMock, ces substituts ne mémorisent pas leurs appels : la mémoire et la durée
+mesurées ne dépendent donc pas du nombre de ticks rejoués.
+
+install() doit être appelée avant le premier import du paquet custom.
+"""
+import sys
+import types
+
+
+class Null:
+    """
+    Objet neutre : tout attribut, appel ou opération retourne l'objet lui-même, les conversions retournent zéro.
+    """
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+    def __bool__(self):
+        return False
+
+    def __int__(self):
+        return 0
+
+    def __float__(self):
+        return 0.0
+
+    def __index__(self):
+        return 0
+
+    def __add__(self, other):
+        return self
+
+    __radd__ = __sub__ = __rsub__ = __mul__ = __rmul__ = __truediv__ = __or__ = __ror__ = __add__
+
+    def __lt__(self, other):
+        return False
+
+    __le__ = __gt__ = __ge__ = __lt__
+
+    def __getitem__(self, key):
+        return self
+
+    def __mro_entries__(self, bases):
+        return (NullBase,)
+
+
+NULL = Null()
+
+
+class NullBase:
+    """
+    Classe de base neutre, utilisée lorsqu'une classe du greffon hérite d'une classe Qt substituée.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return NULL
+
+
+class Signal:
+    """
+    Substitut de pyqtSignal : connect et disconnect sont sans effet, emit appelle les slots connectés.
+    """
+
+    def __init__(self, *types):
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        bound = instance.__dict__.get(self.name)
+        if bound is None:
+            bound = instance.__dict__[self.name] = BoundSignal()
+        return bound
+
+
+class BoundSignal:
+    """
+    Signal lié à une instance.
+    """
+
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot=None):
+        self.slots = [] if slot is None else [connected for connected in self.slots if connected != slot]
+
+    def emit(self, *args):
+        for slot in self.slots:
+            slot(*args)
+
+
+class QTimer:
+    """
+    Minuteur qui ne se déclenche jamais : le banc d'essai appelle directement les méthodes de lecture.
+    """
+
+    def __init__(self, *args):
+        self.timeout = BoundSignal()
+        self.active = False
+
+    def start(self, *args):
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+    def isActive(self) -> bool:
+        return self.active
+
+    def setInterval(self, interval: int):
+        pass
+
+    def setSingleShot(self, state: bool):
+        pass
+
+
+class QMessageBox:
+    """
+    Les erreurs affichées par le greffon interrompent le banc d'essai au lieu d'ouvrir une fenêtre.
+    """
+
+    @staticmethod
+    def warning(parent, title: str, message: str):
+        raise RuntimeError(f"{title} : {message}")
+
+
+class QgsPointXY:
+    __slots__ = ("_x", "_y")
+
+    def __init__(self, x=0.0, y=0.0):
+        if isinstance(x, QgsPointXY):
+            x, y = x._x, x._y
+        self._x = float(x)
+        self._y = float(y)
+
+    def x(self) -> float:
+        return self._x
+
+    def y(self) -> float:
+        return self._y
+
+
+class QgsGeometry:
+    __slots__ = ("points",)
+
+    def __init__(self, points: list = None):
+        self.points = points or []
+
+    @staticmethod
+    def fromPointXY(point: QgsPointXY) -> 'QgsGeometry':
+        return QgsGeometry([QgsPointXY(point)])
+
+    @staticmethod
+    def fromPolylineXY(points: list) -> 'QgsGeometry':
+        return QgsGeometry([QgsPointXY(point) for point in points])
+
+    def asPoint(self) -> QgsPointXY:
+        return self.points[0] if self.points else QgsPointXY()
+
+    def asPolyline(self) -> list:
+        return list(self.points)
+
+    def centroid(self) -> 'QgsGeometry':
+        return self
+
+    def isEmpty(self) -> bool:
+        return not self.points
+
+    isNull = isEmpty
+
+    def isGeosValid(self) -> bool:
+        return bool(self.points)
+
+
+class QgsFeature:
+    __slots__ = ("_id", "_geometry", "_attributes", "_named_attributes")
+
+    def __init__(self, fields=None):
+        self._id = -1
+        self._geometry = QgsGeometry()
+        self._attributes = []
+        self._named_attributes = {}
+
+    def id(self) -> int:
+        return self._id
+
+    def setId(self, feature_id: int):
+        self._id = feature_id
+
+    def geometry(self) -> QgsGeometry:
+        return self._geometry
+
+    def setGeometry(self, geometry: QgsGeometry):
+        self._geometry = geometry
+
+    def attributes(self) -> list:
+        return self._attributes
+
+    def setAttributes(self, attributes: list):
+        self._attributes = list(attributes)
+
+    def attribute(self, key):
+        return self._named_attributes.get(key)
+
+    def setAttribute(self, key, value):
+        self._named_attributes[key] = value
+
+
+class StubProvider:
+    """
+    Fournisseur de couche mémoire qui attribue les identifiants des entités ajoutées sans les conserver.
+    """
+
+    def __init__(self):
+        self.next_id = 1
+
+    def addFeature(self, feature: QgsFeature, *args) -> bool:
+        feature.setId(self.next_id)
+        self.next_id += 1
+        return True
+
+    def addFeatures(self, features: list, *args):
+        for feature in features:
+            self.addFeature(feature)
+        return True, features
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return NULL
+
+
+class QgsVectorLayer(NullBase):
+    """
+    Couche vectorielle vide dont le fournisseur n'enregistre rien.
+    """
+
+    def __init__(self, *args):
+        self.provider = StubProvider()
+
+    def dataProvider(self) -> StubProvider:
+        return self.provider
+
+    def getFeatures(self, *args):
+        return iter(())
+
+
+def install():
+    """
+    Remplace dans sys.modules les modules qgis et PyQt5 par les substituts, sans effet s'ils sont déjà installés.
+    """
+    if getattr(sys.modules.get("qgis"), "__stub__", False):
+        return
+
+    names = (
+        "qgis", "qgis.core", "qgis.gui", "qgis.utils",
+        "qgis.PyQt", "qgis.PyQt.QtCore", "qgis.PyQt.QtGui", "qgis.PyQt.QtWidgets", "qgis.PyQt.uic",
+        "PyQt5", "PyQt5.QtCore", "PyQt5.QtGui", "PyQt5.QtWidgets",
+    )
+    for name in names:
+        module = types.ModuleType(name)
+        module.__stub__ = True
+        module.__getattr__ = lambda attribute: NULL
+        sys.modules[name] = module
+
+    core = sys.modules["qgis.core"]
+    core.QgsPointXY = QgsPointXY
+    core.QgsGeometry = QgsGeometry
+    core.QgsFeature = QgsFeature
+    core.QgsVectorLayer = QgsVectorLayer
+
+    for name in ("qgis.PyQt.QtWidgets", "PyQt5.QtWidgets"):
+        sys.modules[name].QMessageBox = QMessageBox
+
+    for name in ("qgis.PyQt.QtCore", "PyQt5.QtCore"):
+        module = sys.modules[name]
+        module.pyqtSignal = Signal
+        module.QObject = NullBase
+        module.QTimer = QTimer
@@ -0,0 +1,166 @@
+"""
+Générateur de scénarios synthétiques pour les bancs d'essai.
+
+Produit, à partir d'une graine, N entités réparties autour du Golfe de Saint-Tropez (comme demo_generate_entity)
+et M actions au format dictionnaire lu par ActionFactory (comme demo_generate_action), selon une répartition
+configurable des types d'action.
+"""
+import math
+import random
+
+CENTER_LAT = 43.29122571034485
+CENTER_LON = 6.655847355159512
+LAT_RANGE = 0.01
+LON_RANGE = 0.03
+ICON = "sous-marin.png"
+BACKGROUND = "broadcast.png"
+
+# Poids de chaque type d'action dans la répartition par défaut, proche de celle de la démonstration
+DEFAULT_MIX = {
+    "move": 4,
+    "move_to": 3,
+    "around": 2,
+    "text": 3,
+    "arrow": 2,
+    "highlight": 1,
+    "background": 1,
+    "image": 1,
+    "size": 1,
+    "opacity": 1,
+    "rotate": 1,
+    "load": 0,
+    "unload": 0,
+}
+
+
+def parse_mix(text: str) -> dict:
+    """
+    Lit une répartition des types d'action de la forme "move=4,text=2".
+
+    Paramètres:
+    text (str): La répartition, les types absents ont un poids nul.
+
+    Retourne:
+    dict: Le poids de chaque type d'action.
+
+    Exceptions:
+    ValueError: Levée si un type d'action est inconnu ou si tous les poids sont nuls.
+    """
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Type d'action inconnu : {name}")
+        mix[name] = float(weight or 1)
+
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("La répartition des types d'action ne contient aucun poids positif.")
+    return mix
+
+
+def generate_entities(count: int, seed: int = 0) -> list[dict]:
+    """
+    Génère les paramètres de N entités : une moitié de drones placés aléatoirement autour du centre,
+    une moitié de balises réparties en cercle.
+
+    Paramètres:
+    count (int): Nombre d'entités.
+    seed (int): Graine du générateur aléatoire.
+
+    Retourne:
+    list[dict]: Les arguments du constructeur de MapEntity (id, name, url_icon, latitude, longitude).
+    """
+    rng = random.Random(seed)
+    drones = (count + 1) // 2
+    entities = []
+
+    for i in range(drones):
+        entities.append({
+            "id": str(i + 1),
+            "name": f"Drone {i + 1}",
+            "url_icon": ICON,
+            "latitude": CENTER_LAT + rng.uniform(-LAT_RANGE / 2, LAT_RANGE / 2),
+            "longitude": CENTER_LON + rng.uniform(-LON_RANGE / 2, LON_RANGE / 2),
+        })
+
+    radius = 0.015
+    for i in range(drones, count):
+        angle = math.radians((i - drones) * 360 / max(count - drones, 1))
+        entities.append({
+            "id": str(i + 1),
+            "name": f"Balise {i + 1}",
+            "url_icon": ICON,
+            "latitude": CENTER_LAT + radius * math.cos(angle),
+            "longitude": CENTER_LON + radius * math.sin(angle),
+        })
+
+    return entities
+
+
+def generate_actions(entity_count: int, count: int, tick_end: int, mix: dict = None, seed: int = 0) -> list[dict]:
+    """
+    Génère M actions réparties sur la durée du scénario.
+
+    Paramètres:
+    entity_count (int): Nombre d'entités, les identifiants vont de "1" à str(entity_count).
+    count (int): Nombre d'actions.
+    tick_end (int): Dernier tick du scénario.
+    mix (dict): Poids de chaque type d'action, DEFAULT_MIX si None.
+    seed (int): Graine du générateur aléatoire.
+
+    Retourne:
+    list[dict]: Les actions au format lu par ActionFactory.action_from_dict.
+    """
+    rng = random.Random(seed)
+    mix = DEFAULT_MIX if mix is None else mix
+    types = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in types]
+    max_duration = max(tick_end // 10, 1)
+
+    actions = []
+    for _ in range(count):
+        action_type = rng.choices(types, weights)[0]
+        start_at = rng.randint(0, max(tick_end - 1, 0))
+        end_at = min(start_at + rng.randint(1, max_duration), tick_end)
+        entity_id = rng.randint(1, entity_count)
+        other_id = (entity_id + rng.randint(0, max(entity_count - 2, 0))) % entity_count + 1
+
+        action = {
+            "type": action_type,
+            "start_at": start_at,
+            "end_at": end_at,
+            "entity_id": str(entity_id),
+        }
+
+        match action_type:
+            case "move":
+                action["lat_to"] = CENTER_LAT + rng.uniform(-LAT_RANGE / 2, LAT_RANGE / 2)
+                action["lon_to"] = CENTER_LON + rng.uniform(-LON_RANGE / 2, LON_RANGE / 2)
+            case "move_to":
+                action["entity_id2"] = str(other_id)
+                action["distance"] = rng.choice((0, 100, 300))
+            case "around":
+                action["entity_id2"] = str(other_id)
+                action["distance"] = 300
+                action["angle"] = rng.choice((180, 360, 720))
+            case "arrow" | "load" | "unload":
+                action["entity_id2"] = str(other_id)
+            case "highlight":
+                action["color"] = rng.choice(("yellow", "red", "blue"))
+            case "background" | "image":
+                action["image"] = BACKGROUND
+            case "size":
+                action["size"] = rng.uniform(3, 12)
+            case "opacity":
+                action["opacity"] = rng.uniform(0.2, 1)
+            case "rotate":
+                action["angle"] = rng.uniform(0, 720)
+
+        if action_type != "text" and rng.random() < 0.5:
+            action["text"] = "Message"
+        elif action_type == "text":
+            action["text"] = "Reception d'un message"
+        actions.append(action)
+
+    return actions
@@ -12,6 +12,7 @@ class Action(ABC):
     - __init__(start_at, end_at, entity_id, text="") : Constructeur de la classe Action, initialisant les paramètres de l'action.
     - is_active_at(tick) : Retourne un booléen indiquant si l'action est active au tick donné.
     - add_text(map_entity) : Ajoute un texte à une entité donnée.
+    - move_entity(map_entity, lat, lon, alti) : Déplace une entité donnée et conserve la trace du mouvement.
     - execute() : Méthode abstraite à implémenter pour définir l'exécution de l'action.
     - __str__() : Retourne une représentation sous forme de chaîne de caractères de l'objet Action.
 
@@ -68,6 +69,31 @@ class Action(ABC):
         if self.text:
             map_entity.append_text(self.text)
 
+    def move_entity(self, map_entity: "MapEntity", lat: float, lon: float, alti: float):
+        """
+        Déplace l'entité de carte spécifiée et conserve la trace du mouvement.
+
+        Paramètres:
+        map_entity (MapEntity): L'entité de carte à déplacer.
+        lat (float): Latitude de destination.
+        lon (float): Longitude de destination.
+        alti (float): Altitude de destination.
+
+        Comportement:
+        - Déplace l'entité sur la carte selon les coordonnées données.
+        - Signale le mouvement depuis la position précédente à la simulation, qui en conserve la trace.
+        - Ajoute le texte de l'action à l'entité.
+        """
+        from ..business.simulation import Simulation
+
+        old_lat = map_entity.get_latitude()
+        old_lon = map_entity.get_longitude()
+        map_entity.move_to(lat, lon, alti)
+
+        Simulation.get_instance().notify_move(map_entity, old_lat, old_lon)
+
+        self.add_text(map_entity)
+
     @abstractmethod
     def execute(self) -> bool:
         pass
@@ -77,16 +103,16 @@ class Action(ABC):
         Renvoie une représentation textuelle de l'objet sous forme d'une chaîne.
 
         La méthode construit une chaîne de caractères comprenant le nom de la classe,
-        l'état actuel du tick récupéré depuis `LayerTraceQGIS.get_current_tick`,
+        l'état actuel du tick récupéré depuis `Simulation.get_current_tick`,
         ainsi que les noms et valeurs des attributs de l'objet.
 
         Retourne:
             str : Représentation textuelle de l'objet.
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
+        from ..business.simulation import Simulation
 
         text = self.__class__.__name__ + ":"
-        text += " current_tick=" + str(LayerTraceQGIS.get_current_tick())
+        text += " current_tick=" + str(Simulation.get_current_tick())
         for nom_attr, valeur in self.__dict__.items():
             text += f", {nom_attr}={str(valeur)}"
 
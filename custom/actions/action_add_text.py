@@ -24,9 +24,9 @@ class ActionAddText(Action):
         Logique :
             - Ajoute du texte à une entitée
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
+        from ..business.simulation import Simulation
 
-        map_entity = LayerTraceQGIS.get_map_entity(self.entity_id)
+        map_entity = Simulation.get_map_entity(self.entity_id)
         if not map_entity:
             return False
 
@@ -1,5 +1,10 @@
+from typing import TYPE_CHECKING
+
 from ..utils.utils import Utils
 
+if TYPE_CHECKING:
+    from ..business.map_entity import MapEntity
+
 from .action import Action
 
 class ActionAround(Action):
@@ -52,34 +57,51 @@ class ActionAround(Action):
         - Déplace l'entité sur la carte selon les coordonnées calculées et un angle progressif.
         - Conserve dans les journaux la trace du mouvement depuis la position précédente.
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
+        from ..business.simulation import Simulation
 
-        map_entity = LayerTraceQGIS.get_map_entity(self.entity_id)
-        map_entity2 = LayerTraceQGIS.get_map_entity(self.entity_id2)
-
-        if (not map_entity or not map_entity2) or map_entity.id == map_entity2.id:
+        map_entity = self.prepare()
+        if not map_entity:
             return False
 
-        if not self.init:
-            point1 = map_entity.feature.geometry().centroid().asPoint()
-            point2 = map_entity2.feature.geometry().centroid().asPoint()
-            self.center_lat = point2.y()
-            self.center_lon = point2.x()
-            self.origin_angle = Utils.calculate_azimuth(self.center_lat, self.center_lon, point1.y(), point1.x())
-            self.angle += self.origin_angle
-            self.init = True
-
-        current_tick = LayerTraceQGIS.get_current_tick()
-
-        old_position = map_entity.feature.geometry().asPoint()
+        current_tick = Simulation.get_current_tick()
 
         angle = Utils.get_intermediare_value(self.start_at, self.end_at, current_tick, self.origin_angle, self.angle)
         lat, lon = Utils.destination_point(self.center_lat, self.center_lon, angle, self.distance)
 
-        map_entity.move_to(lat, lon, map_entity.altitude)
+        self.move_entity(map_entity, lat, lon, map_entity.altitude)
 
-        LayerTraceQGIS.get_instance().log_trace(map_entity, old_position)
+        return True
 
-        self.add_text(map_entity)
+    def need_init(self) -> bool:
+        """
+        Indique si le centre et l'angle d'origine doivent encore être lus sur les entités.
 
-        return True
+        Retourne:
+        bool: True si l'action n'a pas encore été initialisée.
+        """
+        return not self.init
+
+    def prepare(self) -> 'MapEntity | None':
+        """
+        Récupère l'entité à déplacer et, à la première exécution, calcule le centre de rotation et l'angle d'origine
+        à partir de la position actuelle des deux entités.
+
+        Retourne:
+        MapEntity | None: L'entité à déplacer, ou None si une des entités n'existe pas ou si les deux entités sont identiques.
+        """
+        from ..business.simulation import Simulation
+
+        map_entity = Simulation.get_map_entity(self.entity_id)
+        map_entity2 = Simulation.get_map_entity(self.entity_id2)
+
+        if (not map_entity or not map_entity2) or map_entity.id == map_entity2.id:
+            return None
+
+        if not self.init:
+            self.center_lat = map_entity2.get_latitude()
+            self.center_lon = map_entity2.get_longitude()
+            self.origin_angle = Utils.calculate_azimuth(self.center_lat, self.center_lon, map_entity.get_latitude(), map_entity.get_longitude())
+            self.angle += self.origin_angle
+            self.init = True
+
+        return map_entity
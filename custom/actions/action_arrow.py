@@ -30,15 +30,15 @@ class ActionArrow(Action):
         - Vérifie les entités
         - Ajoute un ligne entre les deux entitées
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
+        from ..business.simulation import Simulation
 
-        map_entity = LayerTraceQGIS.get_map_entity(self.entity_id)
-        map_entity2 = LayerTraceQGIS.get_map_entity(self.entity_id2)
+        map_entity = Simulation.get_map_entity(self.entity_id)
+        map_entity2 = Simulation.get_map_entity(self.entity_id2)
 
         if (not map_entity or not map_entity2) or map_entity.id == map_entity2.id:
             return False
 
-        LayerTraceQGIS.get_instance().add_line(map_entity.id, map_entity2.id)
+        Simulation.get_instance().add_line(map_entity.id, map_entity2.id)
         self.add_text(map_entity)
 
         return True
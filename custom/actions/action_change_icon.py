@@ -29,13 +29,13 @@ class ActionChangeIcon(Action):
         - Vérifie la(es) entité(s)
         - Met à jour l'icône de l'entité en fonction
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
+        from ..business.simulation import Simulation
 
-        map_entity = LayerTraceQGIS.get_map_entity(self.entity_id)
+        map_entity = Simulation.get_map_entity(self.entity_id)
         if not map_entity:
             return False
 
-        current_tick = LayerTraceQGIS.get_current_tick()
+        current_tick = Simulation.get_current_tick()
 
         map_entity.set_url_icon(self.image, (current_tick == self.start_at or current_tick == self.end_at))
         self.add_text(map_entity)
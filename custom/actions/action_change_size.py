@@ -32,13 +32,13 @@ class ActionChangeSize(Action):
         - Calcule de la taille intermediaire
         - Mise à jour de la taille
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
+        from ..business.simulation import Simulation
 
-        map_entity = LayerTraceQGIS.get_map_entity(self.entity_id)
+        map_entity = Simulation.get_map_entity(self.entity_id)
         if not map_entity:
             return False
 
-        current_tick = LayerTraceQGIS.get_current_tick()
+        current_tick = Simulation.get_current_tick()
 
         if current_tick == self.start_at:
             self.start_size = float(map_entity.size)
@@ -37,13 +37,13 @@ class ActionHighlight(Action):
         - Vérifie la(es) entité(s)
         - Définit la mise en surbrillance de l'entité
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
+        from ..business.simulation import Simulation
 
-        map_entity = LayerTraceQGIS.get_map_entity(self.entity_id)
+        map_entity = Simulation.get_map_entity(self.entity_id)
         if not map_entity:
             return False
 
-        current_tick = LayerTraceQGIS.get_current_tick()
+        current_tick = Simulation.get_current_tick()
 
         map_entity.set_highlight(self.highlight, (current_tick == self.start_at or current_tick == self.end_at))
         self.add_text(map_entity)
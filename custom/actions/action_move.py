@@ -1,4 +1,3 @@
-import math
 from typing import Tuple
 from typing import TYPE_CHECKING
 
@@ -39,39 +38,47 @@ class ActionMove(Action):
         - Déplace l'entité sur la carte selon les coordonnées calculées
         - Conserve dans les journaux la trace du mouvement depuis la position précédente
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
-
-        map_entity = LayerTraceQGIS.get_map_entity(self.entity_id)
+        map_entity = self.prepare()
         if not map_entity:
             return False
 
-        old_position = map_entity.feature.geometry().asPoint()
-
         lat, lon, alti = self.get_next_geometry(map_entity)
-        map_entity.move_to(lat, lon, alti)
+        self.move_entity(map_entity, lat, lon, alti)
+        return True
 
+    def need_init(self) -> bool:
+        """
+        Indique si la position ou l'altitude de départ doivent encore être lues sur l'entité.
 
-        LayerTraceQGIS.get_instance().log_trace(map_entity, old_position)
+        Retourne:
+        bool: True si une des coordonnées de départ ou l'altitude d'arrivée n'est pas encore connue.
+        """
+        return self.lat_from is None or self.lon_from is None or self.alti_from is None or self.alti_to is None
 
-        self.add_text(map_entity)
-        return True
+    def prepare(self) -> 'MapEntity | None':
+        """
+        Récupère l'entité à déplacer et complète les coordonnées manquantes à partir de sa position actuelle.
 
-    def get_next_geometry(self, map_entity: 'MapEntity') -> Tuple[float, float, float]:
+        Retourne:
+        MapEntity | None: L'entité à déplacer, ou None si elle n'existe pas.
         """
-        Calcule et renvoie les coordonnées géographiques suivantes (latitude, longitude et altitude) en fonction de la progression temporelle et de la distance réelle entre des points de départ et d'arrivée.
+        from ..business.simulation import Simulation
 
-        Arguments:
-        map_entity (MapEntity): Instance de MapEntity contenant des informations géographiques et d'altitude.
+        map_entity = Simulation.get_map_entity(self.entity_id)
+        if map_entity:
+            self.init_geometry(map_entity)
+        return map_entity
 
-        Retourne:
-        Tuple[float, float, float]: Un tuple contenant les coordonnées interpolées (latitude, longitude, altitude).
+    def init_geometry(self, map_entity: 'MapEntity'):
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
+        Complète les coordonnées de départ et d'arrivée non renseignées à partir de la position actuelle de l'entité.
 
+        Arguments:
+        map_entity (MapEntity): Instance de MapEntity contenant des informations géographiques et d'altitude.
+        """
         if self.lat_from is None or self.lon_from is None:
-            point = map_entity.feature.geometry().centroid().asPoint()
-            self.lat_from = point.y()
-            self.lon_from = point.x()
+            self.lat_from = map_entity.get_latitude()
+            self.lon_from = map_entity.get_longitude()
 
         if self.alti_from is None:
             self.alti_from = map_entity.altitude
@@ -79,26 +86,24 @@ class ActionMove(Action):
         if self.alti_to is None:
             self.alti_to = map_entity.altitude
 
-        current_tick = LayerTraceQGIS.get_current_tick()
+    def get_next_geometry(self, map_entity: 'MapEntity') -> Tuple[float, float, float]:
+        """
+        Calcule et renvoie les coordonnées géographiques suivantes (latitude, longitude et altitude) en fonction de la progression temporelle entre des points de départ et d'arrivée.
 
-        # Rayon de la Terre en mètres
-        R = 6371000
+        Arguments:
+        map_entity (MapEntity): Instance de MapEntity contenant des informations géographiques et d'altitude.
 
-        # Convertir en radians
-        phi1 = math.radians(self.lat_from)
-        phi2 = math.radians(self.lat_to)
-        lambda1 = math.radians(self.lon_from)
-        lambda2 = math.radians(self.lon_to)
+        Retourne:
+        Tuple[float, float, float]: Un tuple contenant les coordonnées interpolées (latitude, longitude, altitude).
+        """
+        from ..business.simulation import Simulation
 
-        dphi = phi2 - phi1
-        dlambda = lambda2 - lambda1
+        self.init_geometry(map_entity)
 
-        # Formule de Haversine pour la distance réelle
-        a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-        d = R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))  # en mètres
+        current_tick = Simulation.get_current_tick()
 
         # Progression temporelle
-        if self.end_at == self.start_at or d == 0 or current_tick >= self.end_at:
+        if self.end_at == self.start_at or current_tick >= self.end_at:
             return self.lat_to, self.lon_to, self.alti_to
 
         ratio = min(max((current_tick - self.start_at) / (self.end_at - self.start_at), 0), 1)
@@ -1,11 +1,10 @@
-import math
 from typing import Tuple
 from typing import TYPE_CHECKING
 
 from ..utils.utils import Utils
 
 if TYPE_CHECKING:
-    pass
+    from ..business.map_entity import MapEntity
 
 from .action import Action
 
@@ -61,74 +60,72 @@ class ActionMoveTo(Action):
         - Déplace l'entité sur la carte selon les coordonnées calculées
         - Conserve dans les journaux la trace du mouvement depuis la position précédente
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
+        map_entity = self.prepare()
+        if not map_entity:
+            return False
+
+        lat, lon, alti = self.get_next_geometry()
+        self.move_entity(map_entity, lat, lon, alti)
+        return True
+
+    def need_init(self) -> bool:
+        """
+        Indique si les positions de départ et d'arrivée doivent encore être lues sur les entités.
+
+        Retourne:
+        bool: True si l'action n'a pas encore été initialisée.
+        """
+        return not self.init
+
+    def prepare(self) -> 'MapEntity | None':
+        """
+        Récupère l'entité à déplacer et, à la première exécution, calcule les positions de départ et d'arrivée
+        à partir de la position actuelle des deux entités.
+
+        Retourne:
+        MapEntity | None: L'entité à déplacer, ou None si une des entités n'existe pas.
+        """
+        from ..business.simulation import Simulation
 
-        map_entity = LayerTraceQGIS.get_map_entity(self.entity_id)
-        map_entity2 = LayerTraceQGIS.get_map_entity(self.entity_id2)
+        map_entity = Simulation.get_map_entity(self.entity_id)
+        map_entity2 = Simulation.get_map_entity(self.entity_id2)
         if not map_entity or not map_entity2:
-            return False
+            return None
 
         if not self.init:
-            point = map_entity.feature.geometry().centroid().asPoint()
-            self.lat_from = point.y()
-            self.lon_from = point.x()
+            self.lat_from = map_entity.get_latitude()
+            self.lon_from = map_entity.get_longitude()
             self.alti_from = map_entity.altitude
-            point = map_entity2.feature.geometry().centroid().asPoint()
+            lat2 = map_entity2.get_latitude()
+            lon2 = map_entity2.get_longitude()
             self.alti_to = map_entity2.altitude
             if self.distance is None:
-                self.lat_to = point.y()
-                self.lon_to = point.x()
+                self.lat_to = lat2
+                self.lon_to = lon2
             else:
-                angle = Utils.calculate_azimuth(point.y(), point.x(), self.lat_from, self.lon_from)
-                self.lat_to, self.lon_to = Utils.destination_point(point.y(), point.x(), angle, self.distance)
+                angle = Utils.calculate_azimuth(lat2, lon2, self.lat_from, self.lon_from)
+                self.lat_to, self.lon_to = Utils.destination_point(lat2, lon2, angle, self.distance)
             self.init = True
 
-        old_position = map_entity.feature.geometry().asPoint()
-
-        lat, lon, alti = self.get_next_geometry()
-        map_entity.move_to(lat, lon, alti)
-
-        LayerTraceQGIS.get_instance().log_trace(map_entity, old_position)
-
-        self.add_text(map_entity)
-        return True
+        return map_entity
 
     def get_next_geometry(self) -> Tuple[float, float, float]:
         """
         Calcule et retourne les coordonnées géométriques (latitude, longitude et altitude) interpolées entre un point de départ et un point d'arrivée à un moment donné.
 
-        Cette méthode utilise l'algorithme de la formule de Haversine pour calculer la distance entre deux points géographiques et effectue une interpolation linéaire pour déterminer la position à un instant précis dans une période de temps donnée.
+        Cette méthode effectue une interpolation linéaire pour déterminer la position à un instant précis dans une période de temps donnée.
 
         Retourne les coordonnées finales si l'instant actuel dépasse ou est égal à la fin de la période ou si la durée est nulle.
 
         Retour:
             Tuple contenant la latitude, la longitude et l'altitude interpolées ou finales.
-
-        Exceptions:
-            - Assure que les valeurs temporelles et géographiques soient valides pour effectuer le calcul.
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
-
-        current_tick = LayerTraceQGIS.get_current_tick()
-
-        # Rayon de la Terre en mètres
-        R = 6371000
-
-        # Convertir en radians
-        phi1 = math.radians(self.lat_from)
-        phi2 = math.radians(self.lat_to)
-        lambda1 = math.radians(self.lon_from)
-        lambda2 = math.radians(self.lon_to)
-
-        dphi = phi2 - phi1
-        dlambda = lambda2 - lambda1
+        from ..business.simulation import Simulation
 
-        # Formule de Haversine pour la distance réelle
-        a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-        d = R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))  # en mètres
+        current_tick = Simulation.get_current_tick()
 
         # Progression temporelle
-        if self.end_at == self.start_at or d == 0 or current_tick >= self.end_at:
+        if self.end_at == self.start_at or current_tick >= self.end_at:
             return self.lat_to, self.lon_to, self.alti_to
 
         ratio = min(max((current_tick - self.start_at) / (self.end_at - self.start_at), 0), 1)
@@ -29,18 +29,18 @@ class ActionUnload(Action):
         - Vérifie la(es) entité(s).
         - Décharge l'entité uniquement à la fin de l'action.
         """
-        from ..business.layer_trace_qgis import LayerTraceQGIS
+        from ..business.simulation import Simulation
 
-        map_entity = LayerTraceQGIS.get_map_entity(self.entity_id)
-        map_entity2 = LayerTraceQGIS.get_map_entity(self.entity_id2)
-        if not map_entity or not map_entity2 or not LayerTraceQGIS.static_is_loaded(map_entity2, map_entity):
+        map_entity = Simulation.get_map_entity(self.entity_id)
+        map_entity2 = Simulation.get_map_entity(self.entity_id2)
+        if not map_entity or not map_entity2 or not Simulation.static_is_loaded(map_entity2, map_entity):
             return False
 
-        current_tick = LayerTraceQGIS.get_current_tick()
+        current_tick = Simulation.get_current_tick()
 
         if current_tick == self.end_at:
             map_entity2.move_to_entity(map_entity)
-            LayerTraceQGIS.static_unload_entity(map_entity, map_entity2)
+            Simulation.static_unload_entity(map_entity, map_entity2)
             map_entity2.set_need_update_label(True)
 
         self.add_text(map_entity)
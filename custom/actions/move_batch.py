@@ -0,0 +1,197 @@
+import numpy as np
+from typing import TYPE_CHECKING
+
+from .action_move import ActionMove
+from .action_move_to import ActionMoveTo
+from .action_around import ActionAround
+
+if TYPE_CHECKING:
+    from ..business.map_entity import MapEntity
+    from .action import Action
+
+
+class MoveBatch:
+    """
+    Classe MoveBatch
+
+    Regroupe les actions de déplacement (ActionMove, ActionMoveTo, ActionAround) actives sur un tick afin de
+    calculer toutes les nouvelles coordonnées en une seule passe vectorisée avec NumPy.
+
+    Les autres actions rencontrées pendant qu'un déplacement est en attente sont conservées dans la file pour
+    être exécutées dans l'ordre d'origine lors de l'application du lot.
+
+    Attributs :
+        queue      Liste ordonnée de tuples (action, entité déplacée ou None, indice du déplacement ou None).
+        moves      Liste des actions de déplacement du lot, dans l'ordre des lignes du tableau de coordonnées.
+        moved_ids  Identifiants des entités déplacées par le lot.
+    """
+
+    MOVE_ACTIONS = (ActionMove, ActionMoveTo, ActionAround)
+
+    def __init__(self):
+        """
+        Initialise un lot vide.
+        """
+        self.queue = []
+        self.moves = []
+        self.moved_ids = set()
+
+    @staticmethod
+    def is_move_action(action: 'Action') -> bool:
+        """
+        Indique si l'action est une action de déplacement évaluable par lot.
+
+        Paramètres:
+        action (Action): L'action à tester.
+
+        Retourne:
+        bool: True pour ActionMove, ActionMoveTo et ActionAround.
+        """
+        return isinstance(action, MoveBatch.MOVE_ACTIONS)
+
+    def is_empty(self) -> bool:
+        """
+        Indique si le lot ne contient aucune action.
+
+        Retourne:
+        bool: True si la file est vide.
+        """
+        return not self.queue
+
+    def depends_on_pending(self, action: 'Action') -> bool:
+        """
+        Indique si l'initialisation d'une action de déplacement lirait la position d'une entité déplacée par le lot.
+
+        Dans ce cas le lot doit être appliqué avant de préparer l'action pour conserver l'ordre d'exécution.
+
+        Paramètres:
+        action (Action): L'action de déplacement à préparer.
+
+        Retourne:
+        bool: True si le lot doit être appliqué avant la préparation de l'action.
+        """
+        if not self.moved_ids or not action.need_init():
+            return False
+        return action.entity_id in self.moved_ids or getattr(action, "entity_id2", None) in self.moved_ids
+
+    def add_move(self, action: 'Action', map_entity: 'MapEntity'):
+        """
+        Ajoute une action de déplacement préparée au lot.
+
+        Paramètres:
+        action (Action): L'action de déplacement, déjà préparée.
+        map_entity (MapEntity): L'entité déplacée par l'action.
+        """
+        self.queue.append((action, map_entity, len(self.moves)))
+        self.moves.append(action)
+        self.moved_ids.add(action.entity_id)
+
+    def add_action(self, action: 'Action'):
+        """
+        Ajoute une action qui n'est pas un déplacement, exécutée à son tour lors de l'application du lot.
+
+        Paramètres:
+        action (Action): L'action à exécuter.
+        """
+        self.queue.append((action, None, None))
+
+    def clear(self):
+        """
+        Vide le lot.
+        """
+        self.queue = []
+        self.moves = []
+        self.moved_ids = set()
+
+    def evaluate(self, tick: int) -> np.ndarray:
+        """
+        Calcule les coordonnées de toutes les actions de déplacement du lot pour le tick donné.
+
+        Paramètres:
+        tick (int): Le tick courant.
+
+        Retourne:
+        np.ndarray: Tableau (nombre de déplacements, 3) des latitudes, longitudes et altitudes.
+                    L'altitude vaut NaN pour ActionAround, qui conserve l'altitude courante de l'entité.
+        """
+        coordinates = np.full((len(self.moves), 3), np.nan)
+
+        linear = [index for index, action in enumerate(self.moves) if not isinstance(action, ActionAround)]
+        if linear:
+            parameters = np.array([
+                (
+                    action.start_at, action.end_at,
+                    action.lat_from, action.lon_from, action.alti_from,
+                    action.lat_to, action.lon_to, action.alti_to,
+                )
+                for action in (self.moves[index] for index in linear)
+            ], dtype=np.float64)
+            start, end = parameters[:, 0], parameters[:, 1]
+            coordinates[linear] = MoveBatch.interpolate(tick, start, end, parameters[:, 2:5], parameters[:, 5:8])
+
+        around = [index for index, action in enumerate(self.moves) if isinstance(action, ActionAround)]
+        if around:
+            parameters = np.array([
+                (
+                    action.start_at, action.end_at,
+                    action.origin_angle, action.angle,
+                    action.center_lat, action.center_lon, action.distance,
+                )
+                for action in (self.moves[index] for index in around)
+            ], dtype=np.float64)
+            start, end = parameters[:, 0], parameters[:, 1]
+            angle = MoveBatch.interpolate(tick, start, end, parameters[:, 2:3], parameters[:, 3:4])[:, 0]
+            lat, lon = MoveBatch.destination_points(parameters[:, 4], parameters[:, 5], angle, parameters[:, 6])
+            coordinates[around, 0] = lat
+            coordinates[around, 1] = lon
+
+        return coordinates
+
+    @staticmethod
+    def interpolate(tick: int, start: np.ndarray, end: np.ndarray, value_from: np.ndarray, value_to: np.ndarray) -> np.ndarray:
+        """
+        Interpole linéairement des valeurs en fonction de la progression temporelle de chaque action.
+
+        Paramètres:
+        tick (int): Le tick courant.
+        start (np.ndarray): Ticks de début, de forme (n,).
+        end (np.ndarray): Ticks de fin, de forme (n,).
+        value_from (np.ndarray): Valeurs de départ, de forme (n, k).
+        value_to (np.ndarray): Valeurs d'arrivée, de forme (n, k).
+
+        Retourne:
+        np.ndarray: Les valeurs interpolées de forme (n, k), égales aux valeurs d'arrivée si la durée est nulle
+                    ou si le tick de fin est atteint.
+        """
+        duration = end - start
+        finished = (duration == 0) | (tick >= end)
+        ratio = np.clip((tick - start) / np.where(finished, 1, duration), 0, 1)[:, np.newaxis]
+
+        values = value_from + (value_to - value_from) * ratio
+        return np.where(finished[:, np.newaxis], value_to, values)
+
+    @staticmethod
+    def destination_points(lat_deg: np.ndarray, lon_deg: np.ndarray, azimuth_deg: np.ndarray, distance_m: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Version vectorisée de Utils.destination_point : calcule les positions GPS atteintes à partir de points GPS,
+        d'azimuts et de distances (en mètres).
+
+        Paramètres:
+        lat_deg (np.ndarray): Latitudes des points de départ en degrés.
+        lon_deg (np.ndarray): Longitudes des points de départ en degrés.
+        azimuth_deg (np.ndarray): Azimuts en degrés (0 = nord, 90 = est, ...).
+        distance_m (np.ndarray): Distances à parcourir en mètres.
+
+        Retourne:
+        tuple[np.ndarray, np.ndarray]: Les latitudes et longitudes atteintes en degrés.
+        """
+        R = 6371000  # Rayon de la Terre en mètres
+        lat1 = np.radians(lat_deg)
+        lon1 = np.radians(lon_deg)
+        azimuth = np.radians(azimuth_deg)
+        delta = distance_m / R
+
+        lat2 = np.arcsin(np.sin(lat1) * np.cos(delta) + np.cos(lat1) * np.sin(delta) * np.cos(azimuth))
+        lon2 = lon1 + np.arctan2(np.sin(azimuth) * np.sin(delta) * np.cos(lat1), np.cos(delta) - np.sin(lat1) * np.sin(lat2))
+
+        return np.degrees(lat2), np.degrees(lon2)
@@ -0,0 +1,117 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..actions.action import Action
+
+class ActionIndex:
+    """
+    Classe ActionIndex
+
+    Index d'intervalles sur les actions permettant de retrouver les actions actives à un tick donné
+    sans parcourir l'ensemble des actions.
+
+    Attributs :
+        actions          Liste des actions indexées, dans leur ordre d'origine.
+        starts           Dictionnaire tick -> indices des actions qui débutent à ce tick.
+        ends             Dictionnaire tick -> indices des actions qui se terminent à ce tick.
+        cursor           Dernier tick interrogé, None si aucun.
+        active           Ensemble des indices des actions actives au tick `cursor`.
+    """
+
+    def __init__(self, actions: list['Action'] = []):
+        """
+        Initialise l'index et le construit à partir des actions fournies.
+
+        Paramètres:
+        actions (list[Action]): Liste des actions à indexer. Par défaut, une liste vide.
+        """
+        self.actions = []
+        self.starts = {}
+        self.ends = {}
+        self.cursor = None
+        self.active = set()
+        self.build(actions)
+
+    def build(self, actions: list['Action']):
+        """
+        Construit les listes d'événements de début et de fin des actions.
+
+        Paramètres:
+        actions (list[Action]): Liste des actions à indexer.
+
+        Comportement:
+        - Conserve la liste des actions dans leur ordre d'origine.
+        - Regroupe les indices des actions par tick de début et par tick de fin.
+        - Réinitialise le curseur et l'ensemble des actions actives.
+        """
+        self.actions = list(actions)
+        self.starts = {}
+        self.ends = {}
+
+        for index, action in enumerate(self.actions):
+            self.starts.setdefault(action.start_at, []).append(index)
+            self.ends.setdefault(action.end_at, []).append(index)
+
+        self.cursor = None
+        self.active = set()
+
+    def get_active_at(self, tick: int) -> list['Action']:
+        """
+        Retourne les actions actives au tick donné.
+
+        Paramètres:
+        tick (int): Le tick pour lequel récupérer les actions actives.
+
+        Comportement:
+        - Si le tick suit directement le dernier tick interrogé, l'ensemble actif est mis à jour
+          uniquement avec les actions qui se terminaient au tick précédent et celles qui débutent.
+        - Sinon (saut dans le temps), l'ensemble actif est recalculé entièrement.
+
+        Retourne:
+        list[Action]: Les actions actives, dans l'ordre de la liste d'origine.
+        """
+        if self.cursor is not None and tick == self.cursor + 1:
+            for index in self.ends.get(self.cursor, []):
+                self.active.discard(index)
+            self.active.update(self.starts.get(tick, []))
+        elif tick != self.cursor:
+            self.active = self.scan(tick)
+
+        self.cursor = tick
+        return [self.actions[index] for index in sorted(self.active)]
+
+    def scan(self, tick: int) -> set[int]:
+        """
+        Recalcule l'ensemble des indices des actions actives au tick donné en parcourant toutes les actions.
+
+        Paramètres:
+        tick (int): Le tick à évaluer.
+
+        Retourne:
+        set[int]: Les indices des actions actives.
+        """
+        return {index for index, action in enumerate(self.actions) if action.is_active_at(tick)}
+
+    def get_starting_at(self, tick: int) -> list['Action']:
+        """
+        Retourne les actions qui débutent au tick donné.
+
+        Paramètres:
+        tick (int): Le tick à évaluer.
+
+        Retourne:
+        list[Action]: Les actions dont `start_at` vaut `tick`.
+        """
+        return [self.actions[index] for index in self.starts.get(tick, [])]
+
+    def get_ending_at(self, tick: int) -> list['Action']:
+        """
+        Retourne les actions qui se terminent au tick donné.
+
+        Paramètres:
+        tick (int): Le tick à évaluer.
+
+        Retourne:
+        list[Action]: Les actions dont `end_at` vaut `tick`.
+        """
+        return [self.actions[index] for index in self.ends.get(tick, [])]
@@ -0,0 +1,179 @@
+from typing import TYPE_CHECKING
+
+from .snapshot_store import SnapshotStore
+
+if TYPE_CHECKING:
+    from .map_entity import MapEntity
+
+
+class DeltaLog:
+    """
+    Classe DeltaLog
+
+    Journal des modifications tick par tick enregistré pendant la lecture. Chaque entrée contient
+    l'ancienne et la nouvelle valeur de chaque propriété modifiée au cours du tick, ce qui permet
+    de revenir d'un tick en arrière en ne traitant que ces modifications.
+
+    Le journal ne conserve qu'une fenêtre des derniers ticks : les entrées les plus anciennes sont évincées
+    lorsque le budget mémoire est dépassé. Un retour avant cette fenêtre repart d'un instantané (go_to_tick).
+
+    Attributs :
+        entries          Dictionnaire tick -> entrée du journal, du plus ancien au plus récent.
+        sizes            Dictionnaire tick -> taille estimée de l'entrée.
+        memory_budget    Taille mémoire maximale (en octets, estimée) occupée par les entrées.
+        memory_used      Taille estimée totale des entrées conservées.
+        pending_tick     Tick en cours d'enregistrement, None si aucun.
+        pending_loaded   Copie des entités chargées au début du tick en cours.
+        pending_lines    Copie des lignes au début du tick en cours.
+    """
+
+    DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        """
+        Initialise un journal vide.
+
+        Paramètres:
+        memory_budget (int): Budget mémoire en octets. Par défaut 32 Mo.
+        """
+        self.entries = {}
+        self.sizes = {}
+        self.memory_budget = 0
+        self.memory_used = 0
+        self.pending_tick = None
+        self.pending_loaded = {}
+        self.pending_lines = set()
+
+        self.set_memory_budget(memory_budget)
+
+    def set_memory_budget(self, memory_budget: int):
+        """
+        Modifie le budget mémoire et évince les entrées en trop.
+
+        Paramètres:
+        memory_budget (int): Budget mémoire en octets.
+        """
+        self.memory_budget = max(int(memory_budget), 0)
+        self.evict()
+
+    @staticmethod
+    def copy_entities_loaded(entities_loaded: dict) -> dict:
+        """
+        Copie le dictionnaire des entités chargées en dupliquant chaque liste.
+
+        Paramètres:
+        entities_loaded (dict): Dictionnaire identifiant -> liste d'entités chargées.
+
+        Retourne:
+        dict: La copie du dictionnaire.
+        """
+        return {entity_id: list(entity_list) for entity_id, entity_list in entities_loaded.items()}
+
+    def begin(self, tick: int, entities_loaded: dict, lines: set):
+        """
+        Débute l'enregistrement d'un tick en mémorisant l'état des entités chargées et des lignes.
+
+        Paramètres:
+        tick (int): Le tick qui va être traité.
+        entities_loaded (dict): Les entités chargées au début du tick.
+        lines (set): Les lignes au début du tick.
+        """
+        self.pending_tick = tick
+        self.pending_loaded = DeltaLog.copy_entities_loaded(entities_loaded)
+        self.pending_lines = set(lines)
+
+    def commit(self, map_entities: list['MapEntity'], entities_loaded: dict, lines: set):
+        """
+        Termine l'enregistrement du tick en cours et conserve les modifications dans le journal.
+
+        Paramètres:
+        map_entities (list[MapEntity]): Les entités de la carte dont les modifications doivent être collectées.
+        entities_loaded (dict): Les entités chargées à la fin du tick.
+        lines (set): Les lignes à la fin du tick.
+
+        Comportement:
+        - Collecte les modifications de chaque entité via pop_changes().
+        - Conserve l'ancien et le nouvel état des entités chargées et des lignes uniquement s'ils ont changé.
+        - Évince les entrées les plus anciennes si le budget mémoire est dépassé.
+        """
+        if self.pending_tick is None:
+            return
+
+        entry = {
+            "entities": {},
+            "entities_loaded": None,
+            "lines": None,
+        }
+
+        for map_entity in map_entities:
+            changes = map_entity.pop_changes()
+            if changes:
+                entry["entities"][map_entity.get_id()] = changes
+
+        loaded = DeltaLog.copy_entities_loaded(entities_loaded)
+        if loaded != self.pending_loaded:
+            entry["entities_loaded"] = (self.pending_loaded, loaded)
+
+        new_lines = set(lines)
+        if new_lines != self.pending_lines:
+            entry["lines"] = (self.pending_lines, new_lines)
+
+        self.remove(self.pending_tick)
+        size = SnapshotStore.estimate_size(entry)
+        self.entries[self.pending_tick] = entry
+        self.sizes[self.pending_tick] = size
+        self.memory_used += size
+        self.pending_tick = None
+
+        self.evict()
+
+    def get(self, tick: int) -> dict | None:
+        """
+        Retourne l'entrée du journal d'un tick.
+
+        Paramètres:
+        tick (int): Le tick recherché.
+
+        Retourne:
+        dict | None: L'entrée du journal, ou None si le tick n'a pas été enregistré.
+        """
+        return self.entries.get(tick)
+
+    def truncate_from(self, tick: int):
+        """
+        Supprime les entrées du journal à partir du tick donné.
+
+        Paramètres:
+        tick (int): Le premier tick à supprimer.
+        """
+        for entry_tick in [entry_tick for entry_tick in self.entries if entry_tick >= tick]:
+            self.remove(entry_tick)
+        self.pending_tick = None
+
+    def remove(self, tick: int):
+        """
+        Supprime l'entrée du tick donné si elle existe.
+
+        Paramètres:
+        tick (int): Le tick de l'entrée à supprimer.
+        """
+        if tick in self.entries:
+            del self.entries[tick]
+            self.memory_used -= self.sizes.pop(tick)
+
+    def evict(self):
+        """
+        Évince les entrées les plus anciennes tant que le budget mémoire est dépassé.
+        """
+        while self.entries and self.memory_used > self.memory_budget:
+            tick = next(iter(self.entries))
+            self.remove(tick)
+
+    def clear(self):
+        """
+        Vide le journal.
+        """
+        self.entries = {}
+        self.sizes = {}
+        self.memory_used = 0
+        self.pending_tick = None
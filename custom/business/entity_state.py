@@ -0,0 +1,600 @@
+class EntityState:
+    """
+    Classe EntityState
+
+    État de simulation d'une entité, indépendant de QGIS : position, altitude, propriétés visuelles, textes,
+    indicateurs de mise à jour et journal des modifications. Les actions et la Simulation ne manipulent que cet état,
+    MapEntity y ajoute sa représentation dans QGIS (entité de la couche, étiquette et catégorie de rendu).
+    """
+
+    def __init__(self, id: str, name: str, url_icon: str, latitude: float, longitude: float, altitude: float = 0, size: float = 5):
+        """
+        Initialise l'état d'une entité avec ses propriétés spécifiques.
+
+        Paramètres:
+        id (str): Identifiant unique de l'instance.
+        name (str): Nom de l'instance.
+        url_icon (str): URL de l'icône associée.
+        latitude (float): Latitude pour l'instance.
+        longitude (float): Longitude pour l'instance.
+        altitude (float, optionnel): Altitude pour l'instance, par défaut à 0.
+        size (float, optionnel): Taille de l'objet, par défaut à 5.
+
+        Attributs:
+        id: Stocke l'identifiant de l'instance.
+        name: Stocke le nom de l'instance.
+        url_icon: Stocke l'URL de l'icône.
+        url_icon_default: Valeur par défaut pour l'URL de l'icône.
+        size: Taille de l'instance en tant que nombre décimal.
+        size_default: Taille par défaut de l'instance.
+        angle: Angle de rotation de l'instance, initialisé à 0.
+        opacity: Niveau d'opacité de l'instance, initialisé à 1.
+        highlight: Met en évidence une sélection, initialisé à None.
+        background_image: Image d'arrière-plan, initialisé à None.
+        latitude: Latitude actuelle de l'instance.
+        longitude: Longitude actuelle de l'instance.
+        latitude_default: Latitude initiale par défaut.
+        longitude_default: Longitude initiale par défaut.
+        altitude: Altitude actuelle de l'instance.
+        altitude_default: Altitude par défaut de l'instance.
+        texts: Liste des textes associés à l'instance.
+        changes: Dictionnaire propriété -> ancienne valeur des propriétés modifiées depuis le dernier appel à pop_changes().
+
+        need_refresh_category: Détermine si une catégorie nécessite une mise à jour, initialisé à False.
+        need_update_label: Indique si une étiquette doit être mise à jour, initialisé à False.
+        """
+        self.id = id
+        self.name = name
+        self.url_icon = url_icon
+        self.url_icon_default = url_icon
+        self.size = float(size)
+        self.size_default = float(size)
+        self.angle = 0
+        self.opacity = 1
+        self.highlight = None
+        self.background_image = None
+        self.latitude = latitude
+        self.longitude = longitude
+        self.latitude_default = latitude
+        self.longitude_default = longitude
+        self.altitude = altitude
+        self.altitude_default = altitude
+        self.texts = []
+        self.changes = {}
+
+        self.need_refresh_category = False
+        self.need_update_label = False
+
+    def copy_initial(self) -> 'EntityState':
+        """
+        Retourne une nouvelle EntityState dans l'état initial de cette entité (identifiant, nom, icône, position,
+        altitude et taille par défaut), sans représentation QGIS. Elle peut être transmise à un autre processus.
+
+        Retourne:
+            EntityState: La copie de l'état initial.
+        """
+        return EntityState(
+            self.id,
+            self.name,
+            self.url_icon_default,
+            self.latitude_default,
+            self.longitude_default,
+            self.altitude_default,
+            self.size_default
+        )
+
+    def get_latitude(self) -> float:
+        """
+        Renvoie la latitude actuelle.
+
+        Retourne:
+            float: La latitude de l'entité.
+        """
+        return self.latitude
+
+    def get_longitude(self) -> float:
+        """
+        Récupère la longitude actuelle.
+
+        Retourne:
+            float: La longitude de l'entité.
+        """
+        return self.longitude
+
+    def get_altitude(self) -> float:
+        """
+        Renvoie l'altitude actuelle.
+
+        Retourne:
+            float: La valeur de l'altitude.
+        """
+        return self.altitude
+
+    def set_altitude(self, value: float):
+        """
+        Définit l'altitude à la valeur spécifiée.
+
+        Paramètres:
+        value (float): La nouvelle valeur de l'altitude.
+        """
+        self.record_change("position")
+        self.altitude = value
+
+    def get_url_icon(self) -> str:
+        """
+        Retourne l'icône d'URL.
+
+        Renvoie:
+        Une chaîne de caractères représentant l'icône d'URL.
+        """
+        return self.url_icon
+
+    def set_url_icon(self, value: str, need_refresh_category: bool = True):
+        """
+        Définit l'icône d'URL et met à jour l'état de rafraîchissement de la catégorie si nécessaire.
+
+        Paramètres:
+        value (str): L'URL de l'icône à affecter.
+        need_refresh_category (bool): Indique s'il est nécessaire de marquer la catégorie pour un rafraîchissement. Par défaut à True.
+        """
+        self.record_change("url_icon")
+        self.url_icon = value
+        self.set_need_refresh_category(need_refresh_category)
+
+    def reset_url_icon(self):
+        """
+        Réinitialise l'icône de l'URL à sa valeur par défaut.
+
+        Cette méthode remplace l'icône actuelle de l'URL par l'icône par défaut spécifiée dans l'attribut url_icon_default.
+        """
+        self.set_url_icon(self.url_icon_default)
+
+    def get_background_image(self) -> str:
+        """
+        Renvoie l'image d'arrière-plan actuelle.
+
+        Cette méthode retourne le chemin ou l'identifiant de l'image d'arrière-plan actuellement définie.
+
+        Retourne:
+            str: L'image d'arrière-plan.
+        """
+        return self.background_image
+
+    def set_background_image(self, value: str|None, need_refresh_category: bool = True):
+        """
+        Définit l'image d'arrière-plan de l'objet.
+
+        Parameters:
+         value (str | None): Chemin ou identifiant de l'image à définir comme arrière-plan, ou None pour supprimer l'image existante.
+         need_refresh_category (bool): Indique si une actualisation de la catégorie est nécessaire après la modification de l'image d'arrière-plan. La valeur par défaut est True.
+        """
+        self.record_change("background_image")
+        self.background_image = value
+        self.set_need_refresh_category(need_refresh_category)
+
+    def reset_background_image(self):
+        """
+        Réinitialise l'image d'arrière-plan à sa valeur par défaut.
+
+        Cette méthode supprime l'image d'arrière-plan actuellement définie
+        en assignant une valeur nulle, indiquant qu'aucune image n'est utilisée.
+        """
+        self.set_background_image(None)
+
+    def get_highlight(self) -> bool:
+        """
+        Renvoie l'état de mise en évidence.
+
+        Retourne:
+        bool: La valeur de l'attribut highlight indiquant si un élément est mis en évidence.
+        """
+        return self.highlight
+
+    def set_highlight(self, value: str|None, need_refresh_category: bool = True):
+        """
+        Définit la valeur de mise en surbrillance et met à jour l'état de rafraîchissement de la catégorie si nécessaire.
+
+        Arguments:
+        value: Une chaîne ou None représentant la valeur de mise en surbrillance à définir.
+        need_refresh_category: Un booléen indiquant si la catégorie doit être rafraîchie. Par défaut, True.
+        """
+        self.record_change("highlight")
+        self.highlight = value
+        self.set_need_refresh_category(need_refresh_category)
+
+    def reset_highlight(self):
+        """
+        Réinitialise la mise en surbrillance de l'objet.
+
+        Définit la mise en surbrillance sur "None" pour indiquer qu'aucune
+        mise en surbrillance n'est actuellement active.
+        """
+        self.set_highlight(None)
+
+    def get_size(self) -> float:
+        """
+        Retourne la taille de l'objet.
+
+        Retour :
+            float : La taille de l'objet.
+        """
+        return self.size
+
+    def set_size(self, value: float, need_refresh_category: bool = True):
+        """
+        Définit la taille et met à jour l'état pour indiquer si une actualisation de catégorie est nécessaire.
+
+        Paramètres:
+        value (float): La nouvelle taille à définir.
+        need_refresh_category (bool): Indique si une actualisation de catégorie est nécessaire. Par défaut, True.
+        """
+        self.record_change("size")
+        self.size = value
+        self.set_need_refresh_category(need_refresh_category)
+
+    def reset_size(self):
+        """
+        Réinitialise la taille d'un objet à la valeur par défaut.
+
+        Cette méthode met à jour la taille actuelle de l'objet en utilisant
+        la valeur par défaut définie dans l'attribut `size_default`.
+        """
+        self.set_size(self.size_default)
+
+    def get_texts(self) -> list[str]:
+        """
+        Récupère une liste de textes.
+
+        Renvoie :
+            list[str] : Une liste de chaînes de caractères.
+        """
+        return self.texts
+
+    def set_texts(self, value: list[str]):
+        """
+        Définit les textes avec une liste de chaînes spécifiées.
+
+        Paramètres :
+        value (list[str]) : Liste de chaînes à assigner à l'attribut texts.
+
+        Comportement :
+        - Met à jour l'attribut texts avec la liste fournie.
+        - Indique que l'étiquette nécessite une mise à jour en définissant l'indicateur approprié à True.
+        """
+        self.record_change("texts")
+        self.texts = value
+        self.set_need_update_label(True)
+
+    def append_text(self, text: str):
+        """
+        Ajoute un texte à la liste des textes et met à jour l'état de l'étiquette.
+
+        Paramètres:
+        text (str): Le texte à ajouter.
+        """
+        self.record_change("texts")
+        self.texts.append(text)
+        self.set_need_update_label(True)
+
+    def reset_text(self):
+        """
+        Réinitialise les textes de l'objet.
+
+        Vérifie si des textes existent. Si c'est le cas, remplace les textes existants
+        par une liste vide.
+        """
+        if self.texts:
+            self.set_texts([])
+
+    def get_need_refresh_category(self) -> bool:
+        """
+        Retourne la valeur de l'attribut need_refresh_category.
+
+        Renvoie:
+         bool: La valeur de l'attribut need_refresh_category.
+        """
+        return self.need_refresh_category
+
+    def set_need_refresh_category(self, value: bool):
+        """
+        Définit la nécessité de rafraîchir la catégorie.
+
+        Paramètres:
+        value (bool): Indique si la catégorie doit être marquée comme nécessitant un rafraîchissement.
+
+        Comportement:
+        Si l'attribut 'need_refresh_category' est actuellement défini sur False, il sera mis à jour avec la valeur spécifiée.
+        """
+        if self.need_refresh_category is False:
+            self.need_refresh_category = value
+
+    def get_need_update_label(self) -> bool:
+        """
+        Renvoie l'état actuel de l'attribut need_update_label.
+
+        Retourne:
+            bool : La valeur de l'attribut need_update_label indiquant si une mise à jour de l'étiquette est nécessaire.
+        """
+        return self.need_update_label
+
+    def set_need_update_label(self, value: bool):
+        """
+        Définit si l'attribut need_update_label doit être mis à jour.
+
+        Paramètres:
+        value (bool): Valeur indiquant si l'attribut need_update_label doit être mis à jour.
+        """
+        if self.need_update_label is False:
+            self.need_update_label = value
+
+    def get_name(self) -> str:
+        """
+        Renvoie le nom.
+
+        Retour:
+            str: Le nom.
+        """
+        return self.name
+
+    def set_name(self, value: str):
+        """
+        Définit le nom de l'objet.
+
+        Paramètres:
+        value (str): Le nom à attribuer à l'objet.
+        """
+        self.name = value
+
+    def get_angle(self) -> float:
+        """
+        Renvoie l'angle actuel.
+
+        Retour:
+        float : La valeur de l'angle.
+        """
+        return self.angle
+
+    def set_angle(self, value: float, need_refresh_category: bool = True):
+        """
+        Définit l'angle à une valeur spécifiée et, si nécessaire, met à jour l'état de rafraîchissement de la catégorie.
+
+        Paramètres:
+        value (float): La valeur de l'angle à définir.
+        need_refresh_category (bool): Indique si la catégorie doit être marquée pour un rafraîchissement. La valeur par défaut est True.
+        """
+        self.record_change("angle")
+        self.angle = value
+        self.set_need_refresh_category(need_refresh_category)
+
+    def reset_angle(self):
+        """
+        Réinitialise l'angle de l'objet à zéro.
+
+        Cette méthode modifie l'angle actuel de l'objet en le fixant à 0.
+        Elle utilise la méthode interne set_angle pour effectuer cette opération.
+        """
+        self.set_angle(0)
+
+    def get_id(self) -> str:
+        """
+        Cette méthode retourne l'identifiant unique associé à l'objet.
+
+        Retour:
+            str: L'identifiant unique de l'objet.
+        """
+        return self.id
+
+    def get_opacity(self) -> float:
+        """
+        Renvoie l'opacité actuelle.
+
+        Retourne:
+            float: La valeur de l'opacité.
+        """
+        return self.opacity
+
+    def set_opacity(self, value: float, need_refresh_category: bool = True):
+        """
+        Définit l'opacité de l'objet.
+
+        Paramètres:
+        value (float): La nouvelle valeur d'opacité.
+        need_refresh_category (bool, optionnel): Indique si une actualisation de la catégorie est nécessaire. Valeur par défaut à True.
+        """
+        self.record_change("opacity")
+        self.opacity = value
+        self.set_need_refresh_category(need_refresh_category)
+
+    def reset_opacity(self):
+        """
+        Réinitialise l'opacité de l'objet.
+        Fixe l'opacité à la valeur maximale (1).
+        """
+        self.set_opacity(1)
+
+    def move_to(self, lat: float, lon: float, alti: float):
+        """
+        Déplace l'entité vers nouvelles coordonnées géographiques et met à jour l'altitude.
+
+        Paramètres:
+        lat (float): La latitude de la nouvelle position.
+        lon (float): La longitude de la nouvelle position.
+        alti (float): La nouvelle altitude.
+
+        Actions:
+        - Met à jour les propriétés `latitude`, `longitude` et `altitude` de l'entité.
+        - Indique qu'une mise à jour de l'étiquette est nécessaire.
+        """
+        self.record_change("position")
+        self.latitude = lat
+        self.longitude = lon
+        self.altitude = alti
+        self.set_need_update_label(True)
+
+    def move_to_entity(self, map_entity):
+        """
+        Déplace l'objet actuel vers l'entité spécifiée en utilisant ses coordonnées.
+
+        Paramètres:
+        map_entity : Une entité vers laquelle bougée
+        """
+        self.move_to(map_entity.get_latitude(), map_entity.get_longitude(), map_entity.altitude)
+
+    def reset(self):
+        """
+        Réinitialise les attributs de l'objet à leurs valeurs par défaut.
+
+        Les méthodes appelées effectuent les actions suivantes :
+        - Réinitialise l'icône URL.
+        - Réinitialise la position de l'objet.
+        - Réinitialise la taille de l'objet.
+        - Réinitialise le texte de l'objet.
+        - Réinitialise l'angle de rotation de l'objet.
+        - Réinitialise l'opacité de l'objet.
+        - Réinitialise la mise en surbrillance de l'objet.
+        - Réinitialise l'image d'arrière-plan de l'objet.
+        """
+        self.reset_url_icon()
+        self.reset_position()
+        self.reset_size()
+        self.reset_text()
+        self.reset_angle()
+        self.reset_opacity()
+        self.reset_highlight()
+        self.reset_background_image()
+
+    def reset_position(self):
+        """
+        Réinitialise la position de l'objet aux valeurs par défaut.
+        """
+        self.move_to(self.latitude_default, self.longitude_default, self.altitude_default)
+
+    def get_state(self) -> dict:
+        """
+        Retourne l'état de simulation de l'entité, utilisé pour les instantanés.
+
+        Retourne:
+        dict: Position, altitude, taille, angle, opacité, icône, mise en surbrillance, image d'arrière-plan et textes.
+        """
+        return {
+            "latitude": self.get_latitude(),
+            "longitude": self.get_longitude(),
+            "altitude": self.altitude,
+            "size": self.size,
+            "angle": self.angle,
+            "opacity": self.opacity,
+            "url_icon": self.url_icon,
+            "highlight": self.highlight,
+            "background_image": self.background_image,
+            "texts": list(self.texts),
+        }
+
+    def set_state(self, state: dict):
+        """
+        Restaure l'état de simulation de l'entité à partir d'un instantané.
+
+        Paramètres:
+        state (dict): L'état retourné par get_state().
+
+        Comportement:
+        - Déplace l'entité à la position enregistrée.
+        - Restaure les propriétés visuelles et marque la catégorie pour un rafraîchissement.
+        - Restaure les textes et marque l'étiquette pour une mise à jour.
+        - Les propriétés déjà égales à la valeur enregistrée ne sont pas modifiées.
+        """
+        position = (state["latitude"], state["longitude"], state["altitude"])
+        if self.get_property("position") != position:
+            self.move_to(*position)
+
+        for name in ("size", "angle", "opacity", "url_icon", "highlight", "background_image", "texts"):
+            if self.get_property(name) != state[name]:
+                self.set_property(name, state[name])
+
+    def get_property(self, name: str):
+        """
+        Retourne la valeur courante d'une propriété suivie par le journal des modifications.
+
+        Paramètres:
+        name (str): Nom de la propriété ("position", "size", "angle", "opacity", "url_icon", "highlight", "background_image" ou "texts").
+
+        Retourne:
+        La valeur de la propriété, (latitude, longitude, altitude) pour "position" et une copie de la liste pour "texts".
+
+        Exceptions:
+        ValueError: Levée si la propriété n'est pas reconnue.
+        """
+        match name:
+            case "position":
+                return self.get_latitude(), self.get_longitude(), self.altitude
+            case "texts":
+                return list(self.texts)
+            case "size" | "angle" | "opacity" | "url_icon" | "highlight" | "background_image":
+                return getattr(self, name)
+            case _:
+                raise ValueError(f"Propriété inconnue : {name}")
+
+    def set_property(self, name: str, value):
+        """
+        Définit la valeur d'une propriété suivie par le journal des modifications en passant par son setter.
+
+        Paramètres:
+        name (str): Nom de la propriété, voir get_property().
+        value: La valeur à définir.
+
+        Exceptions:
+        ValueError: Levée si la propriété n'est pas reconnue.
+        """
+        match name:
+            case "position":
+                self.move_to(*value)
+            case "texts":
+                self.set_texts(list(value))
+            case "size":
+                self.set_size(value)
+            case "angle":
+                self.set_angle(value)
+            case "opacity":
+                self.set_opacity(value)
+            case "url_icon":
+                self.set_url_icon(value)
+            case "highlight":
+                self.set_highlight(value)
+            case "background_image":
+                self.set_background_image(value)
+            case _:
+                raise ValueError(f"Propriété inconnue : {name}")
+
+    def record_change(self, name: str):
+        """
+        Mémorise l'ancienne valeur d'une propriété avant sa première modification depuis le dernier appel à pop_changes().
+
+        Paramètres:
+        name (str): Nom de la propriété modifiée.
+        """
+        if name not in self.changes:
+            self.changes[name] = self.get_property(name)
+
+    def pop_changes(self) -> dict:
+        """
+        Retourne les propriétés réellement modifiées depuis le dernier appel puis vide le journal.
+
+        Retourne:
+        dict: Dictionnaire propriété -> (ancienne valeur, nouvelle valeur).
+        """
+        if not self.changes:
+            return {}
+
+        changes = {}
+        for name, old_value in self.changes.items():
+            new_value = self.get_property(name)
+            if new_value != old_value:
+                changes[name] = (old_value, new_value)
+
+        self.changes = {}
+        return changes
+
+    def clear_changes(self):
+        """
+        Vide le journal des modifications sans le consulter.
+        """
+        self.changes = {}
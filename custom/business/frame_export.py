@@ -0,0 +1,197 @@
+import os
+
+from qgis.core import (
+    Qgis,
+    QgsMapSettings,
+    QgsMapRendererParallelJob,
+    QgsMessageLog,
+    QgsDateTimeRange,
+    QgsRectangle,
+    QgsCoordinateReferenceSystem,
+    QgsVectorLayer
+)
+from qgis.PyQt.QtCore import QObject, QSize, QDateTime, pyqtSignal
+from qgis.PyQt.QtGui import QColor
+
+from .temporal_export import TemporalExport
+
+
+class FrameExport(QObject):
+    """
+    Classe FrameExport
+
+    Rend hors écran une suite de ticks en images PNG numérotées, de taille fixe.
+
+    Les images sont rendues à partir de couches temporelles (voir TemporalExport) : chaque image ne diffère
+    que par l'intervalle temporel de ses QgsMapSettings, les couches ne sont donc jamais modifiées pendant l'export
+    et plusieurs QgsMapRendererParallelJob peuvent rendre des ticks différents en même temps.
+
+    Attributs :
+        signal_progress          Signal émis après chaque image écrite, avec le nombre d'images écrites et le total.
+        signal_finished          Signal émis à la fin de l'export, True s'il est complet, False s'il a été annulé
+                                 ou a échoué.
+        DEFAULT_WIDTH            Largeur par défaut des images, en pixels.
+        DEFAULT_HEIGHT           Hauteur par défaut des images, en pixels.
+        DEFAULT_CONCURRENT_JOBS  Nombre par défaut de rendus menés en même temps.
+        FILE_NAME                Modèle du nom des images, numérotées à partir de 0 dans l'ordre des ticks.
+        export                   L'export temporel donnant l'instant de chaque tick.
+        layers                   Les couches rendues, de la plus haute à la plus basse.
+        directory                Le dossier de destination des images.
+        ticks                    Les ticks à rendre, dans l'ordre.
+        concurrent_jobs          Nombre maximal de rendus menés en même temps.
+        settings                 Les paramètres de rendu communs à toutes les images.
+        jobs                     Les rendus en cours, associés à l'indice et au tick de leur image.
+        next_index               L'indice de la prochaine image à démarrer.
+        written                  Le nombre d'images écrites.
+        cancelled                Indique si l'export a été annulé ou a échoué.
+    """
+
+    signal_progress = pyqtSignal(int, int)
+    signal_finished = pyqtSignal(bool)
+
+    DEFAULT_WIDTH = 1920
+    DEFAULT_HEIGHT = 1080
+    DEFAULT_CONCURRENT_JOBS = 4
+    FILE_NAME = "frame_{:05d}.png"
+
+    def __init__(
+        self,
+        export: TemporalExport,
+        layers: list[QgsVectorLayer],
+        extent: QgsRectangle,
+        crs: QgsCoordinateReferenceSystem,
+        directory: str,
+        ticks: range,
+        width: int = DEFAULT_WIDTH,
+        height: int = DEFAULT_HEIGHT,
+        concurrent_jobs: int = DEFAULT_CONCURRENT_JOBS
+    ):
+        """
+        Initialise un export d'images.
+
+        Paramètres:
+        export (TemporalExport): L'export temporel donnant l'instant de chaque tick.
+        layers (list[QgsVectorLayer]): Les couches rendues, de la plus haute à la plus basse.
+        extent (QgsRectangle): L'emprise rendue, dans le système de coordonnées crs.
+        crs (QgsCoordinateReferenceSystem): Le système de coordonnées des images.
+        directory (str): Le dossier de destination des images.
+        ticks (range): Les ticks à rendre.
+        width (int): Largeur des images en pixels.
+        height (int): Hauteur des images en pixels.
+        concurrent_jobs (int): Nombre maximal de rendus menés en même temps, ramené à 1 au minimum.
+        """
+        super().__init__()
+
+        self.export = export
+        self.layers = list(layers)
+        self.directory = directory
+        self.ticks = list(ticks)
+        self.concurrent_jobs = max(int(concurrent_jobs), 1)
+
+        self.settings = QgsMapSettings()
+        self.settings.setLayers(self.layers)
+        self.settings.setDestinationCrs(crs)
+        self.settings.setExtent(extent)
+        self.settings.setOutputSize(QSize(width, height))
+        self.settings.setBackgroundColor(QColor("white"))
+        self.settings.setIsTemporal(True)
+
+        self.jobs = {}
+        self.next_index = 0
+        self.written = 0
+        self.cancelled = False
+
+    def get_frame_path(self, index: int) -> str:
+        """
+        Retourne le chemin de l'image d'indice donné.
+        """
+        return os.path.join(self.directory, FrameExport.FILE_NAME.format(index))
+
+    def start(self):
+        """
+        Démarre l'export : crée le dossier de destination puis lance les premiers rendus.
+
+        Exceptions:
+        OSError: Levée si le dossier de destination ne peut pas être créé.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+
+        if not self.ticks:
+            self.signal_finished.emit(True)
+            return
+
+        self.start_next_jobs()
+
+    def start_next_jobs(self):
+        """
+        Lance des rendus jusqu'à en avoir concurrent_jobs en cours ou jusqu'au dernier tick.
+        """
+        while not self.cancelled and len(self.jobs) < self.concurrent_jobs and self.next_index < len(self.ticks):
+            self.start_job(self.next_index, self.ticks[self.next_index])
+            self.next_index += 1
+
+    def start_job(self, index: int, tick: int):
+        """
+        Lance le rendu d'une image, limité à l'intervalle temporel du tick.
+
+        Paramètres:
+        index (int): L'indice de l'image.
+        tick (int): Le tick rendu.
+        """
+        settings = QgsMapSettings(self.settings)
+        settings.setTemporalRange(QgsDateTimeRange(
+            QDateTime(self.export.tick_to_datetime(tick)),
+            QDateTime(self.export.tick_to_datetime(tick + 1)),
+            True,
+            False
+        ))
+
+        job = QgsMapRendererParallelJob(settings)
+        self.jobs[job] = (index, tick)
+        job.finished.connect(lambda job=job: self.on_job_finished(job))
+        job.start()
+
+    def on_job_finished(self, job: QgsMapRendererParallelJob):
+        """
+        Écrit l'image d'un rendu terminé, signale la progression puis lance le rendu suivant.
+
+        Si l'image ne peut pas être écrite, l'export est annulé.
+
+        Paramètres:
+        job (QgsMapRendererParallelJob): Le rendu terminé.
+        """
+        index, tick = self.jobs.pop(job)
+
+        if not self.cancelled:
+            path = self.get_frame_path(index)
+            if job.renderedImage().save(path, "PNG"):
+                self.written += 1
+                self.signal_progress.emit(self.written, len(self.ticks))
+            else:
+                QgsMessageLog.logMessage(f"Écriture de l'image du tick {tick} impossible : {path}", "Trace QGIS", level=Qgis.Warning)
+                self.cancel_jobs()
+
+        self.start_next_jobs()
+
+        if not self.jobs and (self.cancelled or self.written == len(self.ticks)):
+            self.signal_finished.emit(not self.cancelled)
+
+    def cancel(self):
+        """
+        Annule l'export : aucun nouveau rendu n'est lancé et les rendus en cours sont interrompus sans attendre.
+        Les images déjà écrites sont conservées. signal_finished est émis à la fin du dernier rendu interrompu.
+        """
+        if self.cancelled:
+            return
+
+        self.cancel_jobs()
+        if not self.jobs:
+            self.signal_finished.emit(False)
+
+    def cancel_jobs(self):
+        """
+        Marque l'export comme annulé et interrompt sans attendre les rendus en cours.
+        """
+        self.cancelled = True
+        for job in list(self.jobs):
+            job.cancelWithoutBlocking()
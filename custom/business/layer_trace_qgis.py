@@ -1,3 +1,5 @@
+import time
+
 from qgis.utils import iface
 from qgis.core import (
     Qgis,
@@ -12,22 +14,45 @@ from qgis.core import (
     QgsLineSymbol,
     QgsSingleSymbolRenderer,
     QgsArrowSymbolLayer,
-    QgsRendererCategory
+    QgsRendererCategory,
+    QgsMarkerSymbol,
+    QgsRasterMarkerSymbolLayer,
+    QgsSimpleMarkerSymbolLayer,
+    QgsOuterGlowEffect,
+    QgsProperty,
+    QgsSymbol,
+    QgsSymbolLayer,
+    QgsPalLayerSettings,
+    QgsTextFormat,
+    QgsTextBackgroundSettings,
+    QgsVectorLayerSimpleLabeling,
+    QgsDateTimeRange,
+    QgsInterval
 )
 
-from qgis.PyQt.QtCore import Qt, QTimer, QVariant, pyqtSignal, QObject
+from qgis.PyQt.QtCore import Qt, QTimer, QVariant, pyqtSignal, QObject, QDateTime
 from typing import TYPE_CHECKING
-from PyQt5.QtGui import QColor
+from PyQt5.QtGui import QColor, QFont
 from PyQt5.QtWidgets import QMessageBox
 
 from PyQt5.QtCore import QMetaType
 from qgis.core import QgsField
 
-from ..actions.action_factory import ActionFactory
 from ..utils.utils import Utils
+from .snapshot_store import SnapshotStore
+from .delta_log import DeltaLog
+from .spatial_index import SpatialIndex
+from .simulation import Simulation
+from .temporal_export import TemporalExport
+from .temporal_layers import TemporalLayers
+from .frame_export import FrameExport
+from .timeline_partition import TimelinePartition
+from .trace_polyline import TracePolyline
 
 if TYPE_CHECKING:
     from .map_entity import MapEntity
+    from .action_index import ActionIndex
+    from .timeline import Timeline
     from ..actions.action import Action
 
 class LayerTraceQGIS(QObject):
@@ -36,17 +61,53 @@ class LayerTraceQGIS(QObject):
 
     Cette classe gère les couches vectorielles et les entités utilisées pour suivre les entités et leurs actions dans QGIS.
 
+    L'état de la simulation (entités, actions, entités chargées, lignes et tick) est porté par une Simulation,
+    indépendante de QGIS, dont LayerTraceQGIS reporte les changements dans les couches. Les attributs map_entities,
+    actions, action_index, tick_end, tick, entities_loaded et lines sont ceux de la simulation.
+
     Attributs :
         signal_tick_changed      Signal émis à chaque progression de tick.
         signal_tick_reset        Signal émis lors de la réinitialisation des ticks.
         signal_timer_changed     Signal indiquant un changement d'état du timer.
         signal_entities_updated  Signal émis lorsqu'il y a une mise à jour des entités.
+        signal_playback_stats    Signal émis après chaque tick lu, avec la cadence atteinte (ticks/s) et le nombre d'images sautées.
+        signal_profiling_updated Signal émis avec les statistiques du profilage, au plus une fois par PROFILING_EMIT_INTERVAL.
+        signal_frame_export_progress Signal émis après chaque image écrite par l'export d'images, avec le nombre d'images écrites et le total.
+        signal_frame_export_finished Signal émis à la fin de l'export d'images, True s'il est complet.
+        RENDER_CATEGORIZED       Mode de rendu avec une catégorie de symbole par entité.
+        RENDER_DATA_DEFINED      Mode de rendu avec un symbole unique lisant les champs de la couche.
+        RENDER_FIELDS            Champs de la couche principale lus par le rendu par attributs.
+        LOADED_FILTER            Filtre de la couche principale masquant les entités dont le champ "loaded" vaut 1.
+        LABEL_WIDGETS            Mode d'étiquetage avec un QLabel par entité, positionné à la main.
+        LABEL_NATIVE             Mode d'étiquetage par le moteur d'étiquettes de QGIS, lisant le champ "label".
+        LABEL_REFRESH_INTERVAL   Délai (en millisecondes) de regroupement des changements d'emprise du canevas.
+        PROFILING_EMIT_INTERVAL  Délai minimal (en secondes) entre deux émissions des statistiques du profilage.
+        TRACE_SEGMENTS           Mode de trace avec un segment par déplacement tracé.
+        TRACE_ENTITY             Mode de trace avec une polyligne par entité, prolongée à chaque déplacement tracé.
+        TRACE_MOVE               Mode de trace avec une polyligne par déplacement ininterrompu (ticks consécutifs).
+        TRACE_WRITE_INTERVAL     Nombre de ticks entre deux réécritures des polylignes de trace prolongées pendant la lecture.
         _instance                Instance unique de la classe LayerTraceQGIS, utilisée pour un modèle singleton.
     """
     signal_tick_changed = pyqtSignal(int)
     signal_tick_reset = pyqtSignal(int)
     signal_timer_changed = pyqtSignal(bool)
     signal_entities_updated = pyqtSignal(list)
+    signal_playback_stats = pyqtSignal(float, int)
+    signal_profiling_updated = pyqtSignal(list)
+    signal_frame_export_progress = pyqtSignal(int, int)
+    signal_frame_export_finished = pyqtSignal(bool)
+    RENDER_CATEGORIZED = "categorized"
+    RENDER_DATA_DEFINED = "data_defined"
+    RENDER_FIELDS = ("size", "angle", "opacity", "icon", "highlight", "background")
+    LOADED_FILTER = 'coalesce("loaded", 0) = 0'
+    LABEL_WIDGETS = "widgets"
+    LABEL_NATIVE = "native"
+    LABEL_REFRESH_INTERVAL = 16
+    PROFILING_EMIT_INTERVAL = 0.5
+    TRACE_SEGMENTS = "segments"
+    TRACE_ENTITY = "entity"
+    TRACE_MOVE = "move"
+    TRACE_WRITE_INTERVAL = 25
     _instance = None
 
     @classmethod
@@ -76,6 +137,8 @@ class LayerTraceQGIS(QObject):
             Une liste initiale d'actions à associer.
 
         Attributs :
+        simulation : Simulation
+            Le moteur de simulation, activé comme simulation courante des actions.
         layer : objet
             La couche principale utilisée pour représenter les entités sur la carte.
         layer_lines : objet
@@ -92,6 +155,8 @@ class LayerTraceQGIS(QObject):
             La valeur de fin des tick des actions.
         actions : dict
             Un dictionnaire contenant des actions associées.
+        action_index : ActionIndex
+            L'index d'intervalles des actions, construit dans set_actions.
         timer : QTimer
             Un minuteur pour gérer des rafraîchissements périodiques.
         entities_loaded : dict
@@ -104,40 +169,228 @@ class LayerTraceQGIS(QObject):
             L'identifiant de l'entitées focalisé.
         tick : int
             Le compteur actuel des ticks.
-        lines : liste
-            Une liste des lignes représentées.
+        lines : set
+            L'ensemble des lignes représentées, couples (source, cible) d'identifiants.
+        line_features : dict
+            Les lignes dessinées dans layer_lines : couple (source, cible) -> (identifiant d'entité QGIS, extrémités).
+        snapshot_store : SnapshotStore
+            Les instantanés de l'état de la simulation utilisés par go_to_tick.
+        delta_log : DeltaLog
+            Le journal des modifications tick par tick utilisé pour revenir en arrière.
+        reverse : bool
+            Indique si la lecture se fait en sens inverse.
+        timeline_enabled : bool
+            Indique si la chronologie doit être compilée après chaque définition des actions.
+        timeline : Timeline
+            La chronologie précompilée lue à la place des actions, None si elle n'est pas utilisée.
+        timeline_workers : int
+            Nombre maximal de processus compilant la chronologie (voir TimelinePartition), 0 pour un par processeur.
+        dirty_geometries : dict
+            Les entités QGIS déplacées depuis la dernière écriture dans la couche, par identifiant.
+        pending_traces : list
+            Les segments de trace en attente d'écriture dans la couche trace.
+        trace_feature_ids : dict
+            Les identifiants des segments écrits dans la couche trace, par tick, dans l'ordre croissant des ticks.
+        trace_every_n_ticks : int
+            Politique de décimation : seuls les ticks multiples de cette valeur sont tracés.
+        trace_min_distance : float
+            Politique de décimation : distance minimale (en mètres) parcourue avant de tracer un segment.
+        trace_anchors : dict
+            Le point de départ du prochain segment de chaque entité dont des mouvements ont été ignorés par la décimation.
+        trace_mode : str
+            Le mode de trace, TRACE_SEGMENTS, TRACE_ENTITY ou TRACE_MOVE.
+        trace_tolerance : float
+            Tolérance de simplification des polylignes de trace, en unités de la carte, 0 pour la désactiver.
+        trace_polylines : list
+            Les polylignes de trace, dans l'ordre de création (modes TRACE_ENTITY et TRACE_MOVE).
+        open_polylines : dict
+            La polyligne prolongée par le prochain déplacement tracé de chaque entité.
+        dirty_polylines : list
+            Les polylignes modifiées en attente d'écriture dans la couche trace (TracePolyline.dirty).
+        trace_written_tick : int
+            Le tick de la dernière réécriture des polylignes de trace modifiées.
+        trace_last_moves : dict
+            Le tick du dernier déplacement de chaque entité, pour détecter le début d'un déplacement (mode TRACE_MOVE).
+        render_mode : str
+            Le mode de rendu de la couche principale, RENDER_CATEGORIZED ou RENDER_DATA_DEFINED.
+        data_defined_renderer_applied : bool
+            Indique si le rendu par attributs est déjà appliqué à la couche principale.
+        category_indexes : dict
+            L'indice de la catégorie de chaque entité dans le rendu catégorisé appliqué, None s'il doit être reconstruit.
+        label_mode : str
+            Le mode d'étiquetage des entités, LABEL_WIDGETS ou LABEL_NATIVE.
+        spatial_index : SpatialIndex
+            L'index spatial des positions courantes des entités, par identifiant d'entité QGIS.
+        feature_entities : dict
+            Les entités de la carte par identifiant d'entité QGIS.
+        visible_label_ids : set
+            Les identifiants d'entité QGIS dont l'étiquette a pu être affichée lors de la dernière mise à jour.
+        hidden_ids : set
+            Les identifiants des entités masquées car chargées, d'après le champ "loaded" de la couche principale.
+        label_timer : QTimer
+            Un minuteur regroupant les changements d'emprise du canevas en une mise à jour des étiquettes.
+        clock_start : float
+            L'instant (time.perf_counter) de référence de l'horloge de lecture, None si elle doit être recalée.
+        clock_start_tick : int
+            Le tick affiché à l'instant de référence de l'horloge de lecture.
+        clock_next_tick : int
+            Le tick courant attendu au prochain pas de lecture, l'horloge est recalée s'il a changé entre-temps.
+        frames_dropped : int
+            Le nombre de ticks exécutés sans être affichés pour rattraper le temps réel depuis le démarrage du minuteur.
+        last_refresh_duration : float
+            La durée (en secondes) du dernier rafraîchissement affiché par la lecture.
+        profiler : Profiler
+            Le profileur de la simulation, mesurant la durée de chaque phase du rafraîchissement, désactivé par défaut.
+        profiling_last_emit : float
+            L'instant (time.perf_counter) de la dernière émission des statistiques du profilage.
+        frame_export : FrameExport
+            L'export d'images en cours, None s'il n'y en a pas.
 
         Initialise toutes les valeurs et les couche de fonctionnement en fonction des entitées et des actions
         """
         super().__init__()
 
+        self.simulation = Simulation()
+        self.simulation.move_listener = self.on_entity_moved
+        self.simulation.message_listener = self.on_simulation_message
+        self.simulation.activate()
+
         self.layer = None
         self.layer_lines = None
+        self.line_features = {}
         self.layer_trace = None
+        self.dirty_geometries = {}
+        self.pending_traces = []
+        self.trace_feature_ids = {}
+        self.trace_mode = LayerTraceQGIS.TRACE_SEGMENTS
+        self.trace_tolerance = 0
+        self.trace_polylines = []
+        self.open_polylines = {}
+        self.dirty_polylines = []
+        self.trace_written_tick = 0
+        self.trace_last_moves = {}
+        self.trace_every_n_ticks = 1
+        self.trace_min_distance = 0
+        self.trace_anchors = {}
+        self.render_mode = LayerTraceQGIS.RENDER_CATEGORIZED
+        self.data_defined_renderer_applied = False
+        self.category_indexes = None
+        self.label_mode = LayerTraceQGIS.LABEL_WIDGETS
+        self.spatial_index = SpatialIndex()
+        self.feature_entities = {}
+        self.visible_label_ids = set()
+        self.hidden_ids = set()
+        self.profiler = self.simulation.profiler
+        self.profiling_last_emit = 0.0
+        self.frame_export = None
         self.init_layer()
 
         self.show_name = False
         self.show_position = False
 
-        self.map_entities = []
-        self.set_map_entities(map_entities)
+        self.snapshot_store = SnapshotStore()
+        self.delta_log = DeltaLog()
+        self.timeline_enabled = False
+        self.timeline = None
+        self.timeline_workers = 1
 
-        self.tick_end = 0
-        self.actions = {}
+        self.set_map_entities(map_entities)
         self.set_actions(actions)
 
         self.timer = QTimer()
-        self.timer.timeout.connect(self.refresh)
-
-        self.entities_loaded = {}
+        self.timer.timeout.connect(self.play_step)
 
         self.speed = 1
         self.interval = 1000
         self.focus = 0
-        self.tick = 0
-        self.lines = []
+        self.reverse = False
+
+        self.clock_start = None
+        self.clock_start_tick = 0
+        self.clock_next_tick = 0
+        self.frames_dropped = 0
+        self.last_refresh_duration = 0.0
+
+        self.label_timer = QTimer()
+        self.label_timer.setSingleShot(True)
+        self.label_timer.setInterval(LayerTraceQGIS.LABEL_REFRESH_INTERVAL)
+        self.label_timer.timeout.connect(self.update_all_labels)
+
+        iface.mapCanvas().extentsChanged.connect(self.schedule_label_update)
+
+    @property
+    def map_entities(self) -> dict:
+        return self.simulation.map_entities
+
+    @map_entities.setter
+    def map_entities(self, value: dict):
+        self.simulation.map_entities = value
+
+    @property
+    def actions(self) -> list:
+        return self.simulation.actions
+
+    @actions.setter
+    def actions(self, value: list):
+        self.simulation.actions = value
+
+    @property
+    def action_index(self) -> 'ActionIndex':
+        return self.simulation.action_index
 
-        iface.mapCanvas().extentsChanged.connect(self.update_all_labels)
+    @property
+    def tick_end(self) -> int:
+        return self.simulation.tick_end
+
+    @tick_end.setter
+    def tick_end(self, value: int):
+        self.simulation.tick_end = value
+
+    @property
+    def tick(self) -> int:
+        return self.simulation.tick
+
+    @tick.setter
+    def tick(self, value: int):
+        self.simulation.tick = value
+
+    @property
+    def entities_loaded(self) -> dict:
+        return self.simulation.entities_loaded
+
+    @entities_loaded.setter
+    def entities_loaded(self, value: dict):
+        self.simulation.entities_loaded = value
+
+    @property
+    def lines(self) -> set:
+        return self.simulation.lines
+
+    @lines.setter
+    def lines(self, value: set):
+        self.simulation.lines = value
+
+    def on_entity_moved(self, map_entity: 'MapEntity', old_lat: float, old_lon: float):
+        """
+        Reçoit de la simulation le déplacement d'une entité par une action et l'enregistre dans la couche trace.
+
+        Paramètres:
+        map_entity (MapEntity): L'entité déplacée.
+        old_lat (float): La latitude avant le déplacement.
+        old_lon (float): La longitude avant le déplacement.
+        """
+        self.log_trace(map_entity, QgsPointXY(old_lon, old_lat))
+
+    def on_simulation_message(self, message: str, level: str):
+        """
+        Enregistre un message de la simulation dans les journaux de QGIS.
+
+        Paramètres:
+        message (str): Le message.
+        level (str): Simulation.MESSAGE_INFO ou Simulation.MESSAGE_WARNING.
+        """
+        qgis_level = Qgis.Warning if level == Simulation.MESSAGE_WARNING else Qgis.Info
+        QgsMessageLog.logMessage(message, "Trace QGIS", level=qgis_level)
 
     def init_layer(self):
         """
@@ -153,10 +406,10 @@ class LayerTraceQGIS(QObject):
 
         Méthodes et fonctionnalités :
         - Vérifie l'existence d'un groupe "Trace QGIS" dans l'arborescence des couches du projet. Si le groupe n'existe pas, il est créé.
-        - Initialise une couche vectorielle en mémoire de type "Point", nommée "Entity", avec deux attributs : un entier ("id") et une chaîne ("nom"). Cette couche est ajoutée au groupe "Trace QGIS".
+        - Initialise une couche vectorielle en mémoire de type "Point", nommée "Entity", avec deux attributs : un entier ("id") et une chaîne ("nom"), suivis des champs lus par le rendu par attributs (taille, angle, opacité, icône, surbrillance et arrière-plan), du texte de l'étiquette native ("label") et de l'indicateur de chargement ("loaded"). La couche est filtrée une fois pour toutes sur ce dernier (LOADED_FILTER) et ajoutée au groupe "Trace QGIS".
         - Initialise une couche vectorielle en mémoire de type "LineString", nommée "Communication", avec un rendu spécifique basé sur un symbole de flèche noire finement ajusté.
         - Applique un rendu personnalisé à la couche "Communication" avec une flèche noire pointillée pour mieux représenter les connexions ou les directions.
-        - Crée une seconde couche vectorielle en mémoire de type "LineString", nommée "Traces Mouvements", destinée à représenter les mouvements. Elle possède deux attributs : un entier ("id") et une chaîne ("nom"), et utilise un simple rendu de ligne.
+        - Crée une seconde couche vectorielle en mémoire de type "LineString", nommée "Traces Mouvements", destinée à représenter les mouvements. Elle possède trois attributs : un identifiant ("id"), une chaîne ("nom") et le tick du mouvement ("tick"), et utilise un simple rendu de ligne.
         - Ajoute chaque couche nouvellement créée au projet et les regroupe dans le dossier "Trace QGIS" pour faciliter leur gestion.
 
         Cette fonction permet d'automatiser l'ajout et la configuration des couches géographiques en mémoire pour des projets QGIS spécifiques comportant des entités, des communications et des traces de mouvement.
@@ -170,15 +423,25 @@ class LayerTraceQGIS(QObject):
 
         self.layer.dataProvider().addAttributes([
             QgsField("id", QMetaType.QString),  # entier
-            QgsField("nom", QMetaType.QString)  # chaîne
+            QgsField("nom", QMetaType.QString),  # chaîne
+            QgsField("size", QMetaType.Double),  # champs du rendu par attributs
+            QgsField("angle", QMetaType.Double),
+            QgsField("opacity", QMetaType.Double),
+            QgsField("icon", QMetaType.QString),
+            QgsField("highlight", QMetaType.QString),
+            QgsField("background", QMetaType.QString),
+            QgsField("label", QMetaType.QString),  # texte de l'étiquette native
+            QgsField("loaded", QMetaType.Int)  # 1 si l'entité est chargée dans une autre
         ])
 
         self.layer.updateFields()
+        self.layer.setSubsetString(LayerTraceQGIS.LOADED_FILTER)
         QgsProject.instance().addMapLayer(self.layer, False)
         group.addLayer(self.layer)
 
         # Création de la couche mémoire en LineString
         self.layer_lines = QgsVectorLayer("LineString?crs=EPSG:4326", "Communication", "memory")
+        self.line_features = {}
 
         # Création du symbole de ligne principal (pointillé)
         line_symbol = QgsLineSymbol()
@@ -208,7 +471,8 @@ class LayerTraceQGIS(QObject):
 
         self.layer_trace.dataProvider().addAttributes([
             QgsField("id", QMetaType.QString),  # entier
-            QgsField("nom", QMetaType.QString)  # chaîne
+            QgsField("nom", QMetaType.QString),  # chaîne
+            QgsField("tick", QMetaType.Int)  # tick du mouvement
         ])
         self.layer_trace.updateFields()
 
@@ -228,7 +492,7 @@ class LayerTraceQGIS(QObject):
         interval (int): Définit l'intervalle à 1000.
         focus (int): Réinitialise le focus à 0.
         tick (int): Réinitialise le compteur de ticks à 0.
-        lines (List): Réinitialise la liste des lignes à une liste vide.
+        lines (set): Réinitialise l'ensemble des lignes à un ensemble vide.
         entities_loaded (dict): Réinitialise les entités chargées.
 
         Actions:
@@ -240,7 +504,7 @@ class LayerTraceQGIS(QObject):
         self.interval = 1000
         self.focus = 0
         self.tick = 0
-        self.lines = []
+        self.lines = set()
         self.entities_loaded = {}
 
         for map_entity in self.map_entities.values():
@@ -266,11 +530,34 @@ class LayerTraceQGIS(QObject):
         self.layer.dataProvider().truncate()
         self.layer_trace.dataProvider().truncate()
 
-        self.map_entities = {mapEntity.get_id(): mapEntity for mapEntity in map_entities}
+        self.simulation.set_map_entities(map_entities)
+        self.dirty_geometries = {}
+        self.pending_traces = []
+        self.trace_feature_ids = {}
+        self.trace_anchors = {}
+        self.trace_polylines = []
+        self.open_polylines = {}
+        self.dirty_polylines = []
+        self.trace_last_moves = {}
+        self.data_defined_renderer_applied = False
+        self.category_indexes = None
+        self.spatial_index.clear()
+        self.feature_entities = {}
+        self.visible_label_ids = set()
+        self.hidden_ids = set()
+        self.snapshot_store.clear()
+        self.delta_log.clear()
+        self.timeline = None
 
         for map_entity in self.map_entities.values():
             self.layer.dataProvider().addFeature(map_entity.feature)
-            map_entity.update_label_position(self.show_name, self.show_position)
+            self.feature_entities[map_entity.feature.id()] = map_entity
+            self.update_spatial_index(map_entity.feature)
+            if self.label_mode == LayerTraceQGIS.LABEL_WIDGETS:
+                map_entity.update_label_position(self.show_name, self.show_position)
+
+        if self.label_mode == LayerTraceQGIS.LABEL_NATIVE:
+            self.update_label_texts(self.map_entities.values())
 
         self.apply_renderer()
         self.apply_trace_renderer()
@@ -289,37 +576,35 @@ class LayerTraceQGIS(QObject):
         actions (list): Une liste de dictionnaires représentant les actions.
 
         Traitement:
-        - Initialise la liste `self.actions` en tant que liste d'objets 'Action'.
-        - Pour chaque dictionnaire dans `actions`, tente de créer une instance d'Action via `ActionFactory.action_from_dict`.
-        - Ajoute l'action créée à la liste `self.actions`.
-        - Si une erreur de type `ValueError` est levée lors de la création d'une action,
-          un message est enregistré dans les journaux de QGIS avec un niveau d'avertissement (Qgis.Warning).
-        - Met à jour `self.tick_end` avec la valeur la plus élevée de la propriété `end_at` parmi toutes les actions,
-          avec une valeur par défaut de 0.
+        - Crée les actions, calcule `self.tick_end` et construit l'index d'intervalles dans la simulation
+          (voir Simulation.set_actions). Une action invalide est signalée dans les journaux de QGIS avec un niveau
+          d'avertissement (Qgis.Warning).
+        - Supprime les instantanés et le journal des modifications devenus obsolètes.
+        - Compile la chronologie si la lecture depuis la chronologie précompilée est activée.
         - La méthode émet un signal contenant le tick le plus elever pour l'interface.
 
         Exceptions:
         - Enregistre une erreur dans le journal si une action ne peut pas être créée à partir du dictionnaire fourni.
         """
-        self.actions: list['Action'] = []
-        for action_dict in actions:
-            try:
-                action = ActionFactory.action_from_dict(action_dict)
-                self.actions.append(action)
-            except ValueError as e:
-                QgsMessageLog.logMessage(f"Erreur lors de la création d'une action : {e}", "Trace QGIS", level=Qgis.Warning)
-
-        self.tick_end = max((action.end_at for action in self.actions), default=0)
+        self.simulation.set_actions(actions)
+        self.snapshot_store.clear()
+        self.delta_log.clear()
+        self.timeline = None
+        if self.timeline_enabled:
+            self.compile_timeline()
         self.signal_tick_reset.emit(self.tick_end)
 
     def get_active_actions(self) -> list['Action']:
         """
         Retourne toutes les actions actives par rapport au tick actuel
 
+        L'index d'intervalles ne traite que les actions qui débutent ou se terminent lorsque les ticks
+        se suivent, il ne reparcourt toutes les actions qu'en cas de saut dans le temps.
+
         Retour :
             list['Action']: Liste des actions actives.
         """
-        return [action for action in self.actions if action.is_active_at(self.tick)]
+        return self.simulation.get_active_actions()
 
     def need_refresh_categories(self) -> bool:
         """
@@ -342,7 +627,22 @@ class LayerTraceQGIS(QObject):
     def apply_renderer(self):
         """
         Génère la liste des catégories pour le layer des entitées
+
+        Le rendu catégorisé n'est entièrement reconstruit que si des entités ont été ajoutées ou supprimées depuis
+        sa dernière construction. Sinon, seuls les symboles des entités dont la catégorie a changé sont remplacés
+        dans le rendu existant via update_categories.
+
+        En mode RENDER_DATA_DEFINED, le rendu n'est pas reconstruit : seuls les champs des entités modifiées
+        sont écrits dans la couche via apply_data_defined_renderer.
         """
+        if self.render_mode == LayerTraceQGIS.RENDER_DATA_DEFINED:
+            self.apply_data_defined_renderer()
+            return
+
+        if self.category_indexes is not None and self.category_indexes.keys() == self.map_entities.keys():
+            self.update_categories()
+            return
+
         categories = []
 
         for mapEntity in self.map_entities.values():
@@ -351,15 +651,147 @@ class LayerTraceQGIS(QObject):
         # Applique un rendu catégorisé basé sur l'attribut "icon"
         renderer = QgsCategorizedSymbolRenderer("id", categories)
         self.layer.setRenderer(renderer)
+        self.category_indexes = {entity_id: index for index, entity_id in enumerate(self.map_entities.keys())}
+
+    def update_categories(self):
+        """
+        Remplace dans le rendu catégorisé de la couche principale le symbole des entités dont la catégorie a changé.
+        """
+        renderer = self.layer.renderer()
+        for entity_id, map_entity in self.map_entities.items():
+            if map_entity.get_need_refresh_category():
+                category = map_entity.get_category()
+                renderer.updateCategorySymbol(self.category_indexes[entity_id], category.symbol().clone())
+
+    def apply_data_defined_renderer(self):
+        """
+        Applique le rendu par attributs puis écrit les champs des entités dont l'état visuel a changé.
+
+        Le symbole unique n'est appliqué à la couche qu'une seule fois, tous les champs sont alors écrits.
+        Ensuite, chaque rafraîchissement se limite à une écriture groupée des attributs.
+        """
+        force = not self.data_defined_renderer_applied
+        if force:
+            self.layer.setRenderer(QgsSingleSymbolRenderer(LayerTraceQGIS.build_data_defined_symbol()))
+            self.data_defined_renderer_applied = True
+
+        self.update_entity_attributes(force)
+
+    @staticmethod
+    def build_data_defined_symbol() -> QgsMarkerSymbol:
+        """
+        Construit le symbole unique du rendu par attributs.
+
+        Les couches symboliques reprennent celles de MapEntity.build_symbol, mais leurs propriétés sont lues
+        dans les champs de l'entité par des propriétés définies par les données :
+        - La surbrillance et l'arrière-plan ne sont activés que si leur champ est renseigné.
+        - L'icône et l'arrière-plan lisent le chemin de leur image dans les champs "icon" et "background".
+        - La taille, l'angle et l'opacité sont lus dans les champs "size", "angle" et "opacity".
+
+        Retourne:
+        QgsMarkerSymbol: Le symbole à utiliser avec un QgsSingleSymbolRenderer.
+        """
+        symbol = QgsMarkerSymbol()
+        symbol.deleteSymbolLayer(0)
+        symbol.setDataDefinedProperty(QgsSymbol.PropertyOpacity, QgsProperty.fromExpression('"opacity" * 100'))
+
+        glow_effect = QgsOuterGlowEffect()
+        glow_effect.setSpread(5)
+        glow_effect.setBlurLevel(1)
+        glow_layer = QgsSimpleMarkerSymbolLayer()
+        glow_layer.setPaintEffect(glow_effect)
+        glow_layer.setDataDefinedProperty(QgsSymbolLayer.PropertyLayerEnabled, QgsProperty.fromExpression('"highlight" IS NOT NULL'))
+        glow_layer.setDataDefinedProperty(QgsSymbolLayer.PropertyFillColor, QgsProperty.fromField("highlight"))
+        glow_layer.setDataDefinedProperty(QgsSymbolLayer.PropertySize, QgsProperty.fromField("size"))
+        symbol.appendSymbolLayer(glow_layer)
+
+        background_layer = QgsRasterMarkerSymbolLayer("")
+        background_layer.setOpacity(0.5)
+        background_layer.setDataDefinedProperty(QgsSymbolLayer.PropertyLayerEnabled, QgsProperty.fromExpression('"background" IS NOT NULL'))
+        background_layer.setDataDefinedProperty(QgsSymbolLayer.PropertyName, QgsProperty.fromField("background"))
+        background_layer.setDataDefinedProperty(QgsSymbolLayer.PropertySize, QgsProperty.fromExpression('"size" * 3'))
+        symbol.appendSymbolLayer(background_layer)
+
+        raster_layer = QgsRasterMarkerSymbolLayer("")
+        raster_layer.setDataDefinedProperty(QgsSymbolLayer.PropertyName, QgsProperty.fromField("icon"))
+        raster_layer.setDataDefinedProperty(QgsSymbolLayer.PropertySize, QgsProperty.fromField("size"))
+        raster_layer.setDataDefinedProperty(QgsSymbolLayer.PropertyAngle, QgsProperty.fromField("angle"))
+        symbol.appendSymbolLayer(raster_layer)
+
+        return symbol
+
+    def update_entity_attributes(self, force: bool = False):
+        """
+        Écrit dans la couche principale, en un seul appel à changeAttributeValues, les champs du rendu par attributs.
+
+        Paramètres:
+        force (bool): Si True, les champs de toutes les entités sont écrits, sinon seulement ceux des entités
+                      dont la catégorie nécessite une mise à jour.
+        """
+        fields = self.layer.fields()
+        indexes = {name: fields.indexOf(name) for name in LayerTraceQGIS.RENDER_FIELDS}
+
+        changes = {}
+        for map_entity in self.map_entities.values():
+            if not force and not map_entity.get_need_refresh_category():
+                continue
+            attributes = map_entity.get_render_attributes()
+            changes[map_entity.feature.id()] = {indexes[name]: value for name, value in attributes.items()}
+
+        if changes:
+            self.layer.dataProvider().changeAttributeValues(changes)
+
+    def set_render_mode(self, mode: str):
+        """
+        Change le mode de rendu de la couche principale puis l'applique.
+
+        Paramètres:
+        mode (str): RENDER_CATEGORIZED ou RENDER_DATA_DEFINED.
+
+        Exceptions:
+        ValueError: Levée si le mode de rendu n'est pas reconnu.
+        """
+        if mode not in (LayerTraceQGIS.RENDER_CATEGORIZED, LayerTraceQGIS.RENDER_DATA_DEFINED):
+            raise ValueError(f"Mode de rendu inconnu : {mode}")
+
+        self.render_mode = mode
+        self.data_defined_renderer_applied = False
+        self.category_indexes = None
+
+        if mode == LayerTraceQGIS.RENDER_CATEGORIZED:
+            # Les catégories n'ont pas été tenues à jour pendant le rendu par attributs
+            for map_entity in self.map_entities.values():
+                map_entity.set_need_refresh_category(True)
+
+        self.apply_renderer()
+        self.layer.triggerRepaint()
+
+    def toggle_data_defined_renderer(self, state: bool):
+        """
+        Permet d'utiliser le rendu par attributs au lieu du rendu catégorisé.
+
+        Paramètres:
+        state (bool): True pour le rendu par attributs, False pour le rendu catégorisé.
+        """
+        self.set_render_mode(LayerTraceQGIS.RENDER_DATA_DEFINED if state else LayerTraceQGIS.RENDER_CATEGORIZED)
 
     def apply_trace_renderer(self):
         """
-        Génère la liste des catégories pour le layer des mouvements des entitées, elle génères une couleur unique
-        en fonction des ID des entitées
+        Applique à la couche des mouvements le rendu généré par build_trace_renderer.
         """
         if not self.layer_trace:
             return
 
+        self.layer_trace.setRenderer(self.build_trace_renderer())
+
+    def build_trace_renderer(self) -> QgsCategorizedSymbolRenderer:
+        """
+        Génère la liste des catégories pour le layer des mouvements des entitées, elle génères une couleur unique
+        en fonction des ID des entitées
+
+        Retourne:
+        QgsCategorizedSymbolRenderer: Le rendu catégorisé sur le champ "id".
+        """
         categories = []
 
         # Extraire les entités actuelles pour connaître les IDs présents
@@ -371,14 +803,16 @@ class LayerTraceQGIS(QObject):
             category = QgsRendererCategory(mapEntity.get_id(), symbol, f"Trace {mapEntity.get_name()}")
             categories.append(category)
 
-        renderer = QgsCategorizedSymbolRenderer("id", categories)
-        self.layer_trace.setRenderer(renderer)
+        return QgsCategorizedSymbolRenderer("id", categories)
 
     def refresh(self) -> bool:
         """
         Permet d'executer les actions en fonction du tick actuel et de passer au suivant.
 
         La méthode émet un signal contenant le tick actuel pour l'interface.
+        Les modifications du tick sont enregistrées dans le journal des modifications.
+        Si une chronologie a été compilée, l'état du tick y est lu au lieu d'exécuter les actions.
+        Si le profilage est activé, la durée de chaque phase est mesurée.
 
         Retourne:
             bool: True si la méthode a réussi à poursuivre la mise à jour, sinon False.
@@ -387,12 +821,24 @@ class LayerTraceQGIS(QObject):
             self.stop_timer()
             return False
 
+        profiler = self.profiler
         try:
-            self.reset_before_refresh()
-
-            self.refresh_action()
-            self.refresh_line()
-            self.refresh_focus()
+            with profiler.measure("refresh"):
+                if self.timeline is not None:
+                    with profiler.measure("timeline"):
+                        self.refresh_timeline()
+                else:
+                    self.record_snapshot()
+                    self.delta_log.begin(self.tick, self.entities_loaded, self.lines)
+                    with profiler.measure("reset_before_refresh"):
+                        self.reset_before_refresh()
+                    self.refresh_action()
+                    self.delta_log.commit(self.map_entities.values(), self.entities_loaded, self.lines)
+
+                with profiler.measure("refresh_line"):
+                    self.refresh_line()
+                with profiler.measure("refresh_focus"):
+                    self.refresh_focus()
 
             self.signal_tick_changed.emit(self.tick)
         except Exception as e:
@@ -401,387 +847,1245 @@ class LayerTraceQGIS(QObject):
             return False
 
         self.tick += 1
+        self.emit_profiling()
         return True
 
     def go_to_tick(self, to: int):
         """
-        Rejous toutes les actions de 0 pour aller jusque l'étape tick "to"
+        Rejoue les actions depuis l'état connu le plus proche pour aller jusque l'étape tick "to"
 
         Paramètres:
         to (int): L'étape cible jusqu'à laquelle le processus doit avancer.
 
         Comportement:
-        - Réinitialise les entités cartographiques en appelant leur fonction reset.
-        - Débute une édition de la couche trace, vide ses données, et valide les changements.
-        - Réinitialise et recharge les entités.
-        - Met à jour le style ou le rendu à utiliser.
-        - Avance jusqu'à l'étape cible en réinitialisant et en actualisant l'état à chaque tick.
-        - Effectue une actualisation finale pour synchroniser avec l'état atteint.
+        - Si une chronologie a été compilée, l'état du tick précédent la cible y est lu directement.
+        - Si l'état courant est antérieur à la cible et plus proche que tout instantané, la lecture reprend depuis l'état courant.
+        - Sinon, si un instantané antérieur à la cible existe, il est restauré.
+        - Sinon, réinitialise les entités, vide la couche trace et les entités chargées puis repart du tick 0.
+        - Avance jusqu'à l'étape cible en réinitialisant et en actualisant l'état à chaque tick, en enregistrant les instantanés et le journal des modifications au passage.
+        - Écrit en une fois dans les couches les géométries déplacées et les traces enregistrées pendant la relecture.
+        - Effectue une actualisation finale pour synchroniser avec l'état atteint, puis simplifie les polylignes de trace.
+        - Si le profilage est activé, mesure la durée totale du déplacement et celle de la relecture.
 
         Renvoie:
         bool: Retourne True après avoir procédé avec succès au déplacement jusqu'à l'étape spécifiée.
         """
-        for map_entity in self.map_entities.values():
-            map_entity.reset()
+        with self.profiler.measure("go_to_tick"):
+            if self.timeline is not None:
+                with self.profiler.measure("seek"):
+                    self.apply_timeline(to - 1)
+                    self.rebuild_trace(to - 1)
+                self.tick = to
+                self.refresh()
+                self.simplify_traces()
+                return True
 
-        self.layer_trace.startEditing()
-        self.layer_trace.dataProvider().truncate()
-        self.layer_trace.commitChanges()
+            snapshot_tick, snapshot = self.snapshot_store.get_nearest(to)
 
-        self.entities_loaded = {}
-        self.apply_renderer()
+            resume_from_current = 0 < self.tick <= to and (snapshot_tick is None or snapshot_tick <= self.tick)
 
-        self.tick = 0
-        while self.tick < to:
-            self.reset_before_refresh()
-            self.refresh_action(True)
-            self.tick += 1
+            with self.profiler.measure("seek"):
+                if not resume_from_current and snapshot is not None:
+                    self.restore_snapshot(snapshot_tick, snapshot)
+                    self.delta_log.truncate_from(snapshot_tick)
+                    self.clear_changes()
+                elif not resume_from_current:
+                    self.reset_simulation()
 
-        self.refresh()
+                self.skip_to_tick(to)
 
-        return True
+                self.flush_geometries()
+                self.flush_traces()
 
-    def reset_before_refresh(self):
-        """
-        Réinitialise les entités et leurs attributs visuels avant un rafraîchissement.
+            self.refresh()
+            self.simplify_traces()
 
-        Efface toutes les lignes actuelles. Parcourt les entités mappées et réinitialise leurs propriétés visuelles comme suit :
-        - Réinitialise le texte des entités.
-        - En cas de nécessité, réinitialise l'icône des entités après une action de changement d'icône.
-        - En cas de nécessité, réinitialise la mise en surbrillance des entités après une action de surbrillance.
-        - En cas de nécessité, réinitialise l'image de fond des entités après une action sur l'arrière-plan.
-        """
-        self.lines = []
-        for mapEntity in self.map_entities.values():
-            mapEntity.reset_text()
-            if self.in_last_action('ActionChangeIcon'):
-                mapEntity.reset_icon()
-            if self.in_last_action('ActionHighlight'):
-                mapEntity.reset_highlight()
-            if self.in_last_action('ActionBackground'):
-                mapEntity.reset_background_image()
+        return True
 
-    def in_last_action(self, action_name: str) -> bool:
+    def step_backward(self) -> bool:
         """
-        Détermine si une action spécifique a eu lieu au dernier tick.
+        Revient d'un tick en arrière en annulant les modifications du dernier tick affiché.
 
-        Paramètres:
-        action_name (str): Le nom de la classe de l'action pour laquelle vérifier l'occurrence.
+        La méthode émet un signal contenant le tick affiché pour l'interface.
 
-        Retourne:
-        bool: Retourne True si l'action spécifiée a eu lieu à la fin du dernier tick. Sinon, retourne False.
+        Comportement:
+        - Arrête la lecture si le début de la chronologie est atteint.
+        - Si une chronologie a été compilée, l'état du tick précédent y est lu, puis les traces du tick affiché sont supprimées.
+        - Si le tick affiché est présent dans le journal des modifications, restaure les anciennes valeurs
+          des propriétés modifiées, des entités chargées et des lignes, puis supprime ses traces.
+        - Sinon, se replace sur le tick précédent via go_to_tick.
 
-        Exceptions:
-        ValueError: Exception lancée si le nom de l'action donné ne correspond pas à une classe d'action reconnue.
+        Retourne:
+            bool: True si le retour en arrière a réussi, sinon False.
         """
-        # Dictionnaire des classes possibles
-        from ..actions.action_change_icon import ActionChangeIcon
-        from ..actions.action_highlight import ActionHighlight
-        from ..actions.action_background import ActionBackground
+        displayed_tick = self.tick - 1
+        if displayed_tick < 1:
+            self.stop_timer()
+            return False
 
-        action_classes = {
-            "ActionChangeIcon": ActionChangeIcon,
-            "ActionHighlight": ActionHighlight,
-            "ActionBackground": ActionBackground,
-        }
+        delta = self.delta_log.get(displayed_tick)
+        if self.timeline is None and delta is None:
+            return self.go_to_tick(displayed_tick - 1)
 
-        action_type = action_classes.get(action_name)
-        if action_type is None:
-            raise ValueError(f"Action '{action_name}' non reconnue.")
+        try:
+            if self.timeline is not None:
+                self.apply_timeline(displayed_tick - 1, displayed_tick)
+                self.delete_trace_from(displayed_tick)
+            else:
+                self.undo_delta(displayed_tick, delta)
+            self.tick = displayed_tick
 
-        return any(
-            isinstance(act, action_type) and (act.end_at + 1) == self.tick
-            for act in self.actions
-        )
+            self.apply_load_filter()
+            self.refresh_display()
+            self.refresh_line()
+            self.refresh_focus()
 
+            self.signal_tick_changed.emit(displayed_tick - 1)
+        except Exception as e:
+            QMessageBox.warning(self, "Erreur", str(e))
+            self.stop_timer()
+            return False
 
-    def refresh_action(self, fast: bool = False):
+        return True
+
+    def undo_delta(self, tick: int, delta: dict):
         """
-        Partie du refresh qui traite les actions.
+        Annule les modifications d'un tick enregistrées dans le journal des modifications.
 
-        Paramètres :
-        fast (bool) : Indique si l'actualisation doit être rapide ou complète.
-                      Si True, les actions liées a l'interface ne sont pas executée.
+        Paramètres:
+        tick (int): Le tick dont les modifications sont annulées.
+        delta (dict): L'entrée du journal correspondant au tick.
+        """
+        for entity_id, changes in delta["entities"].items():
+            map_entity = self.map_entities.get(entity_id)
+            if not map_entity:
+                continue
+            for name, (old_value, new_value) in changes.items():
+                map_entity.set_property(name, old_value)
+            map_entity.clear_changes()
 
-        Procédé :
-        1. Récupère et trie les actions en fonction des prioritées.
-        2. Exécute chaque action active si son entité associée n'est pas encore chargée,
-           sinon enregistre un message dans les journaux QGIS.
-        3. Rafraîchit le chargement des ressources.
-        4. Si l'actualisation n'est pas rapide (fast=False) :
-            - Vérifie si les catégories doivent être rafraîchies et applique le moteur de rendu si nécessaire.
-            - Met à jour la position des étiquettes pour les entités de la carte nécessitant une actualisation en fonction des configurations.
-            - Déclenche le repaint des couches (principale et de trace).
-        """
-        actions_active = self.get_active_actions()
-        actions_active = Utils.sort_actions(actions_active)
-
-        for action in actions_active:
-            if not self.is_loaded_by_id(action.entity_id):
-                action.execute()
-            else:
-                QgsMessageLog.logMessage("Action non traité car entity load\n" + str(action), "Trace QGIS", level=Qgis.Info)
+        if delta["entities_loaded"] is not None:
+            self.entities_loaded = DeltaLog.copy_entities_loaded(delta["entities_loaded"][0])
 
-        self.refresh_load()
+        if delta["lines"] is not None:
+            self.lines = set(delta["lines"][0])
 
-        if not fast:
-            if self.need_refresh_categories():
-                self.apply_renderer()
+        self.delete_trace_from(tick)
 
-            for map_entity in self.map_entities_need_refresh_labels():
-                if not self.is_loaded(map_entity):
-                    map_entity.update_label_position(self.show_name, self.show_position)
-                else:
-                    map_entity.update_label_position(False, False)
+    def skip_to_tick(self, to: int):
+        """
+        Exécute en mode rapide, sans mettre à jour l'affichage, les ticks depuis le tick courant jusqu'au tick "to" exclu.
 
-            self.layer.triggerRepaint()
-            self.layer_trace.triggerRepaint()
+        Les instantanés et le journal des modifications sont enregistrés au passage. Si une chronologie a été compilée,
+        l'état de chaque tick y est lu au lieu d'exécuter les actions.
 
+        Paramètres:
+        to (int): Le tick auquel s'arrêter, il reste à traiter.
+        """
+        while self.tick < to:
+            if self.timeline is not None:
+                self.apply_timeline(self.tick, self.tick - 1, True)
+            else:
+                self.record_snapshot()
+                self.delta_log.begin(self.tick, self.entities_loaded, self.lines)
+                self.reset_before_refresh()
+                self.refresh_action(True)
+                self.delta_log.commit(self.map_entities.values(), self.entities_loaded, self.lines)
+            self.tick += 1
 
-    def refresh_line(self):
+    def play_step(self) -> bool:
         """
-        Partie du refresh qui traite les lignes entre entitées.
+        Avance ou recule d'un tick selon le sens de lecture, appelée à chaque déclenchement du minuteur.
+
+        En lecture normale, l'horloge de lecture compare le temps réel écoulé à la vitesse demandée. Si l'affichage
+        a pris du retard, les ticks intermédiaires sont exécutés en mode rapide via skip_to_tick et comptés comme
+        images sautées, puis le tick attendu est affiché. La cadence atteinte est émise après chaque tick lu.
+
+        Retourne:
+            bool: True si le tick a pu être traité, sinon False.
         """
-        self.layer_lines.startEditing()
+        if self.reverse:
+            return self.step_backward()
 
-        self.layer_lines.dataProvider().truncate()
-        if self.lines:
-            for line in self.lines:
-                self.draw_line_between(line[0], line[1])
+        now = time.perf_counter()
+        if self.clock_start is None or self.clock_next_tick != self.tick:
+            self.restart_playback_clock(now)
 
-        self.layer_lines.commitChanges()
+        due_tick = min(self.clock_start_tick + round((now - self.clock_start) * self.get_ticks_per_second()), self.tick_end)
+        if due_tick > self.tick:
+            self.frames_dropped += due_tick - self.tick
+            self.skip_to_tick(due_tick)
 
-        self.layer_lines.triggerRepaint()
+        result = self.refresh()
+        self.last_refresh_duration = time.perf_counter() - now
+        self.clock_next_tick = self.tick
 
-    # TIMER SECTION
-    def start_timer(self):
+        elapsed = time.perf_counter() - self.clock_start
+        ticks_per_second = (self.tick - 1 - self.clock_start_tick) / elapsed if elapsed > 0 else 0.0
+        self.signal_playback_stats.emit(ticks_per_second, self.frames_dropped)
+
+        return result
+
+    def restart_playback_clock(self, now: float = None):
         """
-        Démarre le minuteur à une vitesse déterminée par l'intervalle et la vitesse actuelle.
+        Recale l'horloge de lecture sur le tick affiché.
 
-        La méthode émet un signal indiquant le départ du minuteur.
+        Paramètres:
+        now (float): L'instant de référence (time.perf_counter), l'instant courant si None.
         """
-        self.timer.start(self.interval // self.speed)
-        self.signal_timer_changed.emit(True)
+        self.clock_start = time.perf_counter() if now is None else now
+        self.clock_start_tick = self.tick - 1
+        self.clock_next_tick = self.tick
 
-    def change_interval_timer(self, speed: int):
+    def get_ticks_per_second(self) -> float:
         """
-        Modifie l'intervalle du minuteur en fonction de la vitesse donnée.
+        Retourne la cadence de lecture demandée, déduite de l'intervalle et de la vitesse du minuteur.
 
-        Arguments:
-        speed (int): La vitesse souhaitée
+        Retourne:
+            float: Le nombre de ticks à afficher par seconde.
         """
-        self.speed = speed
-        if self.speed <= 0:
-            self.speed = 1  # éviter division par 0
-        self.timer.setInterval(1000 // self.speed)
+        return self.speed * 1000 / self.interval
 
-    def stop_timer(self):
+    def toggle_reverse(self, state: bool):
         """
-        Arrête le minuteur en cours d'exécution.
+        Permet de lire l'animation en sens inverse.
 
-        La méthode émet un signal indiquant l'arret du minuteur.
+        Paramètres:
+        state (bool): True pour lire en sens inverse, False pour lire normalement.
         """
-        self.timer.stop()
-        self.signal_timer_changed.emit(False)
+        self.reverse = state
 
-    def toggle_timer(self, is_active: bool = True):
+    def clear_changes(self):
         """
-        Cette méthode permet de basculer l'état du minuteur.
-        Si le minuteur est actif, il est arrêté.
-        Sinon, il le démarre
+        Vide les modifications en attente de toutes les entités, pour qu'elles ne soient pas attribuées au prochain tick.
         """
-        if is_active:
-            self.start_timer()
-        else:
-            self.stop_timer()
+        self.simulation.clear_changes()
 
-    # INTERFACE SECTION
-    def draw_line_between(self, idFeature1: str, idFeature2: str):
+    def take_snapshot(self) -> dict:
         """
-        Dessine une ligne directe entre deux entités sur layer_lines.
+        Capture l'état complet de la simulation au début du tick courant.
+
+        Retourne:
+        dict: L'état de chaque entité, les entités chargées et les lignes.
         """
-        feature1 = self.map_entities.get(idFeature1)
-        feature2 = self.map_entities.get(idFeature2)
-        if not feature1 or not feature2:
-            QgsMessageLog.logMessage(f"Feature {idFeature1} ou {idFeature2} est introuvable.", level=Qgis.Warning)
-            return
+        return {
+            "entities": {entity_id: map_entity.get_state() for entity_id, map_entity in self.map_entities.items()},
+            "entities_loaded": {entity_id: list(entity_list) for entity_id, entity_list in self.entities_loaded.items()},
+            "lines": set(self.lines),
+        }
 
-        geom1 = feature1.feature.geometry()
-        geom2 = feature2.feature.geometry()
+    def record_snapshot(self):
+        """
+        Enregistre un instantané de l'état courant si le tick courant tombe sur l'intervalle du magasin d'instantanés.
+        """
+        if self.snapshot_store.need_snapshot(self.tick):
+            self.snapshot_store.store(self.tick, self.take_snapshot())
 
-        if not geom1.isGeosValid() or not geom2.isGeosValid() or geom1.isEmpty() or geom2.isEmpty():
-            QgsMessageLog.logMessage(
-                f"Une ou les deux géométries de {idFeature1} et {idFeature2} sont invalides ou vides.",
-                level=Qgis.Warning)
-            return
+    def restore_snapshot(self, tick: int, snapshot: dict):
+        """
+        Restaure l'état de la simulation à partir d'un instantané.
 
-        point1 = geom1.asPoint()
-        point2 = geom2.asPoint()
+        Paramètres:
+        tick (int): Le tick auquel l'instantané a été pris.
+        snapshot (dict): L'instantané retourné par take_snapshot().
 
-        if point1 == point2:
-            QgsMessageLog.logMessage(
-                f"Les deux points sont identiques, aucune ligne tracée.",
-                level=Qgis.Warning)
-            return
+        Comportement:
+        - Restaure l'état de chaque entité encore présente.
+        - Restaure les entités chargées et les lignes.
+        - Supprime de la couche trace les mouvements enregistrés à partir du tick de l'instantané.
+        - Replace le tick courant sur celui de l'instantané.
+        """
+        for entity_id, state in snapshot["entities"].items():
+            map_entity = self.map_entities.get(entity_id)
+            if map_entity:
+                map_entity.set_state(state)
 
-        line_geom = QgsGeometry.fromPolylineXY([point1, point2])
+        self.entities_loaded = {entity_id: list(entity_list) for entity_id, entity_list in snapshot["entities_loaded"].items()}
+        self.lines = set(snapshot["lines"])
 
-        line_feature = QgsFeature()
-        line_feature.setGeometry(line_geom)
-        self.layer_lines.addFeature(line_feature)
+        self.delete_trace_from(tick)
+        self.tick = tick
 
-    def exist_line(self, id1: str, id2: str):
+    def delete_trace_from(self, tick: int):
         """
-        Vérifie si une ligne existante connecte deux identifiants donnés.
-
-        Paramètres:
-        id1: Premier identifiant à vérifier.
-        id2: Deuxième identifiant à vérifier.
+        Supprime de la couche trace les mouvements enregistrés à partir du tick donné.
 
-        Retourne:
-        bool: True si une ligne existante connecte id1 et id2, sinon False.
-        """
-        return any(line == [id1, id2] for line in self.lines)
+        Les segments à supprimer sont retrouvés dans l'index trace_feature_ids, en partant du dernier tick : le coût
+        est proportionnel au nombre de segments supprimés et non à la taille de la couche trace.
 
-    def add_line(self, idFeature1: str, idFeature2: str):
+        Paramètres:
+        tick (int): Le premier tick dont les mouvements doivent être supprimés.
         """
-        Ajoute une ligne entre deux entités si elle n'existe pas déjà.
+        self.pending_traces = [feature for feature in self.pending_traces if feature.attribute("tick") < tick]
+        self.trace_anchors = {}
 
-        Paramètres:
-        idFeature1 (int): Identifiant de la première entité.
-        idFeature2 (int): Identifiant de la seconde entité.
+        if self.trace_mode != LayerTraceQGIS.TRACE_SEGMENTS:
+            self.truncate_polylines(tick)
+            return
 
-        Description:
-        Vérifie si une ligne reliant les deux entités identifiées par `idFeature1` et `idFeature2` existe déjà.
-        Si elle n'existe pas, ajoute une nouvelle ligne à la liste `lines` reliant ces deux entités"""
-        if not self.exist_line(idFeature1, idFeature2):
-            self.lines.append([idFeature1, idFeature2])
+        ids = []
+        while self.trace_feature_ids and next(reversed(self.trace_feature_ids)) >= tick:
+            ids.extend(self.trace_feature_ids.popitem()[1])
+        if ids:
+            self.layer_trace.dataProvider().deleteFeatures(ids)
 
-    def remove_line(self, id1: str, id2: str):
+    def truncate_polylines(self, tick: int):
         """
-        Supprime une ligne spécifique entre deux identifiants donnés.
+        Tronque les polylignes de trace au tick donné : les sommets tracés à partir de ce tick sont retirés, les
+        polylignes qui n'ont plus de segment sont supprimées de la couche trace et les autres y sont réécrites
+        (pendant la lecture, tous les TRACE_WRITE_INTERVAL ticks seulement, voir flush_traces).
+        Hors lecture, les polylignes réécrites sont ensuite simplifiées (voir simplify_traces).
 
         Paramètres:
-        id1 : Identifiant du premier point de la ligne.
-        id2 : Identifiant du second point de la ligne.
+        tick (int): Le premier tick dont les mouvements doivent être supprimés.
+        """
+        kept = []
+        deleted_ids = []
+        for polyline in self.trace_polylines:
+            truncated = polyline.truncate(tick)
+            if not polyline.is_empty():
+                kept.append(polyline)
+                if truncated:
+                    self.mark_polyline_dirty(polyline)
+            elif polyline.feature_id is not None:
+                deleted_ids.append(polyline.feature_id)
+
+        self.trace_polylines = kept
+        self.dirty_polylines = [polyline for polyline in self.dirty_polylines if not polyline.is_empty()]
+        self.trace_last_moves = {}
+        self.open_polylines = {}
+        if self.trace_mode == LayerTraceQGIS.TRACE_ENTITY:
+            self.open_polylines = {polyline.entity_id: polyline for polyline in kept}
+
+        if deleted_ids:
+            self.layer_trace.dataProvider().deleteFeatures(deleted_ids)
+
+        # Pendant la lecture inverse, la réécriture est espacée et la simplification attend la pause
+        self.flush_traces(not self.timer.isActive())
+        if not self.timer.isActive():
+            self.simplify_traces()
+
+    def configure_snapshots(self, interval: int, memory_budget: int):
+        """
+        Configure le magasin d'instantanés.
 
-        Comportement:
-        Parcourt la liste des lignes pour identifier une ligne composée des deux identifiants spécifiés.
-        Si une correspondance exacte est trouvée, la ligne est supprimée de la liste.
+        Paramètres:
+        interval (int): Nombre de ticks entre deux instantanés.
+        memory_budget (int): Budget mémoire en octets alloué aux instantanés.
         """
-        for line in self.lines:
-            if set(line) == {id1, id2}:
-                self.lines.remove(line)
+        self.snapshot_store.set_interval(interval)
+        self.snapshot_store.set_memory_budget(memory_budget)
 
-    def set_focus(self, id_entity: str):
+    def reset_simulation(self):
         """
-        Définit la mise au point de l'entité spécifiée.
+        Replace la simulation dans son état initial, avant le tick 0.
 
-        Paramètres:
-        id_entity (int): Identifiant de l'entité.
+        Réinitialise la simulation (entités, entités chargées, lignes et tick), vide la couche trace et le journal
+        des modifications.
         """
-        self.focus = id_entity
+        self.simulation.reset()
+        self.delta_log.clear()
+        self.clear_trace()
 
-    def refresh_focus(self):
+        self.flush_geometries()
+        self.apply_load_filter()
+        self.apply_renderer()
+
+    def set_timeline_enabled(self, state: bool):
         """
-        Actualise le focus sur l'entité courante si elle est définie.
+        Active ou désactive la lecture depuis la chronologie précompilée.
 
-        Si l'entité existe, calcule le centre de sa géométrie, repositionne le centre de la carte sur ce point
-        et rafraîchit l'affichage du canevas cartographique.
+        À l'activation, la chronologie est compilée puis la lecture est replacée sur le tick affiché.
+
+        Paramètres:
+        state (bool): True pour lire depuis la chronologie, False pour exécuter les actions.
         """
-        if not self.focus:
+        self.timeline_enabled = state
+        if not state:
+            self.timeline = None
             return
 
-        focusEntity = self.map_entities[self.focus]
-        if not focusEntity:
-            self.focus = False
-            return
+        displayed_tick = self.tick - 1
+        if self.compile_timeline() and displayed_tick >= 0:
+            self.go_to_tick(displayed_tick)
 
-        center = focusEntity.feature.geometry().centroid().asPoint()
-        iface.mapCanvas().setCenter(center)
-        iface.mapCanvas().refresh()
+    def set_timeline_workers(self, workers: int):
+        """
+        Définit le nombre maximal de processus compilant la chronologie, utilisé à la prochaine compilation.
 
-    def update_all_labels(self):
+        Paramètres:
+        workers (int): Le nombre de processus, 1 pour une compilation séquentielle, 0 pour un par processeur.
         """
-        Mise à jour de toutes les étiquettes des entités de la carte.
+        self.timeline_workers = max(int(workers), 0)
 
-        Parcourt toutes les entités présentes dans map_entities et
-        met à jour la position de leur étiquette associée en appelant
-        la méthode update_label_position() pour chaque entité.
+    def compile_timeline(self) -> bool:
         """
-        for map_entity in self.map_entities.values():
-            if not self.is_loaded(map_entity):
-                map_entity.update_label_position(self.show_name, self.show_position)
+        Compile toute la simulation en une chronologie lue ensuite tick par tick.
+
+        Procédé :
+        1. Compile la chronologie par TimelinePartition.compile, sans écrire de trace : les groupes d'entités
+           indépendants sont compilés dans timeline_workers processus, sinon par Simulation.compile_timeline.
+        2. Replace la simulation et les couches dans leur état initial.
+
+        La durée de la compilation est conservée dans la chronologie et enregistrée dans le journal de QGIS.
+
+        Retourne:
+            bool: True si la compilation a réussi, sinon False.
+        """
+        self.timeline = None
+        start = time.perf_counter()
+
+        try:
+            timeline = TimelinePartition.compile(self.simulation, self.timeline_workers)
+        except Exception as e:
+            QgsMessageLog.logMessage(f"Erreur lors de la compilation de la chronologie : {e}", "Trace QGIS", level=Qgis.Warning)
+            timeline = None
+
+        self.reset_simulation()
+
+        if timeline is None:
+            return False
+
+        timeline.compile_duration = time.perf_counter() - start
+        QgsMessageLog.logMessage(
+            f"Chronologie compilée : {timeline.tick_count} ticks, {len(timeline.entity_ids)} entités en {timeline.compile_duration:.3f} s",
+            "Trace QGIS",
+            level=Qgis.Info
+        )
+        self.timeline = timeline
+        return True
+
+    def refresh_timeline(self):
+        """
+        Partie du refresh qui lit l'état du tick courant dans la chronologie au lieu d'exécuter les actions.
+
+        Seules les entités dont l'état diffère du tick précédent sont mises à jour, leurs déplacements sont
+        enregistrés dans la couche trace. La durée de lecture est cumulée dans la chronologie.
+        """
+        start = time.perf_counter()
+
+        self.apply_timeline(self.tick, self.tick - 1, True)
+        self.apply_load_filter()
+        self.refresh_display()
+
+        self.timeline.playback_duration += time.perf_counter() - start
+        self.timeline.playback_ticks += 1
+
+    def apply_timeline(self, tick: int, from_tick: int = None, log_moves: bool = False):
+        """
+        Applique aux entités l'état d'un tick lu dans la chronologie.
+
+        Paramètres:
+        tick (int): Le tick à appliquer, -1 pour l'état initial.
+        from_tick (int): Le tick correspondant à l'état actuel des entités. Si None, toutes les entités sont comparées.
+        log_moves (bool): Si True, les déplacements sont enregistrés dans la couche trace.
+        """
+        if from_tick is None:
+            entity_ids = self.timeline.entity_ids
+        else:
+            entity_ids = self.timeline.get_changed_entities(from_tick, tick)
+
+        for entity_id in entity_ids:
+            map_entity = self.map_entities.get(entity_id)
+            if not map_entity:
+                continue
+
+            state = self.timeline.get_state(tick, entity_id)
+            old_point = map_entity.feature.geometry().asPoint()
+            moved = (map_entity.get_latitude(), map_entity.get_longitude()) != (state["latitude"], state["longitude"])
+
+            map_entity.set_state(state)
+            map_entity.clear_changes()
+
+            if log_moves and moved:
+                self.log_trace(map_entity, old_point)
+
+        self.entities_loaded = {
+            entity_id: [self.map_entities[loaded_id] for loaded_id in loaded_ids if loaded_id in self.map_entities]
+            for entity_id, loaded_ids in self.timeline.get_entities_loaded(tick).items()
+        }
+        self.lines = self.timeline.get_lines(tick)
+
+    def rebuild_trace(self, tick: int):
+        """
+        Reconstruit la couche trace à partir des déplacements de la chronologie jusqu'au tick donné inclus,
+        en appliquant la politique de décimation et en écrivant tous les segments en un seul appel.
+
+        Paramètres:
+        tick (int): Le dernier tick dont les déplacements sont tracés.
+        """
+        self.clear_trace()
+
+        for move_tick, entity_id, (lat_from, lon_from), (lat_to, lon_to) in self.timeline.get_moves(tick):
+            map_entity = self.map_entities.get(entity_id)
+            if map_entity:
+                self.add_trace(map_entity, QgsPointXY(lon_from, lat_from), QgsPointXY(lon_to, lat_to), move_tick)
+
+        self.flush_traces()
+
+    def export_temporal_layers(self, path: str = "", multiplier: float = 1, unit: str = "sec") -> bool:
+        """
+        Exporte toute la simulation dans des couches temporelles, lues ensuite par le contrôleur temporel de QGIS
+        et son cache de rendu au lieu du minuteur de LayerTraceQGIS.
+
+        Procédé :
+        1. Évalue la chronologie complète (voir get_export_timeline).
+        2. Construit la couche "Entity (temporel)", une entité par période d'état constant de chaque entité, et
+           la couche "Traces Mouvements (temporel)", un segment par déplacement, chacune en un seul appel à addFeatures.
+        3. Si un chemin est donné, écrit les deux couches dans un GeoPackage et les recharge depuis ce fichier.
+        4. Configure les propriétés temporelles des couches (champs "start" et "end") et le contrôleur temporel
+           du canevas (étendue et durée d'une image égale à la durée d'un tick), puis ajoute les couches au groupe
+           "Trace QGIS".
+
+        Paramètres:
+        path (str): Chemin du GeoPackage à écrire, vide pour conserver des couches en mémoire.
+        multiplier (float): Nombre d'unités par tick, comme l'équivalent affiché par le panneau de paramétrage.
+        unit (str): L'unité du multiplicateur (voir TemporalExport.UNIT_SECONDS).
+
+        Retourne:
+            bool: True si l'export a réussi, sinon False.
+        """
+        try:
+            export = TemporalExport(self.get_export_timeline(), multiplier, unit)
+            entity_layer, trace_layer = self.build_temporal_layers(export)
+            if path:
+                entity_layer, trace_layer = TemporalLayers.write_geopackage(path, [entity_layer, trace_layer], ["entity", "traces"])
+        except (ValueError, OSError) as e:
+            QMessageBox.warning(self, "Erreur", str(e))
+            return False
+
+        self.style_temporal_layers(entity_layer, trace_layer)
+
+        root = QgsProject.instance().layerTreeRoot()
+        group = root.findGroup("Trace QGIS")
+        if not group:
+            group = root.addGroup("Trace QGIS")
+
+        for layer in (entity_layer, trace_layer):
+            QgsProject.instance().addMapLayer(layer, False)
+            group.addLayer(layer)
+
+        begin, end = export.get_extent()
+        controller = iface.mapCanvas().temporalController()
+        if hasattr(controller, "setTemporalExtents"):
+            controller.setTemporalExtents(QgsDateTimeRange(QDateTime(begin), QDateTime(end)))
+            controller.setFrameDuration(QgsInterval(export.get_tick_duration()))
+
+        QgsMessageLog.logMessage(
+            f"Export temporel : {entity_layer.featureCount()} états et {trace_layer.featureCount()} segments",
+            "Trace QGIS",
+            level=Qgis.Info
+        )
+        return True
+
+    def export_frames(
+        self,
+        directory: str,
+        multiplier: float = 1,
+        unit: str = "sec",
+        first_tick: int = 0,
+        last_tick: int = -1,
+        width: int = FrameExport.DEFAULT_WIDTH,
+        height: int = FrameExport.DEFAULT_HEIGHT
+    ) -> bool:
+        """
+        Démarre le rendu hors écran d'une suite de ticks en images PNG numérotées (voir FrameExport).
+
+        Les entités et les traces sont rendues depuis des couches temporelles construites comme pour
+        export_temporal_layers, mais non ajoutées au projet, sous les autres couches visibles du canevas (fond
+        de carte), dans l'emprise et le système de coordonnées du canevas. La lecture n'est pas modifiée.
+        La progression et la fin de l'export, y compris s'il n'a pas pu démarrer, sont signalées par
+        signal_frame_export_progress et signal_frame_export_finished.
+
+        Paramètres:
+        directory (str): Le dossier de destination des images.
+        multiplier (float): Nombre d'unités par tick.
+        unit (str): L'unité du multiplicateur (voir TemporalExport.UNIT_SECONDS).
+        first_tick (int): Le premier tick rendu.
+        last_tick (int): Le dernier tick rendu, -1 pour le dernier tick de la simulation.
+        width (int): Largeur des images en pixels.
+        height (int): Hauteur des images en pixels.
+
+        Retourne:
+            bool: True si l'export a démarré, sinon False.
+        """
+        if self.frame_export is not None:
+            QMessageBox.warning(self, "Erreur", "Un export d'images est déjà en cours")
+            return False
+
+        try:
+            export = TemporalExport(self.get_export_timeline(), multiplier, unit)
+            entity_layer, trace_layer = self.build_temporal_layers(export)
+        except ValueError as e:
+            QMessageBox.warning(self, "Erreur", str(e))
+            self.signal_frame_export_finished.emit(False)
+            return False
+
+        self.style_temporal_layers(entity_layer, trace_layer)
+
+        tick_count = export.timeline.tick_count
+        if last_tick < 0 or last_tick >= tick_count:
+            last_tick = tick_count - 1
+
+        canvas = iface.mapCanvas()
+        own_layers = (self.layer, self.layer_lines, self.layer_trace)
+        basemap_layers = [layer for layer in canvas.layers() if layer not in own_layers]
+
+        frame_export = FrameExport(
+            export,
+            [entity_layer, trace_layer] + basemap_layers,
+            canvas.extent(),
+            canvas.mapSettings().destinationCrs(),
+            directory,
+            range(max(first_tick, 0), last_tick + 1),
+            width,
+            height
+        )
+        frame_export.signal_progress.connect(self.signal_frame_export_progress.emit)
+        frame_export.signal_finished.connect(self.on_frame_export_finished)
+        self.frame_export = frame_export
+
+        try:
+            frame_export.start()
+        except OSError as e:
+            self.frame_export = None
+            QMessageBox.warning(self, "Erreur", str(e))
+            self.signal_frame_export_finished.emit(False)
+            return False
+
+        return True
+
+    def cancel_frame_export(self):
+        """
+        Annule l'export d'images en cours, les images déjà écrites sont conservées.
+        """
+        if self.frame_export is not None:
+            self.frame_export.cancel()
+
+    def on_frame_export_finished(self, completed: bool):
+        """
+        Méthode appelée à la fin de l'export d'images : l'enregistre dans le journal de QGIS et le signale.
+
+        Paramètres:
+        completed (bool): True si toutes les images ont été écrites.
+        """
+        frame_export = self.frame_export
+        self.frame_export = None
+        if frame_export is None:
+            return
+
+        QgsMessageLog.logMessage(
+            f"Export d'images {'terminé' if completed else 'interrompu'} : {frame_export.written} images dans {frame_export.directory}",
+            "Trace QGIS",
+            level=Qgis.Info if completed else Qgis.Warning
+        )
+        self.signal_frame_export_finished.emit(completed)
+
+    def style_temporal_layers(self, entity_layer: QgsVectorLayer, trace_layer: QgsVectorLayer):
+        """
+        Applique aux couches temporelles le rendu par attributs et l'étiquetage natif (entités), le rendu
+        catégorisé des traces (traces), puis active leurs propriétés temporelles.
+
+        Paramètres:
+        entity_layer (QgsVectorLayer): La couche temporelle des entités.
+        trace_layer (QgsVectorLayer): La couche temporelle des traces.
+        """
+        entity_layer.setRenderer(QgsSingleSymbolRenderer(LayerTraceQGIS.build_data_defined_symbol()))
+        entity_layer.setLabeling(LayerTraceQGIS.build_labeling())
+        entity_layer.setLabelsEnabled(True)
+        trace_layer.setRenderer(self.build_trace_renderer())
+
+        TemporalLayers.set_temporal_fields(entity_layer)
+        TemporalLayers.set_temporal_fields(trace_layer)
+
+    def get_export_timeline(self) -> 'Timeline':
+        """
+        Retourne la chronologie complète de la simulation.
+
+        La chronologie lue par la lecture est réutilisée si elle existe. Sinon, elle est compilée par
+        TimelinePartition.compile sans être conservée, à partir d'une copie de la simulation dans son état
+        initial (voir Simulation.copy_initial) : la simulation affichée, ses instantanés et son journal des
+        modifications ne sont pas modifiés.
+
+        Retourne:
+        Timeline: La chronologie de tous les ticks.
+        """
+        if self.timeline is not None:
+            return self.timeline
+
+        simulation = self.simulation.copy_initial()
+        simulation.activate()
+        try:
+            return TimelinePartition.compile(simulation, self.timeline_workers)
+        finally:
+            self.simulation.activate()
+
+    def build_temporal_layers(self, export: TemporalExport) -> tuple[QgsVectorLayer, QgsVectorLayer]:
+        """
+        Construit les couches temporelles des entités et des traces (voir TemporalLayers), avec les options
+        d'étiquetage courantes.
+
+        Paramètres:
+        export (TemporalExport): L'export de la chronologie.
+
+        Retourne:
+        tuple[QgsVectorLayer, QgsVectorLayer]: La couche des entités et celle des traces.
+        """
+        entity_layer = TemporalLayers.build_entity_layer(export, self.map_entities, self.show_name, self.show_position)
+        trace_layer = TemporalLayers.build_trace_layer(export, self.map_entities)
+        return entity_layer, trace_layer
+
+    def reset_before_refresh(self):
+        """
+        Réinitialise les lignes et les attributs visuels expirés des entités avant un rafraîchissement
+        (voir Simulation.reset_before_refresh).
+        """
+        self.simulation.reset_before_refresh()
+
+    def refresh_action(self, fast: bool = False):
+        """
+        Partie du refresh qui traite les actions.
+
+        Paramètres :
+        fast (bool) : Indique si l'actualisation doit être rapide ou complète.
+                      Si True, les actions liées a l'interface ne sont pas executée.
+
+        Procédé :
+        1. Exécute les actions actives dans la simulation (voir Simulation.execute_actions), les déplacements sont
+           enregistrés dans la couche trace et les actions non traitées dans les journaux QGIS.
+        2. Rafraîchit le chargement des ressources.
+        3. Si l'actualisation n'est pas rapide (fast=False), écrit les géométries déplacées dans la couche
+           et met à jour l'affichage via refresh_display.
+        """
+        self.simulation.execute_actions()
+
+        with self.profiler.measure("refresh_load"):
+            self.refresh_load()
+
+        if not fast:
+            self.refresh_display()
+
+    def mark_geometry_dirty(self, feature: QgsFeature):
+        """
+        Signale qu'une entité QGIS a été déplacée, sa géométrie sera écrite dans la couche au prochain flush_geometries.
+        Sa position est mise à jour immédiatement dans l'index spatial.
+
+        Paramètres:
+        feature (QgsFeature): L'entité QGIS déplacée.
+        """
+        self.dirty_geometries[feature.id()] = feature
+        self.update_spatial_index(feature)
+
+    def update_spatial_index(self, feature: QgsFeature):
+        """
+        Met à jour la position d'une entité QGIS dans l'index spatial.
+
+        Paramètres:
+        feature (QgsFeature): L'entité QGIS ajoutée ou déplacée.
+        """
+        point = feature.geometry().asPoint()
+        self.spatial_index.update(feature.id(), point.x(), point.y())
+
+    def flush_geometries(self):
+        """
+        Écrit dans la couche principale, en un seul appel à changeGeometryValues, les géométries de toutes
+        les entités déplacées depuis la dernière écriture.
+        """
+        if not self.dirty_geometries:
+            return
+
+        geometries = {feature_id: feature.geometry() for feature_id, feature in self.dirty_geometries.items()}
+        self.dirty_geometries = {}
+        self.layer.dataProvider().changeGeometryValues(geometries)
+
+    def refresh_display(self):
+        """
+        Partie du refresh qui met à jour l'affichage à partir de l'état courant des entités.
+
+        Procédé :
+        0. Écrit dans les couches les géométries déplacées et les traces en attente via flush_geometries et flush_traces
+           (pendant la lecture, les polylignes prolongées ne sont réécrites que tous les TRACE_WRITE_INTERVAL ticks).
+        1. Vérifie si les catégories doivent être rafraîchies et applique le moteur de rendu si nécessaire
+           (en mode rendu par attributs, seuls les champs des entités modifiées sont écrits).
+        2. Met à jour les étiquettes des entités de la carte nécessitant une actualisation en fonction des configurations
+           (position des QLabel ou texte de l'étiquette native selon le mode d'étiquetage).
+        3. Déclenche le repaint des couches (principale et de trace).
+        """
+        profiler = self.profiler
+        with profiler.measure("flush"):
+            self.flush_geometries()
+            self.flush_traces(not self.timer.isActive())
+
+        if self.need_refresh_categories():
+            with profiler.measure("apply_renderer"):
+                self.apply_renderer()
+
+        with profiler.measure("labels"):
+            self.update_labels(self.map_entities_need_refresh_labels())
+
+        with profiler.measure("repaint"):
+            self.layer.triggerRepaint()
+            self.layer_trace.triggerRepaint()
+
+
+    def set_profiling_enabled(self, state: bool):
+        """
+        Active ou désactive la mesure de la durée de chaque phase du rafraîchissement.
+
+        Paramètres:
+        state (bool): True pour activer le profilage.
+        """
+        self.profiler.set_enabled(state)
+        self.profiling_last_emit = 0.0
+
+    def reset_profiling(self):
+        """
+        Supprime les mesures du profilage et émet des statistiques vides.
+        """
+        self.profiler.reset()
+        self.signal_profiling_updated.emit([])
+
+    def emit_profiling(self, force: bool = False):
+        """
+        Émet les statistiques du profilage si celui-ci est activé, au plus une fois par PROFILING_EMIT_INTERVAL.
+
+        Paramètres:
+        force (bool): True pour émettre sans tenir compte du délai depuis la dernière émission.
+        """
+        if not self.profiler.enabled:
+            return
+
+        now = time.perf_counter()
+        if not force and now - self.profiling_last_emit < LayerTraceQGIS.PROFILING_EMIT_INTERVAL:
+            return
+
+        self.profiling_last_emit = now
+        self.signal_profiling_updated.emit(self.profiler.get_stats())
+
+    def export_profiling(self, path: str):
+        """
+        Exporte les statistiques du profilage dans un fichier CSV.
+
+        Paramètres:
+        path (str): Chemin du fichier à écrire.
+        """
+        try:
+            self.profiler.export_csv(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Erreur", str(e))
+
+    def refresh_line(self):
+        """
+        Partie du refresh qui traite les lignes entre entitées.
+
+        Les lignes dessinées sont conservées d'un tick à l'autre (voir line_features) : seules les lignes apparues
+        sont ajoutées, celles qui ont disparu sont supprimées et celles dont une extrémité a bougé sont déplacées,
+        chaque opération en un seul appel au fournisseur de données. Sans changement, la couche n'est pas modifiée.
+        """
+        provider = self.layer_lines.dataProvider()
+
+        deleted = [self.line_features.pop(key)[0] for key in list(self.line_features) if key not in self.lines]
+        moved = {}
+        added = []
+        for key in self.lines:
+            points = self.get_line_points(*key)
+            drawn = self.line_features.get(key)
+            if points is None:
+                if drawn is not None:
+                    deleted.append(self.line_features.pop(key)[0])
+            elif drawn is None:
+                line_feature = QgsFeature()
+                line_feature.setGeometry(QgsGeometry.fromPolylineXY(list(points)))
+                added.append((key, line_feature, points))
+            elif drawn[1] != points:
+                moved[drawn[0]] = QgsGeometry.fromPolylineXY(list(points))
+                self.line_features[key] = (drawn[0], points)
+
+        if deleted:
+            provider.deleteFeatures(deleted)
+        if moved:
+            provider.changeGeometryValues(moved)
+        if added:
+            _, features = provider.addFeatures([line_feature for _, line_feature, _ in added])
+            for (key, _, points), line_feature in zip(added, features):
+                self.line_features[key] = (line_feature.id(), points)
+
+        if deleted or moved or added:
+            self.layer_lines.triggerRepaint()
+
+    # TIMER SECTION
+    def start_timer(self):
+        """
+        Démarre le minuteur à une vitesse déterminée par l'intervalle et la vitesse actuelle.
+        L'horloge de lecture est recalée et le compteur d'images sautées remis à zéro.
+
+        La méthode émet un signal indiquant le départ du minuteur.
+        """
+        self.clock_start = None
+        self.frames_dropped = 0
+        self.timer.start(self.interval // self.speed)
+        self.signal_timer_changed.emit(True)
+
+    def change_interval_timer(self, speed: int):
+        """
+        Modifie l'intervalle du minuteur en fonction de la vitesse donnée.
+
+        Arguments:
+        speed (int): La vitesse souhaitée
+        """
+        self.speed = speed
+        if self.speed <= 0:
+            self.speed = 1  # éviter division par 0
+        self.timer.setInterval(1000 // self.speed)
+        self.clock_start = None
+
+    def stop_timer(self):
+        """
+        Arrête le minuteur en cours d'exécution.
+
+        La méthode émet un signal indiquant l'arret du minuteur.
+        Les polylignes de trace prolongées pendant la lecture et pas encore réécrites sont écrites, puis simplifiées.
+        """
+        self.timer.stop()
+        if self.dirty_polylines:
+            self.flush_traces()
+            self.layer_trace.triggerRepaint()
+        self.simplify_traces()
+        self.signal_timer_changed.emit(False)
+
+    def toggle_timer(self, is_active: bool = True):
+        """
+        Cette méthode permet de basculer l'état du minuteur.
+        Si le minuteur est actif, il est arrêté.
+        Sinon, il le démarre
+        """
+        if is_active:
+            self.start_timer()
+        else:
+            self.stop_timer()
+
+    # INTERFACE SECTION
+    def get_line_points(self, idFeature1: str, idFeature2: str) -> tuple[QgsPointXY, QgsPointXY] | None:
+        """
+        Retourne les extrémités de la ligne directe entre deux entités.
+
+        Retourne:
+        tuple[QgsPointXY, QgsPointXY] | None: Les positions des deux entités, None (avec un message) si une entité
+        est introuvable, si une géométrie est vide ou si les deux points sont identiques.
+        """
+        feature1 = self.map_entities.get(idFeature1)
+        feature2 = self.map_entities.get(idFeature2)
+        if not feature1 or not feature2:
+            QgsMessageLog.logMessage(f"Feature {idFeature1} ou {idFeature2} est introuvable.", level=Qgis.Warning)
+            return None
+
+        geom1 = feature1.feature.geometry()
+        geom2 = feature2.feature.geometry()
+
+        if geom1.isEmpty() or geom2.isEmpty():
+            QgsMessageLog.logMessage(
+                f"Une ou les deux géométries de {idFeature1} et {idFeature2} sont vides.",
+                level=Qgis.Warning)
+            return None
+
+        point1 = geom1.asPoint()
+        point2 = geom2.asPoint()
+
+        if point1 == point2:
+            QgsMessageLog.logMessage(
+                f"Les deux points sont identiques, aucune ligne tracée.",
+                level=Qgis.Warning)
+            return None
+
+        return point1, point2
+
+    def set_focus(self, id_entity: str):
+        """
+        Définit la mise au point de l'entité spécifiée.
+
+        Paramètres:
+        id_entity (int): Identifiant de l'entité.
+        """
+        self.focus = id_entity
+
+    def refresh_focus(self):
+        """
+        Actualise le focus sur l'entité courante si elle est définie.
+
+        Si l'entité existe, calcule le centre de sa géométrie, repositionne le centre de la carte sur ce point
+        et rafraîchit l'affichage du canevas cartographique.
+        """
+        if not self.focus:
+            return
+
+        focusEntity = self.map_entities[self.focus]
+        if not focusEntity:
+            self.focus = False
+            return
+
+        center = focusEntity.feature.geometry().centroid().asPoint()
+        iface.mapCanvas().setCenter(center)
+        iface.mapCanvas().refresh()
+
+    def schedule_label_update(self):
+        """
+        Programme la mise à jour des étiquettes après un changement d'emprise du canevas.
+
+        Les changements d'emprise reçus pendant que le minuteur est actif sont regroupés,
+        update_all_labels n'est donc appelée qu'une fois par intervalle LABEL_REFRESH_INTERVAL.
+        """
+        if not self.label_timer.isActive():
+            self.label_timer.start()
+
+    def get_entities_in_extent(self) -> list['MapEntity']:
+        """
+        Retourne les entités dont la position est comprise dans l'emprise actuelle du canevas, d'après l'index spatial.
+
+        Retourne:
+        list[MapEntity]: Les entités visibles.
+        """
+        extent = iface.mapCanvas().extent()
+        return self.get_entities_in_rect(extent.xMinimum(), extent.yMinimum(), extent.xMaximum(), extent.yMaximum())
+
+    def get_entities_in_rect(self, lon_min: float, lat_min: float, lon_max: float, lat_max: float) -> list['MapEntity']:
+        """
+        Retourne les entités dont la position courante est comprise dans un rectangle, d'après l'index spatial.
+
+        Paramètres:
+        lon_min (float): Longitude minimale.
+        lat_min (float): Latitude minimale.
+        lon_max (float): Longitude maximale.
+        lat_max (float): Latitude maximale.
+
+        Retourne:
+        list[MapEntity]: Les entités comprises dans le rectangle.
+        """
+        return self.get_entities_from_feature_ids(self.spatial_index.query_rect(lon_min, lat_min, lon_max, lat_max))
+
+    def get_entities_in_radius(self, lat: float, lon: float, radius: float) -> list['MapEntity']:
+        """
+        Retourne les entités situées à moins d'une distance donnée d'un point GPS, d'après l'index spatial.
+
+        Paramètres:
+        lat (float): Latitude du centre.
+        lon (float): Longitude du centre.
+        radius (float): Rayon en mètres.
+
+        Retourne:
+        list[MapEntity]: Les entités comprises dans le cercle.
+        """
+        return self.get_entities_from_feature_ids(self.spatial_index.query_radius(lon, lat, radius))
+
+    def get_entities_near(self, map_entity: 'MapEntity', radius: float) -> list['MapEntity']:
+        """
+        Retourne les autres entités situées à moins d'une distance donnée d'une entité.
+
+        Paramètres:
+        map_entity (MapEntity): L'entité de référence.
+        radius (float): Rayon en mètres.
+
+        Retourne:
+        list[MapEntity]: Les entités proches, sans l'entité de référence.
+        """
+        return [
+            entity for entity in self.get_entities_in_radius(map_entity.get_latitude(), map_entity.get_longitude(), radius)
+            if entity is not map_entity
+        ]
+
+    def get_nearest_entity(self, lat: float, lon: float, max_radius: float) -> 'MapEntity | None':
+        """
+        Retourne l'entité la plus proche d'un point GPS dans la limite d'une distance maximale.
+
+        Paramètres:
+        lat (float): Latitude du point.
+        lon (float): Longitude du point.
+        max_radius (float): Distance maximale de recherche en mètres.
+
+        Retourne:
+        MapEntity | None: L'entité la plus proche, ou None si aucune n'est à moins de max_radius.
+        """
+        return self.feature_entities.get(self.spatial_index.nearest(lon, lat, max_radius))
+
+    def get_entities_from_feature_ids(self, feature_ids: list) -> list['MapEntity']:
+        """
+        Retourne les entités de la carte correspondant à des identifiants d'entité QGIS.
+
+        Paramètres:
+        feature_ids (list): Les identifiants d'entité QGIS retournés par l'index spatial.
+
+        Retourne:
+        list[MapEntity]: Les entités correspondantes.
+        """
+        return [self.feature_entities[feature_id] for feature_id in feature_ids if feature_id in self.feature_entities]
+
+    def update_all_labels(self):
+        """
+        Mise à jour de toutes les étiquettes des entités de la carte.
+
+        Seules les entités comprises dans l'emprise du canevas, retrouvées par l'index spatial, sont repositionnées
+        via la méthode update_label_position(). Les étiquettes affichées lors de la mise à jour précédente dont
+        l'entité est sortie de l'emprise sont masquées. Les rafraîchissements de la fenêtre principale sont
+        suspendus le temps de la mise à jour pour que tous les QLabel soient redessinés en une fois.
+
+        En mode LABEL_NATIVE, QGIS place lui-même les étiquettes à chaque rendu, il n'y a rien à faire.
+        """
+        if self.label_mode == LayerTraceQGIS.LABEL_NATIVE:
+            return
+
+        visible_entities = self.get_entities_in_extent()
+        visible_ids = {map_entity.feature.id() for map_entity in visible_entities}
+
+        main_window = iface.mainWindow()
+        main_window.setUpdatesEnabled(False)
+        try:
+            for feature_id in self.visible_label_ids - visible_ids:
+                map_entity = self.feature_entities.get(feature_id)
+                if map_entity:
+                    map_entity.hide_label()
+
+            self.visible_label_ids = set()
+            self.update_labels(visible_entities)
+        finally:
+            main_window.setUpdatesEnabled(True)
+
+    def update_labels(self, map_entities: list['MapEntity']):
+        """
+        Met à jour les étiquettes des entités données selon le mode d'étiquetage.
+
+        Les étiquettes des entités chargées n'affichent ni le nom ni la position.
+
+        Paramètres:
+        map_entities (list[MapEntity]): Les entités dont l'étiquette doit être mise à jour.
+        """
+        if self.label_mode == LayerTraceQGIS.LABEL_NATIVE:
+            self.update_label_texts(map_entities)
+            return
+
+        for map_entity in map_entities:
+            if not self.is_loaded(map_entity):
+                map_entity.update_label_position(self.show_name, self.show_position)
             else:
                 map_entity.update_label_position(False, False)
+            self.visible_label_ids.add(map_entity.feature.id())
 
-    def toggle_show_information_name(self, state: bool):
+    def update_label_texts(self, map_entities: list['MapEntity']):
         """
-        Permet d'afficher ou non le nom de l'entitée sur la carte
+        Écrit dans le champ "label" de la couche principale, en un seul appel à changeAttributeValues,
+        le texte de l'étiquette native des entités données.
 
         Paramètres:
-        state (bool): Détermine si le nom sera affiché ou masqué.
+        map_entities (list[MapEntity]): Les entités dont le texte doit être écrit.
         """
-        self.show_name = state
-        self.update_all_labels()
+        index = self.layer.fields().indexOf("label")
 
-    def toggle_show_information_position(self, state):
+        changes = {}
+        for map_entity in map_entities:
+            if not self.is_loaded(map_entity):
+                text = map_entity.get_label_text(self.show_name, self.show_position)
+            else:
+                text = map_entity.get_label_text(False, False)
+            changes[map_entity.feature.id()] = {index: text or None}
+
+        if changes:
+            self.layer.dataProvider().changeAttributeValues(changes)
+
+    def apply_labeling(self):
         """
-        Permet d'afficher ou non la position de l'entitée sur la carte
+        Configure l'étiquetage natif de la couche principale (voir build_labeling).
+        """
+        self.layer.setLabeling(LayerTraceQGIS.build_labeling())
+        self.layer.setLabelsEnabled(True)
 
-        Paramètres:
-        state (bool): Détermine si le position sera affiché ou masqué.
+    @staticmethod
+    def build_labeling() -> QgsVectorLayerSimpleLabeling:
         """
-        self.show_position = state
-        self.update_all_labels()
+        Construit l'étiquetage natif à partir du champ "label", avec le même style que les QLabel
+        (police Arial 10, fond blanc semi-transparent et bordure noire).
+
+        Retourne:
+        QgsVectorLayerSimpleLabeling: L'étiquetage à appliquer à une couche d'entités.
+        """
+        background = QgsTextBackgroundSettings()
+        background.setEnabled(True)
+        background.setFillColor(QColor(255, 255, 255, 200))
+        background.setStrokeColor(QColor('black'))
+        background.setStrokeWidth(0.2)
+
+        text_format = QgsTextFormat()
+        text_format.setFont(QFont("Arial", 10))
+        text_format.setSize(10)
+        text_format.setBackground(background)
 
+        settings = QgsPalLayerSettings()
+        settings.fieldName = "label"
+        settings.placement = QgsPalLayerSettings.AroundPoint
+        settings.dist = 2
+        settings.setFormat(text_format)
 
-    def load_entity(self, entity: 'MapEntity', entity_load: 'MapEntity'):
+        return QgsVectorLayerSimpleLabeling(settings)
+
+    def set_label_mode(self, mode: str):
         """
-        Permet de charger une entité dans une autre.
+        Change le mode d'étiquetage des entités.
 
         Paramètres:
-        entity (MapEntity): L'entité à charger.
-        entity_load (MapEntity): L'entité dans lequel elle est charger.
+        mode (str): LABEL_WIDGETS ou LABEL_NATIVE.
 
         Comportement:
-        - Vérifie si l'identifiant de l'entité principale est déjà dans le dictionnaire des entités chargées.
-        - Si ce n'est pas le cas, initialise une nouvelle liste pour cet identifiant.
-        - Ajoute l'entité associée dans la liste des entités chargées pour l'entité principale, si elle n'est pas déjà incluse.
+        - En mode LABEL_NATIVE, supprime les QLabel, active l'étiquetage de la couche et écrit le texte de toutes les étiquettes.
+        - En mode LABEL_WIDGETS, désactive l'étiquetage de la couche et repositionne tous les QLabel, recréés à leur affichage.
+
+        Exceptions:
+        ValueError: Levée si le mode d'étiquetage n'est pas reconnu.
         """
-        entity_id = entity.get_id()
-        if entity_id not in self.entities_loaded:
-            self.entities_loaded[entity_id] = []
+        if mode not in (LayerTraceQGIS.LABEL_WIDGETS, LayerTraceQGIS.LABEL_NATIVE):
+            raise ValueError(f"Mode d'étiquetage inconnu : {mode}")
+
+        self.label_mode = mode
+
+        if mode == LayerTraceQGIS.LABEL_NATIVE:
+            for map_entity in self.map_entities.values():
+                map_entity.delete_label()
+            self.apply_labeling()
+        else:
+            self.layer.setLabelsEnabled(False)
 
-        if entity_load not in self.entities_loaded[entity_id]:
-            self.entities_loaded[entity_id].append(entity_load)
+        self.update_labels(self.map_entities.values())
+        self.layer.triggerRepaint()
 
-    def unload_entity(self, entity: 'MapEntity', entity_load: 'MapEntity'):
+    def toggle_native_labels(self, state: bool):
         """
-        Permet de décharger une entité
+        Permet d'utiliser le moteur d'étiquettes de QGIS au lieu d'un QLabel par entité.
 
         Paramètres:
-        entity : MapEntity
-            L'entité à décharger.
-        entity_load : MapEntity
-            L'entité cible qui doit être retirée du groupe d'entités chargées.
+        state (bool): True pour l'étiquetage natif, False pour les QLabel.
+        """
+        self.set_label_mode(LayerTraceQGIS.LABEL_NATIVE if state else LayerTraceQGIS.LABEL_WIDGETS)
 
-        Description:
-        Vérifie si l'entité source est présente dans les entités chargées. Si elle l'est, retire l'entité cible du groupe associé. Si le groupe devient vide après le retrait, il est complètement supprimé.
+    def toggle_show_information_name(self, state: bool):
         """
-        group_id = entity.get_id()
-        target_id = entity_load.get_id()
+        Permet d'afficher ou non le nom de l'entitée sur la carte
+
+        Paramètres:
+        state (bool): Détermine si le nom sera affiché ou masqué.
+        """
+        self.show_name = state
+        self.update_labels(self.map_entities.values())
+
+    def toggle_show_information_position(self, state):
+        """
+        Permet d'afficher ou non la position de l'entitée sur la carte
+
+        Paramètres:
+        state (bool): Détermine si le position sera affiché ou masqué.
+        """
+        self.show_position = state
+        self.update_labels(self.map_entities.values())
 
-        if group_id in self.entities_loaded:
-            self.entities_loaded[group_id] = [
-                e for e in self.entities_loaded[group_id] if e.get_id() != target_id
-            ]
-            if not self.entities_loaded[group_id]:
-                del self.entities_loaded[group_id]
 
     def is_loaded(self, entity_load: 'MapEntity', in_entity: 'MapEntity' = None) -> bool:
         """
-        Vérifie si une entité est chargée dans une entité ou simplement chargé
+        Vérifie si une entité est chargée dans une entité ou simplement chargé (voir Simulation.is_loaded).
 
         Paramètres:
         - entity_load : 'MapEntity'
@@ -792,57 +2096,45 @@ class LayerTraceQGIS(QObject):
         Retourne:
         - bool : True si l'entité est chargée, False sinon.
         """
-        if not self.entities_loaded:
-            return False
+        return self.simulation.is_loaded(entity_load, in_entity)
 
-        if in_entity is None:
-            # Vérifie si l'entité est chargée dans n'importe quel groupe
-            return any(entity_load in loaded_list for loaded_list in self.entities_loaded.values())
-        else:
-            group_id = in_entity.get_id()
-            return entity_load in self.entities_loaded.get(group_id, [])
+    def refresh_load(self):
+        """
+        Partie du refresh qui traite les entitées chargée : la simulation ajoute le texte des entités contenues,
+        puis les entités chargées sont masquées.
+        """
+        self.apply_load_filter(self.simulation.refresh_load())
 
-    def is_loaded_by_id(self, entity_id: str, in_entity_id: str = None) -> bool:
+    def apply_load_filter(self, ids: list = None) -> list:
         """
-        Vérifie si une entité avec un identifiant donné est chargée.
+        Masque les entités chargées dans une autre entité.
+
+        La couche principale est filtrée une fois pour toutes sur le champ "loaded" (voir LOADED_FILTER) : seul ce
+        champ est écrit, en un seul appel à changeAttributeValues, pour les entités chargées ou déchargées depuis
+        le dernier appel. Si aucune entité n'a changé d'état, le fournisseur de données n'est pas sollicité.
 
         Paramètres:
-        entity_id: str
-            L'identifiant de l'entité à vérifier.
-        in_entity_id: str, optionnel
-            L'identifiant d'une entité spécifique où effectuer la recherche.
+        ids (list): Les identifiants des entités chargées, lus dans la simulation si None.
 
         Retourne:
-        bool
-            True si l'entité est chargée, False autrement.
-        """
-        if in_entity_id is None:
-            return any(
-                any(e.get_id() == entity_id for e in loaded_list)
-                for loaded_list in self.entities_loaded.values()
-            )
-        else:
-            return any(
-                e.get_id() == entity_id for e in self.entities_loaded.get(in_entity_id, [])
-            )
+        list: Les identifiants des entités chargées.
+        """
+        if ids is None:
+            ids = self.simulation.get_loaded_ids()
+
+        loaded_ids = set(ids)
+        changed_ids = loaded_ids ^ self.hidden_ids
+        if changed_ids:
+            index = self.layer.fields().indexOf("loaded")
+            self.layer.dataProvider().changeAttributeValues({
+                self.map_entities[entity_id].feature.id(): {index: int(entity_id in loaded_ids)}
+                for entity_id in changed_ids
+                if entity_id in self.map_entities
+            })
+            self.hidden_ids = loaded_ids
+            self.layer.triggerRepaint()
 
-    def refresh_load(self):
-        """
-       Partie du refresh qui traite les entitées chargée
-       """
-        ids = [entity.get_id() for entity in self.map_entities.values() if self.is_loaded(entity)]
-
-        if ids:
-            self.layer.setSubsetString("id NOT IN (" + ", ".join(str(id_) for id_ in ids) + ")")
-            for entity_id, entity_list in self.entities_loaded.items():
-                entity = self.map_entities.get(entity_id)
-                if entity:
-                    names = [entity_loaded.get_name() for entity_loaded in entity_list]
-                    text = "Stock: "
-                    text += ", ".join(names)
-                    entity.append_text(text)
-        else:
-            self.layer.setSubsetString("")
+        return ids
 
 
     def log_trace(self, entity: 'MapEntity', old_point: QgsPointXY):
@@ -853,35 +2145,275 @@ class LayerTraceQGIS(QObject):
         entity (MapEntity): L'entité cartographique concernée.
         old_point (QgsPointXY): Le point précédent de l'entité.
 
-        Cette méthode crée une nouvelle entité dans la couche de trace représentant
-        le déplacement de l'entité cartographique. La géométrie de la nouvelle entité
-        est une ligne reliant l'ancien point à la position actuelle de l'entité. Les
-        attributs "id" et "nom" de l'entité sont également définis.
+        Cette méthode crée un segment reliant l'ancien point à la position actuelle de l'entité, pour le tick courant.
+        Le segment est mis en attente et écrit dans la couche trace avec ceux du même tick par flush_traces.
+        """
+        self.add_trace(entity, old_point, entity.feature.geometry().asPoint(), self.tick)
+
+    def add_trace(self, entity: 'MapEntity', old_point: QgsPointXY, new_point: QgsPointXY, tick: int):
+        """
+        Met en attente un segment de trace après application de la politique de décimation.
+
+        Paramètres:
+        entity (MapEntity): L'entité cartographique concernée.
+        old_point (QgsPointXY): Le point de départ du déplacement.
+        new_point (QgsPointXY): Le point d'arrivée du déplacement.
+        tick (int): Le tick du déplacement.
+
+        Comportement:
+        - Si le tick n'est pas un multiple de trace_every_n_ticks ou si la distance parcourue depuis le dernier
+          segment tracé est inférieure à trace_min_distance, le déplacement est ignoré et son point de départ
+          est conservé comme point de départ du prochain segment.
+        - Sinon, en mode TRACE_SEGMENTS, crée une entité QGIS reliant le point de départ au point d'arrivée avec
+          les attributs "id", "nom" et "tick" ; dans les autres modes, prolonge la polyligne de l'entité
+          (voir add_trace_vertex).
         """
+        entity_id = entity.get_id()
+        if self.trace_mode == LayerTraceQGIS.TRACE_MOVE and self.trace_last_moves.get(entity_id) != tick - 1:
+            self.open_polylines.pop(entity_id, None)
+        self.trace_last_moves[entity_id] = tick
+
+        start_point = self.trace_anchors.get(entity.get_id(), old_point)
+
+        if tick % self.trace_every_n_ticks != 0 or (
+            self.trace_min_distance > 0
+            and Utils.haversine_distance(start_point.y(), start_point.x(), new_point.y(), new_point.x()) < self.trace_min_distance
+        ):
+            self.trace_anchors[entity.get_id()] = start_point
+            return
+
+        self.trace_anchors.pop(entity.get_id(), None)
+
+        if self.trace_mode != LayerTraceQGIS.TRACE_SEGMENTS:
+            self.add_trace_vertex(entity, start_point, new_point, tick)
+            return
+
         feature = QgsFeature(self.layer_trace.fields())
-        feature.setGeometry(QgsGeometry.fromPolylineXY([old_point, entity.feature.geometry().asPoint()]))
+        feature.setGeometry(QgsGeometry.fromPolylineXY([start_point, new_point]))
         feature.setAttribute("id", entity.get_id())
         feature.setAttribute("nom", entity.get_name())
-        self.layer_trace.dataProvider().addFeature(feature)
+        feature.setAttribute("tick", tick)
+        self.pending_traces.append(feature)
+
+    def add_trace_vertex(self, entity: 'MapEntity', start_point: QgsPointXY, new_point: QgsPointXY, tick: int):
+        """
+        Prolonge la polyligne ouverte de l'entité d'un segment, ou en crée une si l'entité n'en a pas.
+
+        Paramètres:
+        entity (MapEntity): L'entité cartographique concernée.
+        start_point (QgsPointXY): Le point de départ du segment.
+        new_point (QgsPointXY): Le point d'arrivée du segment.
+        tick (int): Le tick du segment.
+        """
+        polyline = self.open_polylines.get(entity.get_id())
+        if polyline is None:
+            polyline = TracePolyline(entity.get_id(), entity.get_name(), start_point, new_point, tick)
+            self.trace_polylines.append(polyline)
+            self.open_polylines[entity.get_id()] = polyline
+        else:
+            polyline.append(start_point, new_point, tick)
+
+        self.mark_polyline_dirty(polyline)
+
+    def mark_polyline_dirty(self, polyline: TracePolyline):
+        """
+        Met une polyligne en attente d'écriture dans la couche trace, si elle ne l'est pas déjà.
+
+        Paramètres:
+        polyline (TracePolyline): La polyligne modifiée.
+        """
+        if not polyline.dirty:
+            polyline.dirty = True
+            self.dirty_polylines.append(polyline)
+
+    def flush_traces(self, force: bool = True):
+        """
+        Écrit dans la couche trace les segments et les polylignes en attente.
+
+        Les segments et les nouvelles polylignes sont ajoutés en un seul appel à addFeatures, la géométrie des
+        polylignes prolongées ou tronquées est remplacée en un seul appel à changeGeometryValues. Les polylignes
+        sont écrites sans simplification, appliquée seulement hors lecture (voir simplify_traces).
+
+        Réécrire une polyligne copie tous ses sommets : pendant la lecture, les polylignes déjà présentes dans la
+        couche ne sont réécrites que tous les TRACE_WRITE_INTERVAL ticks, et le restent en attente entre-temps.
+
+        Paramètres:
+        force (bool): Indique si les polylignes déjà présentes dans la couche sont réécrites quel que soit le
+                      nombre de ticks depuis leur dernière réécriture (pause, déplacement, arrêt).
+        """
+        if self.pending_traces:
+            features = self.pending_traces
+            self.pending_traces = []
+            _, features = self.layer_trace.dataProvider().addFeatures(features)
+            self.index_trace_features(features)
+
+        if not self.dirty_polylines:
+            return
+
+        polylines = self.dirty_polylines
+        self.dirty_polylines = []
+
+        if not force and abs(self.tick - self.trace_written_tick) < LayerTraceQGIS.TRACE_WRITE_INTERVAL:
+            self.dirty_polylines = [polyline for polyline in polylines if polyline.feature_id is not None]
+            polylines = [polyline for polyline in polylines if polyline.feature_id is None]
+        else:
+            geometries = {
+                polyline.feature_id: polyline.get_geometry()
+                for polyline in polylines
+                if polyline.feature_id is not None
+            }
+            if geometries:
+                self.layer_trace.dataProvider().changeGeometryValues(geometries)
+            self.trace_written_tick = self.tick
+
+        added = [polyline for polyline in polylines if polyline.feature_id is None]
+        if added:
+            features = []
+            for polyline in added:
+                feature = QgsFeature(self.layer_trace.fields())
+                feature.setGeometry(polyline.get_geometry())
+                feature.setAttribute("id", polyline.entity_id)
+                feature.setAttribute("nom", polyline.name)
+                feature.setAttribute("tick", polyline.get_first_tick())
+                features.append(feature)
+            _, features = self.layer_trace.dataProvider().addFeatures(features)
+            for polyline, feature in zip(added, features):
+                polyline.feature_id = feature.id()
+
+        for polyline in polylines:
+            polyline.dirty = False
+            polyline.simplified = False
+
+    def simplify_traces(self):
+        """
+        Remplace dans la couche trace la géométrie des polylignes par leur géométrie simplifiée (Douglas-Peucker,
+        tolérance trace_tolerance), en un seul appel à changeGeometryValues.
+
+        La simplification parcourt tous les sommets d'une polyligne : elle n'est pas appliquée à chaque tick mais
+        à la pause, après un déplacement dans la simulation ou une troncature, et seules les polylignes modifiées
+        depuis leur dernière simplification sont réécrites.
+        """
+        if self.trace_mode == LayerTraceQGIS.TRACE_SEGMENTS or self.trace_tolerance <= 0:
+            return
+
+        self.flush_traces()
+        polylines = [polyline for polyline in self.trace_polylines if not polyline.simplified]
+        if not polylines:
+            return
+
+        self.layer_trace.dataProvider().changeGeometryValues({
+            polyline.feature_id: polyline.get_geometry(self.trace_tolerance) for polyline in polylines
+        })
+        for polyline in polylines:
+            polyline.simplified = True
+        self.layer_trace.triggerRepaint()
+
+    def index_trace_features(self, features: list[QgsFeature]):
+        """
+        Ajoute des segments écrits dans la couche trace à l'index trace_feature_ids.
+
+        Les segments arrivent normalement par ticks croissants (lecture, reconstruction depuis la chronologie) ;
+        sinon l'index est retrié pour que delete_trace_from puisse le parcourir depuis le dernier tick.
+
+        Paramètres:
+        features (list[QgsFeature]): Les segments, avec les identifiants attribués par le fournisseur.
+        """
+        last_tick = next(reversed(self.trace_feature_ids), None)
+        ordered = True
+        for feature in features:
+            tick = feature.attribute("tick")
+            if last_tick is not None and tick < last_tick:
+                ordered = False
+            self.trace_feature_ids.setdefault(tick, []).append(feature.id())
+            last_tick = max(tick, last_tick) if last_tick is not None else tick
+
+        if not ordered:
+            self.trace_feature_ids = dict(sorted(self.trace_feature_ids.items()))
+
+    def clear_trace(self):
+        """
+        Vide la couche trace, les segments et les polylignes en attente et les points de départ conservés par la décimation.
+        """
+        self.pending_traces = []
+        self.trace_feature_ids = {}
+        self.trace_anchors = {}
+        self.trace_polylines = []
+        self.open_polylines = {}
+        self.dirty_polylines = []
+        self.trace_last_moves = {}
+
+        self.layer_trace.startEditing()
+        self.layer_trace.dataProvider().truncate()
+        self.layer_trace.commitChanges()
+
+    def set_trace_decimation(self, every_n_ticks: int, min_distance: float):
+        """
+        Configure la politique de décimation des traces.
+
+        Paramètres:
+        every_n_ticks (int): Seuls les ticks multiples de cette valeur sont tracés, ramené à 1 au minimum.
+        min_distance (float): Distance minimale en mètres parcourue avant de tracer un segment, 0 pour la désactiver.
+        """
+        self.trace_every_n_ticks = max(int(every_n_ticks), 1)
+        self.trace_min_distance = max(float(min_distance), 0)
+        self.trace_anchors = {}
+
+    def set_trace_mode(self, mode: str, tolerance: float = 0):
+        """
+        Change le mode de trace des déplacements et la tolérance de simplification des polylignes.
+
+        Si le mode change, la couche trace est vidée puis reconstruite depuis la chronologie si elle est compilée ;
+        sans chronologie, seuls les déplacements suivants sont tracés dans le nouveau mode. Si seule la tolérance
+        change, les polylignes sont réécrites, simplifiées avec la nouvelle tolérance.
+
+        Paramètres:
+        mode (str): TRACE_SEGMENTS, TRACE_ENTITY ou TRACE_MOVE.
+        tolerance (float): Tolérance de simplification (Douglas-Peucker) en unités de la carte, 0 pour la désactiver.
+
+        Exceptions:
+        ValueError: Levée si le mode de trace n'est pas reconnu.
+        """
+        if mode not in (LayerTraceQGIS.TRACE_SEGMENTS, LayerTraceQGIS.TRACE_ENTITY, LayerTraceQGIS.TRACE_MOVE):
+            raise ValueError(f"Mode de trace inconnu : {mode}")
+
+        mode_changed = mode != self.trace_mode
+        self.trace_mode = mode
+        self.trace_tolerance = max(float(tolerance), 0)
+
+        if mode_changed:
+            if self.timeline is not None:
+                self.rebuild_trace(self.tick - 1)
+            else:
+                self.clear_trace()
+        else:
+            for polyline in self.trace_polylines:
+                self.mark_polyline_dirty(polyline)
+            self.flush_traces()
+        self.simplify_traces()
+
+        self.layer_trace.triggerRepaint()
 
     def unload(self):
         """
         Décharge les ressources, déconnecte les signaux et libère les couches et entités cartographiques associées.
 
         Cette méthode effectue les actions suivantes :
-        - Arrête le minuteur utilisé par l'application.
-        - Déconnecte les signaux liés au changement d'extension de la carte et au rafraîchissement.
+        - Arrête le minuteur utilisé par l'application et annule l'export d'images en cours.
+        - Arrête le minuteur des étiquettes et déconnecte les signaux liés au changement d'extension de la carte et au rafraîchissement.
         - Vide toutes les entités cartographiques et libère les ressources associées.
         - Supprime les couches de points, de lignes et de traces si elles existent.
         - Supprime le groupe "Trace QGIS" du projet QGIS.
-        - Réinitialise l'instance singleton de LayerTraceQGIS à None.
+        - Réinitialise l'instance singleton de LayerTraceQGIS à None, ainsi que la simulation courante si c'est la sienne.
         """
         self.stop_timer()
-        iface.mapCanvas().extentsChanged.disconnect(self.update_all_labels)
-        self.timer.timeout.disconnect(self.refresh)
+        self.label_timer.stop()
+        self.cancel_frame_export()
+        iface.mapCanvas().extentsChanged.disconnect(self.schedule_label_update)
+        self.label_timer.timeout.disconnect(self.update_all_labels)
+        self.timer.timeout.disconnect(self.play_step)
 
         self.map_entities.clear()
-        self.entities_loaded.clear()
+        self.simulation.load_registry.clear()
 
         for map_entity in self.map_entities.values():
             map_entity.unload()
@@ -909,6 +2441,8 @@ class LayerTraceQGIS(QObject):
                 parent.removeChildNode(group)
 
         LayerTraceQGIS._instance = None
+        if Simulation._instance is self.simulation:
+            Simulation._instance = None
 
     @staticmethod
     def get_map_entity(entity_id: str):
@@ -917,15 +2451,3 @@ class LayerTraceQGIS(QObject):
     @staticmethod
     def get_current_tick() -> int:
         return int(LayerTraceQGIS.get_instance().tick)
-
-    @staticmethod
-    def static_load_entity(entity: 'MapEntity', entity_load: 'MapEntity') -> bool:
-        return LayerTraceQGIS.get_instance().load_entity(entity, entity_load)
-
-    @staticmethod
-    def static_unload_entity(entity: 'MapEntity', entity_load: 'MapEntity') -> bool:
-        return LayerTraceQGIS.get_instance().unload_entity(entity, entity_load)
-
-    @staticmethod
-    def static_is_loaded(entity_load: 'MapEntity', in_entity: 'MapEntity' = None) -> bool:
-        return LayerTraceQGIS.get_instance().is_loaded(entity_load, in_entity)
\ No newline at end of file
@@ -0,0 +1,173 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .entity_state import EntityState
+
+class LoadRegistry:
+    """
+    Classe LoadRegistry
+
+    Registre indexé des entités chargées : chaque entité chargée n'a qu'un seul contenant, qui peut lui-même être
+    chargé dans une autre entité (chargements imbriqués).
+
+    Les questions « l'entité est-elle chargée ? » et « l'entité est-elle chargée dans ce contenant ? » sont résolues
+    en temps constant par le dictionnaire enfant -> contenant, sans parcourir les contenants.
+
+    Attributs :
+        children      Dictionnaire identifiant du contenant -> dictionnaire identifiant -> entité chargée,
+                      dans l'ordre de chargement.
+        container_of  Dictionnaire identifiant de l'entité chargée -> identifiant de son contenant.
+    """
+
+    def __init__(self, entities_loaded: dict = {}):
+        """
+        Initialise le registre à partir d'un dictionnaire identifiant -> entités chargées.
+
+        Paramètres:
+        entities_loaded (dict): Dictionnaire identifiant du contenant -> liste des entités chargées. Par défaut, vide.
+        """
+        self.children = {}
+        self.container_of = {}
+        self.set_loaded(entities_loaded)
+
+    def __bool__(self) -> bool:
+        return bool(self.container_of)
+
+    def __len__(self) -> int:
+        return len(self.container_of)
+
+    def clear(self):
+        """
+        Vide le registre.
+        """
+        self.children = {}
+        self.container_of = {}
+
+    def set_loaded(self, entities_loaded: dict):
+        """
+        Remplace le contenu du registre par un dictionnaire identifiant -> entités chargées.
+
+        Paramètres:
+        entities_loaded (dict): Dictionnaire identifiant du contenant -> liste des entités chargées.
+        """
+        self.clear()
+        for container_id, entity_list in entities_loaded.items():
+            for entity in entity_list:
+                self.load(container_id, entity)
+
+    def to_dict(self) -> dict:
+        """
+        Retourne le contenu du registre sous forme de dictionnaire identifiant -> liste des entités chargées.
+
+        Retourne:
+        dict: Une copie, les listes sont dans l'ordre de chargement.
+        """
+        return {container_id: list(children.values()) for container_id, children in self.children.items()}
+
+    def load(self, container_id: str, entity: 'EntityState') -> bool:
+        """
+        Charge une entité dans un contenant. Une entité déjà chargée ailleurs est d'abord retirée de son contenant.
+
+        Paramètres:
+        container_id (str): L'identifiant du contenant.
+        entity (EntityState): L'entité à charger.
+
+        Retourne:
+        bool: False si le chargement formerait un cycle (le contenant est l'entité elle-même ou se trouve à
+        l'intérieur de l'entité), True sinon.
+        """
+        entity_id = entity.get_id()
+        if entity_id == container_id or self.is_inside(container_id, entity_id):
+            return False
+
+        if self.container_of.get(entity_id) != container_id:
+            self.unload(entity_id)
+            self.container_of[entity_id] = container_id
+        self.children.setdefault(container_id, {})[entity_id] = entity
+        return True
+
+    def unload(self, entity_id: str, container_id: str = None) -> bool:
+        """
+        Retire une entité de son contenant. Les entités qu'elle contient restent chargées dans celle-ci.
+
+        Paramètres:
+        entity_id (str): L'identifiant de l'entité à décharger.
+        container_id (str): Si renseigné, l'entité n'est déchargée que si elle se trouve dans ce contenant.
+
+        Retourne:
+        bool: True si l'entité a été déchargée, False si elle n'était pas chargée (dans ce contenant).
+        """
+        current_id = self.container_of.get(entity_id)
+        if current_id is None or (container_id is not None and current_id != container_id):
+            return False
+
+        del self.container_of[entity_id]
+        children = self.children[current_id]
+        del children[entity_id]
+        if not children:
+            del self.children[current_id]
+        return True
+
+    def is_loaded(self, entity_id: str, container_id: str = None) -> bool:
+        """
+        Vérifie si une entité est chargée, directement dans un contenant donné ou dans n'importe quel contenant.
+
+        Paramètres:
+        entity_id (str): L'identifiant de l'entité.
+        container_id (str): L'identifiant du contenant, None pour n'importe quel contenant.
+
+        Retourne:
+        bool: True si l'entité est chargée (dans ce contenant).
+        """
+        if container_id is None:
+            return entity_id in self.container_of
+        return self.container_of.get(entity_id) == container_id
+
+    def get_container(self, entity_id: str) -> str | None:
+        """
+        Retourne l'identifiant du contenant direct d'une entité, None si elle n'est pas chargée.
+        """
+        return self.container_of.get(entity_id)
+
+    def get_children(self, container_id: str) -> list['EntityState']:
+        """
+        Retourne les entités chargées directement dans un contenant, dans l'ordre de chargement.
+        """
+        return list(self.children.get(container_id, {}).values())
+
+    def get_root_container(self, entity_id: str) -> str | None:
+        """
+        Retourne l'identifiant du contenant le plus extérieur d'une entité, None si elle n'est pas chargée.
+
+        Le coût est proportionnel à la profondeur d'imbrication.
+        """
+        container_id = self.container_of.get(entity_id)
+        while container_id in self.container_of:
+            container_id = self.container_of[container_id]
+        return container_id
+
+    def is_inside(self, entity_id: str, container_id: str) -> bool:
+        """
+        Vérifie si une entité se trouve dans un contenant, directement ou à l'intérieur d'une entité qu'il contient.
+
+        Le coût est proportionnel à la profondeur d'imbrication.
+        """
+        current_id = self.container_of.get(entity_id)
+        while current_id is not None:
+            if current_id == container_id:
+                return True
+            current_id = self.container_of.get(current_id)
+        return False
+
+    def get_contents(self, container_id: str) -> list['EntityState']:
+        """
+        Retourne toutes les entités contenues dans un contenant, y compris celles chargées dans ces entités.
+
+        Retourne:
+        list[EntityState]: Les entités, en profondeur d'abord et dans l'ordre de chargement.
+        """
+        contents = []
+        for entity_id, entity in self.children.get(container_id, {}).items():
+            contents.append(entity)
+            contents.extend(self.get_contents(entity_id))
+        return contents
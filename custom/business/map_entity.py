@@ -18,9 +18,18 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     pass
 
+from .entity_state import EntityState
 from .layer_trace_qgis import LayerTraceQGIS
+from .symbol_cache import SymbolCache
 
-class MapEntity:
+class MapEntity(EntityState):
+    """
+    Classe MapEntity
+
+    Représentation dans QGIS d'une entité : son état de simulation (EntityState) associé à l'entité de la couche
+    principale, à l'étiquette QLabel et à la catégorie de rendu. Les déplacements sont reportés sur la géométrie
+    de l'entité QGIS et signalés à LayerTraceQGIS.
+    """
 
     def __init__(self, id: str, name: str, url_icon: str, latitude: float, longitude: float, altitude: float = 0, size: float = 5):
         """
@@ -36,259 +45,55 @@ class MapEntity:
         size (float, optionnel): Taille de l'objet, par défaut à 5.
 
         Attributs:
-        id: Stocke l'identifiant de l'instance.
-        name: Stocke le nom de l'instance.
-        url_icon: Stocke l'URL de l'icône.
-        url_icon_default: Valeur par défaut pour l'URL de l'icône.
-        size: Taille de l'instance en tant que nombre décimal.
-        size_default: Taille par défaut de l'instance.
-        angle: Angle de rotation de l'instance, initialisé à 0.
-        opacity: Niveau d'opacité de l'instance, initialisé à 1.
-        highlight: Met en évidence une sélection, initialisé à None.
-        background_image: Image d'arrière-plan, initialisé à None.
-        latitude_default: Latitude initiale par défaut.
-        longitude_default: Longitude initiale par défaut.
-        altitude: Altitude actuelle de l'instance.
-        altitude_default: Altitude par défaut de l'instance.
-        texts: Liste des textes associés à l'instance.
-
-        need_refresh_category: Détermine si une catégorie nécessite une mise à jour, initialisé à False.
-        need_update_label: Indique si une étiquette doit être mise à jour, initialisé à False.
+        Les attributs de l'état de simulation sont décrits dans EntityState.
 
         feature: Contient un objet QgsFeature avec un identifiant et un nom comme attributs, et une géométrie représentant le point XY.
-        label: Étiquette configurée pour le point.
+        label: Étiquette QLabel du point, créée à son premier affichage (None tant qu'elle n'est pas affichée ; jamais
+        créée en mode d'étiquetage natif).
         category: Catégorie calculée automatiquement pour organiser cette instance.
 
         Méthodes:
         create_label(): Crée une étiquette liée à cet objet.
+        get_label(): Retourne l'étiquette, créée si besoin.
+        delete_label(): Supprime l'étiquette si elle existe.
         update_label_position(refresh_category, refresh_feature): Met à jour la position de l'étiquette selon les paramètres fournis.
         generate_category(): Génère une catégorie spécifique associée à cet objet.
         """
-        self.id = id
-        self.name = name
-        self.url_icon = url_icon
-        self.url_icon_default = url_icon
-        self.size = float(size)
-        self.size_default = float(size)
-        self.angle = 0
-        self.opacity = 1
-        self.highlight = None
-        self.background_image = None
-        self.latitude_default = latitude
-        self.longitude_default = longitude
-        self.altitude = altitude
-        self.altitude_default = altitude
-        self.texts = []
-
-        self.need_refresh_category = False
-        self.need_update_label = False
+        super().__init__(id, name, url_icon, latitude, longitude, altitude, size)
 
         self.feature = QgsFeature()
         self.feature.setAttributes([id, name])
         self.feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(longitude, latitude)))
 
-        self.label = self.create_label()
+        self.label = None
         self.update_label_position(False, False)
 
         self.category = self.generate_category()
 
-    def get_latitude(self) -> float:
-        """
-        Renvoie la latitude du point géométrique.
-
-        Retourne:
-            float: La latitude du point.
-        """
-        point = self.feature.geometry().asPoint()
-        return point.y()  # y correspond à la latitude
-
-    def get_longitude(self) -> float:
-        """
-        Récupère la longitude d'une entité géographique.
-
-        Retourne:
-            float: La coordonnée x (longitude) du point géométrique associé à l'entité.
-        """
-        point = self.feature.geometry().asPoint()
-        return point.x()
-
-    def get_altitude(self) -> float:
-        """
-        Renvoie l'altitude actuelle.
-
-        Retourne:
-            float: La valeur de l'altitude.
-        """
-        return self.altitude
-
-    def set_altitude(self, value: float):
-        """
-        Définit l'altitude à la valeur spécifiée.
-
-        Paramètres:
-        value (float): La nouvelle valeur de l'altitude.
-        """
-        self.altitude = value
-
-    def get_url_icon(self) -> str:
-        """
-        Retourne l'icône d'URL.
-
-        Renvoie:
-        Une chaîne de caractères représentant l'icône d'URL.
-        """
-        return self.url_icon
-
-    def set_url_icon(self, value: str, need_refresh_category: bool = True):
-        """
-        Définit l'icône d'URL et met à jour l'état de rafraîchissement de la catégorie si nécessaire.
-
-        Paramètres:
-        value (str): L'URL de l'icône à affecter.
-        need_refresh_category (bool): Indique s'il est nécessaire de marquer la catégorie pour un rafraîchissement. Par défaut à True.
-        """
-        self.url_icon = value
-        self.set_need_refresh_category(need_refresh_category)
-
-    def reset_url_icon(self):
-        """
-        Réinitialise l'icône de l'URL à sa valeur par défaut.
-
-        Cette méthode remplace l'icône actuelle de l'URL par l'icône par défaut spécifiée dans l'attribut url_icon_default.
-        """
-        self.set_url_icon(self.url_icon_default)
-
-    def get_background_image(self) -> str:
-        """
-        Renvoie l'image d'arrière-plan actuelle.
-
-        Cette méthode retourne le chemin ou l'identifiant de l'image d'arrière-plan actuellement définie.
-
-        Retourne:
-            str: L'image d'arrière-plan.
-        """
-        return self.background_image
-
-    def set_background_image(self, value: str|None, need_refresh_category: bool = True):
-        """
-        Définit l'image d'arrière-plan de l'objet.
-
-        Parameters:
-         value (str | None): Chemin ou identifiant de l'image à définir comme arrière-plan, ou None pour supprimer l'image existante.
-         need_refresh_category (bool): Indique si une actualisation de la catégorie est nécessaire après la modification de l'image d'arrière-plan. La valeur par défaut est True.
-        """
-        self.background_image = value
-        self.set_need_refresh_category(need_refresh_category)
-
-    def reset_background_image(self):
-        """
-        Réinitialise l'image d'arrière-plan à sa valeur par défaut.
-
-        Cette méthode supprime l'image d'arrière-plan actuellement définie
-        en assignant une valeur nulle, indiquant qu'aucune image n'est utilisée.
-        """
-        self.set_background_image(None)
-
-    def get_highlight(self) -> bool:
-        """
-        Renvoie l'état de mise en évidence.
-
-        Retourne:
-        bool: La valeur de l'attribut highlight indiquant si un élément est mis en évidence.
-        """
-        return self.highlight
-
-    def set_highlight(self, value: str|None, need_refresh_category: bool = True):
-        """
-        Définit la valeur de mise en surbrillance et met à jour l'état de rafraîchissement de la catégorie si nécessaire.
-
-        Arguments:
-        value: Une chaîne ou None représentant la valeur de mise en surbrillance à définir.
-        need_refresh_category: Un booléen indiquant si la catégorie doit être rafraîchie. Par défaut, True.
-        """
-        self.highlight = value
-        self.set_need_refresh_category(need_refresh_category)
-
-    def reset_highlight(self):
-        """
-        Réinitialise la mise en surbrillance de l'objet.
-
-        Définit la mise en surbrillance sur "None" pour indiquer qu'aucune
-        mise en surbrillance n'est actuellement active.
-        """
-        self.set_highlight(None)
-
-    def get_size(self) -> float:
-        """
-        Retourne la taille de l'objet.
-
-        Retour :
-            float : La taille de l'objet.
-        """
-        return self.size
-
-    def set_size(self, value: float, need_refresh_category: bool = True):
+    def move_to(self, lat: float, lon: float, alti: float):
         """
-        Définit la taille et met à jour l'état pour indiquer si une actualisation de catégorie est nécessaire.
+        Déplace l'entité vers nouvelles coordonnées géographiques et met à jour l'altitude.
 
         Paramètres:
-        value (float): La nouvelle taille à définir.
-        need_refresh_category (bool): Indique si une actualisation de catégorie est nécessaire. Par défaut, True.
-        """
-        self.size = value
-        self.set_need_refresh_category(need_refresh_category)
-
-    def reset_size(self):
-        """
-        Réinitialise la taille d'un objet à la valeur par défaut.
-
-        Cette méthode met à jour la taille actuelle de l'objet en utilisant
-        la valeur par défaut définie dans l'attribut `size_default`.
-        """
-        self.set_size(self.size_default)
-
-    def get_texts(self) -> list[str]:
-        """
-        Récupère une liste de textes.
-
-        Renvoie :
-            list[str] : Une liste de chaînes de caractères.
-        """
-        return self.texts
-
-    def set_texts(self, value: list[str]):
-        """
-        Définit les textes avec une liste de chaînes spécifiées.
-
-        Paramètres :
-        value (list[str]) : Liste de chaînes à assigner à l'attribut texts.
-
-        Comportement :
-        - Met à jour l'attribut texts avec la liste fournie.
-        - Indique que l'étiquette nécessite une mise à jour en définissant l'indicateur approprié à True.
-        """
-        self.texts = value
-        self.set_need_update_label(True)
-
-    def append_text(self, text: str):
-        """
-        Ajoute un texte à la liste des textes et met à jour l'état de l'étiquette.
+        lat (float): La latitude de la nouvelle position.
+        lon (float): La longitude de la nouvelle position.
+        alti (float): La nouvelle altitude.
 
-        Paramètres:
-        text (str): Le texte à ajouter.
+        Actions:
+        - Met à jour l'état de simulation de l'entité (EntityState.move_to).
+        - Définit la nouvelle géométrie de l'entité QGIS avec les coordonnées données.
+        - Signale la géométrie à LayerTraceQGIS, qui met à jour les données de la couche en une fois pour toutes les entités.
         """
-        self.texts.append(text)
-        self.set_need_update_label(True)
+        super().move_to(lat, lon, alti)
+        self.feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(lon, lat)))
+        LayerTraceQGIS.get_instance().mark_geometry_dirty(self.feature)
 
-    def reset_text(self):
+    def reset(self):
         """
-        Réinitialise les textes de l'objet.
-
-        Vérifie si des textes existent. Si c'est le cas, remplace les textes existants
-        par une liste vide.
+        Réinitialise l'état de l'objet à ses valeurs par défaut (EntityState.reset) puis réinitialise l'étiquette associée.
         """
-        if self.texts:
-            self.set_texts([])
+        super().reset()
+        self.reset_label()
 
     def get_feature(self) -> str:
         """
@@ -299,170 +104,89 @@ class MapEntity:
         """
         return self.feature
 
-    def get_need_refresh_category(self) -> bool:
-        """
-        Retourne la valeur de l'attribut need_refresh_category.
-
-        Renvoie:
-         bool: La valeur de l'attribut need_refresh_category.
-        """
-        return self.need_refresh_category
-
-    def set_need_refresh_category(self, value: bool):
-        """
-        Définit la nécessité de rafraîchir la catégorie.
-
-        Paramètres:
-        value (bool): Indique si la catégorie doit être marquée comme nécessitant un rafraîchissement.
-
-        Comportement:
-        Si l'attribut 'need_refresh_category' est actuellement défini sur False, il sera mis à jour avec la valeur spécifiée.
+    def get_category(self):
         """
-        if self.need_refresh_category is False:
-            self.need_refresh_category = value
+        Renvoie la catégorie après avoir vérifié si une mise à jour est nécessaire.
 
-    def get_need_update_label(self) -> bool:
-        """
-        Renvoie l'état actuel de l'attribut need_update_label.
+        Si la catégorie nécessite une mise à jour (indiquée par l'attribut need_refresh_category),
+        elle est régénérée en appelant la méthode generate_category. Une fois mise à jour,
+        la propriété need_refresh_category est définie sur False pour indiquer que la catégorie est actuelle.
 
         Retourne:
-            bool : La valeur de l'attribut need_update_label indiquant si une mise à jour de l'étiquette est nécessaire.
-        """
-        return self.need_update_label
-
-    def set_need_update_label(self, value: bool):
-        """
-        Définit si l'attribut need_update_label doit être mis à jour.
-
-        Paramètres:
-        value (bool): Valeur indiquant si l'attribut need_update_label doit être mis à jour.
-        """
-        if self.need_update_label is False:
-            self.need_update_label = value
-
-    def get_name(self) -> str:
-        """
-        Renvoie le nom.
-
-        Retour:
-            str: Le nom.
-        """
-        return self.name
-
-    def set_name(self, value: str):
-        """
-        Définit le nom de l'objet.
-
-        Paramètres:
-        value (str): Le nom à attribuer à l'objet.
-        """
-        self.name = value
-
-    def get_angle(self) -> float:
-        """
-        Renvoie l'angle actuel.
-
-        Retour:
-        float : La valeur de l'angle.
-        """
-        return self.angle
-
-    def set_angle(self, value: float, need_refresh_category: bool = True):
-        """
-        Définit l'angle à une valeur spécifiée et, si nécessaire, met à jour l'état de rafraîchissement de la catégorie.
-
-        Paramètres:
-        value (float): La valeur de l'angle à définir.
-        need_refresh_category (bool): Indique si la catégorie doit être marquée pour un rafraîchissement. La valeur par défaut est True.
-        """
-        self.angle = value
-        self.set_need_refresh_category(need_refresh_category)
-
-    def reset_angle(self):
-        """
-        Réinitialise l'angle de l'objet à zéro.
-
-        Cette méthode modifie l'angle actuel de l'objet en le fixant à 0.
-        Elle utilise la méthode interne set_angle pour effectuer cette opération.
+        La catégorie actualisée ou non actualisée selon l'état de need_refresh_category.
         """
-        self.set_angle(0)
+        if self.need_refresh_category:
+            self.category = self.generate_category()
+            self.need_refresh_category = False
 
-    def get_id(self) -> str:
-        """
-        Cette méthode retourne l'identifiant unique associé à l'objet.
+        return self.category
 
-        Retour:
-            str: L'identifiant unique de l'objet.
+    def get_render_attributes(self) -> dict:
         """
-        return self.id
+        Renvoie les valeurs des champs lus par le rendu par attributs de LayerTraceQGIS.
 
-    def get_opacity(self) -> float:
-        """
-        Renvoie l'opacité actuelle.
+        Comme pour get_category, la propriété need_refresh_category est définie sur False puisque
+        la couche est mise à jour avec ces valeurs.
 
         Retourne:
-            float: La valeur de l'opacité.
+        dict: Dictionnaire nom du champ -> valeur (taille, angle, opacité, icône, surbrillance et arrière-plan).
         """
-        return self.opacity
+        self.need_refresh_category = False
 
-    def set_opacity(self, value: float, need_refresh_category: bool = True):
-        """
-        Définit l'opacité de l'objet.
+        return {
+            "size": self.size,
+            "angle": self.angle,
+            "opacity": self.opacity,
+            "icon": self.url_icon,
+            "highlight": self.highlight,
+            "background": self.background_image,
+        }
 
-        Paramètres:
-        value (float): La nouvelle valeur d'opacité.
-        need_refresh_category (bool, optionnel): Indique si une actualisation de la catégorie est nécessaire. Valeur par défaut à True.
-        """
-        self.opacity = value
-        self.set_need_refresh_category(need_refresh_category)
 
-    def reset_opacity(self):
-        """
-        Réinitialise l'opacité de l'objet.
-        Fixe l'opacité à la valeur maximale (1).
+    def generate_category(self) -> QgsRendererCategory:
         """
-        self.set_opacity(1)
+        Génère une catégorie de rendu basée sur les propriétés de l'objet.
 
-    def get_category(self):
-        """
-        Renvoie la catégorie après avoir vérifié si une mise à jour est nécessaire.
-
-        Si la catégorie nécessite une mise à jour (indiquée par l'attribut need_refresh_category),
-        elle est régénérée en appelant la méthode generate_category. Une fois mise à jour,
-        la propriété need_refresh_category est définie sur False pour indiquer que la catégorie est actuelle.
+        Le symbole est recherché dans le cache partagé SymbolCache à partir de l'état visuel de l'entité (taille et
+        angle quantifiés). S'il est absent, il est construit par build_symbol puis ajouté au cache. La catégorie
+        reçoit un clone du symbole partagé.
 
         Retourne:
-        La catégorie actualisée ou non actualisée selon l'état de need_refresh_category.
+        Un objet QgsRendererCategory contenant le symbole configuré et les propriétés associées.
         """
-        if self.need_refresh_category:
-            self.category = self.generate_category()
-            self.need_refresh_category = False
+        cache = SymbolCache.get_instance()
+        key = cache.make_key(self.url_icon, self.size, self.angle, self.opacity, self.highlight, self.background_image)
 
-        return self.category
+        symbol = cache.get(key)
+        if symbol is None:
+            symbol = MapEntity.build_symbol(*key)
+            cache.put(key, symbol)
 
+        return QgsRendererCategory(self.id, symbol.clone(), self.name)
 
-    def generate_category(self) -> QgsRendererCategory:
+    @staticmethod
+    def build_symbol(url_icon: str, size: float, angle: float, opacity: float, highlight: str | None, background_image: str | None) -> QgsMarkerSymbol:
         """
-        Génère une catégorie de rendu basée sur les propriétés de l'objet.
+        Construit le symbole correspondant à un état visuel.
 
-        Cette méthode crée un objet QgsRendererCategory utilisant un symbole configuré avec plusieurs couches symboliques en fonction des propriétés définies :
+        Cette méthode crée un symbole configuré avec plusieurs couches symboliques en fonction des propriétés données :
         - Une taille et une opacité générales pour le symbole.
-        - Ajout d'une couche de surbrillance avec un effet Glow si la propriété `highlight` est définie.
+        - Ajout d'une couche de surbrillance avec un effet Glow si `highlight` est défini.
         - Ajout d'une couche d'arrière-plan avec une image raster si `background_image` est spécifié.
         - Ajout de la couche principale du symbole basée sur l'image spécifique définie dans `url_icon`.
 
         Retourne:
-        Un objet QgsRendererCategory contenant le symbole configuré et les propriétés associées.
+        Un objet QgsMarkerSymbol configuré.
         """
         symbol = QgsMarkerSymbol()
         symbol.deleteSymbolLayer(0)
-        symbol.setSize(self.size)
-        symbol.setOpacity(self.opacity)
+        symbol.setSize(size)
+        symbol.setOpacity(opacity)
 
-        if self.highlight:
+        if highlight:
             # appliquer un effet blur sur glow_layer (si possible)
             glow_effect = QgsOuterGlowEffect()
-            glow_effect.setColor(QColor(self.highlight))
+            glow_effect.setColor(QColor(highlight))
             glow_effect.setSpread(5)
             glow_effect.setBlurLevel(1)
             glow_layer = QgsSimpleMarkerSymbolLayer()
@@ -470,80 +194,20 @@ class MapEntity:
 
             symbol.appendSymbolLayer(glow_layer)
 
-        if self.background_image:
-            background_layer = QgsRasterMarkerSymbolLayer(self.background_image)
-            background_layer.setSize(self.size * 3)
+        if background_image:
+            background_layer = QgsRasterMarkerSymbolLayer(background_image)
+            background_layer.setSize(size * 3)
             background_layer.setOpacity(0.5)
             symbol.appendSymbolLayer(background_layer)
-            symbol.setSize(self.size * 3)  # Taille du symbole
+            symbol.setSize(size * 3)  # Taille du symbole
 
         # Créer un QgsRasterMarkerSymbolLayer avec le fichier image
-        raster_layer = QgsRasterMarkerSymbolLayer(self.url_icon)  # mapEntity.url_icon est le chemin vers l'image
-        raster_layer.setSize(self.size)
-        raster_layer.setAngle(self.angle)
+        raster_layer = QgsRasterMarkerSymbolLayer(url_icon)  # url_icon est le chemin vers l'image
+        raster_layer.setSize(size)
+        raster_layer.setAngle(angle)
         symbol.appendSymbolLayer(raster_layer)
 
-        return QgsRendererCategory(self.id, symbol, self.name)
-
-    def move_to(self, lat: float, lon: float, alti: float):
-        """
-        Déplace l'entité vers nouvelles coordonnées géographiques et met à jour l'altitude.
-
-        Paramètres:
-        lat (float): La latitude de la nouvelle position.
-        lon (float): La longitude de la nouvelle position.
-        alti (float): La nouvelle altitude.
-
-        Actions:
-        - Définit la nouvelle géométrie de l'entité avec les coordonnées données.
-        - Met à jour les données de la couche pour refléter la nouvelle position.
-        - Met à jour la propriété `altitude` de l'entité.
-        - Indique qu'une mise à jour de l'étiquette est nécessaire.
-        """
-        self.feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(lon, lat)))
-        LayerTraceQGIS.get_instance().layer.dataProvider().changeGeometryValues({self.feature.id(): self.feature.geometry()})
-        self.altitude = alti
-        self.set_need_update_label(True)
-
-    def move_to_entity(self, map_entity):
-        """
-        Déplace l'objet actuel vers l'entité spécifiée en utilisant ses coordonnées.
-
-        Paramètres:
-        map_entity : Une entité vers laquelle bougée
-        """
-        self.move_to(map_entity.get_latitude(), map_entity.get_longitude(), map_entity.altitude)
-
-    def reset(self):
-        """
-        Réinitialise les attributs de l'objet à leurs valeurs par défaut.
-
-        Les méthodes appelées effectuent les actions suivantes :
-        - Réinitialise l'icône URL.
-        - Réinitialise la position de l'objet.
-        - Réinitialise la taille de l'objet.
-        - Réinitialise le texte de l'objet.
-        - Réinitialise l'angle de rotation de l'objet.
-        - Réinitialise l'opacité de l'objet.
-        - Réinitialise la mise en surbrillance de l'objet.
-        - Réinitialise l'image d'arrière-plan de l'objet.
-        - Réinitialise l'étiquette associée à l'objet.
-        """
-        self.reset_url_icon()
-        self.reset_position()
-        self.reset_size()
-        self.reset_text()
-        self.reset_angle()
-        self.reset_opacity()
-        self.reset_highlight()
-        self.reset_background_image()
-        self.reset_label()
-
-    def reset_position(self):
-        """
-        Réinitialise la position de l'objet aux valeurs par défaut.
-        """
-        self.move_to(self.latitude_default, self.longitude_default, self.altitude_default)
+        return symbol
 
     def create_label(self) -> QLabel:
         """
@@ -559,17 +223,34 @@ class MapEntity:
 
         return label
 
-    def reset_label(self):
+    def get_label(self) -> QLabel:
+        """
+        Retourne l'étiquette QLabel, en la créant si elle n'existe pas encore.
+
+        Retourne:
+            QLabel: L'étiquette de l'entité.
+        """
+        if self.label is None:
+            self.label = self.create_label()
+        return self.label
+
+    def delete_label(self):
         """
-        Réinitialise l'étiquette en cours en la supprimant et en en créant une nouvelle.
+        Supprime l'étiquette si elle existe : elle est masquée, détachée de son parent puis supprimée de la mémoire.
+        Elle sera recréée à son prochain affichage.
+        """
+        if self.label is not None:
+            self.hide_label()
+            self.label.setParent(None)
+            self.label.deleteLater()
+            self.label = None
 
-        Cette méthode cache d'abord l'étiquette existante, détache son parent et supprime l'étiquette de la mémoire.
-        Une nouvelle étiquette est ensuite recréée et marquée comme nécessitant une mise à jour.
+    def reset_label(self):
         """
-        self.hide_label()
-        self.label.setParent(None)
-        self.label.deleteLater()
-        self.label = self.create_label()
+        Réinitialise l'étiquette en cours en la supprimant ; elle est recréée à son prochain affichage et marquée
+        comme nécessitant une mise à jour. Sans étiquette (mode d'étiquetage natif), aucun widget n'est créé.
+        """
+        self.delete_label()
         self.set_need_update_label(True)
 
     def update_label_position(self, show_name: bool, show_position: bool):
@@ -634,55 +315,91 @@ class MapEntity:
 
     def generate_description_label(self, show_name: bool, show_position: bool) -> str:
         """
-        Génère l'étiquette descriptive basée sur les paramètres fournis.
+        Génère l'étiquette descriptive basée sur les paramètres fournis (voir format_description).
 
         Paramètres:
         show_name (bool): Indique si le nom doit être inclus dans la description.
         show_position (bool): Indique si la position (latitude, longitude, altitude) doit être incluse dans la description.
 
+        Retourne:
+        str: Une chaîne de caractères contenant la description générée.
+        """
+        return MapEntity.format_description(
+            self.get_name(),
+            self.get_latitude(),
+            self.get_longitude(),
+            self.get_altitude(),
+            self.get_texts(),
+            show_name,
+            show_position
+        )
+
+    @staticmethod
+    def format_description(name: str, latitude: float, longitude: float, altitude: float, texts: list[str], show_name: bool, show_position: bool) -> str:
+        """
+        Construit le texte descriptif d'une entité à partir de son état.
+
+        Paramètres:
+        name (str): Le nom de l'entité.
+        latitude (float): La latitude de l'entité.
+        longitude (float): La longitude de l'entité.
+        altitude (float): L'altitude de l'entité.
+        texts (list[str]): Les textes de l'entité, ajoutés ligne par ligne.
+        show_name (bool): Indique si le nom doit être inclus dans la description.
+        show_position (bool): Indique si la position doit être incluse dans la description.
+
         Retourne:
         str: Une chaîne de caractères contenant la description générée.
         """
         description = ""
         if show_name:
-            description += f"{self.get_name()}"
+            description += f"{name}"
 
         if show_position:
             if description:
                 description += "\n"
-            description += f"Position: {self.get_latitude():.4f}, {self.get_longitude():.4f}, {self.get_altitude():}"
+            description += f"Position: {latitude:.4f}, {longitude:.4f}, {altitude:}"
 
-        if self.get_texts():
+        if texts:
             if description:
                 description += "\n"
-            description += "\n".join(self.get_texts())
+            description += "\n".join(texts)
 
         return description
 
+    def get_label_text(self, show_name: bool, show_position: bool) -> str:
+        """
+        Renvoie le texte de l'étiquette native affichée par le moteur d'étiquettes de QGIS.
+
+        Comme pour update_label_position, la propriété need_update_label est définie sur False.
+
+        Paramètres:
+        show_name (bool): Indique si le nom doit être inclus dans le texte.
+        show_position (bool): Indique si la position doit être incluse dans le texte.
+
+        Retourne:
+        str: Le texte de l'étiquette, vide si rien ne doit être affiché.
+        """
+        self.need_update_label = False
+        return self.generate_description_label(show_name, show_position)
+
     def hide_label(self):
         """
-        Masque l'étiquette.
+        Masque l'étiquette, si elle existe.
         """
-        self.label.setVisible(False)
+        if self.label is not None:
+            self.label.setVisible(False)
 
     def show_label(self):
         """
-        Affiche  l'étiquette
+        Affiche  l'étiquette, créée si besoin
         """
-        self.label.setVisible(True)
+        self.get_label().setVisible(True)
 
     def unload(self):
         """
         Décharge les éléments associés à l'instance de l'objet.
 
-        Si l'objet possède une étiquette (`label`), cette méthode effectue les opérations suivantes :
-        - Appelle la méthode `hide_label()` pour masquer l'étiquette.
-        - Détache l'étiquette en retirant le parent défini avec `setParent(None)`.
-        - Supprime l'étiquette avec `deleteLater`.
-        - Réinitialise l'attribut `label` à `None`.
+        Si l'objet possède une étiquette (`label`), elle est supprimée (voir delete_label).
         """
-        if self.label:
-            self.hide_label()
-            self.label.setParent(None)
-            self.label.deleteLater()
-            self.label = None
+        self.delete_label()
@@ -0,0 +1,170 @@
+import csv
+import time
+from collections import deque
+
+
+class _NullMeasure:
+    """
+    Mesure sans effet retournée par Profiler.measure lorsque le profilage est désactivé.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class _Measure:
+    """
+    Mesure de la durée d'une phase, enregistrée dans le profileur à la sortie du bloc.
+    """
+
+    def __init__(self, profiler: 'Profiler', name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+_NULL_MEASURE = _NullMeasure()
+
+
+class Profiler:
+    """
+    Classe Profiler
+
+    Mesure la durée des phases du rafraîchissement et conserve pour chacune une fenêtre glissante des dernières
+    durées, à partir de laquelle sont calculées les statistiques (médiane, 95e centile et maximum).
+
+    Lorsque le profilage est désactivé, measure() retourne une mesure partagée sans effet et aucune horloge n'est lue.
+
+    Attributs :
+        enabled      Indique si les phases sont mesurées.
+        window_size  Nombre de durées conservées par phase.
+        samples      Dictionnaire nom de phase -> file des dernières durées (en secondes).
+        counts       Dictionnaire nom de phase -> nombre total de mesures.
+        totals       Dictionnaire nom de phase -> durée totale mesurée (en secondes).
+    """
+
+    DEFAULT_WINDOW_SIZE = 500
+    CSV_HEADER = ("phase", "count", "p50_ms", "p95_ms", "max_ms", "total_ms")
+
+    def __init__(self, window_size: int = DEFAULT_WINDOW_SIZE):
+        """
+        Initialise un profileur désactivé.
+
+        Paramètres:
+        window_size (int): Nombre de durées conservées par phase pour les statistiques. Par défaut 500.
+        """
+        self.enabled = False
+        self.window_size = max(int(window_size), 1)
+        self.samples = {}
+        self.counts = {}
+        self.totals = {}
+
+    def set_enabled(self, state: bool):
+        """
+        Active ou désactive le profilage.
+
+        Paramètres:
+        state (bool): True pour mesurer les phases.
+        """
+        self.enabled = state
+
+    def measure(self, name: str):
+        """
+        Retourne un gestionnaire de contexte mesurant la durée du bloc sous le nom de phase donné.
+
+        Paramètres:
+        name (str): Nom de la phase.
+
+        Retourne:
+        Un gestionnaire de contexte, sans effet si le profilage est désactivé.
+        """
+        if not self.enabled:
+            return _NULL_MEASURE
+        return _Measure(self, name)
+
+    def record(self, name: str, duration: float):
+        """
+        Enregistre la durée d'une phase.
+
+        Paramètres:
+        name (str): Nom de la phase.
+        duration (float): Durée en secondes.
+        """
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window_size)
+            self.counts[name] = 0
+            self.totals[name] = 0.0
+
+        samples.append(duration)
+        self.counts[name] += 1
+        self.totals[name] += duration
+
+    def reset(self):
+        """
+        Supprime toutes les mesures.
+        """
+        self.samples = {}
+        self.counts = {}
+        self.totals = {}
+
+    @staticmethod
+    def percentile(sorted_values: list[float], ratio: float) -> float:
+        """
+        Retourne le centile d'une liste triée, par la méthode du rang le plus proche.
+
+        Paramètres:
+        sorted_values (list[float]): Les valeurs triées, non vide.
+        ratio (float): Le centile entre 0 et 1.
+
+        Retourne:
+        float: La valeur du centile.
+        """
+        index = min(max(round(ratio * len(sorted_values)) - 1, 0), len(sorted_values) - 1)
+        return sorted_values[index]
+
+    def get_stats(self) -> list[tuple]:
+        """
+        Retourne les statistiques de chaque phase, de la plus coûteuse à la moins coûteuse en durée totale.
+
+        Retourne:
+        list[tuple]: Des tuples (phase, nombre de mesures, p50, p95, maximum, total), les durées en millisecondes.
+                     La médiane, le 95e centile et le maximum portent sur la fenêtre glissante.
+        """
+        stats = []
+        for name, samples in self.samples.items():
+            values = sorted(samples)
+            stats.append((
+                name,
+                self.counts[name],
+                Profiler.percentile(values, 0.5) * 1000,
+                Profiler.percentile(values, 0.95) * 1000,
+                values[-1] * 1000,
+                self.totals[name] * 1000,
+            ))
+        stats.sort(key=lambda row: row[5], reverse=True)
+        return stats
+
+    def export_csv(self, path: str):
+        """
+        Exporte les statistiques de chaque phase dans un fichier CSV.
+
+        Paramètres:
+        path (str): Chemin du fichier à écrire.
+        """
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(Profiler.CSV_HEADER)
+            for name, count, p50, p95, maximum, total in self.get_stats():
+                writer.writerow((name, count, f"{p50:.4f}", f"{p95:.4f}", f"{maximum:.4f}", f"{total:.4f}"))
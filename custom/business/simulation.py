@@ -0,0 +1,565 @@
+import copy
+import math
+from typing import TYPE_CHECKING, Callable
+
+from ..actions.action_factory import ActionFactory
+from ..actions.move_batch import MoveBatch
+from ..utils.utils import Utils
+from .action_index import ActionIndex
+from .load_registry import LoadRegistry
+from .profiler import Profiler
+from .timeline import Timeline
+
+if TYPE_CHECKING:
+    from .entity_state import EntityState
+    from ..actions.action import Action
+
+class Simulation:
+    """
+    Classe Simulation
+
+    Moteur de simulation indépendant de QGIS et de Qt : il contient les entités, les actions, les entités chargées,
+    les lignes et le tick courant, et calcule l'état de chaque tick en exécutant les actions.
+
+    Les entités sont des EntityState (ou des MapEntity, qui en héritent). LayerTraceQGIS utilise la simulation
+    courante et reporte ses changements dans les couches QGIS ; sans couche, la simulation peut être exécutée,
+    compilée en chronologie ou mesurée dans un processus sans Qt.
+
+    Les actions accèdent à la simulation courante par les méthodes statiques (get_map_entity, get_current_tick...).
+
+    Attributs :
+        map_entities      Dictionnaire identifiant -> entité.
+        actions           Liste des actions, dans leur ordre d'origine.
+        action_index      L'index d'intervalles des actions, construit dans set_actions.
+        expired_resets    Dictionnaire tick -> identifiant d'entité -> méthodes de réinitialisation à appeler à ce tick,
+                          construit dans set_actions à partir des actions qui se terminent au tick précédent.
+        tick_end          La valeur de fin des tick des actions.
+        tick              Le compteur actuel des ticks.
+        load_registry     Le registre indexé des entités chargées (contenant -> entités, entité -> contenant).
+        entities_loaded   Dictionnaire identifiant -> entités chargées dans cette entité, copie du registre ;
+                          l'affecter remplace le contenu du registre.
+        lines             Ensemble des lignes (identifiant source, identifiant cible) entre entités.
+        profiler          Le profileur mesurant la durée de chaque action, désactivé par défaut.
+        move_listener     Fonction appelée avec (entité, ancienne latitude, ancienne longitude) à chaque déplacement
+                          d'une entité par une action, None si aucune.
+        message_listener  Fonction appelée avec (message, niveau) pour chaque message de la simulation, None si aucune.
+        RESET_METHODS     Dictionnaire nom de classe d'action -> méthode de l'entité réinitialisant l'attribut visuel
+                          défini par l'action, appelée au tick qui suit la fin de l'action.
+        MESSAGE_INFO      Niveau des messages d'information.
+        MESSAGE_WARNING   Niveau des messages d'avertissement.
+        _instance         La simulation courante, utilisée par les actions.
+    """
+    MESSAGE_INFO = "info"
+    MESSAGE_WARNING = "warning"
+    RESET_METHODS = {
+        "ActionChangeIcon": "reset_url_icon",
+        "ActionHighlight": "reset_highlight",
+        "ActionBackground": "reset_background_image",
+    }
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> 'Simulation':
+        """
+        Retourne la simulation courante, créée vide si aucune simulation n'a été activée.
+
+        Retourne:
+            Simulation: La simulation courante.
+        """
+        if cls._instance is None:
+            cls._instance = Simulation()
+        return cls._instance
+
+    def __init__(self, map_entities: list['EntityState'] = [], actions: list[dict] = []):
+        """
+        Initialise une simulation à partir des entités et des actions fournies.
+
+        Paramètres:
+        map_entities (list[EntityState]): Liste des entités. Par défaut, une liste vide.
+        actions (list[dict]): Liste des dictionnaires décrivant les actions. Par défaut, une liste vide.
+        """
+        self.map_entities = {}
+        self.actions = []
+        self.action_index = ActionIndex()
+        self.expired_resets = {}
+        self.tick_end = 0
+        self.tick = 0
+        self.load_registry = LoadRegistry()
+        self.lines = set()
+        self.profiler = Profiler()
+        self.move_listener: Callable | None = None
+        self.message_listener: Callable | None = None
+
+        self.set_map_entities(map_entities)
+        self.set_actions(actions)
+
+    def activate(self):
+        """
+        Fait de cette simulation la simulation courante, utilisée par les actions.
+        """
+        Simulation._instance = self
+
+    def copy_initial(self) -> 'Simulation':
+        """
+        Retourne une nouvelle simulation dans l'état initial de celle-ci, avec des copies de l'état initial des
+        entités (EntityState.copy_initial) et des actions, le même tick de fin et le même message_listener.
+        Elle peut être compilée sans modifier cette simulation ; elle n'est pas activée.
+
+        Retourne:
+            Simulation: La copie de la simulation.
+        """
+        simulation = Simulation([map_entity.copy_initial() for map_entity in self.map_entities.values()])
+        simulation.set_built_actions(copy.deepcopy(self.actions))
+        simulation.tick_end = self.tick_end
+        simulation.message_listener = self.message_listener
+        return simulation
+
+    def log(self, message: str, level: str = MESSAGE_INFO):
+        """
+        Transmet un message à message_listener s'il est défini.
+
+        Paramètres:
+        message (str): Le message.
+        level (str): MESSAGE_INFO ou MESSAGE_WARNING.
+        """
+        if self.message_listener is not None:
+            self.message_listener(message, level)
+
+    def set_map_entities(self, map_entities: list['EntityState'] = []):
+        """
+        Définit les entités de la simulation.
+
+        Paramètres:
+        map_entities (list[EntityState]): Liste des entités. Par défaut, une liste vide.
+        """
+        self.map_entities = {map_entity.get_id(): map_entity for map_entity in map_entities}
+
+    @property
+    def entities_loaded(self) -> dict:
+        return self.load_registry.to_dict()
+
+    @entities_loaded.setter
+    def entities_loaded(self, value: dict):
+        self.load_registry.set_loaded(value)
+
+    def set_actions(self, actions: list[dict]):
+        """
+        Définit et initialise les actions à partir d'une liste décrivant chaque action.
+
+        Paramètres:
+        actions (list): Une liste de dictionnaires représentant les actions.
+
+        Traitement:
+        - Crée chaque action via `ActionFactory.action_from_dict`, une action invalide (ValueError) est ignorée
+          et signalée par un message d'avertissement.
+        - Définit les actions construites par set_built_actions : `self.tick_end` prend la valeur la plus élevée
+          de la propriété `end_at` parmi toutes les actions, avec une valeur par défaut de 0, et l'index
+          d'intervalles `self.action_index` utilisé pour retrouver les actions actives est construit, ainsi que
+          `self.expired_resets` utilisé pour réinitialiser les attributs expirés.
+        """
+        built_actions: list['Action'] = []
+        for action_dict in actions:
+            try:
+                action = ActionFactory.action_from_dict(action_dict)
+                built_actions.append(action)
+            except ValueError as e:
+                self.log(f"Erreur lors de la création d'une action : {e}", Simulation.MESSAGE_WARNING)
+
+        self.set_built_actions(built_actions)
+
+    def set_built_actions(self, actions: list['Action']):
+        """
+        Définit des actions déjà construites, met à jour `self.tick_end`, construit l'index d'intervalles et
+        les réinitialisations des attributs expirés.
+
+        Paramètres:
+        actions (list[Action]): Les actions, dans leur ordre d'origine.
+        """
+        self.actions = actions
+        self.tick_end = max((action.end_at for action in self.actions), default=0)
+        self.action_index = ActionIndex(self.actions)
+
+        self.expired_resets = {}
+        for action in self.actions:
+            reset_method = Simulation.RESET_METHODS.get(type(action).__name__)
+            if reset_method is not None:
+                entity_resets = self.expired_resets.setdefault(action.end_at + 1, {})
+                entity_resets.setdefault(action.entity_id, set()).add(reset_method)
+
+    def get_active_actions(self) -> list['Action']:
+        """
+        Retourne toutes les actions actives par rapport au tick actuel
+
+        L'index d'intervalles ne traite que les actions qui débutent ou se terminent lorsque les ticks
+        se suivent, il ne reparcourt toutes les actions qu'en cas de saut dans le temps.
+
+        Retour :
+            list['Action']: Liste des actions actives.
+        """
+        return self.action_index.get_active_at(self.tick)
+
+    def reset(self):
+        """
+        Replace la simulation dans son état initial, avant le tick 0.
+
+        Réinitialise les entités, vide leur journal des modifications, les entités chargées et les lignes.
+        """
+        for map_entity in self.map_entities.values():
+            map_entity.reset()
+        self.clear_changes()
+
+        self.load_registry.clear()
+        self.lines = set()
+        self.tick = 0
+
+    def clear_changes(self):
+        """
+        Vide les modifications en attente de toutes les entités, pour qu'elles ne soient pas attribuées au prochain tick.
+        """
+        for map_entity in self.map_entities.values():
+            map_entity.clear_changes()
+
+    def step(self) -> list[str]:
+        """
+        Calcule l'état du tick courant puis passe au tick suivant.
+
+        Retourne:
+            list[str]: Les identifiants des entités chargées à la fin du tick.
+        """
+        loaded_ids = self.compute_tick()
+        self.tick += 1
+        return loaded_ids
+
+    def compute_tick(self) -> list[str]:
+        """
+        Calcule l'état du tick courant : réinitialise les attributs expirés, exécute les actions actives puis
+        ajoute aux entités le texte des entités qu'elles contiennent.
+
+        Retourne:
+            list[str]: Les identifiants des entités chargées à la fin du tick.
+        """
+        self.reset_before_refresh()
+        self.execute_actions()
+        return self.refresh_load()
+
+    def run(self):
+        """
+        Exécute toute la simulation depuis son état initial jusqu'au dernier tick inclus.
+        """
+        self.reset()
+        while self.tick <= self.tick_end:
+            self.step()
+
+    def compile_timeline(self) -> Timeline:
+        """
+        Compile toute la simulation en une chronologie lue ensuite tick par tick.
+
+        Procédé :
+        1. Replace la simulation dans son état initial et enregistre l'état initial des entités.
+        2. Calcule chaque tick et enregistre l'état des entités modifiées, les entités chargées et les lignes.
+
+        Les déplacements ne sont pas transmis à move_listener pendant la compilation. La simulation reste dans
+        l'état du dernier tick.
+
+        Retourne:
+            Timeline: La chronologie compilée.
+        """
+        move_listener = self.move_listener
+        self.move_listener = None
+        try:
+            self.reset()
+            timeline = Timeline(list(self.map_entities.keys()), self.tick_end + 1)
+            timeline.record_initial(self.map_entities.values())
+
+            while self.tick <= self.tick_end:
+                self.compute_tick()
+                timeline.record(self.tick, self.map_entities.values(), self.entities_loaded, self.lines)
+                self.tick += 1
+        finally:
+            self.move_listener = move_listener
+
+        return timeline
+
+    def reset_before_refresh(self):
+        """
+        Réinitialise les entités et leurs attributs visuels avant un rafraîchissement.
+
+        Efface toutes les lignes actuelles et réinitialise le texte des entités. Seules les entités dont une action
+        de changement d'icône, de surbrillance ou d'arrière-plan s'est terminée au tick précédent voient l'attribut
+        correspondant réinitialisé (voir expired_resets) ; les autres entités ne sont pas parcourues.
+        """
+        self.lines = set()
+        for map_entity in self.map_entities.values():
+            map_entity.reset_text()
+
+        for entity_id, reset_methods in self.expired_resets.get(self.tick, {}).items():
+            map_entity = self.map_entities.get(entity_id)
+            if map_entity is None:
+                continue
+            for reset_method in sorted(reset_methods):
+                getattr(map_entity, reset_method)()
+
+    def in_last_action(self, action_name: str) -> bool:
+        """
+        Détermine si une action spécifique a eu lieu au dernier tick.
+
+        Paramètres:
+        action_name (str): Le nom de la classe de l'action pour laquelle vérifier l'occurrence.
+
+        Retourne:
+        bool: Retourne True si l'action spécifiée a eu lieu à la fin du dernier tick. Sinon, retourne False.
+
+        Exceptions:
+        ValueError: Exception lancée si le nom de l'action donné ne correspond pas à une classe d'action reconnue.
+        """
+        reset_method = Simulation.RESET_METHODS.get(action_name)
+        if reset_method is None:
+            raise ValueError(f"Action '{action_name}' non reconnue.")
+
+        return any(
+            reset_method in reset_methods
+            for reset_methods in self.expired_resets.get(self.tick, {}).values()
+        )
+
+    def execute_actions(self):
+        """
+        Exécute les actions actives au tick courant.
+
+        Procédé :
+        1. Récupère et trie les actions en fonction des prioritées.
+        2. Regroupe les actions de déplacement dans un lot évalué en une seule passe vectorisée, les autres actions
+           sont exécutées dans l'ordre d'origine. Le lot est appliqué avant qu'une action de déplacement ne lise
+           la position d'une entité qu'il déplace.
+        3. Une action n'est pas traitée si son entité associée est chargée, un message d'information est alors émis.
+        """
+        actions_active = self.get_active_actions()
+        actions_active = Utils.sort_actions(actions_active)
+
+        batch = MoveBatch()
+        for action in actions_active:
+            if not MoveBatch.is_move_action(action):
+                if batch.is_empty():
+                    self.execute_action(action)
+                else:
+                    batch.add_action(action)
+                continue
+
+            if self.is_loaded_by_id(action.entity_id):
+                self.log("Action non traité car entity load\n" + str(action))
+                continue
+
+            if batch.depends_on_pending(action):
+                self.execute_batch(batch)
+
+            map_entity = action.prepare()
+            if map_entity:
+                batch.add_move(action, map_entity)
+
+        self.execute_batch(batch)
+
+    def execute_action(self, action: 'Action'):
+        """
+        Exécute une action si son entité associée n'est pas chargée, sinon émet un message d'information.
+
+        Paramètres :
+        action (Action) : L'action à exécuter.
+        """
+        if not self.is_loaded_by_id(action.entity_id):
+            if self.profiler.enabled:
+                with self.profiler.measure("action:" + type(action).__name__):
+                    action.execute()
+            else:
+                action.execute()
+        else:
+            self.log("Action non traité car entity load\n" + str(action))
+
+    def execute_batch(self, batch: MoveBatch):
+        """
+        Applique un lot d'actions : calcule les coordonnées de tous les déplacements en une passe puis déplace
+        les entités et exécute les autres actions dans l'ordre d'origine.
+
+        Paramètres :
+        batch (MoveBatch) : Le lot à appliquer, vidé à la fin.
+        """
+        if batch.is_empty():
+            return
+
+        with self.profiler.measure("move_batch"):
+            coordinates = batch.evaluate(self.tick)
+        for action, map_entity, index in batch.queue:
+            if map_entity is None:
+                self.execute_action(action)
+                continue
+
+            lat, lon, alti = coordinates[index].tolist()
+            if math.isnan(alti):
+                alti = map_entity.altitude
+            action.move_entity(map_entity, lat, lon, alti)
+
+        batch.clear()
+
+    def notify_move(self, map_entity: 'EntityState', old_lat: float, old_lon: float):
+        """
+        Signale le déplacement d'une entité par une action à move_listener s'il est défini.
+
+        Paramètres:
+        map_entity (EntityState): L'entité déplacée, déjà à sa nouvelle position.
+        old_lat (float): La latitude avant le déplacement.
+        old_lon (float): La longitude avant le déplacement.
+        """
+        if self.move_listener is not None:
+            self.move_listener(map_entity, old_lat, old_lon)
+
+    def refresh_load(self) -> list[str]:
+        """
+        Partie du calcul d'un tick qui traite les entités chargées : ajoute à chaque entité contenant d'autres
+        entités le texte "Stock: " suivi de leurs noms.
+
+        Retourne:
+            list[str]: Les identifiants des entités chargées.
+        """
+        ids = self.get_loaded_ids()
+        if ids:
+            for entity_id, children in self.load_registry.children.items():
+                entity = self.map_entities.get(entity_id)
+                if entity:
+                    names = [entity_loaded.get_name() for entity_loaded in children.values()]
+                    text = "Stock: "
+                    text += ", ".join(names)
+                    entity.append_text(text)
+        return ids
+
+    def get_loaded_ids(self) -> list[str]:
+        """
+        Retourne les identifiants des entités chargées dans une autre entité.
+
+        Retourne:
+            list[str]: Les identifiants des entités chargées.
+        """
+        if not self.load_registry:
+            return []
+        return [entity_id for entity_id in self.map_entities if self.load_registry.is_loaded(entity_id)]
+
+    def load_entity(self, entity: 'EntityState', entity_load: 'EntityState'):
+        """
+        Permet de charger une entité dans une autre.
+
+        Paramètres:
+        entity (EntityState): L'entité dans laquelle charger.
+        entity_load (EntityState): L'entité à charger.
+
+        Comportement:
+        - Enregistre le chargement dans le registre indexé, l'entité chargée ailleurs est d'abord retirée de son
+          contenant. L'entité qui charge peut elle-même être chargée dans une autre entité.
+        - Un chargement formant un cycle (une entité chargée dans une entité qu'elle contient) est ignoré et
+          signalé par un message d'avertissement.
+        """
+        if not self.load_registry.load(entity.get_id(), entity_load):
+            self.log(
+                f"Chargement de {entity_load.get_id()} dans {entity.get_id()} ignoré : {entity.get_id()} se trouve dans {entity_load.get_id()}",
+                Simulation.MESSAGE_WARNING
+            )
+
+    def unload_entity(self, entity: 'EntityState', entity_load: 'EntityState'):
+        """
+        Permet de décharger une entité
+
+        Paramètres:
+        entity : EntityState
+            L'entité contenant l'entité à décharger.
+        entity_load : EntityState
+            L'entité cible qui doit être retirée du groupe d'entités chargées.
+
+        Description:
+        Retire l'entité cible de l'entité source si elle y est chargée. Les entités que contient l'entité cible
+        restent chargées dans celle-ci.
+        """
+        self.load_registry.unload(entity_load.get_id(), entity.get_id())
+
+    def is_loaded(self, entity_load: 'EntityState', in_entity: 'EntityState' = None) -> bool:
+        """
+        Vérifie si une entité est chargée dans une entité ou simplement chargé
+
+        Paramètres:
+        - entity_load : 'EntityState'
+          L'entité dont il faut vérifier le chargement.
+        - in_entity : 'EntityState', optionnel (par défaut None)
+          Le groupe dans lequel vérifier si l'entité est chargée. Si None, vérifie dans tous les groupes.
+
+        Retourne:
+        - bool : True si l'entité est chargée, False sinon.
+        """
+        if entity_load is None or not self.load_registry:
+            return False
+
+        return self.load_registry.is_loaded(entity_load.get_id(), None if in_entity is None else in_entity.get_id())
+
+    def is_loaded_by_id(self, entity_id: str, in_entity_id: str = None) -> bool:
+        """
+        Vérifie si une entité avec un identifiant donné est chargée.
+
+        Paramètres:
+        entity_id: str
+            L'identifiant de l'entité à vérifier.
+        in_entity_id: str, optionnel
+            L'identifiant d'une entité spécifique où effectuer la recherche.
+
+        Retourne:
+        bool
+            True si l'entité est chargée, False autrement.
+        """
+        return self.load_registry.is_loaded(entity_id, in_entity_id)
+
+    def exist_line(self, id1: str, id2: str):
+        """
+        Vérifie si une ligne existante connecte deux identifiants donnés.
+
+        Paramètres:
+        id1: Premier identifiant à vérifier.
+        id2: Deuxième identifiant à vérifier.
+
+        Retourne:
+        bool: True si une ligne existante connecte id1 et id2, sinon False.
+        """
+        return (id1, id2) in self.lines
+
+    def add_line(self, idFeature1: str, idFeature2: str):
+        """
+        Ajoute une ligne entre deux entités si elle n'existe pas déjà.
+
+        Paramètres:
+        idFeature1 (int): Identifiant de la première entité.
+        idFeature2 (int): Identifiant de la seconde entité.
+        """
+        self.lines.add((idFeature1, idFeature2))
+
+    def remove_line(self, id1: str, id2: str):
+        """
+        Supprime une ligne spécifique entre deux identifiants donnés.
+
+        Paramètres:
+        id1 : Identifiant du premier point de la ligne.
+        id2 : Identifiant du second point de la ligne.
+        """
+        self.lines.discard((id1, id2))
+        self.lines.discard((id2, id1))
+
+    @staticmethod
+    def get_map_entity(entity_id: str) -> 'EntityState | None':
+        return Simulation.get_instance().map_entities.get(entity_id)
+
+    @staticmethod
+    def get_current_tick() -> int:
+        return int(Simulation.get_instance().tick)
+
+    @staticmethod
+    def static_load_entity(entity: 'EntityState', entity_load: 'EntityState'):
+        return Simulation.get_instance().load_entity(entity, entity_load)
+
+    @staticmethod
+    def static_unload_entity(entity: 'EntityState', entity_load: 'EntityState'):
+        return Simulation.get_instance().unload_entity(entity, entity_load)
+
+    @staticmethod
+    def static_is_loaded(entity_load: 'EntityState', in_entity: 'EntityState' = None) -> bool:
+        return Simulation.get_instance().is_loaded(entity_load, in_entity)
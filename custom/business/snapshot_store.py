@@ -0,0 +1,155 @@
+import sys
+from collections import OrderedDict
+
+
+class SnapshotStore:
+    """
+    Classe SnapshotStore
+
+    Conserve des instantanés complets de l'état de la simulation tous les `interval` ticks afin que
+    `go_to_tick` reparte de l'instantané le plus proche au lieu de rejouer depuis le tick 0.
+    Les instantanés sont évincés selon la politique LRU lorsque le budget mémoire est dépassé.
+
+    Attributs :
+        interval         Nombre de ticks entre deux instantanés.
+        memory_budget    Taille mémoire maximale (en octets, estimée) occupée par les instantanés.
+        snapshots        Dictionnaire ordonné tick -> instantané, du moins récemment utilisé au plus récent.
+        sizes            Dictionnaire tick -> taille estimée de l'instantané.
+        memory_used      Taille estimée totale des instantanés conservés.
+    """
+
+    DEFAULT_INTERVAL = 50
+    DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+    def __init__(self, interval: int = DEFAULT_INTERVAL, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        """
+        Initialise un magasin d'instantanés vide.
+
+        Paramètres:
+        interval (int): Nombre de ticks entre deux instantanés. Par défaut 50.
+        memory_budget (int): Budget mémoire en octets. Par défaut 64 Mo.
+        """
+        self.interval = 1
+        self.memory_budget = 0
+        self.snapshots = OrderedDict()
+        self.sizes = {}
+        self.memory_used = 0
+
+        self.set_interval(interval)
+        self.set_memory_budget(memory_budget)
+
+    def set_interval(self, interval: int):
+        """
+        Modifie l'intervalle entre deux instantanés.
+
+        Les instantanés existants sont supprimés puisqu'ils ne correspondent plus à la nouvelle grille.
+
+        Paramètres:
+        interval (int): Nombre de ticks entre deux instantanés, ramené à 1 au minimum.
+        """
+        self.interval = max(int(interval), 1)
+        self.clear()
+
+    def set_memory_budget(self, memory_budget: int):
+        """
+        Modifie le budget mémoire et évince les instantanés en trop.
+
+        Paramètres:
+        memory_budget (int): Budget mémoire en octets.
+        """
+        self.memory_budget = max(int(memory_budget), 0)
+        self.evict()
+
+    def need_snapshot(self, tick: int) -> bool:
+        """
+        Indique si un instantané doit être enregistré au tick donné.
+
+        Paramètres:
+        tick (int): Le tick courant.
+
+        Retourne:
+        bool: True si le tick est un multiple de l'intervalle (hors tick 0) et qu'aucun instantané n'existe encore.
+        """
+        return tick > 0 and tick % self.interval == 0 and tick not in self.snapshots
+
+    def store(self, tick: int, snapshot: dict):
+        """
+        Enregistre un instantané pour le tick donné puis applique le budget mémoire.
+
+        Paramètres:
+        tick (int): Le tick auquel correspond l'instantané.
+        snapshot (dict): L'état de la simulation au début du tick.
+        """
+        if tick in self.snapshots:
+            self.remove(tick)
+
+        size = SnapshotStore.estimate_size(snapshot)
+        self.snapshots[tick] = snapshot
+        self.sizes[tick] = size
+        self.memory_used += size
+
+        self.evict()
+
+    def get_nearest(self, tick: int) -> tuple[int | None, dict | None]:
+        """
+        Retourne l'instantané le plus proche antérieur ou égal au tick donné.
+
+        L'instantané retourné est marqué comme récemment utilisé.
+
+        Paramètres:
+        tick (int): Le tick cible.
+
+        Retourne:
+        tuple[int | None, dict | None]: Le tick de l'instantané et l'instantané, ou (None, None) si aucun ne convient.
+        """
+        nearest = max((snapshot_tick for snapshot_tick in self.snapshots if snapshot_tick <= tick), default=None)
+        if nearest is None:
+            return None, None
+
+        self.snapshots.move_to_end(nearest)
+        return nearest, self.snapshots[nearest]
+
+    def remove(self, tick: int):
+        """
+        Supprime l'instantané du tick donné s'il existe.
+
+        Paramètres:
+        tick (int): Le tick de l'instantané à supprimer.
+        """
+        if tick in self.snapshots:
+            del self.snapshots[tick]
+            self.memory_used -= self.sizes.pop(tick)
+
+    def evict(self):
+        """
+        Évince les instantanés les moins récemment utilisés tant que le budget mémoire est dépassé.
+        """
+        while self.snapshots and self.memory_used > self.memory_budget:
+            tick, _ = self.snapshots.popitem(last=False)
+            self.memory_used -= self.sizes.pop(tick)
+
+    def clear(self):
+        """
+        Supprime tous les instantanés.
+        """
+        self.snapshots.clear()
+        self.sizes.clear()
+        self.memory_used = 0
+
+    @staticmethod
+    def estimate_size(value) -> int:
+        """
+        Estime la taille mémoire d'un instantané en parcourant ses conteneurs.
+
+        Paramètres:
+        value: L'instantané ou une de ses valeurs (dict, list, tuple, set ou valeur simple).
+
+        Retourne:
+        int: La taille estimée en octets.
+        """
+        size = sys.getsizeof(value)
+        if isinstance(value, dict):
+            size += sum(SnapshotStore.estimate_size(key) + SnapshotStore.estimate_size(item) for key, item in value.items())
+        elif isinstance(value, (list, tuple, set)):
+            size += sum(SnapshotStore.estimate_size(item) for item in value)
+        return size
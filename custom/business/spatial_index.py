@@ -0,0 +1,200 @@
+import math
+
+from ..utils.utils import Utils
+
+
+class SpatialIndex:
+    """
+    Classe SpatialIndex
+
+    Index spatial des positions courantes des entités, sous forme de grille de hachage : chaque position est rangée
+    dans la cellule de la grille qui la contient. Une recherche dans un rectangle ne parcourt que les cellules qui
+    le recouvrent, et chaque déplacement ne met à jour que les cellules de départ et d'arrivée.
+
+    Les coordonnées sont celles des entités (longitude en x, latitude en y, en degrés).
+
+    Attributs :
+        cell_size  Taille (en degrés) du côté d'une cellule de la grille.
+        cells      Dictionnaire (colonne, ligne) -> ensemble des clés rangées dans la cellule.
+        positions  Dictionnaire clé -> (x, y) de la position indexée.
+    """
+
+    DEFAULT_CELL_SIZE = 0.01
+    METERS_PER_DEGREE = 111320
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        """
+        Initialise un index vide.
+
+        Paramètres:
+        cell_size (float): Taille d'une cellule en degrés. Par défaut 0.01 (environ un kilomètre).
+
+        Exceptions:
+        ValueError: Levée si la taille de cellule n'est pas strictement positive.
+        """
+        if cell_size <= 0:
+            raise ValueError(f"La taille de cellule doit être strictement positive : {cell_size}")
+
+        self.cell_size = float(cell_size)
+        self.cells = {}
+        self.positions = {}
+
+    def get_cell(self, x: float, y: float) -> tuple[int, int]:
+        """
+        Retourne la cellule de la grille contenant une position.
+
+        Paramètres:
+        x (float): Longitude.
+        y (float): Latitude.
+
+        Retourne:
+        tuple[int, int]: La colonne et la ligne de la cellule.
+        """
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def update(self, key, x: float, y: float):
+        """
+        Ajoute une position à l'index ou la déplace si la clé est déjà indexée.
+
+        Paramètres:
+        key: Clé hashable identifiant l'entité.
+        x (float): Longitude.
+        y (float): Latitude.
+        """
+        x, y = float(x), float(y)
+        cell = self.get_cell(x, y)
+
+        old_position = self.positions.get(key)
+        if old_position is not None:
+            old_cell = self.get_cell(*old_position)
+            if old_cell != cell:
+                self.discard_from_cell(old_cell, key)
+                self.cells.setdefault(cell, set()).add(key)
+        else:
+            self.cells.setdefault(cell, set()).add(key)
+
+        self.positions[key] = (x, y)
+
+    def remove(self, key):
+        """
+        Retire une clé de l'index, sans effet si elle n'est pas indexée.
+
+        Paramètres:
+        key: La clé à retirer.
+        """
+        position = self.positions.pop(key, None)
+        if position is not None:
+            self.discard_from_cell(self.get_cell(*position), key)
+
+    def discard_from_cell(self, cell: tuple[int, int], key):
+        """
+        Retire une clé d'une cellule et supprime la cellule si elle devient vide.
+
+        Paramètres:
+        cell (tuple[int, int]): La cellule.
+        key: La clé à retirer.
+        """
+        keys = self.cells.get(cell)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self.cells[cell]
+
+    def clear(self):
+        """
+        Vide l'index.
+        """
+        self.cells = {}
+        self.positions = {}
+
+    def query_rect(self, x_min: float, y_min: float, x_max: float, y_max: float) -> list:
+        """
+        Retourne les clés dont la position est comprise dans un rectangle (bords inclus).
+
+        Si le rectangle recouvre plus de cellules qu'il n'y a de positions indexées, les positions sont parcourues
+        directement, ce qui évite d'énumérer des cellules vides pour une emprise très étendue.
+
+        Paramètres:
+        x_min (float): Longitude minimale.
+        y_min (float): Latitude minimale.
+        x_max (float): Longitude maximale.
+        y_max (float): Latitude maximale.
+
+        Retourne:
+        list: Les clés des positions comprises dans le rectangle.
+        """
+        if x_min > x_max or y_min > y_max:
+            return []
+
+        column_min, row_min = self.get_cell(x_min, y_min)
+        column_max, row_max = self.get_cell(x_max, y_max)
+        cell_count = (column_max - column_min + 1) * (row_max - row_min + 1)
+
+        if cell_count > len(self.positions):
+            return [
+                key for key, (x, y) in self.positions.items()
+                if x_min <= x <= x_max and y_min <= y <= y_max
+            ]
+
+        result = []
+        for column in range(column_min, column_max + 1):
+            for row in range(row_min, row_max + 1):
+                keys = self.cells.get((column, row))
+                if not keys:
+                    continue
+                inner = column_min < column < column_max and row_min < row < row_max
+                for key in keys:
+                    if inner:
+                        result.append(key)
+                        continue
+                    x, y = self.positions[key]
+                    if x_min <= x <= x_max and y_min <= y <= y_max:
+                        result.append(key)
+        return result
+
+    def query_radius(self, x: float, y: float, radius: float) -> list:
+        """
+        Retourne les clés dont la position est à moins d'une distance donnée (en mètres) d'un point.
+
+        Les candidats sont d'abord recherchés dans le rectangle englobant le cercle, puis filtrés
+        avec la distance de Haversine.
+
+        Paramètres:
+        x (float): Longitude du centre.
+        y (float): Latitude du centre.
+        radius (float): Rayon en mètres.
+
+        Retourne:
+        list: Les clés des positions comprises dans le cercle (bord inclus).
+        """
+        if radius < 0:
+            return []
+
+        delta_y = radius / SpatialIndex.METERS_PER_DEGREE
+        cos_y = math.cos(math.radians(y))
+        delta_x = 180 if cos_y < 1e-9 else min(delta_y / cos_y, 180)
+
+        return [
+            key for key in self.query_rect(x - delta_x, y - delta_y, x + delta_x, y + delta_y)
+            if Utils.haversine_distance(y, x, self.positions[key][1], self.positions[key][0]) <= radius
+        ]
+
+    def nearest(self, x: float, y: float, max_radius: float):
+        """
+        Retourne la clé de la position la plus proche d'un point, dans la limite d'une distance maximale (en mètres).
+
+        Paramètres:
+        x (float): Longitude du point.
+        y (float): Latitude du point.
+        max_radius (float): Distance maximale de recherche en mètres.
+
+        Retourne:
+        La clé la plus proche, ou None si aucune position n'est à moins de max_radius.
+        """
+        candidates = self.query_radius(x, y, max_radius)
+        return min(
+            candidates,
+            key=lambda key: Utils.haversine_distance(y, x, self.positions[key][1], self.positions[key][0]),
+            default=None
+        )
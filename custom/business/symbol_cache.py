@@ -0,0 +1,144 @@
+from collections import OrderedDict
+
+from qgis.core import QgsMarkerSymbol
+
+
+class SymbolCache:
+    """
+    Classe SymbolCache
+
+    Cache partagé des symboles générés pour les catégories des entités. Les symboles sont indexés par leur état
+    visuel (icône, taille, angle, opacité, mise en surbrillance, image d'arrière-plan) afin que les entités partageant
+    le même état réutilisent un clone du même symbole au lieu de le reconstruire. La taille et l'angle sont
+    quantifiés selon un pas configurable pour que les animations ne produisent pas un symbole par tick.
+
+    Attributs :
+        max_entries  Nombre maximal de symboles conservés, les moins récemment utilisés sont évincés au-delà.
+        size_step    Pas de quantification de la taille, 0 pour la désactiver.
+        angle_step   Pas de quantification de l'angle (en degrés), 0 pour la désactiver.
+        symbols      Dictionnaire ordonné clé -> symbole, du moins récemment utilisé au plus récent.
+        hits         Nombre de symboles trouvés dans le cache.
+        misses       Nombre de symboles absents du cache.
+        _instance    Instance unique de la classe SymbolCache.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+    DEFAULT_SIZE_STEP = 0.1
+    DEFAULT_ANGLE_STEP = 1.0
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> 'SymbolCache':
+        """
+        Méthode de classe pour obtenir l'instance unique partagée par toutes les entités.
+
+        Retourne:
+            SymbolCache: Instance unique de la classe SymbolCache.
+        """
+        if cls._instance is None:
+            cls._instance = SymbolCache()
+        return cls._instance
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, size_step: float = DEFAULT_SIZE_STEP, angle_step: float = DEFAULT_ANGLE_STEP):
+        """
+        Initialise un cache vide.
+
+        Paramètres:
+        max_entries (int): Nombre maximal de symboles conservés. Par défaut 1024.
+        size_step (float): Pas de quantification de la taille. Par défaut 0.1.
+        angle_step (float): Pas de quantification de l'angle en degrés. Par défaut 1.
+        """
+        self.max_entries = 1
+        self.size_step = 0
+        self.angle_step = 0
+        self.symbols = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        self.configure(max_entries, size_step, angle_step)
+
+    def configure(self, max_entries: int, size_step: float, angle_step: float):
+        """
+        Configure le cache. Les symboles existants sont supprimés puisque leurs clés dépendent des pas de quantification.
+
+        Paramètres:
+        max_entries (int): Nombre maximal de symboles conservés, ramené à 1 au minimum.
+        size_step (float): Pas de quantification de la taille, 0 pour la désactiver.
+        angle_step (float): Pas de quantification de l'angle en degrés, 0 pour la désactiver.
+        """
+        self.max_entries = max(int(max_entries), 1)
+        self.size_step = max(float(size_step), 0)
+        self.angle_step = max(float(angle_step), 0)
+        self.clear()
+
+    @staticmethod
+    def quantize(value: float, step: float) -> float:
+        """
+        Arrondit une valeur au multiple du pas le plus proche.
+
+        Paramètres:
+        value (float): La valeur à arrondir.
+        step (float): Le pas, 0 pour retourner la valeur inchangée.
+
+        Retourne:
+        float: La valeur quantifiée.
+        """
+        if not step:
+            return value
+        return round(round(value / step) * step, 6)
+
+    def make_key(self, url_icon: str, size: float, angle: float, opacity: float, highlight: str | None, background_image: str | None) -> tuple:
+        """
+        Construit la clé du cache à partir d'un état visuel, en quantifiant la taille et l'angle.
+
+        Retourne:
+        tuple: (icône, taille, angle, opacité, mise en surbrillance, image d'arrière-plan).
+        """
+        return (
+            url_icon,
+            SymbolCache.quantize(size, self.size_step),
+            SymbolCache.quantize(angle % 360, self.angle_step) % 360,
+            opacity,
+            highlight,
+            background_image,
+        )
+
+    def get(self, key: tuple) -> QgsMarkerSymbol | None:
+        """
+        Retourne le symbole associé à une clé et le marque comme récemment utilisé.
+
+        Paramètres:
+        key (tuple): La clé retournée par make_key().
+
+        Retourne:
+        QgsMarkerSymbol | None: Le symbole partagé (à cloner avant utilisation), ou None s'il est absent.
+        """
+        symbol = self.symbols.get(key)
+        if symbol is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.symbols.move_to_end(key)
+        return symbol
+
+    def put(self, key: tuple, symbol: QgsMarkerSymbol):
+        """
+        Ajoute un symbole au cache puis évince les moins récemment utilisés au-delà de max_entries.
+
+        Paramètres:
+        key (tuple): La clé retournée par make_key().
+        symbol (QgsMarkerSymbol): Le symbole à partager.
+        """
+        self.symbols[key] = symbol
+        self.symbols.move_to_end(key)
+        while len(self.symbols) > self.max_entries:
+            self.symbols.popitem(last=False)
+
+    def clear(self):
+        """
+        Supprime tous les symboles et remet les compteurs à zéro.
+        """
+        self.symbols.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,148 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from .timeline import Timeline
+
+
+class TemporalExport:
+    """
+    Classe TemporalExport
+
+    Convertit une chronologie précompilée en enregistrements horodatés destinés à des couches temporelles QGIS :
+    - un intervalle [début, fin[ par entité et par période d'état constant (position, rendu et textes),
+      les périodes où l'entité est chargée dans une autre n'étant pas exportées ;
+    - un segment de trace par déplacement, visible à partir du tick du déplacement.
+
+    Le tick t (l'état après traitement du tick t) correspond à l'instant start + t * multiplier unités,
+    comme l'équivalent affiché par le panneau de paramétrage. L'état initial correspond au tick -1.
+
+    Attributs :
+        UNIT_SECONDS  Durée en secondes de chaque unité reconnue.
+        timeline      La chronologie exportée.
+        multiplier    Nombre d'unités par tick.
+        unit          L'unité du multiplicateur, une clé de UNIT_SECONDS.
+        start         La date et l'heure du tick 0.
+    """
+
+    UNIT_SECONDS = {
+        "ms": 0.001,
+        "s": 1,
+        "sec": 1,
+        "min": 60,
+        "h": 3600,
+        "jour": 86400,
+    }
+
+    def __init__(self, timeline: Timeline, multiplier: float = 1, unit: str = "sec", start: datetime = None):
+        """
+        Initialise l'export d'une chronologie.
+
+        Paramètres:
+        timeline (Timeline): La chronologie à exporter.
+        multiplier (float): Nombre d'unités par tick, doit être strictement positif.
+        unit (str): L'unité du multiplicateur.
+        start (datetime): La date et l'heure du tick 0. Par défaut, aujourd'hui à minuit.
+
+        Exceptions:
+        ValueError: Levée si l'unité n'est pas reconnue ou si le multiplicateur n'est pas strictement positif.
+        """
+        if unit not in TemporalExport.UNIT_SECONDS:
+            raise ValueError(f"Unité de temps inconnue : {unit}")
+        if multiplier <= 0:
+            raise ValueError(f"Multiplicateur invalide : {multiplier}")
+
+        self.timeline = timeline
+        self.multiplier = float(multiplier)
+        self.unit = unit
+        self.start = start if start is not None else datetime.combine(datetime.now().date(), datetime.min.time())
+
+    def get_tick_duration(self) -> float:
+        """
+        Retourne la durée d'un tick en secondes.
+        """
+        return self.multiplier * TemporalExport.UNIT_SECONDS[self.unit]
+
+    def tick_to_datetime(self, tick: int) -> datetime:
+        """
+        Retourne l'instant correspondant à un tick.
+
+        Paramètres:
+        tick (int): Le tick, -1 pour l'état initial.
+
+        Retourne:
+        datetime: start + tick * durée d'un tick.
+        """
+        return self.start + timedelta(seconds=tick * self.get_tick_duration())
+
+    def get_extent(self) -> tuple[datetime, datetime]:
+        """
+        Retourne l'étendue temporelle de la chronologie, de l'état initial à la fin du dernier tick.
+        """
+        return self.tick_to_datetime(-1), self.tick_to_datetime(self.timeline.tick_count)
+
+    def get_loaded_mask(self) -> np.ndarray:
+        """
+        Retourne, pour chaque ligne de la chronologie, les entités chargées dans une autre.
+
+        Retourne:
+        np.ndarray: Tableau booléen (tick_count + 1, nombre d'entités).
+        """
+        timeline = self.timeline
+        masks = {}
+        loaded = np.zeros((timeline.tick_count + 1, len(timeline.entity_ids)), dtype=bool)
+
+        for row, value_id in enumerate(timeline.entities_loaded):
+            mask = masks.get(value_id)
+            if mask is None:
+                mask = np.zeros(len(timeline.entity_ids), dtype=bool)
+                for _, loaded_ids in timeline.values["entities_loaded"][value_id]:
+                    for loaded_id in loaded_ids:
+                        index = timeline.entity_index.get(loaded_id)
+                        if index is not None:
+                            mask[index] = True
+                masks[value_id] = mask
+            loaded[row] = mask
+
+        return loaded
+
+    def get_entity_intervals(self) -> list[tuple[str, int, int, dict]]:
+        """
+        Découpe la chronologie en périodes d'état constant pour chaque entité.
+
+        Une nouvelle période commence à chaque tick où une propriété de l'entité ou son état de chargement change.
+        Les périodes pendant lesquelles l'entité est chargée dans une autre sont ignorées.
+
+        Retourne:
+        list[tuple]: Des tuples (identifiant, tick de début, tick de fin exclu, état), l'état étant au format
+                     de MapEntity.get_state().
+        """
+        timeline = self.timeline
+        loaded = self.get_loaded_mask()
+
+        changed = np.zeros(loaded.shape, dtype=bool)
+        changed[0] = True
+        for column in timeline.columns.values():
+            changed[1:] |= column[1:] != column[:-1]
+        changed[1:] |= loaded[1:] != loaded[:-1]
+
+        intervals = []
+        for index, entity_id in enumerate(timeline.entity_ids):
+            rows = np.flatnonzero(changed[:, index])
+            ends = np.append(rows[1:], timeline.tick_count + 1)
+            for row, end in zip(rows, ends):
+                if loaded[row, index]:
+                    continue
+                tick = int(row) - 1
+                intervals.append((entity_id, tick, int(end) - 1, timeline.get_state(tick, entity_id)))
+
+        return intervals
+
+    def get_trace_segments(self) -> list[tuple[int, str, tuple[float, float], tuple[float, float]]]:
+        """
+        Retourne tous les déplacements de la chronologie.
+
+        Retourne:
+        list[tuple]: Des tuples (tick, identifiant, (lat, lon) de départ, (lat, lon) d'arrivée).
+        """
+        return self.timeline.get_moves(self.timeline.tick_count - 1)
@@ -0,0 +1,221 @@
+from qgis.core import (
+    QgsFeature,
+    QgsField,
+    QgsGeometry,
+    QgsPointXY,
+    QgsProject,
+    QgsVectorFileWriter,
+    QgsVectorLayer,
+    QgsVectorLayerTemporalProperties
+)
+from qgis.PyQt.QtCore import QDateTime
+from PyQt5.QtCore import QMetaType
+from typing import TYPE_CHECKING
+
+from .temporal_export import TemporalExport
+
+if TYPE_CHECKING:
+    from .map_entity import MapEntity
+
+
+class TemporalLayers:
+    """
+    Classe TemporalLayers
+
+    Construit les couches temporelles QGIS à partir des enregistrements horodatés de TemporalExport, et les écrit
+    dans un GeoPackage. Le rendu des couches et leur ajout au projet restent à la charge de LayerTraceQGIS.
+
+    Chaque couche porte, en plus de ses champs propres, les ticks ("tick_start", "tick_end") et les instants
+    ("start", "end") de début et de fin de chaque entité.
+    """
+
+    @staticmethod
+    def build_entity_layer(
+        export: TemporalExport,
+        map_entities: dict[str, 'MapEntity'],
+        show_name: bool,
+        show_position: bool
+    ) -> QgsVectorLayer:
+        """
+        Construit la couche mémoire "Entity (temporel)" : une entité par période d'état constant de chaque entité,
+        avec les champs du rendu par attributs, le texte de l'étiquette, les ticks et les instants de début et de fin.
+
+        Paramètres:
+        export (TemporalExport): L'export de la chronologie.
+        map_entities (dict): Les entités cartographiques, par identifiant.
+        show_name (bool): Indique si le nom figure dans l'étiquette.
+        show_position (bool): Indique si la position figure dans l'étiquette.
+
+        Retourne:
+        QgsVectorLayer: La couche, remplie en un seul appel à addFeatures.
+        """
+        from .map_entity import MapEntity
+
+        layer = TemporalLayers.create_layer("Point", "Entity (temporel)", [
+            QgsField("id", QMetaType.QString),
+            QgsField("nom", QMetaType.QString),
+            QgsField("size", QMetaType.Double),
+            QgsField("angle", QMetaType.Double),
+            QgsField("opacity", QMetaType.Double),
+            QgsField("icon", QMetaType.QString),
+            QgsField("highlight", QMetaType.QString),
+            QgsField("background", QMetaType.QString),
+            QgsField("label", QMetaType.QString)
+        ])
+
+        features = []
+        for entity_id, tick_start, tick_end, state in export.get_entity_intervals():
+            map_entity = map_entities.get(entity_id)
+            if not map_entity:
+                continue
+
+            label = MapEntity.format_description(
+                map_entity.get_name(),
+                state["latitude"],
+                state["longitude"],
+                state["altitude"],
+                state["texts"],
+                show_name,
+                show_position
+            )
+
+            feature = QgsFeature(layer.fields())
+            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(state["longitude"], state["latitude"])))
+            feature.setAttributes([
+                entity_id,
+                map_entity.get_name(),
+                state["size"],
+                state["angle"],
+                state["opacity"],
+                state["url_icon"],
+                state["highlight"],
+                state["background_image"],
+                label,
+                tick_start,
+                tick_end,
+                QDateTime(export.tick_to_datetime(tick_start)),
+                QDateTime(export.tick_to_datetime(tick_end))
+            ])
+            features.append(feature)
+
+        layer.dataProvider().addFeatures(features)
+        return layer
+
+    @staticmethod
+    def build_trace_layer(export: TemporalExport, map_entities: dict[str, 'MapEntity']) -> QgsVectorLayer:
+        """
+        Construit la couche mémoire "Traces Mouvements (temporel)" : un segment par déplacement, visible du tick
+        du déplacement jusqu'à la fin de la chronologie.
+
+        Paramètres:
+        export (TemporalExport): L'export de la chronologie.
+        map_entities (dict): Les entités cartographiques, par identifiant.
+
+        Retourne:
+        QgsVectorLayer: La couche, remplie en un seul appel à addFeatures.
+        """
+        layer = TemporalLayers.create_layer("LineString", "Traces Mouvements (temporel)", [
+            QgsField("id", QMetaType.QString),
+            QgsField("nom", QMetaType.QString),
+            QgsField("tick", QMetaType.Int)
+        ])
+
+        tick_end = export.timeline.tick_count
+        end = QDateTime(export.tick_to_datetime(tick_end))
+
+        features = []
+        for tick, entity_id, (lat_from, lon_from), (lat_to, lon_to) in export.get_trace_segments():
+            map_entity = map_entities.get(entity_id)
+            if not map_entity:
+                continue
+
+            feature = QgsFeature(layer.fields())
+            feature.setGeometry(QgsGeometry.fromPolylineXY([QgsPointXY(lon_from, lat_from), QgsPointXY(lon_to, lat_to)]))
+            feature.setAttributes([
+                entity_id,
+                map_entity.get_name(),
+                tick,
+                tick,
+                tick_end,
+                QDateTime(export.tick_to_datetime(tick)),
+                end
+            ])
+            features.append(feature)
+
+        layer.dataProvider().addFeatures(features)
+        return layer
+
+    @staticmethod
+    def create_layer(geometry_type: str, name: str, fields: list[QgsField]) -> QgsVectorLayer:
+        """
+        Crée une couche mémoire avec les champs donnés suivis des ticks ("tick_start", "tick_end") et des instants
+        ("start", "end") de début et de fin de chaque entité.
+
+        Paramètres:
+        geometry_type (str): Le type de géométrie ("Point" ou "LineString").
+        name (str): Le nom de la couche.
+        fields (list[QgsField]): Les champs propres à la couche.
+
+        Retourne:
+        QgsVectorLayer: La couche mémoire vide.
+        """
+        layer = QgsVectorLayer(f"{geometry_type}?crs=EPSG:4326", name, "memory")
+        layer.dataProvider().addAttributes(fields + [
+            QgsField("tick_start", QMetaType.Int),
+            QgsField("tick_end", QMetaType.Int),
+            QgsField("start", QMetaType.QDateTime),
+            QgsField("end", QMetaType.QDateTime)
+        ])
+        layer.updateFields()
+        return layer
+
+    @staticmethod
+    def set_temporal_fields(layer: QgsVectorLayer):
+        """
+        Active les propriétés temporelles d'une couche : chaque entité est affichée de l'instant de son champ
+        "start" (inclus) à celui de son champ "end" (exclu).
+
+        Paramètres:
+        layer (QgsVectorLayer): La couche exportée.
+        """
+        properties = layer.temporalProperties()
+        properties.setMode(QgsVectorLayerTemporalProperties.ModeFeatureDateTimeStartAndEndFromFields)
+        properties.setStartField("start")
+        properties.setEndField("end")
+        properties.setIsActive(True)
+
+    @staticmethod
+    def write_geopackage(path: str, layers: list[QgsVectorLayer], table_names: list[str]) -> list[QgsVectorLayer]:
+        """
+        Écrit des couches dans un même GeoPackage, qui est remplacé s'il existe, puis les recharge depuis ce fichier.
+
+        Paramètres:
+        path (str): Chemin du GeoPackage.
+        layers (list[QgsVectorLayer]): Les couches à écrire.
+        table_names (list[str]): Le nom de la table de chaque couche dans le GeoPackage.
+
+        Retourne:
+        list[QgsVectorLayer]: Les couches lues depuis le GeoPackage.
+
+        Exceptions:
+        OSError: Levée si l'écriture d'une couche échoue.
+        """
+        written_layers = []
+        for index, (layer, table_name) in enumerate(zip(layers, table_names)):
+            options = QgsVectorFileWriter.SaveVectorOptions()
+            options.driverName = "GPKG"
+            options.layerName = table_name
+            if index == 0:
+                options.actionOnExistingFile = QgsVectorFileWriter.CreateOrOverwriteFile
+            else:
+                options.actionOnExistingFile = QgsVectorFileWriter.CreateOrOverwriteLayer
+
+            error, message, *_ = QgsVectorFileWriter.writeAsVectorFormatV3(
+                layer, path, QgsProject.instance().transformContext(), options
+            )
+            if error != QgsVectorFileWriter.NoError:
+                raise OSError(f"Écriture de {table_name} dans {path} impossible : {message}")
+
+            written_layers.append(QgsVectorLayer(f"{path}|layername={table_name}", layer.name(), "ogr"))
+
+        return written_layers
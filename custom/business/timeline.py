@@ -0,0 +1,270 @@
+import numpy as np
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .map_entity import MapEntity
+
+
+class Timeline:
+    """
+    Classe Timeline
+
+    Chronologie précompilée de la simulation : l'état de chaque entité est stocké dans des tableaux NumPy
+    indexés par tick (lignes) et par entité (colonnes). Les valeurs non numériques (icône, mise en surbrillance,
+    image d'arrière-plan, textes, lignes et entités chargées) sont internées et stockées sous forme d'identifiants.
+
+    La ligne d'un tick correspond à l'état après traitement de ce tick, le tick -1 correspond à l'état initial.
+
+    Attributs :
+        entity_ids         Liste des identifiants des entités, dans l'ordre des colonnes.
+        entity_index       Dictionnaire identifiant -> indice de colonne.
+        tick_count         Nombre de ticks compilés.
+        columns            Dictionnaire nom de propriété -> tableau (tick_count + 1, nombre d'entités).
+        lines              Tableau des identifiants internés des lignes par tick.
+        entities_loaded    Tableau des identifiants internés des entités chargées par tick.
+        values             Dictionnaire nom -> liste des valeurs internées.
+        value_ids          Dictionnaire nom -> dictionnaire valeur -> identifiant interné.
+        compile_duration   Durée (en secondes) de la compilation.
+        playback_duration  Durée cumulée (en secondes) de lecture de la chronologie.
+        playback_ticks     Nombre de ticks lus depuis la chronologie.
+    """
+
+    FLOAT_COLUMNS = ("latitude", "longitude", "altitude", "size", "angle", "opacity")
+    INTERNED_COLUMNS = ("url_icon", "highlight", "background_image", "texts")
+
+    def __init__(self, entity_ids: list[str], tick_count: int):
+        """
+        Initialise une chronologie vide.
+
+        Paramètres:
+        entity_ids (list[str]): Identifiants des entités.
+        tick_count (int): Nombre de ticks à compiler.
+        """
+        self.entity_ids = list(entity_ids)
+        self.entity_index = {entity_id: index for index, entity_id in enumerate(self.entity_ids)}
+        self.tick_count = tick_count
+
+        shape = (tick_count + 1, len(self.entity_ids))
+        self.columns = {name: np.zeros(shape, dtype=np.float64) for name in Timeline.FLOAT_COLUMNS}
+        self.columns.update({name: np.zeros(shape, dtype=np.int32) for name in Timeline.INTERNED_COLUMNS})
+
+        self.lines = np.zeros(tick_count + 1, dtype=np.int32)
+        self.entities_loaded = np.zeros(tick_count + 1, dtype=np.int32)
+
+        self.values = {name: [] for name in Timeline.INTERNED_COLUMNS + ("lines", "entities_loaded")}
+        self.value_ids = {name: {} for name in self.values}
+
+        self.compile_duration = 0.0
+        self.playback_duration = 0.0
+        self.playback_ticks = 0
+
+        self.intern("lines", ())
+        self.intern("entities_loaded", ())
+
+    def intern(self, name: str, value) -> int:
+        """
+        Retourne l'identifiant interné d'une valeur, en l'ajoutant si nécessaire.
+
+        Paramètres:
+        name (str): Nom de la colonne internée.
+        value: Valeur hashable à interner.
+
+        Retourne:
+        int: L'identifiant de la valeur.
+        """
+        value_ids = self.value_ids[name]
+        value_id = value_ids.get(value)
+        if value_id is None:
+            value_id = len(self.values[name])
+            value_ids[value] = value_id
+            self.values[name].append(value)
+        return value_id
+
+    def set_state(self, tick: int, entity_id: str, state: dict):
+        """
+        Enregistre l'état d'une entité pour un tick.
+
+        Paramètres:
+        tick (int): Le tick, -1 pour l'état initial.
+        entity_id (str): Identifiant de l'entité.
+        state (dict): L'état retourné par MapEntity.get_state().
+        """
+        row = tick + 1
+        column = self.entity_index[entity_id]
+        for name in Timeline.FLOAT_COLUMNS:
+            self.columns[name][row, column] = state[name]
+        for name in ("url_icon", "highlight", "background_image"):
+            self.columns[name][row, column] = self.intern(name, state[name])
+        self.columns["texts"][row, column] = self.intern("texts", tuple(state["texts"]))
+
+    def get_state(self, tick: int, entity_id: str) -> dict:
+        """
+        Retourne l'état d'une entité à un tick.
+
+        Paramètres:
+        tick (int): Le tick, -1 pour l'état initial.
+        entity_id (str): Identifiant de l'entité.
+
+        Retourne:
+        dict: L'état au format de MapEntity.get_state().
+        """
+        row = tick + 1
+        column = self.entity_index[entity_id]
+        state = {name: float(self.columns[name][row, column]) for name in Timeline.FLOAT_COLUMNS}
+        for name in ("url_icon", "highlight", "background_image"):
+            state[name] = self.values[name][self.columns[name][row, column]]
+        state["texts"] = list(self.values["texts"][self.columns["texts"][row, column]])
+        return state
+
+    def record_initial(self, map_entities: list['MapEntity']):
+        """
+        Enregistre l'état initial de toutes les entités.
+
+        Paramètres:
+        map_entities (list[MapEntity]): Les entités de la carte.
+        """
+        for map_entity in map_entities:
+            self.set_state(-1, map_entity.get_id(), map_entity.get_state())
+
+    def record(self, tick: int, map_entities: list['MapEntity'], entities_loaded: dict, lines: set):
+        """
+        Enregistre l'état de la simulation après le traitement d'un tick.
+
+        La ligne du tick précédent est recopiée puis seules les entités modifiées pendant le tick
+        (d'après leur journal des modifications) sont réécrites.
+
+        Paramètres:
+        tick (int): Le tick traité.
+        map_entities (list[MapEntity]): Les entités de la carte.
+        entities_loaded (dict): Les entités chargées à la fin du tick.
+        lines (set): Les lignes à la fin du tick.
+        """
+        row = tick + 1
+        for column in self.columns.values():
+            column[row] = column[row - 1]
+
+        for map_entity in map_entities:
+            if map_entity.pop_changes():
+                self.set_state(tick, map_entity.get_id(), map_entity.get_state())
+
+        self.lines[row] = self.intern("lines", tuple(sorted(tuple(line) for line in lines)))
+        self.entities_loaded[row] = self.intern("entities_loaded", tuple(
+            (entity_id, tuple(entity.get_id() for entity in entity_list))
+            for entity_id, entity_list in entities_loaded.items()
+        ))
+
+    def get_lines(self, tick: int) -> set[tuple[str, str]]:
+        """
+        Retourne les lignes à un tick.
+
+        Paramètres:
+        tick (int): Le tick, -1 pour l'état initial.
+
+        Retourne:
+        set[tuple[str, str]]: Les couples (source, cible) d'identifiants reliés par une ligne.
+        """
+        return set(self.values["lines"][self.lines[tick + 1]])
+
+    def get_entities_loaded(self, tick: int) -> dict:
+        """
+        Retourne les identifiants des entités chargées à un tick.
+
+        Paramètres:
+        tick (int): Le tick, -1 pour l'état initial.
+
+        Retourne:
+        dict: Dictionnaire identifiant du contenant -> tuple des identifiants chargés.
+        """
+        return dict(self.values["entities_loaded"][self.entities_loaded[tick + 1]])
+
+    def get_changed_entities(self, from_tick: int, to_tick: int) -> list[str]:
+        """
+        Retourne les entités dont l'état diffère entre deux ticks.
+
+        Paramètres:
+        from_tick (int): Le tick de départ, -1 pour l'état initial.
+        to_tick (int): Le tick d'arrivée, -1 pour l'état initial.
+
+        Retourne:
+        list[str]: Les identifiants des entités modifiées.
+        """
+        changed = np.zeros(len(self.entity_ids), dtype=bool)
+        for column in self.columns.values():
+            changed |= column[from_tick + 1] != column[to_tick + 1]
+        return [self.entity_ids[index] for index in np.flatnonzero(changed)]
+
+    def get_moves(self, to_tick: int) -> list[tuple[int, str, tuple[float, float], tuple[float, float]]]:
+        """
+        Retourne tous les déplacements jusqu'au tick donné inclus.
+
+        Paramètres:
+        to_tick (int): Le dernier tick à prendre en compte.
+
+        Retourne:
+        list[tuple]: Des tuples (tick, identifiant, (lat, lon) de départ, (lat, lon) d'arrivée).
+        """
+        latitude = self.columns["latitude"][:to_tick + 2]
+        longitude = self.columns["longitude"][:to_tick + 2]
+        moved = (latitude[1:] != latitude[:-1]) | (longitude[1:] != longitude[:-1])
+
+        ticks, columns = np.nonzero(moved)
+        return [
+            (
+                int(tick),
+                self.entity_ids[column],
+                (float(latitude[tick, column]), float(longitude[tick, column])),
+                (float(latitude[tick + 1, column]), float(longitude[tick + 1, column])),
+            )
+            for tick, column in zip(ticks, columns)
+        ]
+
+    @staticmethod
+    def merge(entity_ids: list[str], timelines: list['Timeline']) -> 'Timeline':
+        """
+        Fusionne des chronologies compilées séparément pour des groupes d'entités disjoints et indépendants.
+
+        Les colonnes de chaque chronologie sont recopiées dans celles de ses entités, les valeurs internées étant
+        converties vers les identifiants de la chronologie fusionnée. Les lignes et les entités chargées d'un tick
+        sont la concaténation de celles de chaque chronologie, dans l'ordre des chronologies.
+
+        Paramètres:
+        entity_ids (list[str]): Identifiants de toutes les entités, dans l'ordre des colonnes.
+        timelines (list[Timeline]): Les chronologies à fusionner, de même nombre de ticks.
+
+        Retourne:
+        Timeline: La chronologie fusionnée.
+
+        Exceptions:
+        ValueError: Levée si les chronologies n'ont pas le même nombre de ticks.
+        """
+        tick_counts = {timeline.tick_count for timeline in timelines}
+        if len(tick_counts) > 1:
+            raise ValueError(f"Nombres de ticks différents : {sorted(tick_counts)}")
+
+        merged = Timeline(entity_ids, tick_counts.pop() if tick_counts else 0)
+
+        for timeline in timelines:
+            columns = [merged.entity_index[entity_id] for entity_id in timeline.entity_ids]
+            for name in Timeline.FLOAT_COLUMNS:
+                merged.columns[name][:, columns] = timeline.columns[name]
+            for name in Timeline.INTERNED_COLUMNS:
+                mapping = np.array([merged.intern(name, value) for value in timeline.values[name]], dtype=np.int32)
+                merged.columns[name][:, columns] = mapping[timeline.columns[name]]
+
+        for name in ("lines", "entities_loaded"):
+            merged_ids = {}
+            rows = getattr(merged, name)
+            for row in range(merged.tick_count + 1):
+                key = tuple(int(getattr(timeline, name)[row]) for timeline in timelines)
+                value_id = merged_ids.get(key)
+                if value_id is None:
+                    value = tuple(
+                        item
+                        for timeline, item_id in zip(timelines, key)
+                        for item in timeline.values[name][item_id]
+                    )
+                    value_id = merged.intern(name, value)
+                    merged_ids[key] = value_id
+                rows[row] = value_id
+
+        return merged
@@ -0,0 +1,236 @@
+import multiprocessing
+import multiprocessing.spawn
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from .simulation import Simulation
+from .timeline import Timeline
+
+if TYPE_CHECKING:
+    from .entity_state import EntityState
+    from ..actions.action import Action
+
+
+class TimelinePartition:
+    """
+    Classe TimelinePartition
+
+    Compile la chronologie d'une simulation en parallèle, en la découpant en groupes d'entités indépendants.
+
+    Deux entités appartiennent au même groupe si une action les relie (move_to, around, arrow, load ou unload,
+    par leurs attributs entity_id et entity_id2). Les groupes n'interagissent pas : chacun peut être simulé seul.
+    Les groupes sont répartis en lots de charge équivalente (nombre de ticks d'action), chaque lot est compilé dans
+    un processus par une simulation sans Qt, puis les chronologies sont fusionnées par Timeline.merge.
+
+    Attributs :
+        MIN_TICKS_PER_WORKER  Nombre minimal de ticks d'action par processus, en deçà la compilation reste séquentielle.
+    """
+
+    MIN_TICKS_PER_WORKER = 5000
+
+    @staticmethod
+    def get_action_entity_ids(action: 'Action') -> list[str]:
+        """
+        Retourne les identifiants des entités concernées par une action.
+
+        Paramètres:
+        action (Action): L'action.
+
+        Retourne:
+        list[str]: entity_id, suivi de entity_id2 pour les actions reliant deux entités.
+        """
+        entity_id2 = getattr(action, "entity_id2", None)
+        if entity_id2 is None:
+            return [action.entity_id]
+        return [action.entity_id, entity_id2]
+
+    @staticmethod
+    def find_groups(entity_ids: list[str], actions: list['Action']) -> list[list[str]]:
+        """
+        Regroupe les entités reliées, directement ou non, par des actions (union-find).
+
+        Les identifiants d'entités inconnus dans les actions sont ignorés.
+
+        Paramètres:
+        entity_ids (list[str]): Identifiants des entités.
+        actions (list[Action]): Les actions.
+
+        Retourne:
+        list[list[str]]: Les groupes, dans l'ordre de leur première entité, chacun dans l'ordre de entity_ids.
+        """
+        parents = {entity_id: entity_id for entity_id in entity_ids}
+
+        def find(entity_id: str) -> str:
+            while parents[entity_id] != entity_id:
+                parents[entity_id] = parents[parents[entity_id]]
+                entity_id = parents[entity_id]
+            return entity_id
+
+        for action in actions:
+            roots = [find(entity_id) for entity_id in TimelinePartition.get_action_entity_ids(action) if entity_id in parents]
+            for root in roots[1:]:
+                parents[root] = roots[0]
+
+        groups = {}
+        for entity_id in entity_ids:
+            groups.setdefault(find(entity_id), []).append(entity_id)
+        return list(groups.values())
+
+    @staticmethod
+    def split(entity_ids: list[str], actions: list['Action'], count: int) -> list[tuple[list[str], list['Action']]]:
+        """
+        Répartit les groupes d'entités indépendants en lots de charge équivalente.
+
+        La charge d'un groupe est son nombre de ticks d'action. Les groupes sont placés du plus chargé au moins
+        chargé dans le lot le moins chargé. Les actions de chaque lot gardent leur ordre d'origine.
+
+        Paramètres:
+        entity_ids (list[str]): Identifiants des entités.
+        actions (list[Action]): Les actions.
+        count (int): Nombre maximal de lots.
+
+        Retourne:
+        list[tuple[list[str], list[Action]]]: Les lots non vides, chacun avec ses entités et ses actions.
+        """
+        groups = TimelinePartition.find_groups(entity_ids, actions)
+        group_of = {entity_id: index for index, group in enumerate(groups) for entity_id in group}
+
+        loads = [0] * len(groups)
+        for action in actions:
+            group = group_of.get(action.entity_id)
+            if group is not None:
+                loads[group] += action.end_at - action.start_at + 1
+
+        count = max(min(int(count), len(groups)), 1)
+        chunk_loads = [0] * count
+        chunk_of_group = {}
+        for group in sorted(range(len(groups)), key=lambda index: -loads[index]):
+            chunk = chunk_loads.index(min(chunk_loads))
+            chunk_of_group[group] = chunk
+            chunk_loads[chunk] += loads[group]
+
+        chunks = [([], []) for _ in range(count)]
+        for entity_id in entity_ids:
+            chunks[chunk_of_group[group_of[entity_id]]][0].append(entity_id)
+        for action in actions:
+            group = group_of.get(action.entity_id)
+            if group is not None:
+                chunks[chunk_of_group[group]][1].append(action)
+
+        return [chunk for chunk in chunks if chunk[0]]
+
+    @staticmethod
+    def compile_chunk(entities: list['EntityState'], actions: list['Action'], tick_end: int) -> Timeline:
+        """
+        Compile la chronologie d'un lot d'entités, éventuellement dans un autre processus.
+
+        Paramètres:
+        entities (list[EntityState]): Les entités du lot, dans leur état initial.
+        actions (list[Action]): Les actions du lot.
+        tick_end (int): Le dernier tick de la simulation complète.
+
+        Retourne:
+        Timeline: La chronologie du lot, avec tick_end + 1 ticks.
+        """
+        simulation = Simulation(entities)
+        simulation.set_built_actions(actions)
+        simulation.tick_end = tick_end
+        simulation.activate()
+        return simulation.compile_timeline()
+
+    @staticmethod
+    def get_worker_count(simulation: Simulation, max_workers: int) -> int:
+        """
+        Retourne le nombre de processus utiles : au plus max_workers et un par MIN_TICKS_PER_WORKER ticks d'action.
+
+        Paramètres:
+        simulation (Simulation): La simulation à compiler.
+        max_workers (int): Nombre maximal de processus, 0 pour le nombre de processeurs.
+
+        Retourne:
+        int: Le nombre de processus, 1 pour une compilation séquentielle.
+        """
+        if max_workers <= 0:
+            max_workers = os.cpu_count() or 1
+
+        load = sum(action.end_at - action.start_at + 1 for action in simulation.actions)
+        return max(min(max_workers, load // TimelinePartition.MIN_TICKS_PER_WORKER), 1)
+
+    @staticmethod
+    def get_python_executable() -> str:
+        """
+        Retourne l'interpréteur Python à lancer par les processus, None si celui de multiprocessing convient.
+
+        Dans QGIS, sys.executable est l'exécutable de QGIS et non celui de Python : l'interpréteur est alors
+        recherché dans sys.exec_prefix.
+
+        Retourne:
+        str | None: Le chemin de l'interpréteur Python, None si sys.executable est déjà un interpréteur Python.
+        """
+        if os.path.basename(sys.executable).lower().startswith("python"):
+            return None
+
+        if os.name == "nt":
+            candidate = os.path.join(sys.exec_prefix, "python.exe")
+        else:
+            candidate = os.path.join(sys.exec_prefix, "bin", f"python{sys.version_info.major}")
+        return candidate if os.path.exists(candidate) else sys.executable
+
+    @staticmethod
+    def compile(simulation: Simulation, max_workers: int = 0) -> Timeline:
+        """
+        Compile la chronologie d'une simulation, en parallèle si elle comporte plusieurs groupes indépendants.
+
+        Procédé :
+        1. Répartit les groupes d'entités en lots, au plus un par processus (voir get_worker_count).
+        2. S'il n'y a qu'un lot, compile la simulation elle-même par Simulation.compile_timeline.
+        3. Sinon, compile chaque lot dans un processus (contexte "spawn", sans Qt), à partir de copies de l'état
+           initial des entités (EntityState.copy_initial), puis fusionne les chronologies. Si les processus ne
+           peuvent pas être lancés, la compilation est séquentielle.
+
+        L'interpréteur des processus "spawn" est commun à tout le processus QGIS (greffons, traitements) : s'il doit
+        être remplacé (voir get_python_executable), la valeur d'origine est restaurée à la fin de la compilation.
+
+        La simulation n'est pas modifiée lorsque la compilation est parallèle ; la simulation courante reste la même.
+
+        Paramètres:
+        simulation (Simulation): La simulation à compiler.
+        max_workers (int): Nombre maximal de processus, 0 pour le nombre de processeurs.
+
+        Retourne:
+        Timeline: La chronologie de toute la simulation.
+        """
+        entity_ids = list(simulation.map_entities.keys())
+        chunks = TimelinePartition.split(entity_ids, simulation.actions, TimelinePartition.get_worker_count(simulation, max_workers))
+        if len(chunks) <= 1:
+            return simulation.compile_timeline()
+
+        context = multiprocessing.get_context("spawn")
+        executable = TimelinePartition.get_python_executable()
+        previous_executable = multiprocessing.spawn.get_executable()
+        if executable is not None:
+            context.set_executable(executable)
+        try:
+            with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as executor:
+                futures = [
+                    executor.submit(
+                        TimelinePartition.compile_chunk,
+                        [simulation.map_entities[entity_id].copy_initial() for entity_id in chunk_entity_ids],
+                        chunk_actions,
+                        simulation.tick_end
+                    )
+                    for chunk_entity_ids, chunk_actions in chunks
+                ]
+                timelines = [future.result() for future in futures]
+        except (OSError, BrokenProcessPool) as e:
+            simulation.log(f"Compilation parallèle impossible, compilation séquentielle : {e}", Simulation.MESSAGE_WARNING)
+            return simulation.compile_timeline()
+        finally:
+            if executable is not None:
+                context.set_executable(previous_executable)
+
+        simulation.log(f"Chronologie compilée en parallèle : {len(chunks)} lots", Simulation.MESSAGE_INFO)
+        return Timeline.merge(entity_ids, timelines)
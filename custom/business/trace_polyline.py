@@ -0,0 +1,115 @@
+from qgis.core import QgsGeometry, QgsLineString, QgsPoint, QgsPointXY, QgsVertexId
+
+
+class TracePolyline:
+    """
+    Classe TracePolyline
+
+    Trace de déplacement sous forme d'une polyligne unique, prolongée d'un sommet à chaque segment tracé au lieu
+    d'ajouter une entité QGIS par segment. Les sommets sont ajoutés en place à une QgsLineString, sans
+    simplification afin de pouvoir tronquer la polyligne à un tick donné ; la simplification n'est appliquée
+    qu'à la géométrie écrite dans la couche.
+
+    Attributs :
+        entity_id   Identifiant de l'entité tracée.
+        name        Nom de l'entité tracée.
+        line        Les sommets de la polyligne.
+        last_point  Le dernier sommet de la polyligne.
+        ticks       Tick de chaque segment : ticks[i] est le tick du segment entre les sommets i et i + 1.
+        feature_id  Identifiant de l'entité QGIS de la polyligne dans la couche trace, None tant qu'elle n'est pas écrite.
+        dirty       Indique si la polyligne est en attente d'écriture dans la couche trace.
+        simplified  Indique si la géométrie écrite dans la couche trace est la géométrie simplifiée.
+    """
+
+    def __init__(self, entity_id: str, name: str, start_point: QgsPointXY, end_point: QgsPointXY, tick: int):
+        """
+        Initialise une polyligne à partir de son premier segment.
+
+        Paramètres:
+        entity_id (str): Identifiant de l'entité tracée.
+        name (str): Nom de l'entité tracée.
+        start_point (QgsPointXY): Le point de départ du premier segment.
+        end_point (QgsPointXY): Le point d'arrivée du premier segment.
+        tick (int): Le tick du premier segment.
+        """
+        self.entity_id = entity_id
+        self.name = name
+        self.line = QgsLineString([QgsPoint(start_point), QgsPoint(end_point)])
+        self.last_point = end_point
+        self.ticks = [tick]
+        self.feature_id = None
+        self.dirty = False
+        self.simplified = False
+
+    def get_first_tick(self) -> int:
+        """
+        Retourne le tick du premier segment.
+        """
+        return self.ticks[0]
+
+    def get_last_tick(self) -> int:
+        """
+        Retourne le tick du dernier segment.
+        """
+        return self.ticks[-1]
+
+    def append(self, start_point: QgsPointXY, end_point: QgsPointXY, tick: int):
+        """
+        Prolonge la polyligne d'un segment, en ajoutant ses sommets en place.
+
+        Si le segment ne part pas du dernier sommet (entité déplacée sans trace, par exemple après un changement
+        de décimation), son point de départ est ajouté avant son point d'arrivée.
+
+        Paramètres:
+        start_point (QgsPointXY): Le point de départ du segment.
+        end_point (QgsPointXY): Le point d'arrivée du segment.
+        tick (int): Le tick du segment.
+        """
+        if start_point != self.last_point:
+            self.line.addVertex(QgsPoint(start_point))
+            self.ticks.append(tick)
+        self.line.addVertex(QgsPoint(end_point))
+        self.ticks.append(tick)
+        self.last_point = end_point
+
+    def truncate(self, tick: int) -> bool:
+        """
+        Supprime les segments tracés à partir du tick donné, en retirant les derniers sommets.
+
+        Paramètres:
+        tick (int): Le premier tick dont les segments doivent être supprimés.
+
+        Retourne:
+        bool: True si des segments ont été supprimés.
+        """
+        count = len(self.ticks)
+        while self.ticks and self.ticks[-1] >= tick:
+            self.ticks.pop()
+        if len(self.ticks) == count or not self.ticks:
+            return len(self.ticks) != count
+
+        for index in range(count, len(self.ticks), -1):
+            self.line.deleteVertex(QgsVertexId(0, 0, index))
+        self.last_point = QgsPointXY(self.line.pointN(len(self.ticks)))
+        return True
+
+    def is_empty(self) -> bool:
+        """
+        Indique si la polyligne n'a plus aucun segment.
+        """
+        return not self.ticks
+
+    def get_geometry(self, tolerance: float = 0) -> QgsGeometry:
+        """
+        Retourne la géométrie de la polyligne, éventuellement simplifiée.
+
+        Paramètres:
+        tolerance (float): Tolérance de simplification (Douglas-Peucker) en unités de la carte, 0 pour la désactiver.
+
+        Retourne:
+        QgsGeometry: Une copie de la polyligne.
+        """
+        geometry = QgsGeometry(self.line.clone())
+        if tolerance > 0:
+            geometry = geometry.simplify(tolerance)
+        return geometry
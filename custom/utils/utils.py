@@ -1,8 +1,6 @@
 import math
 import random
 
-from qgis.PyQt.QtGui import QColor
-
 class Utils:
 
     @staticmethod
@@ -50,6 +48,21 @@ class Utils:
         azimuth = math.degrees(math.atan2(x, y))
         return (azimuth + 360) % 360
 
+    @staticmethod
+    def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+        """
+        Calcule la distance (en mètres) entre deux points GPS avec la formule de Haversine.
+        Entrées en degrés.
+        """
+        R = 6371000  # Rayon de la Terre en mètres
+        phi1 = math.radians(lat1)
+        phi2 = math.radians(lat2)
+        dphi = phi2 - phi1
+        dlambda = math.radians(lon2 - lon1)
+
+        a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+        return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
     @staticmethod
     def destination_point(lat_deg: float, lon_deg: float, azimuth_deg: float, distance_m: float) -> tuple[float, float]:
         """
@@ -154,6 +167,9 @@ class Utils:
         Renvoie:
         QColor: Couleur générée aléatoirement avec des composantes rouge, vert et bleu comprises entre 50 et 255.
         """
+        # Import local : le reste de Utils n'a pas besoin de Qt et reste utilisable sans QGIS
+        from qgis.PyQt.QtGui import QColor
+
         random.seed(entity_id)  # str accepté
         r = random.randint(50, 255)
         g = random.randint(50, 255)
@@ -2,7 +2,7 @@ import os
 
 from PyQt5.QtWidgets import QGridLayout
 from qgis.PyQt import uic
-from qgis.PyQt.QtWidgets import QDockWidget, QVBoxLayout, QHBoxLayout, QWidget, QRadioButton, QButtonGroup, QDialog, QMessageBox
+from qgis.PyQt.QtWidgets import QDockWidget, QVBoxLayout, QHBoxLayout, QWidget, QRadioButton, QButtonGroup, QDialog, QMessageBox, QFileDialog, QTableWidgetItem
 from PyQt5.QtCore import Qt, pyqtSignal
 
 # Chargement du .ui existant
@@ -20,6 +20,25 @@ class TraceQGISDockWidget(QDockWidget, FORM_CLASS):
         radio_layout : Un agencement horizontal pour les boutons radio de focus.
         radio_group : Un groupe de boutons radio pour gérer les options de focus.
         pauseButton : Bouton permettant de mettre en pause ou de reprendre le timer.
+        stepBackButton : Bouton permettant de revenir d'un tick en arrière.
+        checkbox_reverse : Case à cocher permettant de lire l'animation en sens inverse.
+        checkbox_timeline : Case à cocher permettant de lire l'animation depuis la chronologie précompilée.
+        timelineWorkersSpinBox : Nombre de processus compilant la chronologie, 0 pour un par processeur.
+        checkbox_data_defined : Case à cocher permettant d'utiliser le rendu par attributs au lieu du rendu catégorisé.
+        checkbox_native_labels : Case à cocher permettant d'utiliser le moteur d'étiquettes de QGIS au lieu d'un QLabel par entité.
+        traceStepSpinBox : Nombre de ticks entre deux segments de trace.
+        traceDistanceSpinBox : Distance minimale (en mètres) parcourue avant de tracer un segment.
+        traceModeComboBox : Mode de trace : un segment par déplacement, une polyligne par entité ou par déplacement ininterrompu.
+        traceToleranceSpinBox : Tolérance de simplification des polylignes de trace, en degrés.
+        playbackStatsLabel : Affiche la cadence de lecture atteinte et le nombre d'images sautées.
+        checkbox_profiling : Case à cocher permettant de mesurer la durée de chaque phase du rafraîchissement.
+        profilingTable : Tableau des statistiques de durée (médiane, 95e centile, maximum) de chaque phase.
+        exportTemporalButton : Bouton permettant d'exporter la simulation en couches temporelles.
+        exportFramesButton : Bouton permettant de rendre une suite de ticks en images PNG.
+        frameStartSpinBox : Premier tick rendu en image.
+        frameEndSpinBox : Dernier tick rendu en image.
+        frameProgressBar : Progression de l'export d'images.
+        frameCancelButton : Bouton permettant d'annuler l'export d'images.
         tickSlider : Slider servant à ajuster la position actuelle dans le traçage temporel.
 
     Méthodes:
@@ -30,11 +49,29 @@ class TraceQGISDockWidget(QDockWidget, FORM_CLASS):
         on_vitesse_changed() : Modifie l'intervalle du timer basé sur la vitesse choisie.
         get_focus() : Retourne l'identifiant de l'entité actuellement sélectionnée dans le groupe de boutons radio de focus.
         toggle_timer() : Active ou désactive le timer, met à jour le texte du bouton pause/lecture.
+        step_backward() : Demande le retour d'un tick en arrière.
+        toggle_reverse(state) : Active ou désactive la lecture inverse.
+        toggle_timeline(state) : Active ou désactive la lecture depuis la chronologie précompilée.
+        on_timeline_workers_changed() : Transmet le nombre de processus compilant la chronologie.
+        toggle_data_defined(state) : Active ou désactive le rendu par attributs.
+        toggle_native_labels(state) : Active ou désactive l'étiquetage natif de QGIS.
+        toggle_profiling(state) : Active ou désactive le profilage du rafraîchissement.
+        reset_profiling() : Demande la suppression des mesures du profilage.
+        export_profiling() : Demande un fichier puis l'export des statistiques du profilage en CSV.
+        set_profiling_stats(stats) : Affiche les statistiques du profilage dans le tableau.
+        export_temporal() : Demande la destination puis l'export de la simulation en couches temporelles.
+        export_frames() : Demande le dossier de destination puis le rendu des ticks choisis en images PNG.
+        cancel_frame_export() : Demande l'annulation de l'export d'images.
+        set_frame_export_progress(written, total) : Affiche la progression de l'export d'images.
+        set_frame_export_finished(completed) : Réactive l'export d'images à la fin du précédent.
+        on_trace_decimation_changed() : Transmet la politique de décimation des traces.
+        on_trace_mode_changed() : Transmet le mode de trace et la tolérance de simplification.
         on_tickSlider_changed() -> bool : Détecte le changement de position du slider et actualise l'état du traçage temporel.
         change_current_tick(tick) : Modifie et affiche la valeur actuelle du tick dans l'affichage numérique.
         change_tick_equivalent(tick, multiplier, unit) : Calcule et affiche la valeur équivalente du tick en fonction d'un multiplicateur et d'une unité donnée.
         get_tickSlider() -> int : Retourne la valeur actuelle du slider.
         set_max_tickSlider(max) : Définit la valeur maximale admissible pour le slider.
+        set_playback_stats(ticks_per_second, frames_dropped) : Affiche la cadence de lecture atteinte et le nombre d'images sautées.
         set_value_tickSlider(value) : Ajuste la valeur du slider et met à jour les affichages du tick courant et équivalent.
     """
     signal_focus_changed = pyqtSignal(str)
@@ -43,6 +80,20 @@ class TraceQGISDockWidget(QDockWidget, FORM_CLASS):
     signal_toggle_timer = pyqtSignal(int)
     signal_toggle_show_info_name = pyqtSignal(bool)
     signal_toggle_show_info_position = pyqtSignal(bool)
+    signal_step_backward = pyqtSignal()
+    signal_toggle_reverse = pyqtSignal(bool)
+    signal_toggle_timeline = pyqtSignal(bool)
+    signal_timeline_workers_changed = pyqtSignal(int)
+    signal_trace_decimation_changed = pyqtSignal(int, float)
+    signal_trace_mode_changed = pyqtSignal(str, float)
+    signal_toggle_data_defined = pyqtSignal(bool)
+    signal_toggle_native_labels = pyqtSignal(bool)
+    signal_toggle_profiling = pyqtSignal(bool)
+    signal_reset_profiling = pyqtSignal()
+    signal_export_profiling = pyqtSignal(str)
+    signal_export_temporal = pyqtSignal(str, float, str)
+    signal_export_frames = pyqtSignal(str, float, str, int, int)
+    signal_cancel_frame_export = pyqtSignal()
     ENTITY_ID_PROPERTY_NAME = "entity_id"
 
     def __init__(self, parent=None, multiplier: float= 10, unit: str = "sec"):
@@ -81,6 +132,22 @@ class TraceQGISDockWidget(QDockWidget, FORM_CLASS):
 
 
         self.pauseButton.clicked.connect(self.toggle_timer)
+        self.stepBackButton.clicked.connect(self.step_backward)
+        self.checkbox_reverse.stateChanged.connect(self.toggle_reverse)
+        self.checkbox_timeline.stateChanged.connect(self.toggle_timeline)
+        self.timelineWorkersSpinBox.valueChanged.connect(self.on_timeline_workers_changed)
+        self.traceStepSpinBox.valueChanged.connect(self.on_trace_decimation_changed)
+        self.traceDistanceSpinBox.valueChanged.connect(self.on_trace_decimation_changed)
+        self.traceModeComboBox.currentIndexChanged.connect(self.on_trace_mode_changed)
+        self.traceToleranceSpinBox.valueChanged.connect(self.on_trace_mode_changed)
+        self.checkbox_data_defined.stateChanged.connect(self.toggle_data_defined)
+        self.checkbox_native_labels.stateChanged.connect(self.toggle_native_labels)
+        self.checkbox_profiling.stateChanged.connect(self.toggle_profiling)
+        self.profilingResetButton.clicked.connect(self.reset_profiling)
+        self.profilingExportButton.clicked.connect(self.export_profiling)
+        self.exportTemporalButton.clicked.connect(self.export_temporal)
+        self.exportFramesButton.clicked.connect(self.export_frames)
+        self.frameCancelButton.clicked.connect(self.cancel_frame_export)
         self.speed_group.buttonClicked.connect(self.on_vitesse_changed)
         self.tickSlider.sliderReleased.connect(self.on_tickSlider_changed)
         self.checkbox_show_name.stateChanged.connect(self.toggle_show_information_name)
@@ -181,6 +248,161 @@ class TraceQGISDockWidget(QDockWidget, FORM_CLASS):
         self.set_timer_on(timer_change)
         self.signal_toggle_timer.emit(timer_change)
 
+    def step_backward(self):
+        """
+        Demande le retour d'un tick en arrière.
+        """
+        self.signal_step_backward.emit()
+
+    def toggle_reverse(self, state):
+        """Active ou désactive la lecture inverse selon l'état du checkbox"""
+        reverse = state == Qt.Checked
+        self.signal_toggle_reverse.emit(reverse)
+
+    def toggle_timeline(self, state):
+        """Active ou désactive la lecture depuis la chronologie précompilée selon l'état du checkbox"""
+        enabled = state == Qt.Checked
+        self.signal_toggle_timeline.emit(enabled)
+
+    def on_timeline_workers_changed(self):
+        """
+        Méthode appelée lorsque le nombre de processus compilant la chronologie change.
+        """
+        self.signal_timeline_workers_changed.emit(self.timelineWorkersSpinBox.value())
+
+    def toggle_data_defined(self, state):
+        """Active ou désactive le rendu par attributs selon l'état du checkbox"""
+        enabled = state == Qt.Checked
+        self.signal_toggle_data_defined.emit(enabled)
+
+    def toggle_native_labels(self, state):
+        """Active ou désactive l'étiquetage natif de QGIS selon l'état du checkbox"""
+        enabled = state == Qt.Checked
+        self.signal_toggle_native_labels.emit(enabled)
+
+    def toggle_profiling(self, state):
+        """Active ou désactive le profilage du rafraîchissement selon l'état du checkbox"""
+        enabled = state == Qt.Checked
+        self.signal_toggle_profiling.emit(enabled)
+
+    def reset_profiling(self):
+        """
+        Demande la suppression des mesures du profilage.
+        """
+        self.signal_reset_profiling.emit()
+
+    def export_profiling(self):
+        """
+        Demande le fichier de destination puis l'export des statistiques du profilage en CSV.
+        """
+        path, _ = QFileDialog.getSaveFileName(self, "Exporter le profilage", "profilage.csv", "CSV (*.csv)")
+        if path:
+            self.signal_export_profiling.emit(path)
+
+    def export_temporal(self):
+        """
+        Demande la destination puis l'export de la simulation en couches temporelles.
+
+        Les couches sont écrites dans un GeoPackage si l'utilisateur le souhaite, sinon conservées en mémoire.
+        Le multiplicateur et l'unité du panneau convertissent les ticks en instants.
+        """
+        answer = QMessageBox.question(
+            self,
+            "Exporter en couches temporelles",
+            "Enregistrer les couches dans un GeoPackage ?\nSinon, elles sont conservées en mémoire.",
+            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
+        )
+        if answer == QMessageBox.Cancel:
+            return
+
+        path = ""
+        if answer == QMessageBox.Yes:
+            path, _ = QFileDialog.getSaveFileName(self, "Exporter en couches temporelles", "trace_qgis.gpkg", "GeoPackage (*.gpkg)")
+            if not path:
+                return
+
+        self.signal_export_temporal.emit(path, float(self.multiplier), self.unit)
+
+    def export_frames(self):
+        """
+        Demande le dossier de destination puis le rendu en images PNG des ticks choisis.
+
+        Le bouton d'export est désactivé et celui d'annulation activé jusqu'à la fin de l'export.
+        """
+        directory = QFileDialog.getExistingDirectory(self, "Dossier des images")
+        if not directory:
+            return
+
+        self.frameProgressBar.setValue(0)
+        self.exportFramesButton.setEnabled(False)
+        self.frameCancelButton.setEnabled(True)
+        self.signal_export_frames.emit(
+            directory,
+            float(self.multiplier),
+            self.unit,
+            self.frameStartSpinBox.value(),
+            self.frameEndSpinBox.value()
+        )
+
+    def cancel_frame_export(self):
+        """
+        Demande l'annulation de l'export d'images en cours.
+        """
+        self.frameCancelButton.setEnabled(False)
+        self.signal_cancel_frame_export.emit()
+
+    def set_frame_export_progress(self, written: int, total: int):
+        """
+        Affiche la progression de l'export d'images.
+
+        Paramètres:
+        written (int): Le nombre d'images écrites.
+        total (int): Le nombre d'images à écrire.
+        """
+        self.frameProgressBar.setMaximum(total)
+        self.frameProgressBar.setValue(written)
+
+    def set_frame_export_finished(self, completed: bool):
+        """
+        Réactive l'export d'images à la fin du précédent.
+
+        Paramètres:
+        completed (bool): True si toutes les images ont été écrites.
+        """
+        self.exportFramesButton.setEnabled(True)
+        self.frameCancelButton.setEnabled(False)
+
+    def set_profiling_stats(self, stats: list):
+        """
+        Affiche les statistiques du profilage, une ligne par phase.
+
+        Paramètres:
+        stats (list): Des tuples (phase, nombre de mesures, p50, p95, maximum, total), les durées en millisecondes.
+        """
+        self.profilingTable.setRowCount(len(stats))
+        for row, (name, count, p50, p95, maximum, total) in enumerate(stats):
+            values = (name, str(count), f"{p50:.2f}", f"{p95:.2f}", f"{maximum:.2f}")
+            for column, value in enumerate(values):
+                self.profilingTable.setItem(row, column, QTableWidgetItem(value))
+
+    def on_trace_decimation_changed(self):
+        """
+        Méthode appelée lorsque la politique de décimation des traces change.
+
+        Émet le nombre de ticks entre deux segments et la distance minimale en mètres.
+        """
+        self.signal_trace_decimation_changed.emit(self.traceStepSpinBox.value(), self.traceDistanceSpinBox.value())
+
+    def on_trace_mode_changed(self):
+        """
+        Méthode appelée lorsque le mode de trace ou la tolérance de simplification change.
+
+        Émet le mode de trace (dans l'ordre des choix de traceModeComboBox : LayerTraceQGIS.TRACE_SEGMENTS,
+        TRACE_ENTITY puis TRACE_MOVE) et la tolérance en degrés.
+        """
+        mode = ("segments", "entity", "move")[self.traceModeComboBox.currentIndex()]
+        self.signal_trace_mode_changed.emit(mode, self.traceToleranceSpinBox.value())
+
     def set_timer_on(self, is_active: bool):
         """
         Permet de basculer l'état du minuteur.
@@ -245,10 +467,15 @@ class TraceQGISDockWidget(QDockWidget, FORM_CLASS):
         """
         Définit la valeur maximale du tickSlider.
 
+        Les bornes des ticks rendus en images suivent le tickSlider, le dernier tick rendu étant placé sur le maximum.
+
         Paramètres:
         max (int): Valeur maximale à définir pour le tickSlider.
         """
         self.tickSlider.setMaximum(max)
+        self.frameStartSpinBox.setMaximum(max)
+        self.frameEndSpinBox.setMaximum(max)
+        self.frameEndSpinBox.setValue(max)
 
     def set_value_tickSlider(self, value: int):
         """
@@ -266,6 +493,16 @@ class TraceQGISDockWidget(QDockWidget, FORM_CLASS):
         self.change_current_tick(value)
         self.change_tick_equivalent(value)
 
+    def set_playback_stats(self, ticks_per_second: float, frames_dropped: int):
+        """
+        Affiche la cadence de lecture atteinte et le nombre d'images sautées.
+
+        Paramètres:
+        ticks_per_second (float): Le nombre de ticks affichés par seconde.
+        frames_dropped (int): Le nombre de ticks exécutés sans être affichés depuis le démarrage de la lecture.
+        """
+        self.playbackStatsLabel.setText(f"{ticks_per_second:.1f} ticks/s, {frames_dropped} images sautées")
+
     def toggle_show_information_name(self, state):
         """Affiche ou cache les labels selon l'état du checkbox"""
         visible = state == Qt.Checked
@@ -279,6 +516,22 @@ class TraceQGISDockWidget(QDockWidget, FORM_CLASS):
     def unload(self):
         self.radio_group.buttonClicked[int].disconnect(self.on_radio_changed)
         self.pauseButton.clicked.disconnect(self.toggle_timer)
+        self.stepBackButton.clicked.disconnect(self.step_backward)
+        self.checkbox_reverse.stateChanged.disconnect(self.toggle_reverse)
+        self.checkbox_timeline.stateChanged.disconnect(self.toggle_timeline)
+        self.timelineWorkersSpinBox.valueChanged.disconnect(self.on_timeline_workers_changed)
+        self.traceStepSpinBox.valueChanged.disconnect(self.on_trace_decimation_changed)
+        self.traceDistanceSpinBox.valueChanged.disconnect(self.on_trace_decimation_changed)
+        self.traceModeComboBox.currentIndexChanged.disconnect(self.on_trace_mode_changed)
+        self.traceToleranceSpinBox.valueChanged.disconnect(self.on_trace_mode_changed)
+        self.checkbox_data_defined.stateChanged.disconnect(self.toggle_data_defined)
+        self.checkbox_native_labels.stateChanged.disconnect(self.toggle_native_labels)
+        self.checkbox_profiling.stateChanged.disconnect(self.toggle_profiling)
+        self.profilingResetButton.clicked.disconnect(self.reset_profiling)
+        self.profilingExportButton.clicked.disconnect(self.export_profiling)
+        self.exportTemporalButton.clicked.disconnect(self.export_temporal)
+        self.exportFramesButton.clicked.disconnect(self.export_frames)
+        self.frameCancelButton.clicked.disconnect(self.cancel_frame_export)
         self.speed_group.buttonClicked.disconnect(self.on_vitesse_changed)
         self.tickSlider.sliderReleased.disconnect(self.on_tickSlider_changed)
         self.checkbox_show_name.stateChanged.disconnect(self.toggle_show_information_name)
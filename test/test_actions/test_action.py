@@ -59,7 +59,7 @@ def test_add_text_without_text():
     map_entity.append_text.assert_not_called()
 
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick", return_value=123)
+@patch("custom.business.simulation.Simulation.get_current_tick", return_value=123)
 def test_str_includes_expected_parts(mock_get_tick):
     action = DummyAction(1, 5, 42, "test")
     result = str(action)
@@ -6,8 +6,8 @@ from custom.actions.action_arrow import ActionArrow
 def action():
     return ActionArrow(1, 10, 101, 202, text="flèche")
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_instance")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_instance")
 def test_execute_success(mock_get_instance, mock_get_map_entity, action):
     # Préparation des entités simulées
     mock_entity1 = MagicMock()
@@ -32,7 +32,7 @@ def test_execute_success(mock_get_instance, mock_get_map_entity, action):
     # Vérifie bien l'appel de la méthode d'instance Action
     # (tu peux adapter si add_text est mockable / observable)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_failure_entity_not_found(mock_get_map_entity, action):
     mock_get_map_entity.side_effect = [None, None]
 
@@ -42,7 +42,7 @@ def test_execute_failure_entity_not_found(mock_get_map_entity, action):
     mock_get_map_entity.assert_any_call(101)
     mock_get_map_entity.assert_any_call(202)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_failure_same_entity(mock_get_map_entity, action):
     mock_entity = MagicMock()
     mock_entity.id = 101
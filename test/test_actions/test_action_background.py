@@ -6,8 +6,8 @@ from custom.actions.action_background import ActionBackground
 def action():
     return ActionBackground(5, 15, 303, "path/to/image.png", text="fond")
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick")
 def test_execute_success(mock_get_current_tick, mock_get_map_entity, action):
     # Mock des retours
     mock_entity = MagicMock()
@@ -25,8 +25,8 @@ def test_execute_success(mock_get_current_tick, mock_get_map_entity, action):
     mock_get_current_tick.assert_called_once()
     mock_entity.set_background_image.assert_called_once_with("path/to/image.png", True)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick")
 def test_execute_success_with_non_matching_tick(mock_get_current_tick, mock_get_map_entity, action):
     mock_entity = MagicMock()
     mock_entity.id = 303
@@ -39,7 +39,7 @@ def test_execute_success_with_non_matching_tick(mock_get_current_tick, mock_get_
     assert result is True
     mock_entity.set_background_image.assert_called_once_with("path/to/image.png", False)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_failure_no_entity(mock_get_map_entity, action):
     mock_get_map_entity.return_value = None
 
@@ -6,8 +6,8 @@ from custom.actions.action_change_icon import ActionChangeIcon
 def action():
     return ActionChangeIcon(10, 20, 404, "icons/my_icon.png", text="icone")
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick")
 def test_execute_success_matching_tick(mock_get_current_tick, mock_get_map_entity, action):
     # Mocks
     mock_entity = MagicMock()
@@ -23,8 +23,8 @@ def test_execute_success_matching_tick(mock_get_current_tick, mock_get_map_entit
     mock_get_current_tick.assert_called_once()
     mock_entity.set_url_icon.assert_called_once_with("icons/my_icon.png", True)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick")
 def test_execute_success_non_matching_tick(mock_get_current_tick, mock_get_map_entity, action):
     mock_entity = MagicMock()
     mock_entity.id = 404
@@ -37,7 +37,7 @@ def test_execute_success_non_matching_tick(mock_get_current_tick, mock_get_map_e
     assert result is True
     mock_entity.set_url_icon.assert_called_once_with("icons/my_icon.png", False)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_failure_no_entity(mock_get_map_entity, action):
     mock_get_map_entity.return_value = None
 
@@ -6,8 +6,8 @@ from custom.actions.action_change_size import ActionChangeSize
 def action():
     return ActionChangeSize(10, 20, 505, 15.0, text="resize")
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick")
 @patch("custom.utils.utils.Utils.get_intermediare_value")
 def test_execute_success_start_tick(mock_get_intermediare_value, mock_get_current_tick, mock_get_map_entity, action):
     mock_entity = MagicMock()
@@ -25,8 +25,8 @@ def test_execute_success_start_tick(mock_get_intermediare_value, mock_get_curren
     mock_get_intermediare_value.assert_called_once_with(10, 20, 10, 8.0, 15.0)
     mock_entity.set_size.assert_called_once_with(12.5)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick")
 @patch("custom.utils.utils.Utils.get_intermediare_value")
 def test_execute_success_intermediate_tick(mock_get_intermediare_value, mock_get_current_tick, mock_get_map_entity, action):
     mock_entity = MagicMock()
@@ -46,7 +46,7 @@ def test_execute_success_intermediate_tick(mock_get_intermediare_value, mock_get
     mock_get_intermediare_value.assert_called_once_with(10, 20, 15, 10.0, 15.0)
     mock_entity.set_size.assert_called_once_with(13.0)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_failure_no_entity(mock_get_map_entity, action):
     mock_get_map_entity.return_value = None
 
@@ -13,8 +13,8 @@ def test_init_color_validation(color, expected):
     action = ActionHighlight(1, 5, 101, color=color)
     assert action.highlight == expected
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick")
 def test_execute_success_start_or_end_tick(mock_get_current_tick, mock_get_map_entity):
     mock_entity = MagicMock()
     mock_entity.id = 101
@@ -28,8 +28,8 @@ def test_execute_success_start_or_end_tick(mock_get_current_tick, mock_get_map_e
     assert result is True
     mock_entity.set_highlight.assert_called_once_with("green", True)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick")
 def test_execute_success_other_tick(mock_get_current_tick, mock_get_map_entity):
     mock_entity = MagicMock()
     mock_entity.id = 101
@@ -43,7 +43,7 @@ def test_execute_success_other_tick(mock_get_current_tick, mock_get_map_entity):
     assert result is True
     mock_entity.set_highlight.assert_called_once_with("blue", False)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_failure_no_entity(mock_get_map_entity):
     mock_get_map_entity.return_value = None
 
@@ -3,10 +3,10 @@ from unittest.mock import patch, MagicMock
 from custom.actions.action_load import ActionLoad
 
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.is_loaded")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.static_load_entity")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.static_is_loaded")
+@patch("custom.business.simulation.Simulation.get_current_tick")
+@patch("custom.business.simulation.Simulation.static_load_entity")
 def test_execute(mock_static_load, mock_get_current_tick, mock_is_loaded, mock_get_map_entity):
     mock_entity1 = MagicMock()
     mock_entity2 = MagicMock()
@@ -38,8 +38,8 @@ def test_execute(mock_static_load, mock_get_current_tick, mock_is_loaded, mock_g
 
 
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.is_loaded")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.static_is_loaded")
 def test_execute_fail_if_entities_missing_and_not_loaded(mock_is_loaded, mock_get_map_entity):
     # Entités absentes
     mock_get_map_entity.side_effect = [None, None]
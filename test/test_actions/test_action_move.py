@@ -3,21 +3,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 from custom.actions.action_move import ActionMove
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_instance")
+@patch("custom.business.simulation.Simulation.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick")
+@patch("custom.business.simulation.Simulation.get_instance")
 def test_execute_success(mock_get_instance, mock_get_current_tick, mock_get_map_entity):
     mock_map_entity = MagicMock()
-    mock_feature = MagicMock()
-    mock_geometry = MagicMock()
-    mock_point = MagicMock()
-
-    mock_map_entity.feature = mock_feature
-    mock_feature.geometry.return_value = mock_geometry
-    mock_geometry.asPoint.return_value = mock_point
-    mock_geometry.centroid.return_value = mock_geometry
-    mock_point.x.return_value = 1.0
-    mock_point.y.return_value = 2.0
+    mock_map_entity.get_latitude.return_value = 2.0
+    mock_map_entity.get_longitude.return_value = 1.0
     mock_map_entity.altitude = 100.0
 
     mock_get_map_entity.return_value = mock_map_entity
@@ -41,11 +33,11 @@ def test_execute_success(mock_get_instance, mock_get_current_tick, mock_get_map_
     result = action.execute()
 
     assert result is True
-    assert mock_geometry.asPoint.call_count == 2
+    assert mock_map_entity.get_latitude.call_count == 2
     mock_map_entity.move_to.assert_called_once()
-    mock_layer_instance.log_trace.assert_called_once_with(mock_map_entity, mock_point)
+    mock_layer_instance.notify_move.assert_called_once_with(mock_map_entity, 2.0, 1.0)
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_failure_entity_none(mock_get_map_entity):
     # Pas d'entité trouvée
     mock_get_map_entity.return_value = None
@@ -54,7 +46,7 @@ def test_execute_failure_entity_none(mock_get_map_entity):
     result = action.execute()
     assert result is False
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick")
+@patch("custom.business.simulation.Simulation.get_current_tick")
 def test_get_next_geometry_various_cases(mock_get_current_tick):
     # Setup action avec coordonnées de départ/arrivée
     action = ActionMove(1, 5, 42, 2.0, 3.0, 100.0, 10.0, 20.0, 200.0)
@@ -95,23 +87,18 @@ def test_get_next_geometry_various_cases(mock_get_current_tick):
     (None, None, 50.0, None),
     (None, None, None, 60.0),
 ])
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick", return_value=2)
+@patch("custom.business.simulation.Simulation.get_current_tick", return_value=2)
 def test_get_next_geometry_handles_none_values(mock_get_current_tick, lat_from, lon_from, alti_from, alti_to):
     mock_map_entity = MagicMock()
-    mock_geometry = MagicMock()
-    mock_point = MagicMock()
-
-    mock_map_entity.feature.geometry.return_value.centroid.return_value = mock_geometry
-    mock_geometry.asPoint.return_value = mock_point
-    mock_point.x.return_value = 1.0
-    mock_point.y.return_value = 2.0
+    mock_map_entity.get_latitude.return_value = 2.0
+    mock_map_entity.get_longitude.return_value = 1.0
     mock_map_entity.altitude = 100.0
 
     action = ActionMove(1, 5, 42, lat_from, lon_from, alti_from, 10.0, 20.0, alti_to)
 
     lat, lon, alti = action.get_next_geometry(mock_map_entity)
 
-    # Quand lat_from/lon_from None, ils doivent être remplacés par centroid
+    # Quand lat_from/lon_from None, ils doivent être remplacés par la position de l'entité
     assert lat is not None and lon is not None
     # Altitudes doivent être numériques
     assert isinstance(alti, float)
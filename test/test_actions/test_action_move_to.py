@@ -8,24 +8,10 @@ def mock_entities():
     map_entity = MagicMock()
     map_entity2 = MagicMock()
 
-    geom1 = MagicMock()
-    geom2 = MagicMock()
-    point1 = MagicMock()
-    point2 = MagicMock()
-
-    map_entity.feature.geometry.return_value = geom1
-    map_entity2.feature.geometry.return_value = geom2
-
-    geom1.centroid.return_value = geom1
-    geom2.centroid.return_value = geom2
-
-    geom1.asPoint.return_value = point1
-    geom2.asPoint.return_value = point2
-
-    point1.x.return_value = 1.0
-    point1.y.return_value = 2.0
-    point2.x.return_value = 3.0
-    point2.y.return_value = 4.0
+    map_entity.get_latitude.return_value = 2.0
+    map_entity.get_longitude.return_value = 1.0
+    map_entity2.get_latitude.return_value = 4.0
+    map_entity2.get_longitude.return_value = 3.0
 
     map_entity.altitude = 10
     map_entity2.altitude = 20
@@ -33,11 +19,11 @@ def mock_entities():
     return map_entity, map_entity2
 
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick", return_value=2)
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_instance")
+@patch("custom.business.simulation.Simulation.get_current_tick", return_value=2)
+@patch("custom.business.simulation.Simulation.get_instance")
 @patch("custom.utils.utils.Utils.destination_point", return_value=(5.0, 6.0))
 @patch("custom.utils.utils.Utils.calculate_azimuth", return_value=123.0)
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_success(
     mock_get_map_entity,
     mock_azimuth,
@@ -58,19 +44,19 @@ def test_execute_success(
 
     assert result is True
     map_entity.move_to.assert_called_once()
-    mock_log.log_trace.assert_called_once_with(map_entity, map_entity.feature.geometry().asPoint())
+    mock_log.notify_move.assert_called_once_with(map_entity, 2.0, 1.0)
     mock_azimuth.assert_called_once()
     mock_dest_point.assert_called_once()
 
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity", side_effect=[None, MagicMock()])
+@patch("custom.business.simulation.Simulation.get_map_entity", side_effect=[None, MagicMock()])
 def test_execute_failure_entity_missing(mock_get_map_entity):
     action = ActionMoveTo(1, 5, 100, 200)
     result = action.execute()
     assert result is False
 
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick", return_value=10)
+@patch("custom.business.simulation.Simulation.get_current_tick", return_value=10)
 def test_get_next_geometry_final_position(mock_get_current_tick):
     action = ActionMoveTo(1, 5, 100, 200)
     action.lat_from = 0.0
@@ -87,7 +73,7 @@ def test_get_next_geometry_final_position(mock_get_current_tick):
     assert alti == 100.0
 
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick", return_value=3)
+@patch("custom.business.simulation.Simulation.get_current_tick", return_value=3)
 def test_get_next_geometry_interpolation(mock_get_current_tick):
     action = ActionMoveTo(1, 5, 100, 200)
     action.lat_from = 0.0
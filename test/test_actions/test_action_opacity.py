@@ -4,10 +4,10 @@ from unittest.mock import MagicMock, patch
 from custom.actions.action_opacity import ActionOpacity
 
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick", return_value=3)
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_instance")
+@patch("custom.business.simulation.Simulation.get_current_tick", return_value=3)
+@patch("custom.business.simulation.Simulation.get_instance")
 @patch("custom.utils.utils.Utils.get_intermediare_value", return_value=0.5)
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_success(
     mock_get_map_entity,
     mock_get_intermediare_value,
@@ -34,15 +34,15 @@ def test_execute_success(
     mock_add_text.assert_called_once_with(map_entity)
 
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity", return_value=None)
+@patch("custom.business.simulation.Simulation.get_map_entity", return_value=None)
 def test_execute_failure_entity_missing(mock_get_map_entity):
     action = ActionOpacity(1, 5, 100, 1.0)
     result = action.execute()
     assert result is False
 
 
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick", return_value=1)
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick", return_value=1)
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_updates_start_opacity(mock_get_map_entity, mock_get_current_tick):
     map_entity = MagicMock()
     map_entity.opacity = 0.3
@@ -3,11 +3,11 @@ from unittest.mock import MagicMock, patch
 from custom.actions.action_unload import ActionUnload
 
 @patch("custom.business.layer_trace_qgis.iface")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick", return_value=5)
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_instance")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.static_unload_entity")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.is_loaded", return_value=True)
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick", return_value=5)
+@patch("custom.business.simulation.Simulation.get_instance")
+@patch("custom.business.simulation.Simulation.static_unload_entity")
+@patch("custom.business.simulation.Simulation.static_is_loaded", return_value=True)
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_success(
     mock_get_map_entity,
     mock_is_loaded,
@@ -34,8 +34,8 @@ def test_execute_success(
     map_entity2.set_need_update_label.assert_called_once_with(True)
 
 @patch("custom.business.layer_trace_qgis.iface")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.is_loaded", return_value=False)
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity", return_value=None)
+@patch("custom.business.simulation.Simulation.static_is_loaded", return_value=False)
+@patch("custom.business.simulation.Simulation.get_map_entity", return_value=None)
 def test_execute_failure_missing_entities(mock_get_map_entity, mock_is_loaded, mock_iface):
     mock_canvas = MagicMock()
     mock_iface.mapCanvas.return_value = mock_canvas
@@ -46,9 +46,9 @@ def test_execute_failure_missing_entities(mock_get_map_entity, mock_is_loaded, m
     assert result is False
 
 @patch("custom.business.layer_trace_qgis.iface")
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_current_tick", return_value=3)
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.is_loaded", return_value=True)
-@patch("custom.business.layer_trace_qgis.LayerTraceQGIS.get_map_entity")
+@patch("custom.business.simulation.Simulation.get_current_tick", return_value=3)
+@patch("custom.business.simulation.Simulation.static_is_loaded", return_value=True)
+@patch("custom.business.simulation.Simulation.get_map_entity")
 def test_execute_no_unload_before_end(
     mock_get_map_entity,
     mock_is_loaded,
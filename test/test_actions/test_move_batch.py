@@ -0,0 +1,108 @@
+import math
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from custom.actions.action_around import ActionAround
+from custom.actions.action_change_size import ActionChangeSize
+from custom.actions.action_move import ActionMove
+from custom.actions.action_move_to import ActionMoveTo
+from custom.actions.move_batch import MoveBatch
+from custom.utils.utils import Utils
+
+
+def make_around(start_at, end_at, center_lat, center_lon, origin_angle, angle, distance):
+    action = ActionAround(start_at, end_at, "e1", "e2", distance=distance, angle=angle)
+    action.center_lat = center_lat
+    action.center_lon = center_lon
+    action.origin_angle = origin_angle
+    action.angle += origin_angle
+    action.init = True
+    return action
+
+
+@pytest.mark.parametrize("tick", [0, 1, 3, 5, 10])
+def test_evaluate_linear_matches_get_next_geometry(tick):
+    moves = [
+        ActionMove(1, 5, "e1", 2.0, 3.0, 100.0, 10.0, 20.0, 200.0),
+        ActionMove(4, 4, "e2", 1.0, 1.0, 0.0, 5.0, 5.0, 0.0),
+        ActionMove(0, 20, "e3", 43.0, 6.6, 0.0, 43.0, 6.6, 50.0),
+    ]
+    batch = MoveBatch()
+    for move in moves:
+        batch.add_move(move, MagicMock())
+
+    coordinates = batch.evaluate(tick)
+
+    with patch("custom.business.simulation.Simulation.get_current_tick", return_value=tick):
+        expected = [move.get_next_geometry(MagicMock()) for move in moves]
+    assert coordinates.shape == (3, 3)
+    assert np.allclose(coordinates, expected)
+
+
+@pytest.mark.parametrize("tick", [1, 4, 10])
+def test_evaluate_around_matches_utils(tick):
+    action = make_around(1, 10, 43.0, 6.6, 30.0, 90.0, 50.0)
+    batch = MoveBatch()
+    batch.add_move(action, MagicMock())
+
+    lat, lon, alti = batch.evaluate(tick)[0]
+
+    angle = Utils.get_intermediare_value(1, 10, tick, action.origin_angle, action.angle)
+    expected_lat, expected_lon = Utils.destination_point(43.0, 6.6, angle, 50.0)
+    assert math.isclose(lat, expected_lat, rel_tol=1e-12)
+    assert math.isclose(lon, expected_lon, rel_tol=1e-12)
+    assert math.isnan(alti)
+
+
+def test_evaluate_mixed_keeps_order():
+    around = make_around(0, 10, 43.0, 6.6, 0.0, 90.0, 100.0)
+    move = ActionMove(0, 10, "e3", 0.0, 0.0, 0.0, 10.0, 10.0, 10.0)
+    batch = MoveBatch()
+    batch.add_move(around, MagicMock())
+    batch.add_move(move, MagicMock())
+
+    coordinates = batch.evaluate(5)
+
+    assert math.isnan(coordinates[0, 2])
+    assert np.allclose(coordinates[1], [5.0, 5.0, 5.0])
+
+
+def test_queue_and_clear():
+    batch = MoveBatch()
+    move = ActionMove(0, 10, "e1", 0.0, 0.0, 0.0, 10.0, 10.0, 10.0)
+    size = ActionChangeSize(0, 10, "e2", 5)
+    entity = MagicMock()
+
+    assert batch.is_empty()
+    batch.add_move(move, entity)
+    batch.add_action(size)
+
+    assert batch.queue == [(move, entity, 0), (size, None, None)]
+    assert batch.moved_ids == {"e1"}
+
+    batch.clear()
+    assert batch.is_empty()
+    assert batch.moves == []
+
+
+def test_depends_on_pending():
+    batch = MoveBatch()
+    batch.add_move(ActionMove(0, 10, "e1", 0.0, 0.0, 0.0, 1.0, 1.0, 0.0), MagicMock())
+
+    move_to = ActionMoveTo(0, 10, "e2", "e1")
+    assert batch.depends_on_pending(move_to)
+
+    move_to.init = True
+    assert not batch.depends_on_pending(move_to)
+
+    assert not batch.depends_on_pending(ActionMove(0, 10, "e3", None, None, None, 1.0, 1.0, None))
+    assert batch.depends_on_pending(ActionMove(0, 10, "e1", None, None, None, 1.0, 1.0, None))
+
+
+def test_is_move_action():
+    assert MoveBatch.is_move_action(ActionMove(0, 1, "e1", 0.0, 0.0, 0.0, 1.0, 1.0, 0.0))
+    assert MoveBatch.is_move_action(ActionMoveTo(0, 1, "e1", "e2"))
+    assert MoveBatch.is_move_action(ActionAround(0, 1, "e1", "e2"))
+    assert not MoveBatch.is_move_action(ActionChangeSize(0, 1, "e1", 5))
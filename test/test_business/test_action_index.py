@@ -0,0 +1,67 @@
+import pytest
+
+from custom.business.action_index import ActionIndex
+from custom.actions.action import Action
+
+
+class DummyAction(Action):
+    def execute(self):
+        return True
+
+
+@pytest.fixture
+def actions():
+    return [
+        DummyAction(0, 10, "e1"),
+        DummyAction(5, 20, "e2"),
+        DummyAction(21, 40, "e1"),
+        DummyAction(10, 10, "e3"),
+    ]
+
+
+def brute_force(actions, tick):
+    return [action for action in actions if action.is_active_at(tick)]
+
+
+def test_build(actions):
+    index = ActionIndex(actions)
+
+    assert index.starts[0] == [0]
+    assert index.starts[10] == [3]
+    assert index.ends[10] == [0, 3]
+    assert index.cursor is None
+
+
+def test_get_active_at_sequential_matches_scan(actions):
+    index = ActionIndex(actions)
+
+    for tick in range(0, 45):
+        assert index.get_active_at(tick) == brute_force(actions, tick)
+
+
+def test_get_active_at_random_access(actions):
+    index = ActionIndex(actions)
+
+    for tick in [25, 6, 10, 11, 3, 40, 41, 0]:
+        assert index.get_active_at(tick) == brute_force(actions, tick)
+
+
+def test_get_active_at_same_tick_twice(actions):
+    index = ActionIndex(actions)
+
+    assert index.get_active_at(6) == index.get_active_at(6)
+
+
+def test_get_starting_and_ending_at(actions):
+    index = ActionIndex(actions)
+
+    assert index.get_starting_at(21) == [actions[2]]
+    assert index.get_ending_at(10) == [actions[0], actions[3]]
+    assert index.get_starting_at(99) == []
+
+
+def test_empty_index():
+    index = ActionIndex()
+
+    assert index.get_active_at(0) == []
+    assert index.get_active_at(1) == []
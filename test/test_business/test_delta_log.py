@@ -0,0 +1,90 @@
+from unittest.mock import MagicMock
+
+from custom.business.delta_log import DeltaLog
+
+
+def make_entity(entity_id, changes):
+    entity = MagicMock()
+    entity.get_id.return_value = entity_id
+    entity.pop_changes.return_value = changes
+    return entity
+
+
+def test_commit_records_changes_only():
+    log = DeltaLog()
+    e1 = make_entity("e1", {"size": (5.0, 6.0)})
+    e2 = make_entity("e2", {})
+
+    log.begin(3, {}, [])
+    log.commit([e1, e2], {}, [])
+
+    entry = log.get(3)
+    assert entry["entities"] == {"e1": {"size": (5.0, 6.0)}}
+    assert entry["entities_loaded"] is None
+    assert entry["lines"] is None
+
+
+def test_commit_records_loaded_and_lines():
+    log = DeltaLog()
+    carrier = MagicMock()
+    entities_loaded = {}
+    lines = {("e1", "e2")}
+
+    log.begin(4, entities_loaded, lines)
+    entities_loaded["e1"] = [carrier]
+    lines.clear()
+    log.commit([], entities_loaded, lines)
+
+    entry = log.get(4)
+    assert entry["entities_loaded"] == ({}, {"e1": [carrier]})
+    assert entry["lines"] == ({("e1", "e2")}, set())
+
+
+def test_commit_without_begin():
+    log = DeltaLog()
+    log.commit([make_entity("e1", {"size": (1, 2)})], {}, [])
+
+    assert log.entries == {}
+
+
+def test_truncate_from_and_clear():
+    log = DeltaLog()
+    for tick in range(5):
+        log.begin(tick, {}, [])
+        log.commit([], {}, [])
+
+    log.truncate_from(3)
+    assert sorted(log.entries.keys()) == [0, 1, 2]
+    assert log.get(3) is None
+
+    log.clear()
+    assert log.entries == {}
+
+
+def test_commit_evicts_oldest_entries_over_budget():
+    log = DeltaLog()
+    for tick in range(3):
+        log.begin(tick, {}, [])
+        log.commit([make_entity("e1", {"size": (tick, tick + 1)})], {}, [])
+    entry_size = log.sizes[0]
+
+    log.set_memory_budget(2 * entry_size)
+    assert list(log.entries) == [1, 2]
+
+    log.begin(3, {}, [])
+    log.commit([make_entity("e1", {"size": (3, 4)})], {}, [])
+
+    assert list(log.entries) == [2, 3]
+    assert log.get(1) is None
+    assert log.memory_used == sum(log.sizes.values()) <= log.memory_budget
+
+
+def test_truncate_from_releases_memory():
+    log = DeltaLog()
+    for tick in range(4):
+        log.begin(tick, {}, [])
+        log.commit([make_entity("e1", {"size": (tick, tick + 1)})], {}, [])
+
+    log.truncate_from(2)
+
+    assert log.memory_used == log.sizes[0] + log.sizes[1]
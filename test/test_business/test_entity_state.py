@@ -0,0 +1,56 @@
+from custom.business.entity_state import EntityState
+
+
+def get_entity_state() -> EntityState:
+    return EntityState("1", "TestName", "icon.png", 45.0, 5.0, -100, 8)
+
+def test_init_defaults():
+    entity = get_entity_state()
+
+    assert (entity.get_latitude(), entity.get_longitude(), entity.get_altitude()) == (45.0, 5.0, -100)
+    assert entity.get_size() == 8.0
+    assert entity.get_url_icon() == "icon.png"
+    assert entity.get_texts() == []
+    assert entity.get_need_update_label() is False
+
+def test_move_to_records_position_change():
+    entity = get_entity_state()
+
+    entity.move_to(46.0, 6.0, 10)
+
+    assert (entity.get_latitude(), entity.get_longitude(), entity.get_altitude()) == (46.0, 6.0, 10)
+    assert entity.get_need_update_label() is True
+    assert entity.pop_changes() == {"position": ((45.0, 5.0, -100), (46.0, 6.0, 10))}
+
+def test_reset_restores_defaults():
+    entity = get_entity_state()
+    entity.move_to(46.0, 6.0, 10)
+    entity.set_size(12)
+    entity.set_highlight("red")
+    entity.append_text("Message")
+
+    entity.reset()
+
+    assert entity.get_state() == {
+        "latitude": 45.0,
+        "longitude": 5.0,
+        "altitude": -100,
+        "size": 8.0,
+        "angle": 0,
+        "opacity": 1,
+        "url_icon": "icon.png",
+        "highlight": None,
+        "background_image": None,
+        "texts": [],
+    }
+
+def test_copy_initial():
+    entity = get_entity_state()
+    entity.move_to(46.0, 6.0, 10)
+    entity.set_size(12)
+
+    copy = entity.copy_initial()
+
+    assert copy is not entity
+    assert copy.get_id() == "1"
+    assert copy.get_state() == get_entity_state().get_state()
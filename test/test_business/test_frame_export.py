@@ -0,0 +1,95 @@
+from datetime import datetime
+
+import pytest
+
+from custom.business.frame_export import FrameExport
+
+
+@pytest.fixture
+def job_class(mocker):
+    return mocker.patch("custom.business.frame_export.QgsMapRendererParallelJob", side_effect=lambda settings: mocker.MagicMock())
+
+
+def get_frame_export(mocker, tmp_path, ticks=range(0, 5), concurrent_jobs=2) -> FrameExport:
+    export = mocker.Mock()
+    export.tick_to_datetime.side_effect = lambda tick: datetime(2024, 1, 1, 0, 0, tick)
+    return FrameExport(export, [], mocker.Mock(), mocker.Mock(), str(tmp_path / "frames"), ticks, 640, 480, concurrent_jobs)
+
+
+def test_start_limits_concurrent_jobs(mocker, tmp_path, job_class):
+    frame_export = get_frame_export(mocker, tmp_path)
+
+    frame_export.start()
+
+    assert (tmp_path / "frames").is_dir()
+    assert job_class.call_count == 2
+    assert sorted(frame_export.jobs.values()) == [(0, 0), (1, 1)]
+    for job in frame_export.jobs:
+        job.start.assert_called_once()
+
+
+def test_finished_jobs_write_frames_in_order(mocker, tmp_path, job_class):
+    frame_export = get_frame_export(mocker, tmp_path, ticks=range(3, 6))
+    frame_export.start()
+
+    while frame_export.jobs:
+        job = next(iter(frame_export.jobs))
+        index, _ = frame_export.jobs[job]
+        job.renderedImage.return_value.save.return_value = True
+
+        frame_export.on_job_finished(job)
+
+        job.renderedImage.return_value.save.assert_called_once_with(frame_export.get_frame_path(index), "PNG")
+
+    assert job_class.call_count == 3
+    assert frame_export.written == 3
+    frame_export.signal_progress.emit.assert_called_with(3, 3)
+    frame_export.signal_finished.emit.assert_called_once_with(True)
+    assert frame_export.get_frame_path(0).endswith("frame_00000.png")
+
+
+def test_cancel_interrupts_running_jobs(mocker, tmp_path, job_class):
+    frame_export = get_frame_export(mocker, tmp_path)
+    frame_export.start()
+    jobs = list(frame_export.jobs)
+
+    frame_export.cancel()
+
+    for job in jobs:
+        job.cancelWithoutBlocking.assert_called_once()
+    frame_export.signal_finished.emit.assert_not_called()
+
+    for job in jobs:
+        frame_export.on_job_finished(job)
+
+    assert job_class.call_count == 2
+    assert frame_export.written == 0
+    frame_export.signal_finished.emit.assert_called_once_with(False)
+
+
+def test_save_error_cancels_export(mocker, tmp_path, job_class):
+    mocker.patch("custom.business.frame_export.QgsMessageLog")
+    frame_export = get_frame_export(mocker, tmp_path)
+    frame_export.start()
+    first, second = list(frame_export.jobs)
+    first.renderedImage.return_value.save.return_value = False
+
+    frame_export.on_job_finished(first)
+
+    assert frame_export.cancelled
+    second.cancelWithoutBlocking.assert_called_once()
+    assert job_class.call_count == 2
+
+    frame_export.on_job_finished(second)
+
+    second.renderedImage.return_value.save.assert_not_called()
+    frame_export.signal_finished.emit.assert_called_once_with(False)
+
+
+def test_start_without_ticks(mocker, tmp_path, job_class):
+    frame_export = get_frame_export(mocker, tmp_path, ticks=range(0))
+
+    frame_export.start()
+
+    job_class.assert_not_called()
+    frame_export.signal_finished.emit.assert_called_once_with(True)
@@ -4,6 +4,9 @@ import pytest
 from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsRendererCategory,QgsMarkerSymbol
 
 from custom.business.layer_trace_qgis import LayerTraceQGIS
+from custom.business.temporal_layers import TemporalLayers
+from custom.business.timeline import Timeline
+from custom.business.simulation import Simulation
 
 
 @pytest.fixture
@@ -72,8 +75,8 @@ def test_reset_method(mocker, mock_map_entity, mock_map_entity2):
     instance.interval = 500
     instance.focus = 99
     instance.tick = 999
-    instance.lines = [[1, 2], [3, 4]]
-    instance.entities_loaded = {"e1": ["e2"]}
+    instance.lines = {(1, 2), (3, 4)}
+    instance.entities_loaded = {"e1": [mock_map_entity2]}
 
     # On mocke les fonctions internes appelées
     m_set_map_entities = mocker.patch.object(instance, "set_map_entities")
@@ -88,7 +91,7 @@ def test_reset_method(mocker, mock_map_entity, mock_map_entity2):
     assert instance.interval == 1000
     assert instance.focus == 0
     assert instance.tick == 0
-    assert instance.lines == []
+    assert instance.lines == set()
     assert instance.entities_loaded == {}
 
     # Vérifie les appels internes
@@ -271,37 +274,71 @@ def test_apply_trace_renderer(mocker, mock_map_entity, mock_map_entity2):
     instance.apply_trace_renderer()
     mock_generate_category.assert_called_once()
 
-def test_draw_line_between(mocker, mock_map_entity, mock_map_entity2):
+def test_get_line_points(mocker, mock_map_entity, mock_map_entity2):
     mocker.patch("custom.business.layer_trace_qgis.iface")
+    m_log = mocker.patch("custom.business.layer_trace_qgis.QgsMessageLog")
 
     # Mock des géométries
     mock_geom1 = mocker.MagicMock()
-    mock_geom1.isGeosValid.return_value = True
     mock_geom1.isEmpty.return_value = False
-    mock_geom1.asPoint.return_value = QgsPointXY(1, 1)
+    mock_geom1.asPoint.return_value = (1, 1)
 
     mock_geom2 = mocker.MagicMock()
-    mock_geom2.isGeosValid.return_value = True
     mock_geom2.isEmpty.return_value = False
-    mock_geom2.asPoint.return_value = QgsPointXY(2, 2)
+    mock_geom2.asPoint.return_value = (2, 2)
 
     # Mock des features
-    mock_feature1 = mocker.Mock()
-    mock_feature1.geometry.return_value = mock_geom1
-    mock_map_entity.feature = mock_feature1
+    mock_map_entity.feature = mocker.Mock()
+    mock_map_entity.feature.geometry.return_value = mock_geom1
+    mock_map_entity2.feature = mocker.Mock()
+    mock_map_entity2.feature.geometry.return_value = mock_geom2
 
-    mock_feature2 = mocker.Mock()
-    mock_feature2.geometry.return_value = mock_geom2
-    mock_map_entity2.feature = mock_feature2
-
-    # Instance et test
     instance = LayerTraceQGIS([], [])
     instance.map_entities = {"entity1": mock_map_entity, "entity2": mock_map_entity2}
 
-    mocker.patch("qgis.core.QgsGeometry.fromPolylineXY")
-    mocker.patch("qgis.core.QgsFeature")
+    assert instance.get_line_points("entity1", "entity2") == ((1, 1), (2, 2))
+    mock_geom1.isGeosValid.assert_not_called()
+    assert instance.get_line_points("entity1", "inconnue") is None
+    m_log.logMessage.assert_called_once()
 
-    instance.draw_line_between("entity1", "entity2")
+def test_refresh_line_updates_only_changed_lines(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    mocker.patch("custom.business.layer_trace_qgis.QgsGeometry")
+    mocker.patch("custom.business.layer_trace_qgis.QgsFeature", side_effect=lambda: mocker.MagicMock())
+    instance = LayerTraceQGIS([], [])
+    instance.layer_lines = mocker.MagicMock()
+    provider = instance.layer_lines.dataProvider.return_value
+    provider.addFeatures.side_effect = lambda features: (True, features)
+    points = {("e1", "e2"): ((0, 0), (1, 1)), ("e2", "e3"): ((1, 1), (2, 2))}
+    mocker.patch.object(instance, "get_line_points", side_effect=lambda id1, id2: points[(id1, id2)])
+
+    instance.lines = {("e1", "e2"), ("e2", "e3")}
+    instance.refresh_line()
+
+    assert len(provider.addFeatures.call_args[0][0]) == 2
+    assert set(instance.line_features) == {("e1", "e2"), ("e2", "e3")}
+
+    # Sans changement, la couche n'est pas modifiée
+    provider.reset_mock()
+    instance.layer_lines.triggerRepaint.reset_mock()
+    instance.refresh_line()
+
+    provider.addFeatures.assert_not_called()
+    provider.deleteFeatures.assert_not_called()
+    provider.changeGeometryValues.assert_not_called()
+    instance.layer_lines.triggerRepaint.assert_not_called()
+
+    # Une ligne disparaît, l'autre a une extrémité déplacée
+    feature_id = instance.line_features[("e1", "e2")][0]
+    moved_id = instance.line_features[("e2", "e3")][0]
+    points[("e2", "e3")] = ((1, 1), (3, 3))
+    instance.lines = {("e2", "e3")}
+    instance.refresh_line()
+
+    provider.deleteFeatures.assert_called_once_with([feature_id])
+    assert list(provider.changeGeometryValues.call_args[0][0]) == [moved_id]
+    provider.addFeatures.assert_not_called()
+    assert instance.line_features == {("e2", "e3"): (moved_id, ((1, 1), (3, 3)))}
 
 def test_unload(mocker, mock_map_entity):
     iface = mocker.patch("custom.business.layer_trace_qgis.iface")
@@ -329,3 +366,949 @@ def test_static_methods(mocker, mock_map_entity, mock_map_entity2):
     mocker.patch.object(instance, "apply_renderer")
 
     assert LayerTraceQGIS.get_instance().get_map_entity("e1") == mock_map_entity
+
+def test_go_to_tick_restores_nearest_snapshot(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.tick = 0
+
+    snapshot = {"entities": {}, "entities_loaded": {}, "lines": set()}
+    instance.snapshot_store.store(50, snapshot)
+
+    def restore(tick, _snapshot):
+        instance.tick = tick
+
+    m_restore = mocker.patch.object(instance, "restore_snapshot", side_effect=restore)
+    mocker.patch.object(instance, "reset_before_refresh")
+    m_refresh_action = mocker.patch.object(instance, "refresh_action")
+    m_refresh = mocker.patch.object(instance, "refresh")
+
+    instance.go_to_tick(60)
+
+    m_restore.assert_called_once_with(50, snapshot)
+    assert m_refresh_action.call_count == 10
+    m_refresh.assert_called_once()
+    mock_map_entity.reset.assert_not_called()
+
+def test_go_to_tick_resumes_from_current_tick(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.tick = 55
+    instance.snapshot_store.store(50, {"entities": {}, "entities_loaded": {}, "lines": set()})
+
+    m_restore = mocker.patch.object(instance, "restore_snapshot")
+    mocker.patch.object(instance, "reset_before_refresh")
+    m_refresh_action = mocker.patch.object(instance, "refresh_action")
+    mocker.patch.object(instance, "refresh")
+
+    instance.go_to_tick(60)
+
+    m_restore.assert_not_called()
+    assert m_refresh_action.call_count == 5
+
+def test_go_to_tick_without_snapshot_replays_from_zero(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.tick = 30
+
+    mocker.patch.object(instance, "reset_before_refresh")
+    mocker.patch.object(instance, "apply_renderer")
+    m_refresh_action = mocker.patch.object(instance, "refresh_action")
+    mocker.patch.object(instance, "refresh")
+
+    instance.go_to_tick(10)
+
+    mock_map_entity.reset.assert_called_once()
+    assert m_refresh_action.call_count == 10
+
+def test_take_and_restore_snapshot(mocker, mock_map_entity, mock_map_entity2):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity, mock_map_entity2], [])
+    mock_map_entity.get_state.return_value = {"latitude": 1}
+    mock_map_entity2.get_state.return_value = {"latitude": 2}
+    instance.entities_loaded = {"e1": [mock_map_entity2]}
+    instance.lines = {("e1", "e2")}
+
+    snapshot = instance.take_snapshot()
+
+    instance.entities_loaded = {}
+    instance.lines = set()
+    m_delete = mocker.patch.object(instance, "delete_trace_from")
+
+    instance.restore_snapshot(20, snapshot)
+
+    mock_map_entity.set_state.assert_called_once_with({"latitude": 1})
+    mock_map_entity2.set_state.assert_called_once_with({"latitude": 2})
+    assert instance.entities_loaded == {"e1": [mock_map_entity2]}
+    assert instance.lines == {("e1", "e2")}
+    assert instance.tick == 20
+    m_delete.assert_called_once_with(20)
+
+def test_step_backward_undoes_delta(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.tick = 6
+    instance.lines = {("e1", "e2")}
+    loaded = mocker.Mock()
+    loaded.get_id.return_value = "x"
+    instance.entities_loaded = {"e1": [loaded]}
+    instance.delta_log.entries[5] = {
+        "entities": {"e1": {"size": (5.0, 6.0)}},
+        "entities_loaded": ({}, {"e1": [loaded]}),
+        "lines": (set(), {("e1", "e2")}),
+    }
+
+    m_delete = mocker.patch.object(instance, "delete_trace_from")
+    mocker.patch.object(instance, "apply_load_filter")
+    mocker.patch.object(instance, "refresh_display")
+    mocker.patch.object(instance, "refresh_line")
+    mocker.patch.object(instance, "refresh_focus")
+    signal_mock = mocker.Mock()
+    instance.signal_tick_changed = signal_mock
+
+    assert instance.step_backward() is True
+
+    mock_map_entity.set_property.assert_called_once_with("size", 5.0)
+    assert instance.entities_loaded == {}
+    assert instance.lines == set()
+    assert instance.tick == 5
+    m_delete.assert_called_once_with(5)
+    signal_mock.emit.assert_called_once_with(4)
+
+def test_step_backward_without_delta_uses_go_to_tick(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.tick = 6
+
+    m_go_to_tick = mocker.patch.object(instance, "go_to_tick", return_value=True)
+
+    assert instance.step_backward() is True
+    m_go_to_tick.assert_called_once_with(4)
+
+def test_step_backward_at_start_stops(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.tick = 1
+    m_stop = mocker.patch.object(instance, "stop_timer")
+
+    assert instance.step_backward() is False
+    m_stop.assert_called_once()
+
+def test_play_step_direction(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    m_refresh = mocker.patch.object(instance, "refresh", return_value=True)
+    m_step_backward = mocker.patch.object(instance, "step_backward", return_value=True)
+
+    instance.play_step()
+    instance.toggle_reverse(True)
+    instance.play_step()
+
+    m_refresh.assert_called_once()
+    m_step_backward.assert_called_once()
+
+def test_refresh_reads_timeline(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.tick_end = 5
+    instance.tick = 2
+    instance.timeline = Timeline(["e1"], 6)
+
+    m_apply = mocker.patch.object(instance, "apply_timeline")
+    m_action = mocker.patch.object(instance, "refresh_action")
+    mocker.patch.object(instance, "apply_load_filter")
+    mocker.patch.object(instance, "refresh_display")
+    mocker.patch.object(instance, "refresh_line")
+    mocker.patch.object(instance, "refresh_focus")
+
+    assert instance.refresh() is True
+
+    m_apply.assert_called_once_with(2, 1, True)
+    m_action.assert_not_called()
+    assert instance.tick == 3
+    assert instance.timeline.playback_ticks == 1
+
+def test_go_to_tick_with_timeline(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.timeline = mocker.Mock()
+
+    m_apply = mocker.patch.object(instance, "apply_timeline")
+    m_rebuild = mocker.patch.object(instance, "rebuild_trace")
+    m_refresh = mocker.patch.object(instance, "refresh")
+
+    assert instance.go_to_tick(40) is True
+
+    m_apply.assert_called_once_with(39)
+    m_rebuild.assert_called_once_with(39)
+    m_refresh.assert_called_once()
+    assert instance.tick == 40
+
+def test_compile_timeline(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.tick_end = 2
+    mock_map_entity.get_state.return_value = {
+        "latitude": 0.0, "longitude": 0.0, "altitude": 0.0, "size": 5.0, "angle": 0.0, "opacity": 1.0,
+        "url_icon": "icon.png", "highlight": None, "background_image": None, "texts": [],
+    }
+    mock_map_entity.pop_changes.return_value = {}
+
+    m_reset = mocker.patch.object(instance, "reset_simulation")
+    m_action = mocker.patch.object(instance.simulation, "execute_actions")
+    mocker.patch.object(instance.simulation, "reset_before_refresh")
+
+    assert instance.compile_timeline() is True
+
+    assert m_action.call_count == 3
+    assert m_reset.call_count == 1
+    assert instance.timeline.tick_count == 3
+    assert instance.timeline.entity_ids == [mock_map_entity.get_id()]
+
+def test_compile_timeline_error(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    mocker.patch.object(instance, "reset_simulation")
+    mocker.patch.object(instance.simulation, "reset_before_refresh", side_effect=AttributeError("reset_icon"))
+
+    assert instance.compile_timeline() is False
+    assert instance.timeline is None
+
+def test_compile_timeline_uses_timeline_workers(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    mocker.patch("custom.business.layer_trace_qgis.QgsMessageLog")
+    instance = LayerTraceQGIS([], [])
+    mocker.patch.object(instance, "reset_simulation")
+    timeline = mocker.MagicMock(tick_count=3, entity_ids=[])
+    m_compile = mocker.patch("custom.business.layer_trace_qgis.TimelinePartition.compile", return_value=timeline)
+
+    instance.set_timeline_workers(8)
+
+    assert instance.compile_timeline() is True
+    m_compile.assert_called_once_with(instance.simulation, 8)
+    assert instance.timeline is timeline
+
+def test_get_export_timeline_leaves_live_simulation_alone(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.tick = 4
+    instance.timeline_workers = 2
+    copy = mocker.Mock()
+    timeline = mocker.Mock()
+    mocker.patch.object(instance.simulation, "copy_initial", return_value=copy)
+    m_compile = mocker.patch("custom.business.layer_trace_qgis.TimelinePartition.compile", return_value=timeline)
+    m_live_compile = mocker.patch.object(instance.simulation, "compile_timeline")
+    m_reset = mocker.patch.object(instance, "reset_simulation")
+    m_go_to = mocker.patch.object(instance, "go_to_tick")
+
+    assert instance.get_export_timeline() is timeline
+
+    m_compile.assert_called_once_with(copy, 2)
+    copy.activate.assert_called_once()
+    m_live_compile.assert_not_called()
+    m_reset.assert_not_called()
+    m_go_to.assert_not_called()
+    assert Simulation.get_instance() is instance.simulation
+    assert instance.tick == 4
+    assert instance.timeline is None
+
+def test_get_export_timeline_reuses_playback_timeline(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.timeline = mocker.Mock()
+    m_compile = mocker.patch.object(instance.simulation, "compile_timeline")
+
+    assert instance.get_export_timeline() is instance.timeline
+    m_compile.assert_not_called()
+
+def test_export_temporal_layers(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    mocker.patch.object(instance, "get_export_timeline", return_value=mocker.Mock(tick_count=5))
+    entity_layer = mocker.Mock()
+    trace_layer = mocker.Mock()
+    mocker.patch.object(instance, "build_temporal_layers", return_value=(entity_layer, trace_layer))
+    m_write = mocker.patch.object(TemporalLayers, "write_geopackage")
+    m_temporal = mocker.patch.object(TemporalLayers, "set_temporal_fields")
+
+    assert instance.export_temporal_layers("", 10, "sec") is True
+
+    m_write.assert_not_called()
+    assert m_temporal.call_args_list == [mocker.call(entity_layer), mocker.call(trace_layer)]
+    entity_layer.setLabelsEnabled.assert_called_once_with(True)
+
+def test_export_temporal_layers_geopackage(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    mocker.patch.object(instance, "get_export_timeline", return_value=mocker.Mock(tick_count=5))
+    mocker.patch.object(instance, "build_temporal_layers", return_value=(mocker.Mock(), mocker.Mock()))
+    written = [mocker.Mock(), mocker.Mock()]
+    m_write = mocker.patch.object(TemporalLayers, "write_geopackage", return_value=written)
+    m_temporal = mocker.patch.object(TemporalLayers, "set_temporal_fields")
+
+    assert instance.export_temporal_layers("/tmp/trace.gpkg", 1, "min") is True
+
+    assert m_write.call_args[0][0] == "/tmp/trace.gpkg"
+    assert m_temporal.call_args_list == [mocker.call(written[0]), mocker.call(written[1])]
+
+def test_export_temporal_layers_invalid_unit(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    m_warning = mocker.patch("custom.business.layer_trace_qgis.QMessageBox.warning")
+    instance = LayerTraceQGIS([], [])
+    mocker.patch.object(instance, "get_export_timeline")
+    m_build = mocker.patch.object(instance, "build_temporal_layers")
+
+    assert instance.export_temporal_layers("", 1, "siècle") is False
+
+    m_warning.assert_called_once_with(instance, "Erreur", "Unité de temps inconnue : siècle")
+    m_build.assert_not_called()
+
+def test_export_frames(mocker):
+    m_iface = mocker.patch("custom.business.layer_trace_qgis.iface")
+    m_frame_export = mocker.patch("custom.business.layer_trace_qgis.FrameExport")
+    instance = LayerTraceQGIS([], [])
+    mocker.patch.object(instance, "get_export_timeline", return_value=mocker.Mock(tick_count=10))
+    entity_layer = mocker.Mock()
+    trace_layer = mocker.Mock()
+    basemap = mocker.Mock()
+    mocker.patch.object(instance, "build_temporal_layers", return_value=(entity_layer, trace_layer))
+    mocker.patch.object(instance, "style_temporal_layers")
+    m_iface.mapCanvas.return_value.layers.return_value = [instance.layer, basemap, instance.layer_trace]
+
+    assert instance.export_frames("/tmp/frames", 10, "sec", 2, 50) is True
+
+    args = m_frame_export.call_args[0]
+    assert args[1] == [entity_layer, trace_layer, basemap]
+    assert args[4] == "/tmp/frames"
+    assert args[5] == range(2, 10)
+    assert instance.frame_export is m_frame_export.return_value
+    instance.frame_export.start.assert_called_once()
+
+def test_export_frames_already_running(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    m_warning = mocker.patch("custom.business.layer_trace_qgis.QMessageBox.warning")
+    instance = LayerTraceQGIS([], [])
+    instance.frame_export = mocker.Mock()
+    m_timeline = mocker.patch.object(instance, "get_export_timeline")
+
+    assert instance.export_frames("/tmp/frames") is False
+
+    m_warning.assert_called_once()
+    m_timeline.assert_not_called()
+
+def test_cancel_and_finish_frame_export(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    mocker.patch("custom.business.layer_trace_qgis.QgsMessageLog")
+    instance = LayerTraceQGIS([], [])
+    frame_export = mocker.Mock(written=3, directory="/tmp/frames")
+    instance.frame_export = frame_export
+
+    instance.cancel_frame_export()
+    instance.on_frame_export_finished(False)
+
+    frame_export.cancel.assert_called_once()
+    assert instance.frame_export is None
+    instance.signal_frame_export_finished.emit.assert_called_once_with(False)
+
+def test_refresh_action_batches_moves_in_order(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    from custom.actions.action_move import ActionMove
+    from custom.actions.action_change_size import ActionChangeSize
+
+    instance = LayerTraceQGIS([], [])
+    instance.tick = 5
+    calls = []
+
+    move = ActionMove(0, 10, "e1", 0.0, 0.0, 0.0, 10.0, 10.0, 10.0)
+    size = ActionChangeSize(0, 10, "e2", 5)
+    entity = mocker.Mock()
+    mocker.patch.object(move, "prepare", return_value=entity)
+    mocker.patch.object(move, "move_entity", side_effect=lambda *args: calls.append(("move", args)))
+    mocker.patch.object(size, "execute", side_effect=lambda: calls.append(("size",)))
+    mocker.patch.object(instance.simulation, "get_active_actions", return_value=[move, size])
+    mocker.patch.object(instance.simulation, "is_loaded_by_id", return_value=False)
+    mocker.patch.object(instance, "refresh_load")
+
+    instance.refresh_action(True)
+
+    assert calls == [("move", (entity, 5.0, 5.0, 5.0)), ("size",)]
+
+def test_flush_geometries_single_provider_call(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.layer = mocker.Mock()
+    provider = instance.layer.dataProvider.return_value
+
+    features = []
+    for feature_id in (1, 2):
+        feature = mocker.Mock()
+        feature.id.return_value = feature_id
+        feature.geometry.return_value.asPoint.return_value = QgsPointXY(feature_id, feature_id)
+        features.append(feature)
+        instance.mark_geometry_dirty(feature)
+    instance.mark_geometry_dirty(features[0])
+
+    instance.flush_geometries()
+    instance.flush_geometries()
+
+    provider.changeGeometryValues.assert_called_once_with({
+        1: features[0].geometry.return_value,
+        2: features[1].geometry.return_value,
+    })
+    assert instance.dirty_geometries == {}
+
+def test_go_to_tick_flushes_geometries_once(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.tick = 1
+
+    mocker.patch.object(instance, "reset_before_refresh")
+    mocker.patch.object(instance, "refresh_action")
+    mocker.patch.object(instance, "refresh")
+    m_flush = mocker.patch.object(instance, "flush_geometries")
+
+    instance.go_to_tick(10)
+
+    m_flush.assert_called_once()
+
+def test_log_trace_buffers_until_flush(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.layer_trace = mocker.Mock()
+    provider = instance.layer_trace.dataProvider.return_value
+    provider.addFeatures.return_value = (True, [])
+
+    instance.log_trace(mock_map_entity, QgsPointXY(0, 0))
+    instance.log_trace(mock_map_entity, QgsPointXY(0, 1))
+
+    provider.addFeature.assert_not_called()
+    provider.addFeatures.assert_not_called()
+    assert len(instance.pending_traces) == 2
+
+    instance.flush_traces()
+
+    provider.addFeatures.assert_called_once()
+    assert len(provider.addFeatures.call_args[0][0]) == 2
+    assert instance.pending_traces == []
+
+def test_add_trace_every_n_ticks(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.set_trace_decimation(3, 0)
+    points = [QgsPointXY(0, tick) for tick in range(5)]
+
+    for tick in range(1, 5):
+        instance.add_trace(mock_map_entity, points[tick - 1], points[tick], tick)
+
+    assert len(instance.pending_traces) == 1
+    assert instance.trace_anchors == {"e1": points[3]}
+
+def test_add_trace_min_distance(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.set_trace_decimation(1, 1000)
+    m_distance = mocker.patch("custom.business.layer_trace_qgis.Utils.haversine_distance", side_effect=[400, 1200])
+
+    instance.add_trace(mock_map_entity, QgsPointXY(0, 0), QgsPointXY(0, 1), 1)
+    assert instance.pending_traces == []
+    assert "e1" in instance.trace_anchors
+
+    instance.add_trace(mock_map_entity, QgsPointXY(0, 1), QgsPointXY(0, 2), 2)
+    assert len(instance.pending_traces) == 1
+    assert instance.trace_anchors == {}
+    assert m_distance.call_count == 2
+
+def test_set_trace_decimation_bounds(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+
+    instance.set_trace_decimation(0, -5)
+
+    assert instance.trace_every_n_ticks == 1
+    assert instance.trace_min_distance == 0
+
+def test_delete_trace_from_uses_tick_index(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.layer_trace = mocker.Mock()
+    provider = instance.layer_trace.dataProvider.return_value
+    features = []
+    for feature_id, tick in enumerate([1, 2, 2, 3]):
+        feature = mocker.Mock()
+        feature.id.return_value = feature_id
+        feature.attribute.return_value = tick
+        features.append(feature)
+    provider.addFeatures.return_value = (True, features)
+    instance.pending_traces = list(features)
+
+    instance.flush_traces()
+    assert instance.trace_feature_ids == {1: [0], 2: [1, 2], 3: [3]}
+
+    instance.delete_trace_from(2)
+
+    provider.deleteFeatures.assert_called_once_with([3, 1, 2])
+    instance.layer_trace.getFeatures.assert_not_called()
+    assert instance.trace_feature_ids == {1: [0]}
+
+def test_index_trace_features_keeps_ticks_sorted(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    features = []
+    for feature_id, tick in enumerate([3, 1]):
+        feature = mocker.Mock()
+        feature.id.return_value = feature_id
+        feature.attribute.return_value = tick
+        features.append(feature)
+
+    instance.index_trace_features(features)
+
+    assert list(instance.trace_feature_ids) == [1, 3]
+
+def test_add_trace_entity_mode_appends_vertices(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.layer_trace = mocker.Mock()
+    provider = instance.layer_trace.dataProvider.return_value
+    added = mocker.Mock()
+    added.id.return_value = 7
+    provider.addFeatures.return_value = (True, [added])
+    instance.set_trace_mode(LayerTraceQGIS.TRACE_ENTITY)
+
+    instance.add_trace(mock_map_entity, (0, 0), (0, 1), 1)
+    instance.flush_traces()
+
+    provider.addFeatures.assert_called_once()
+    assert instance.pending_traces == []
+    polyline = instance.trace_polylines[0]
+    assert polyline.feature_id == 7
+
+    instance.add_trace(mock_map_entity, (0, 1), (0, 2), 2)
+    instance.add_trace(mock_map_entity, (0, 2), (0, 3), 5)
+    instance.flush_traces()
+
+    provider.addFeatures.assert_called_once()
+    provider.changeGeometryValues.assert_called_once()
+    assert list(provider.changeGeometryValues.call_args[0][0]) == [7]
+    assert instance.trace_polylines == [polyline]
+    assert polyline.ticks == [1, 2, 5]
+    assert polyline.line.addVertex.call_count == 2
+    assert instance.dirty_polylines == []
+
+def test_flush_traces_rewrites_polylines_every_interval_during_playback(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.layer_trace = mocker.Mock()
+    instance.timer = mocker.Mock()
+    instance.timer.isActive.return_value = True
+    provider = instance.layer_trace.dataProvider.return_value
+    added = mocker.Mock()
+    added.id.return_value = 7
+    provider.addFeatures.return_value = (True, [added])
+    instance.set_trace_mode(LayerTraceQGIS.TRACE_ENTITY)
+
+    interval = LayerTraceQGIS.TRACE_WRITE_INTERVAL
+    for tick in range(1, 2 * interval + 2):
+        instance.tick = tick
+        instance.add_trace(mock_map_entity, (0, tick - 1), (0, tick), tick)
+        instance.flush_traces(False)
+
+    provider.addFeatures.assert_called_once()
+    assert provider.changeGeometryValues.call_count == 2
+    assert instance.dirty_polylines == instance.trace_polylines
+
+    instance.stop_timer()
+
+    assert provider.changeGeometryValues.call_count == 3
+    assert instance.dirty_polylines == []
+
+def test_add_trace_move_mode_splits_interrupted_moves(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.layer_trace = mocker.Mock()
+    instance.set_trace_mode(LayerTraceQGIS.TRACE_MOVE)
+
+    instance.add_trace(mock_map_entity, (0, 0), (0, 1), 1)
+    instance.add_trace(mock_map_entity, (0, 1), (0, 2), 2)
+    instance.add_trace(mock_map_entity, (0, 2), (0, 3), 5)
+
+    assert [polyline.ticks for polyline in instance.trace_polylines] == [[1, 2], [5]]
+    assert instance.dirty_polylines == instance.trace_polylines
+
+def test_delete_trace_from_truncates_polylines(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([mock_map_entity], [])
+    instance.layer_trace = mocker.Mock()
+    instance.timer = mocker.Mock()
+    instance.timer.isActive.return_value = False
+    provider = instance.layer_trace.dataProvider.return_value
+    instance.set_trace_mode(LayerTraceQGIS.TRACE_MOVE)
+    for tick in (1, 2, 5, 6):
+        instance.add_trace(mock_map_entity, (0, tick - 1), (0, tick), tick)
+    first, second = instance.trace_polylines
+    first.feature_id, second.feature_id = 1, 2
+    first.dirty = second.dirty = False
+    instance.dirty_polylines = []
+
+    instance.delete_trace_from(2)
+
+    provider.deleteFeatures.assert_called_once_with([2])
+    instance.layer_trace.getFeatures.assert_not_called()
+    assert instance.trace_polylines == [first]
+    assert list(provider.changeGeometryValues.call_args[0][0]) == [1]
+    assert instance.dirty_polylines == []
+    assert first.ticks == [1]
+    assert instance.open_polylines == {}
+
+def test_set_trace_mode(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.layer_trace = mocker.Mock()
+    m_clear = mocker.patch.object(instance, "clear_trace")
+    m_flush = mocker.patch.object(instance, "flush_traces")
+
+    instance.set_trace_mode(LayerTraceQGIS.TRACE_ENTITY, -1)
+
+    assert instance.trace_mode == LayerTraceQGIS.TRACE_ENTITY
+    assert instance.trace_tolerance == 0
+    m_clear.assert_called_once()
+
+    instance.set_trace_mode(LayerTraceQGIS.TRACE_ENTITY, 0.001)
+
+    assert instance.trace_tolerance == 0.001
+    m_clear.assert_called_once()
+    m_flush.assert_called()
+
+    with pytest.raises(ValueError):
+        instance.set_trace_mode("polygon")
+
+def test_simplify_traces_rewrites_only_unsimplified_polylines(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.layer_trace = mocker.Mock()
+    provider = instance.layer_trace.dataProvider.return_value
+    instance.trace_mode = LayerTraceQGIS.TRACE_ENTITY
+    polylines = [mocker.Mock(feature_id=1, simplified=True), mocker.Mock(feature_id=2, simplified=False)]
+    instance.trace_polylines = polylines
+
+    instance.simplify_traces()
+    provider.changeGeometryValues.assert_not_called()
+
+    instance.trace_tolerance = 0.5
+    instance.simplify_traces()
+
+    provider.changeGeometryValues.assert_called_once_with({2: polylines[1].get_geometry.return_value})
+    polylines[1].get_geometry.assert_called_once_with(0.5)
+    assert polylines[1].simplified
+
+def test_stop_timer_simplifies_traces(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    m_simplify = mocker.patch.object(instance, "simplify_traces")
+
+    instance.stop_timer()
+
+    m_simplify.assert_called_once()
+
+def test_apply_load_filter_writes_only_changed_entities(mocker, mock_map_entity, mock_map_entity2):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.layer = mocker.Mock()
+    instance.layer.fields.return_value.indexOf.return_value = 9
+    provider = instance.layer.dataProvider.return_value
+    instance.map_entities = {"e1": mock_map_entity, "e2": mock_map_entity2}
+
+    assert instance.apply_load_filter(["e2"]) == ["e2"]
+
+    provider.changeAttributeValues.assert_called_once_with({mock_map_entity2.feature.id(): {9: 1}})
+    assert instance.hidden_ids == {"e2"}
+
+    provider.changeAttributeValues.reset_mock()
+    instance.apply_load_filter(["e2"])
+
+    provider.changeAttributeValues.assert_not_called()
+
+    instance.apply_load_filter([])
+
+    provider.changeAttributeValues.assert_called_once_with({mock_map_entity2.feature.id(): {9: 0}})
+    instance.layer.setSubsetString.assert_not_called()
+    assert instance.hidden_ids == set()
+
+def test_apply_renderer_data_defined_sets_renderer_once(mocker, mock_map_entity, mock_map_entity2):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.layer = mocker.Mock()
+    instance.layer.fields.return_value.indexOf.side_effect = lambda name: LayerTraceQGIS.RENDER_FIELDS.index(name) + 2
+    provider = instance.layer.dataProvider.return_value
+    instance.map_entities = {"e1": mock_map_entity, "e2": mock_map_entity2}
+    mock_map_entity.get_render_attributes.return_value = {"size": 5.0}
+    mock_map_entity2.get_render_attributes.return_value = {"angle": 90}
+
+    instance.set_render_mode(LayerTraceQGIS.RENDER_DATA_DEFINED)
+
+    instance.layer.setRenderer.assert_called_once()
+    provider.changeAttributeValues.assert_called_once_with({
+        mock_map_entity.feature.id(): {2: 5.0},
+        mock_map_entity2.feature.id(): {3: 90},
+    })
+
+    provider.changeAttributeValues.reset_mock()
+    instance.apply_renderer()
+
+    instance.layer.setRenderer.assert_called_once()
+    mock_map_entity.get_category.assert_not_called()
+    provider.changeAttributeValues.assert_called_once_with({mock_map_entity2.feature.id(): {3: 90}})
+
+def test_set_render_mode_categorized_refreshes_categories(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.map_entities = {"e1": mock_map_entity}
+    instance.render_mode = LayerTraceQGIS.RENDER_DATA_DEFINED
+
+    instance.toggle_data_defined_renderer(False)
+
+    assert instance.render_mode == LayerTraceQGIS.RENDER_CATEGORIZED
+    mock_map_entity.set_need_refresh_category.assert_called_once_with(True)
+    mock_map_entity.get_category.assert_called_once()
+
+def test_set_render_mode_unknown(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+
+    with pytest.raises(ValueError):
+        instance.set_render_mode("unknown")
+
+def test_apply_renderer_updates_changed_categories_only(mocker, mock_map_entity, mock_map_entity2):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.layer = mocker.Mock()
+    instance.map_entities = {"e1": mock_map_entity, "e2": mock_map_entity2}
+
+    instance.apply_renderer()
+    instance.layer.setRenderer.assert_called_once()
+    assert instance.category_indexes == {"e1": 0, "e2": 1}
+
+    mock_map_entity.get_category.reset_mock()
+    instance.apply_renderer()
+
+    instance.layer.setRenderer.assert_called_once()
+    mock_map_entity.get_category.assert_not_called()
+    renderer = instance.layer.renderer.return_value
+    renderer.updateCategorySymbol.assert_called_once_with(1, mock_map_entity2.get_category.return_value.symbol().clone())
+
+def test_apply_renderer_rebuilds_when_entities_change(mocker, mock_map_entity, mock_map_entity2):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.layer = mocker.Mock()
+    instance.map_entities = {"e1": mock_map_entity}
+    instance.apply_renderer()
+
+    instance.map_entities = {"e1": mock_map_entity, "e2": mock_map_entity2}
+    instance.apply_renderer()
+
+    assert instance.layer.setRenderer.call_count == 2
+    instance.layer.renderer.return_value.updateCategorySymbol.assert_not_called()
+
+def test_set_label_mode_native(mocker, mock_map_entity, mock_map_entity2):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.layer = mocker.Mock()
+    instance.layer.fields.return_value.indexOf.return_value = 8
+    provider = instance.layer.dataProvider.return_value
+    instance.map_entities = {"e1": mock_map_entity, "e2": mock_map_entity2}
+    instance.entities_loaded = {"e1": [mock_map_entity2]}
+    instance.show_name = True
+    mock_map_entity.get_label_text.return_value = "Name1"
+    mock_map_entity2.get_label_text.return_value = ""
+
+    instance.toggle_native_labels(True)
+
+    mock_map_entity.delete_label.assert_called_once()
+    mock_map_entity2.delete_label.assert_called_once()
+    instance.layer.setLabeling.assert_called_once()
+    instance.layer.setLabelsEnabled.assert_called_once_with(True)
+    mock_map_entity.get_label_text.assert_called_once_with(True, False)
+    mock_map_entity2.get_label_text.assert_called_once_with(False, False)
+    provider.changeAttributeValues.assert_called_once_with({
+        mock_map_entity.feature.id(): {8: "Name1"},
+        mock_map_entity2.feature.id(): {8: None},
+    })
+    mock_map_entity.update_label_position.assert_not_called()
+
+def test_update_all_labels_native_does_nothing(mocker, mock_map_entity):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.map_entities = {"e1": mock_map_entity}
+    instance.label_mode = LayerTraceQGIS.LABEL_NATIVE
+
+    instance.update_all_labels()
+
+    mock_map_entity.update_label_position.assert_not_called()
+    mock_map_entity.get_label_text.assert_not_called()
+
+def test_set_label_mode_unknown(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+
+    with pytest.raises(ValueError):
+        instance.set_label_mode("unknown")
+
+def test_schedule_label_update_coalesces(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.label_timer = mocker.Mock()
+    instance.label_timer.isActive.side_effect = [False, True, True]
+
+    for _ in range(3):
+        instance.schedule_label_update()
+
+    instance.label_timer.start.assert_called_once()
+
+def test_update_all_labels_culls_to_extent(mocker, mock_map_entity, mock_map_entity2):
+    iface = mocker.patch("custom.business.layer_trace_qgis.iface")
+    extent = iface.mapCanvas.return_value.extent.return_value
+    extent.xMinimum.return_value = 0.0
+    extent.yMinimum.return_value = 0.0
+    extent.xMaximum.return_value = 10.0
+    extent.yMaximum.return_value = 10.0
+
+    instance = LayerTraceQGIS([], [])
+    instance.entities_loaded = {}
+    instance.feature_entities = {1: mock_map_entity, 2: mock_map_entity2}
+    mock_map_entity.feature = mocker.Mock()
+    mock_map_entity.feature.id.return_value = 1
+    mock_map_entity2.feature = mocker.Mock()
+    mock_map_entity2.feature.id.return_value = 2
+    instance.spatial_index.update(1, 5.0, 5.0)
+    instance.spatial_index.update(2, 50.0, 50.0)
+    instance.visible_label_ids = {1, 2}
+
+    instance.update_all_labels()
+
+    mock_map_entity.update_label_position.assert_called_once_with(False, False)
+    mock_map_entity2.update_label_position.assert_not_called()
+    mock_map_entity2.hide_label.assert_called_once()
+    mock_map_entity.hide_label.assert_not_called()
+    assert instance.visible_label_ids == {1}
+
+def test_get_entities_in_radius_and_near(mocker, mock_map_entity, mock_map_entity2):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.feature_entities = {1: mock_map_entity, 2: mock_map_entity2}
+    instance.spatial_index.update(1, 5.0, 45.0)
+    instance.spatial_index.update(2, 5.001, 45.0)
+    mock_map_entity.get_latitude.return_value = 45.0
+    mock_map_entity.get_longitude.return_value = 5.0
+
+    assert sorted(instance.get_entities_in_radius(45.0, 5.0, 100), key=lambda e: e.get_id()) == [mock_map_entity, mock_map_entity2]
+    assert instance.get_entities_in_radius(45.0, 5.0, 10) == [mock_map_entity]
+    assert instance.get_entities_near(mock_map_entity, 100) == [mock_map_entity2]
+    assert instance.get_entities_in_rect(5.0005, 44.0, 6.0, 46.0) == [mock_map_entity2]
+    assert instance.get_nearest_entity(45.0, 5.0009, 1000) is mock_map_entity2
+    assert instance.get_nearest_entity(50.0, 5.0, 1000) is None
+
+def test_play_step_skips_ticks_when_behind(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.tick_end = 100
+    instance.tick = 5
+    instance.clock_start = 10.0
+    instance.clock_start_tick = 4
+    instance.clock_next_tick = 5
+    instance.signal_playback_stats = mocker.Mock()
+    mocker.patch("custom.business.layer_trace_qgis.time.perf_counter", side_effect=[13.0, 13.5, 14.0])
+
+    def skip_to_tick(to):
+        instance.tick = to
+
+    def refresh():
+        instance.tick += 1
+        return True
+
+    m_skip = mocker.patch.object(instance, "skip_to_tick", side_effect=skip_to_tick)
+    mocker.patch.object(instance, "refresh", side_effect=refresh)
+
+    assert instance.play_step() is True
+
+    m_skip.assert_called_once_with(7)
+    assert instance.frames_dropped == 2
+    assert instance.clock_next_tick == 8
+    instance.signal_playback_stats.emit.assert_called_once_with(0.75, 2)
+
+def test_play_step_restarts_clock_after_seek(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.tick_end = 100
+    instance.tick = 50
+    instance.clock_start = 0.0
+    instance.clock_start_tick = 0
+    instance.clock_next_tick = 3
+    mocker.patch("custom.business.layer_trace_qgis.time.perf_counter", return_value=100.0)
+    m_skip = mocker.patch.object(instance, "skip_to_tick")
+    mocker.patch.object(instance, "refresh", return_value=True)
+
+    instance.play_step()
+
+    m_skip.assert_not_called()
+    assert instance.clock_start == 100.0
+    assert instance.clock_start_tick == 49
+    assert instance.frames_dropped == 0
+
+def test_skip_to_tick_runs_fast_mode(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.tick = 2
+    m_refresh_action = mocker.patch.object(instance, "refresh_action")
+    mocker.patch.object(instance, "reset_before_refresh")
+
+    instance.skip_to_tick(5)
+
+    assert instance.tick == 5
+    assert m_refresh_action.call_args_list == [mocker.call(True)] * 3
+    assert sorted(instance.delta_log.entries) == [2, 3, 4]
+
+def test_refresh_profiles_phases(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    from custom.actions.action_change_size import ActionChangeSize
+
+    instance = LayerTraceQGIS([], [])
+    instance.tick_end = 10
+    instance.tick = 1
+    instance.layer_lines = mocker.MagicMock()
+    instance.signal_profiling_updated = mocker.Mock()
+    size = ActionChangeSize(0, 10, "e1", 5)
+    mocker.patch.object(size, "execute")
+    mocker.patch.object(instance.simulation, "get_active_actions", return_value=[size])
+    mocker.patch.object(instance.simulation, "is_loaded_by_id", return_value=False)
+    mocker.patch.object(instance, "refresh_load")
+
+    instance.set_profiling_enabled(True)
+    assert instance.refresh() is True
+
+    phases = {row[0] for row in instance.profiler.get_stats()}
+    assert {"refresh", "reset_before_refresh", "action:ActionChangeSize", "refresh_load", "labels",
+            "repaint", "refresh_line", "refresh_focus"} <= phases
+    instance.signal_profiling_updated.emit.assert_called_once()
+
+def test_refresh_without_profiling_records_nothing(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    instance = LayerTraceQGIS([], [])
+    instance.tick_end = 10
+    instance.tick = 1
+    instance.layer_lines = mocker.MagicMock()
+    instance.signal_profiling_updated = mocker.Mock()
+    mocker.patch.object(instance, "refresh_action")
+
+    assert instance.refresh() is True
+
+    assert instance.profiler.get_stats() == []
+    instance.signal_profiling_updated.emit.assert_not_called()
+
+def test_export_profiling_error(mocker):
+    mocker.patch("custom.business.layer_trace_qgis.iface")
+    m_warning = mocker.patch("custom.business.layer_trace_qgis.QMessageBox.warning")
+    instance = LayerTraceQGIS([], [])
+    mocker.patch.object(instance.profiler, "export_csv", side_effect=OSError("Permission refusée"))
+
+    instance.export_profiling("/inaccessible/profilage.csv")
+
+    m_warning.assert_called_once_with(instance, "Erreur", "Permission refusée")
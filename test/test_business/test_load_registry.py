@@ -0,0 +1,68 @@
+import pytest
+
+from custom.business.entity_state import EntityState
+from custom.business.load_registry import LoadRegistry
+
+
+@pytest.fixture
+def entities():
+    return {
+        entity_id: EntityState(entity_id, f"Entité {entity_id}", "icon.png", 43.0, 6.0)
+        for entity_id in ("navire", "camion", "caisse", "colis")
+    }
+
+
+def test_load_and_unload(entities):
+    registry = LoadRegistry()
+
+    assert registry.load("camion", entities["caisse"])
+    assert registry.load("camion", entities["colis"])
+
+    assert registry.is_loaded("caisse")
+    assert registry.is_loaded("caisse", "camion")
+    assert not registry.is_loaded("caisse", "navire")
+    assert not registry.is_loaded("camion")
+    assert registry.to_dict() == {"camion": [entities["caisse"], entities["colis"]]}
+
+    assert not registry.unload("caisse", "navire")
+    assert registry.unload("caisse", "camion")
+    assert registry.unload("colis")
+    assert not registry
+    assert registry.to_dict() == {}
+
+
+def test_load_moves_entity_between_containers(entities):
+    registry = LoadRegistry({"camion": [entities["caisse"]]})
+
+    registry.load("navire", entities["caisse"])
+
+    assert registry.get_container("caisse") == "navire"
+    assert registry.to_dict() == {"navire": [entities["caisse"]]}
+
+
+def test_nested_cargo(entities):
+    registry = LoadRegistry()
+    registry.load("caisse", entities["colis"])
+    registry.load("camion", entities["caisse"])
+    registry.load("navire", entities["camion"])
+
+    assert registry.get_root_container("colis") == "navire"
+    assert registry.is_inside("colis", "navire")
+    assert not registry.is_loaded("colis", "navire")
+    assert registry.get_contents("navire") == [entities["camion"], entities["caisse"], entities["colis"]]
+    assert len(registry) == 3
+
+    # Décharger le camion garde la caisse et le colis à l'intérieur
+    registry.unload("camion", "navire")
+
+    assert registry.get_root_container("colis") == "camion"
+    assert registry.get_children("camion") == [entities["caisse"]]
+
+
+def test_load_refuses_cycles(entities):
+    registry = LoadRegistry()
+    registry.load("camion", entities["caisse"])
+
+    assert not registry.load("caisse", entities["camion"])
+    assert not registry.load("camion", entities["camion"])
+    assert registry.to_dict() == {"camion": [entities["caisse"]]}
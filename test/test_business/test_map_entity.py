@@ -1,6 +1,12 @@
+import pytest
 from pytest_mock import MockerFixture
 
 from custom.business.map_entity import MapEntity
+from custom.business.symbol_cache import SymbolCache
+
+@pytest.fixture(autouse=True)
+def clear_symbol_cache():
+    SymbolCache.get_instance().clear()
 
 def get_default_parameters():
     return {
@@ -83,16 +89,47 @@ def test_map_entity_init(mocker: MockerFixture):
     mock_feature_instance.setAttributes.assert_called_once_with([params["id"], params["name"]])
     mock_feature_instance.setGeometry.assert_called_once()
 
-    # Assert QLabel setup
+    # Le QLabel n'est créé qu'à son premier affichage
+    mock_label.assert_not_called()
+    assert entity.label is None
+
+    mock_update_label_position.assert_called_once()
+
+    assert entity.category == "MockedCategory"
+
+def test_show_label_creates_label_once(mocker: MockerFixture):
+    entity, params, mock_feature, mock_feature_instance, mock_label, mock_iface = get_map_entity(mocker)
+
+    entity.show_label()
+    entity.show_label()
+
     mock_label.assert_called_once_with(mock_iface.mainWindow.return_value)
     mock_label_instance = mock_label.return_value
     mock_label_instance.setFont.assert_called_once()
     mock_label_instance.setStyleSheet.assert_called_once_with("background-color: rgba(255, 255, 255, 200); border: 1px solid black;")
     mock_label_instance.setAttribute.assert_called_once()
+    assert entity.label is mock_label_instance
 
-    mock_update_label_position.assert_called_once()
+def test_reset_without_label_creates_no_widget(mocker: MockerFixture):
+    entity, params, mock_feature, mock_feature_instance, mock_label, mock_iface = get_map_entity(mocker)
 
-    assert entity.category == "MockedCategory"
+    entity.reset()
+    entity.hide_label()
+
+    mock_label.assert_not_called()
+    assert entity.label is None
+    assert entity.need_update_label is True
+
+def test_reset_label_deletes_existing_label(mocker: MockerFixture):
+    entity, params, mock_feature, mock_feature_instance, mock_label, mock_iface = get_map_entity(mocker)
+    entity.show_label()
+    label = entity.label
+
+    entity.reset_label()
+
+    label.deleteLater.assert_called_once()
+    assert entity.label is None
+    mock_label.assert_called_once()
 
 def test_get_latitude(mocker: MockerFixture):
     entity, params, mock_feature, mock_feature_instance, mock_label, mock_iface = get_map_entity(mocker)
@@ -372,6 +409,34 @@ def test_get_category_skips_refresh(mocker: MockerFixture):
     mock_generate.assert_not_called()
     assert result == mock_category1
 
+def test_get_render_attributes(mocker: MockerFixture):
+    entity, params, mock_feature, mock_feature_instance, mock_label, mock_iface = get_map_entity(mocker)
+
+    entity.need_refresh_category = True
+    entity.highlight = "red"
+
+    result = entity.get_render_attributes()
+
+    assert result == {
+        "size": params["size"],
+        "angle": 0,
+        "opacity": 1,
+        "icon": params["icon"],
+        "highlight": "red",
+        "background": None,
+    }
+    assert entity.need_refresh_category is False
+
+def test_get_label_text(mocker: MockerFixture):
+    entity, params, mock_feature, mock_feature_instance, mock_label, mock_iface = get_map_entity(mocker)
+
+    entity.need_update_label = True
+    entity.texts = ["Stock: A"]
+
+    assert entity.get_label_text(True, False) == f"{params['name']}\nStock: A"
+    assert entity.need_update_label is False
+    assert entity.get_label_text(False, False) == "Stock: A"
+
 def test_generate_category(mocker: MockerFixture):
     entity, params, mock_feature, mock_feature_instance, mock_label, mock_iface = get_map_entity(mocker)
 
@@ -463,8 +528,9 @@ def test_move_to_updates_geometry_and_altitude(mocker):
     from_point_patch.assert_called_once_with(mock_point)
     entity.feature.setGeometry.assert_called_once_with(mock_geometry)
 
-    # ✅ Vérifie que changeGeometryValues a été appelé avec le bon ID et géométrie
-    mock_data_provider.changeGeometryValues.assert_called_once_with({42: mock_geometry})
+    # ✅ Vérifie que la géométrie est signalée au tampon au lieu d'être écrite directement
+    mock_get_instance.return_value.mark_geometry_dirty.assert_called_once_with(entity.feature)
+    mock_data_provider.changeGeometryValues.assert_not_called()
 
     # ✅ Vérifie que l'altitude a bien été mise à jour
     assert entity.altitude == 123.0
@@ -609,11 +675,8 @@ def test_generate_description_label_with_info_and_texts(mocker):
     entity.name = "Entity1"
     entity.altitude = 123.4567
     entity.texts = ["Line 1", "Line 2"]
-
-    mock_point = mocker.Mock()
-    mock_point.x.return_value = 1.23456
-    mock_point.y.return_value = 2.34567
-    entity.feature.geometry().asPoint.return_value = mock_point
+    entity.latitude = 2.34567
+    entity.longitude = 1.23456
 
     result = entity.generate_description_label(True, True)
 
@@ -647,3 +710,94 @@ def test_unload_removes_label(mocker):
     mock_label.deleteLater.assert_called_once()
     assert entity.label is None
 
+
+def test_get_state(mocker):
+    entity, params, *_ = get_map_entity(mocker)
+    entity.texts = ["a"]
+
+    state = entity.get_state()
+
+    assert state["latitude"] == 45.0
+    assert state["longitude"] == 5.0
+    assert state["altitude"] == params["altitude"]
+    assert state["size"] == params["size"]
+    assert state["url_icon"] == params["icon"]
+    assert state["texts"] == ["a"]
+    assert state["texts"] is not entity.texts
+
+def test_set_state(mocker):
+    entity, *_ = get_map_entity(mocker)
+    entity.move_to = mocker.Mock()
+
+    entity.set_state({
+        "latitude": 1.0,
+        "longitude": 2.0,
+        "altitude": 3.0,
+        "size": 10.0,
+        "angle": 90,
+        "opacity": 0.5,
+        "url_icon": "other.png",
+        "highlight": "red",
+        "background_image": "bg.png",
+        "texts": ["b"],
+    })
+
+    entity.move_to.assert_called_once_with(1.0, 2.0, 3.0)
+    assert entity.size == 10.0
+    assert entity.angle == 90
+    assert entity.opacity == 0.5
+    assert entity.url_icon == "other.png"
+    assert entity.highlight == "red"
+    assert entity.background_image == "bg.png"
+    assert entity.texts == ["b"]
+    assert entity.need_refresh_category is True
+
+def test_record_change_and_pop_changes(mocker):
+    entity, *_ = get_map_entity(mocker)
+
+    entity.set_size(10)
+    entity.set_size(12)
+    entity.set_angle(0)
+    entity.append_text("a")
+
+    changes = entity.pop_changes()
+
+    assert changes == {"size": (8.0, 12), "texts": ([], ["a"])}
+    assert entity.changes == {}
+    assert entity.pop_changes() == {}
+
+def test_set_property(mocker):
+    entity, *_ = get_map_entity(mocker)
+    entity.move_to = mocker.Mock()
+
+    entity.set_property("position", (1.0, 2.0, 3.0))
+    entity.set_property("opacity", 0.2)
+    entity.set_property("texts", ["x"])
+
+    entity.move_to.assert_called_once_with(1.0, 2.0, 3.0)
+    assert entity.get_property("opacity") == 0.2
+    assert entity.get_property("texts") == ["x"]
+
+def test_get_property_unknown(mocker):
+    entity, *_ = get_map_entity(mocker)
+
+    with pytest.raises(ValueError):
+        entity.get_property("unknown")
+
+def test_generate_category_reuses_cached_symbol(mocker):
+    entity, *_ = get_map_entity(mocker)
+    other, *_ = get_map_entity(mocker)
+
+    mock_symbol = mocker.Mock(name="QgsMarkerSymbol")
+    marker_patch = mocker.patch("custom.business.map_entity.QgsMarkerSymbol", return_value=mock_symbol)
+    mocker.patch("custom.business.map_entity.QgsRasterMarkerSymbolLayer")
+    category_patch = mocker.patch("custom.business.map_entity.QgsRendererCategory")
+
+    entity.size = 5.02
+    other.size = 4.98
+    entity.generate_category()
+    other.generate_category()
+
+    marker_patch.assert_called_once()
+    assert mock_symbol.clone.call_count == 2
+    category_patch.assert_called_with(other.id, mock_symbol.clone.return_value, other.name)
@@ -0,0 +1,59 @@
+import csv
+
+from custom.business.profiler import Profiler
+
+
+def test_measure_disabled_records_nothing(mocker):
+    profiler = Profiler()
+    m_perf_counter = mocker.patch("custom.business.profiler.time.perf_counter")
+
+    with profiler.measure("refresh"):
+        pass
+
+    m_perf_counter.assert_not_called()
+    assert profiler.get_stats() == []
+
+def test_measure_enabled_records_duration(mocker):
+    profiler = Profiler()
+    profiler.set_enabled(True)
+    mocker.patch("custom.business.profiler.time.perf_counter", side_effect=[1.0, 1.25])
+
+    with profiler.measure("refresh"):
+        pass
+
+    assert profiler.get_stats() == [("refresh", 1, 250.0, 250.0, 250.0, 250.0)]
+
+def test_get_stats_percentiles_over_window():
+    profiler = Profiler(window_size=100)
+    for duration in range(1, 201):
+        profiler.record("labels", duration / 1000)
+    profiler.record("repaint", 1.0)
+
+    stats = profiler.get_stats()
+
+    assert [row[0] for row in stats] == ["labels", "repaint"]
+    name, count, p50, p95, maximum, total = stats[0]
+    assert count == 200
+    assert round(p50, 6) == 150.0
+    assert round(p95, 6) == 195.0
+    assert round(maximum, 6) == 200.0
+    assert round(total, 6) == 20100.0
+
+def test_reset():
+    profiler = Profiler()
+    profiler.record("refresh", 0.1)
+
+    profiler.reset()
+
+    assert profiler.get_stats() == []
+
+def test_export_csv(tmp_path):
+    profiler = Profiler()
+    profiler.record("refresh", 0.002)
+    path = tmp_path / "profilage.csv"
+
+    profiler.export_csv(str(path))
+
+    with open(path, encoding="utf-8") as file:
+        rows = list(csv.reader(file))
+    assert rows == [list(Profiler.CSV_HEADER), ["refresh", "1", "2.0000", "2.0000", "2.0000", "2.0000"]]
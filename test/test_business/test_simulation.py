@@ -0,0 +1,191 @@
+import pytest
+
+from custom.business.entity_state import EntityState
+from custom.business.simulation import Simulation
+
+
+@pytest.fixture(autouse=True)
+def clear_simulation():
+    Simulation._instance = None
+    yield
+    Simulation._instance = None
+
+
+def get_simulation(actions: list[dict]) -> Simulation:
+    map_entities = [
+        EntityState("1", "Drone", "drone.png", 43.0, 6.0),
+        EntityState("2", "Balise", "balise.png", 43.01, 6.01),
+    ]
+    simulation = Simulation(map_entities, actions)
+    simulation.activate()
+    return simulation
+
+
+def test_get_instance_returns_activated_simulation():
+    simulation = get_simulation([])
+
+    assert Simulation.get_instance() is simulation
+    assert Simulation.get_map_entity("1").get_name() == "Drone"
+    assert Simulation.get_current_tick() == 0
+
+
+def test_set_actions_reports_invalid_actions():
+    messages = []
+    simulation = Simulation()
+    simulation.message_listener = lambda message, level: messages.append(level)
+
+    simulation.set_actions([
+        {"type": "move", "start_at": 0, "end_at": 4, "entity_id": "1", "lat_to": 43.0, "lon_to": 6.0},
+        {"type": "unknown", "start_at": 0, "end_at": 9, "entity_id": "1"},
+    ])
+
+    assert len(simulation.actions) == 1
+    assert simulation.tick_end == 4
+    assert messages == [Simulation.MESSAGE_WARNING]
+
+
+def test_step_moves_entities_and_notifies_moves():
+    simulation = get_simulation([
+        {"type": "move", "start_at": 0, "end_at": 2, "entity_id": "1", "lat_to": 44.0, "lon_to": 7.0, "text": "En route"},
+    ])
+    moves = []
+    simulation.move_listener = lambda entity, old_lat, old_lon: moves.append((entity.get_id(), old_lat, old_lon))
+
+    simulation.step()
+    simulation.step()
+    simulation.step()
+
+    drone = simulation.map_entities["1"]
+    assert simulation.tick == 3
+    assert (drone.get_latitude(), drone.get_longitude()) == (44.0, 7.0)
+    assert drone.get_texts() == ["En route"]
+    assert moves[0] == ("1", 43.0, 6.0)
+    assert len(moves) == 3
+
+
+def test_step_loads_entities_and_lines():
+    simulation = get_simulation([
+        {"type": "load", "start_at": 0, "end_at": 1, "entity_id": "1", "entity_id2": "2"},
+        {"type": "arrow", "start_at": 0, "end_at": 3, "entity_id": "1", "entity_id2": "2"},
+    ])
+
+    assert simulation.step() == []
+    assert simulation.lines == {("1", "2")}
+
+    assert simulation.step() == ["2"]
+    assert simulation.is_loaded_by_id("2", "1")
+    assert simulation.map_entities["1"].get_texts() == ["Stock: Balise"]
+
+
+def test_run_and_reset():
+    simulation = get_simulation([
+        {"type": "size", "start_at": 0, "end_at": 4, "entity_id": "2", "size": 10},
+    ])
+
+    simulation.run()
+
+    assert simulation.tick == simulation.tick_end + 1
+    assert simulation.map_entities["2"].get_size() == 10
+
+    simulation.reset()
+
+    assert simulation.tick == 0
+    assert simulation.map_entities["2"].get_size() == 5
+    assert simulation.map_entities["2"].pop_changes() == {}
+
+
+def test_compile_timeline_does_not_notify_moves():
+    simulation = get_simulation([
+        {"type": "move", "start_at": 0, "end_at": 3, "entity_id": "1", "lat_to": 44.0, "lon_to": 7.0},
+    ])
+    moves = []
+    listener = lambda *args: moves.append(args)
+    simulation.move_listener = listener
+
+    timeline = simulation.compile_timeline()
+
+    assert timeline.tick_count == 4
+    assert timeline.get_state(3, "1")["latitude"] == 44.0
+    assert timeline.get_state(-1, "1")["latitude"] == 43.0
+    assert moves == []
+    assert simulation.move_listener is listener
+
+
+def test_copy_initial_compiles_without_changing_simulation():
+    simulation = get_simulation([
+        {"type": "move", "start_at": 0, "end_at": 3, "entity_id": "1", "lat_to": 44.0, "lon_to": 7.0},
+    ])
+    simulation.step()
+    simulation.step()
+    latitude = simulation.map_entities["1"].get_latitude()
+
+    copy = simulation.copy_initial()
+    copy.activate()
+    timeline = copy.compile_timeline()
+    simulation.activate()
+
+    assert timeline.get_state(3, "1")["latitude"] == 44.0
+    assert copy.actions[0] is not simulation.actions[0]
+    assert copy.tick_end == simulation.tick_end
+    assert copy.map_entities["1"] is not simulation.map_entities["1"]
+    assert simulation.tick == 2
+    assert simulation.map_entities["1"].get_latitude() == latitude
+
+
+def test_reset_before_refresh_resets_only_expired_entities(mocker):
+    simulation = get_simulation([
+        {"type": "image", "start_at": 0, "end_at": 1, "entity_id": "1", "image": "alerte.png"},
+        {"type": "highlight", "start_at": 0, "end_at": 3, "entity_id": "2", "color": "red"},
+    ])
+    drone, balise = simulation.map_entities["1"], simulation.map_entities["2"]
+
+    assert simulation.expired_resets == {2: {"1": {"reset_url_icon"}}, 4: {"2": {"reset_highlight"}}}
+
+    simulation.step()
+    simulation.step()
+    assert drone.get_url_icon() == "alerte.png"
+
+    m_reset_icon = mocker.spy(balise, "reset_url_icon")
+    assert simulation.in_last_action("ActionChangeIcon")
+    assert not simulation.in_last_action("ActionHighlight")
+    simulation.step()
+
+    assert drone.get_url_icon() == "drone.png"
+    assert balise.get_highlight() == "red"
+    m_reset_icon.assert_not_called()
+
+
+def test_in_last_action_unknown_action():
+    simulation = get_simulation([])
+
+    with pytest.raises(ValueError):
+        simulation.in_last_action("ActionChangeSize")
+
+
+def test_nested_loads():
+    simulation = get_simulation([
+        {"type": "load", "start_at": 0, "end_at": 0, "entity_id": "1", "entity_id2": "2"},
+        {"type": "unload", "start_at": 2, "end_at": 2, "entity_id": "1", "entity_id2": "2"},
+    ])
+    simulation.map_entities["3"] = EntityState("3", "Navire", "navire.png", 43.0, 6.0)
+    messages = []
+    simulation.message_listener = lambda message, level: messages.append(level)
+
+    simulation.step()
+    simulation.load_entity(simulation.map_entities["3"], simulation.map_entities["1"])
+    simulation.load_entity(simulation.map_entities["2"], simulation.map_entities["3"])
+
+    assert simulation.get_loaded_ids() == ["1", "2"]
+    assert simulation.load_registry.get_root_container("2") == "3"
+    assert messages == [Simulation.MESSAGE_WARNING]
+
+    # Le drone étant chargé dans le navire, il ne décharge pas la balise
+    simulation.step()
+    simulation.step()
+
+    assert simulation.entities_loaded == {"1": [simulation.map_entities["2"]], "3": [simulation.map_entities["1"]]}
+
+    simulation.unload_entity(simulation.map_entities["3"], simulation.map_entities["1"])
+
+    assert simulation.get_loaded_ids() == ["2"]
+    assert simulation.is_loaded_by_id("2", "1")
@@ -0,0 +1,77 @@
+from custom.business.snapshot_store import SnapshotStore
+
+
+def make_snapshot(value: str = "x"):
+    return {
+        "entities": {"e1": {"latitude": 1.0, "longitude": 2.0, "texts": [value]}},
+        "entities_loaded": {},
+        "lines": [],
+    }
+
+
+def test_need_snapshot():
+    store = SnapshotStore(interval=10)
+
+    assert store.need_snapshot(0) is False
+    assert store.need_snapshot(5) is False
+    assert store.need_snapshot(10) is True
+
+    store.store(10, make_snapshot())
+    assert store.need_snapshot(10) is False
+
+
+def test_get_nearest():
+    store = SnapshotStore(interval=10)
+    store.store(10, make_snapshot("a"))
+    store.store(20, make_snapshot("b"))
+
+    assert store.get_nearest(5) == (None, None)
+    tick, snapshot = store.get_nearest(25)
+    assert tick == 20
+    assert snapshot["entities"]["e1"]["texts"] == ["b"]
+    assert store.get_nearest(19)[0] == 10
+
+
+def test_lru_eviction():
+    snapshot_size = SnapshotStore.estimate_size(make_snapshot())
+    store = SnapshotStore(interval=10, memory_budget=snapshot_size * 2)
+
+    store.store(10, make_snapshot())
+    store.store(20, make_snapshot())
+    # 10 devient le plus récemment utilisé
+    store.get_nearest(15)
+    store.store(30, make_snapshot())
+
+    assert list(store.snapshots.keys()) == [10, 30]
+    assert store.memory_used == snapshot_size * 2
+
+
+def test_set_memory_budget_evicts():
+    store = SnapshotStore(interval=10)
+    store.store(10, make_snapshot())
+    store.store(20, make_snapshot())
+
+    store.set_memory_budget(0)
+
+    assert not store.snapshots
+    assert store.memory_used == 0
+
+
+def test_set_interval_clears():
+    store = SnapshotStore(interval=10)
+    store.store(10, make_snapshot())
+
+    store.set_interval(0)
+
+    assert store.interval == 1
+    assert not store.snapshots
+
+
+def test_store_replaces_existing():
+    store = SnapshotStore(interval=10)
+    store.store(10, make_snapshot())
+    used = store.memory_used
+    store.store(10, make_snapshot())
+
+    assert len(store.snapshots) == 1
+    assert store.memory_used == used
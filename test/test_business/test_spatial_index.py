@@ -0,0 +1,71 @@
+import pytest
+
+from custom.business.spatial_index import SpatialIndex
+
+
+def test_update_and_query_rect():
+    index = SpatialIndex(1.0)
+    index.update("a", 0.5, 0.5)
+    index.update("b", 2.5, 2.5)
+    index.update("c", 10.0, 10.0)
+
+    assert sorted(index.query_rect(0, 0, 3, 3)) == ["a", "b"]
+    assert index.query_rect(0.6, 0.6, 2.4, 2.4) == []
+    assert index.query_rect(5, 5, 1, 1) == []
+
+def test_update_moves_between_cells():
+    index = SpatialIndex(1.0)
+    index.update("a", 0.5, 0.5)
+    index.update("a", 5.5, 5.5)
+
+    assert index.query_rect(0, 0, 1, 1) == []
+    assert index.query_rect(5, 5, 6, 6) == ["a"]
+    assert list(index.cells) == [(5, 5)]
+
+def test_remove_and_clear():
+    index = SpatialIndex(1.0)
+    index.update("a", 0.5, 0.5)
+    index.update("b", 0.7, 0.7)
+
+    index.remove("a")
+    index.remove("unknown")
+    assert index.query_rect(0, 0, 1, 1) == ["b"]
+
+    index.clear()
+    assert index.positions == {} and index.cells == {}
+
+def test_query_rect_large_extent_scans_positions():
+    index = SpatialIndex(0.001)
+    index.update("a", -170.0, -80.0)
+    index.update("b", 170.0, 80.0)
+
+    assert sorted(index.query_rect(-180, -90, 180, 90)) == ["a", "b"]
+
+def test_negative_coordinates():
+    index = SpatialIndex(1.0)
+    index.update("a", -0.5, -0.5)
+
+    assert index.get_cell(-0.5, -0.5) == (-1, -1)
+    assert index.query_rect(-1, -1, 0, 0) == ["a"]
+
+def test_invalid_cell_size():
+    with pytest.raises(ValueError):
+        SpatialIndex(0)
+
+def test_query_radius():
+    index = SpatialIndex()
+    index.update("center", 5.0, 45.0)
+    index.update("near", 5.001, 45.0)  # environ 79 m
+    index.update("far", 5.01, 45.0)  # environ 786 m
+
+    assert sorted(index.query_radius(5.0, 45.0, 100)) == ["center", "near"]
+    assert sorted(index.query_radius(5.0, 45.0, 1000)) == ["center", "far", "near"]
+    assert index.query_radius(5.0, 45.0, -1) == []
+
+def test_nearest():
+    index = SpatialIndex()
+    index.update("near", 5.001, 45.0)
+    index.update("far", 5.01, 45.0)
+
+    assert index.nearest(5.0, 45.0, 1000) == "near"
+    assert index.nearest(5.0, 45.0, 10) is None
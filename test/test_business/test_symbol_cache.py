@@ -0,0 +1,57 @@
+from custom.business.symbol_cache import SymbolCache
+
+
+def test_quantize():
+    assert SymbolCache.quantize(5.04, 0.1) == 5.0
+    assert SymbolCache.quantize(5.06, 0.1) == 5.1
+    assert SymbolCache.quantize(44.6, 1) == 45
+    assert SymbolCache.quantize(3.14159, 0) == 3.14159
+
+
+def test_make_key_quantizes_size_and_angle():
+    cache = SymbolCache(size_step=0.5, angle_step=10)
+
+    key = cache.make_key("icon.png", 5.2, 364, 0.5, None, "bg.png")
+
+    assert key == ("icon.png", 5.0, 0.0, 0.5, None, "bg.png")
+    assert cache.make_key("icon.png", 4.9, 1, 0.5, None, "bg.png") == key
+
+
+def test_get_and_put(mocker):
+    cache = SymbolCache()
+    symbol = mocker.Mock()
+    key = cache.make_key("icon.png", 5, 0, 1, None, None)
+
+    assert cache.get(key) is None
+    cache.put(key, symbol)
+
+    assert cache.get(key) is symbol
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_lru_eviction(mocker):
+    cache = SymbolCache(max_entries=2)
+    cache.put("a", mocker.Mock())
+    cache.put("b", mocker.Mock())
+
+    cache.get("a")
+    cache.put("c", mocker.Mock())
+
+    assert list(cache.symbols) == ["a", "c"]
+
+
+def test_configure_clears(mocker):
+    cache = SymbolCache()
+    cache.put("a", mocker.Mock())
+
+    cache.configure(0, -1, 5)
+
+    assert cache.symbols == {}
+    assert cache.max_entries == 1
+    assert cache.size_step == 0
+    assert cache.angle_step == 5
+
+
+def test_get_instance_is_shared():
+    assert SymbolCache.get_instance() is SymbolCache.get_instance()
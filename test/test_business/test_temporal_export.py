@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pytest
+
+from custom.business.entity_state import EntityState
+from custom.business.temporal_export import TemporalExport
+from custom.business.timeline import Timeline
+
+
+@pytest.fixture
+def timeline():
+    # e1 se déplace au tick 1, e2 est chargé dans e1 aux ticks 2 et 3
+    e1 = EntityState("e1", "Drone", "drone.png", 43.0, 6.0)
+    e2 = EntityState("e2", "Balise", "balise.png", 44.0, 7.0)
+    entities = [e1, e2]
+
+    timeline = Timeline(["e1", "e2"], 4)
+    timeline.record_initial(entities)
+    timeline.record(0, entities, {}, [])
+    e1.move_to(43.5, 6.5, 0)
+    timeline.record(1, entities, {}, [])
+    timeline.record(2, entities, {"e1": [e2]}, [])
+    timeline.record(3, entities, {"e1": [e2]}, [])
+    return timeline
+
+
+def test_tick_to_datetime(timeline):
+    export = TemporalExport(timeline, 10, "min", datetime(2024, 1, 1))
+
+    assert export.get_tick_duration() == 600
+    assert export.tick_to_datetime(0) == datetime(2024, 1, 1)
+    assert export.tick_to_datetime(3) == datetime(2024, 1, 1, 0, 30)
+    assert export.get_extent() == (datetime(2023, 12, 31, 23, 50), datetime(2024, 1, 1, 0, 40))
+
+
+@pytest.mark.parametrize("multiplier, unit", [(1, "siècle"), (0, "sec"), (-2, "sec")])
+def test_invalid_time_mapping(timeline, multiplier, unit):
+    with pytest.raises(ValueError):
+        TemporalExport(timeline, multiplier, unit)
+
+
+def test_get_entity_intervals(timeline):
+    export = TemporalExport(timeline)
+
+    intervals = [(entity_id, start, end, state["latitude"]) for entity_id, start, end, state in export.get_entity_intervals()]
+
+    assert intervals == [
+        ("e1", -1, 1, 43.0),
+        ("e1", 1, 4, 43.5),
+        ("e2", -1, 2, 44.0),
+    ]
+
+
+def test_get_trace_segments(timeline):
+    export = TemporalExport(timeline)
+
+    assert export.get_trace_segments() == [(1, "e1", (43.0, 6.0), (43.5, 6.5))]
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+import pytest
+
+from custom.business.temporal_layers import TemporalLayers
+
+
+def get_export(mocker, segments):
+    export = mocker.Mock()
+    export.timeline.tick_count = 10
+    export.tick_to_datetime.side_effect = lambda tick: datetime(2024, 1, 1, 0, 0, tick)
+    export.get_trace_segments.return_value = segments
+    return export
+
+
+def test_build_trace_layer_skips_unknown_entities(mocker):
+    m_layer = mocker.patch("custom.business.temporal_layers.QgsVectorLayer")
+    mocker.patch("custom.business.temporal_layers.QgsFeature", side_effect=lambda fields: mocker.Mock())
+    entity = mocker.Mock()
+    entity.get_name.return_value = "Name1"
+    export = get_export(mocker, [
+        (2, "e1", (43.0, 6.0), (43.1, 6.1)),
+        (3, "inconnue", (43.0, 6.0), (43.1, 6.1)),
+    ])
+
+    layer = TemporalLayers.build_trace_layer(export, {"e1": entity})
+
+    assert layer is m_layer.return_value
+    features = layer.dataProvider.return_value.addFeatures.call_args[0][0]
+    assert len(features) == 1
+    assert features[0].setAttributes.call_args[0][0][:5] == ["e1", "Name1", 2, 2, 10]
+
+
+def test_write_geopackage_error(mocker):
+    m_writer = mocker.patch("custom.business.temporal_layers.QgsVectorFileWriter")
+    mocker.patch("custom.business.temporal_layers.QgsProject")
+    m_writer.NoError = 0
+    m_writer.writeAsVectorFormatV3.return_value = (1, "disque plein")
+
+    with pytest.raises(OSError):
+        TemporalLayers.write_geopackage("/tmp/trace.gpkg", [mocker.Mock()], ["entity"])
@@ -0,0 +1,122 @@
+import pytest
+
+from custom.business.timeline import Timeline
+
+
+def make_state(latitude=0.0, longitude=0.0, size=5.0, url_icon="icon.png", texts=None):
+    return {
+        "latitude": latitude,
+        "longitude": longitude,
+        "altitude": 0.0,
+        "size": size,
+        "angle": 0.0,
+        "opacity": 1.0,
+        "url_icon": url_icon,
+        "highlight": None,
+        "background_image": None,
+        "texts": texts or [],
+    }
+
+
+@pytest.fixture
+def map_entities(mocker):
+    entities = []
+    for entity_id in ("e1", "e2"):
+        entity = mocker.Mock()
+        entity.get_id.return_value = entity_id
+        entity.get_state.return_value = make_state()
+        entity.pop_changes.return_value = {}
+        entities.append(entity)
+    return entities
+
+
+def test_set_and_get_state():
+    timeline = Timeline(["e1", "e2"], 3)
+    state = make_state(1.5, 2.5, 8.0, "other.png", ["a", "b"])
+
+    timeline.set_state(1, "e2", state)
+
+    assert timeline.get_state(1, "e2") == state
+    assert timeline.columns["latitude"].shape == (4, 2)
+
+
+def test_intern_reuses_ids():
+    timeline = Timeline(["e1"], 1)
+
+    first = timeline.intern("url_icon", "icon.png")
+    second = timeline.intern("url_icon", "other.png")
+
+    assert timeline.intern("url_icon", "icon.png") == first
+    assert second != first
+    assert timeline.values["url_icon"] == ["icon.png", "other.png"]
+
+
+def test_record_copies_previous_row_and_changed_entities(mocker, map_entities):
+    timeline = Timeline(["e1", "e2"], 2)
+    timeline.record_initial(map_entities)
+
+    map_entities[0].pop_changes.return_value = {"size": (5.0, 9.0)}
+    map_entities[0].get_state.return_value = make_state(size=9.0)
+    loaded = mocker.Mock()
+    loaded.get_id.return_value = "e2"
+    timeline.record(0, map_entities, {"e1": [loaded]}, {("e1", "e2")})
+
+    map_entities[0].pop_changes.return_value = {}
+    timeline.record(1, map_entities, {}, [])
+
+    assert timeline.get_state(-1, "e1")["size"] == 5.0
+    assert timeline.get_state(0, "e1")["size"] == 9.0
+    assert timeline.get_state(1, "e1")["size"] == 9.0
+    assert timeline.get_entities_loaded(0) == {"e1": ("e2",)}
+    assert timeline.get_lines(0) == {("e1", "e2")}
+    assert timeline.get_entities_loaded(1) == {}
+    assert timeline.get_lines(1) == set()
+
+
+def test_get_changed_entities():
+    timeline = Timeline(["e1", "e2"], 2)
+    timeline.set_state(-1, "e1", make_state())
+    timeline.set_state(-1, "e2", make_state())
+    timeline.set_state(0, "e1", make_state())
+    timeline.set_state(0, "e2", make_state(url_icon="other.png"))
+
+    assert timeline.get_changed_entities(-1, 0) == ["e2"]
+    assert timeline.get_changed_entities(0, -1) == ["e2"]
+    assert timeline.get_changed_entities(0, 0) == []
+
+
+def test_get_moves():
+    timeline = Timeline(["e1", "e2"], 3)
+    for tick in range(-1, 3):
+        timeline.set_state(tick, "e1", make_state())
+        timeline.set_state(tick, "e2", make_state())
+    timeline.set_state(1, "e1", make_state(1.0, 2.0))
+    timeline.set_state(2, "e1", make_state(1.0, 2.0))
+
+    assert timeline.get_moves(0) == []
+    assert timeline.get_moves(2) == [(1, "e1", (0.0, 0.0), (1.0, 2.0))]
+
+
+def test_merge_remaps_interned_values():
+    first = Timeline(["e1"], 1)
+    first.set_state(-1, "e1", make_state(1.0, 1.0, url_icon="a.png"))
+    first.set_state(0, "e1", make_state(2.0, 2.0, url_icon="b.png"))
+    first.lines[1] = first.intern("lines", (("e1", "e3"),))
+    second = Timeline(["e2"], 1)
+    second.set_state(-1, "e2", make_state(3.0, 3.0, url_icon="b.png", texts=["t"]))
+    second.set_state(0, "e2", make_state(3.0, 3.0, url_icon="b.png", texts=["t"]))
+    second.entities_loaded[1] = second.intern("entities_loaded", (("e2", ("e4",)),))
+
+    merged = Timeline.merge(["e2", "e1"], [first, second])
+
+    assert merged.get_state(-1, "e1") == first.get_state(-1, "e1")
+    assert merged.get_state(0, "e1") == first.get_state(0, "e1")
+    assert merged.get_state(0, "e2") == second.get_state(0, "e2")
+    assert merged.get_lines(0) == {("e1", "e3")}
+    assert merged.get_entities_loaded(0) == {"e2": ("e4",)}
+    assert merged.get_lines(-1) == set()
+
+
+def test_merge_rejects_different_tick_counts():
+    with pytest.raises(ValueError):
+        Timeline.merge(["e1", "e2"], [Timeline(["e1"], 1), Timeline(["e2"], 2)])
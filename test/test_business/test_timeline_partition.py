@@ -0,0 +1,142 @@
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from custom.business.entity_state import EntityState
+from custom.business.simulation import Simulation
+from custom.business.timeline_partition import TimelinePartition
+
+
+ACTIONS = [
+    {"type": "move", "start_at": 0, "end_at": 5, "entity_id": "1", "lat_to": 44.0, "lon_to": 7.0},
+    {"type": "load", "start_at": 6, "end_at": 6, "entity_id": "1", "entity_id2": "2"},
+    {"type": "move_to", "start_at": 0, "end_at": 4, "entity_id": "3", "entity_id2": "4", "distance": 10},
+    {"type": "arrow", "start_at": 2, "end_at": 3, "entity_id": "4", "entity_id2": "3"},
+    {"type": "size", "start_at": 1, "end_at": 8, "entity_id": "5", "size": 12},
+]
+
+
+class SequentialExecutor:
+    """
+    Exécuteur de substitution exécutant chaque tâche dans le processus courant.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def submit(self, function, *args):
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+
+@pytest.fixture(autouse=True)
+def clear_simulation():
+    Simulation._instance = None
+    yield
+    Simulation._instance = None
+
+
+def get_simulation() -> Simulation:
+    map_entities = [
+        EntityState(str(index), f"Entité {index}", "icon.png", 43.0 + index / 100, 6.0 + index / 100)
+        for index in range(1, 7)
+    ]
+    simulation = Simulation(map_entities, ACTIONS)
+    simulation.activate()
+    return simulation
+
+
+def test_find_groups():
+    simulation = get_simulation()
+
+    groups = TimelinePartition.find_groups(list(simulation.map_entities), simulation.actions)
+
+    assert groups == [["1", "2"], ["3", "4"], ["5"], ["6"]]
+
+
+def test_split_balances_chunks_and_keeps_action_order():
+    simulation = get_simulation()
+
+    chunks = TimelinePartition.split(list(simulation.map_entities), simulation.actions, 2)
+
+    # Charges : {1, 2} = 7 ticks, {3, 4} = 7 ticks, {5} = 8 ticks, {6} = 0 tick
+    assert [entity_ids for entity_ids, _ in chunks] == [["5", "6"], ["1", "2", "3", "4"]]
+    assert [action.entity_id for action in chunks[1][1]] == ["1", "1", "3", "4"]
+
+
+def test_get_worker_count(mocker):
+    simulation = get_simulation()
+    mocker.patch.object(TimelinePartition, "MIN_TICKS_PER_WORKER", 10)
+
+    assert TimelinePartition.get_worker_count(simulation, 8) == 2
+    assert TimelinePartition.get_worker_count(simulation, 1) == 1
+
+
+def test_compile_matches_sequential_compilation(mocker):
+    sequential = get_simulation().compile_timeline()
+
+    simulation = get_simulation()
+    mocker.patch.object(TimelinePartition, "MIN_TICKS_PER_WORKER", 1)
+    mocker.patch("custom.business.timeline_partition.ProcessPoolExecutor", SequentialExecutor)
+    m_compile = mocker.patch.object(simulation, "compile_timeline")
+
+    timeline = TimelinePartition.compile(simulation, 4)
+
+    m_compile.assert_not_called()
+    assert timeline.entity_ids == sequential.entity_ids
+    for tick in range(-1, sequential.tick_count):
+        for entity_id in sequential.entity_ids:
+            assert timeline.get_state(tick, entity_id) == sequential.get_state(tick, entity_id)
+        assert sorted(timeline.get_lines(tick)) == sorted(sequential.get_lines(tick))
+        assert timeline.get_entities_loaded(tick) == sequential.get_entities_loaded(tick)
+
+
+def test_compile_single_chunk_is_sequential(mocker):
+    simulation = get_simulation()
+    m_pool = mocker.patch("custom.business.timeline_partition.ProcessPoolExecutor")
+
+    timeline = TimelinePartition.compile(simulation, 1)
+
+    m_pool.assert_not_called()
+    assert timeline.tick_count == simulation.tick_end + 1
+
+
+def test_compile_falls_back_when_pool_fails(mocker):
+    simulation = get_simulation()
+    messages = []
+    simulation.message_listener = lambda message, level: messages.append(level)
+    mocker.patch.object(TimelinePartition, "MIN_TICKS_PER_WORKER", 1)
+    mocker.patch("custom.business.timeline_partition.ProcessPoolExecutor", side_effect=BrokenProcessPool("spawn"))
+
+    timeline = TimelinePartition.compile(simulation, 4)
+
+    assert timeline.tick_count == simulation.tick_end + 1
+    assert messages == [Simulation.MESSAGE_WARNING]
+
+
+def test_compile_restores_spawn_executable(mocker):
+    simulation = get_simulation()
+    mocker.patch.object(TimelinePartition, "MIN_TICKS_PER_WORKER", 1)
+    mocker.patch("custom.business.timeline_partition.ProcessPoolExecutor", SequentialExecutor)
+    mocker.patch.object(TimelinePartition, "get_python_executable", return_value="/opt/qgis/bin/python3")
+    mocker.patch("custom.business.timeline_partition.multiprocessing.spawn.get_executable", return_value="/opt/qgis/bin/qgis")
+    context = mocker.Mock()
+    mocker.patch("custom.business.timeline_partition.multiprocessing.get_context", return_value=context)
+
+    TimelinePartition.compile(simulation, 4)
+
+    assert context.set_executable.call_args_list == [mocker.call("/opt/qgis/bin/python3"), mocker.call("/opt/qgis/bin/qgis")]
+
+
+def test_get_python_executable_keeps_python_interpreter(mocker):
+    mocker.patch("custom.business.timeline_partition.sys.executable", "/usr/bin/python3")
+
+    assert TimelinePartition.get_python_executable() is None
@@ -0,0 +1,86 @@
+import pytest
+
+from custom.business.trace_polyline import TracePolyline
+
+
+class FakeLineString:
+    """
+    QgsLineString de substitution conservant ses sommets dans une liste.
+    """
+
+    def __init__(self, points):
+        self.points = list(points)
+
+    def addVertex(self, point):
+        self.points.append(point)
+
+    def deleteVertex(self, vertex):
+        del self.points[vertex]
+
+    def pointN(self, index):
+        return self.points[index]
+
+    def clone(self):
+        return FakeLineString(self.points)
+
+
+@pytest.fixture(autouse=True)
+def fake_line_string(mocker):
+    mocker.patch("custom.business.trace_polyline.QgsLineString", FakeLineString)
+    mocker.patch("custom.business.trace_polyline.QgsPoint", side_effect=lambda point: point)
+    mocker.patch("custom.business.trace_polyline.QgsPointXY", side_effect=lambda point: point)
+    mocker.patch("custom.business.trace_polyline.QgsVertexId", side_effect=lambda part, ring, vertex: vertex)
+
+
+def test_append_extends_line_in_place():
+    polyline = TracePolyline("e1", "Name1", (0, 0), (0, 1), 1)
+    line = polyline.line
+
+    polyline.append((0, 1), (0, 2), 2)
+
+    assert polyline.line is line
+    assert line.points == [(0, 0), (0, 1), (0, 2)]
+    assert polyline.ticks == [1, 2]
+    assert polyline.get_first_tick() == 1
+    assert polyline.get_last_tick() == 2
+
+
+def test_append_disjoint_segment_adds_start_point():
+    polyline = TracePolyline("e1", "Name1", (0, 0), (0, 1), 1)
+
+    polyline.append((0, 3), (0, 4), 4)
+
+    assert polyline.line.points == [(0, 0), (0, 1), (0, 3), (0, 4)]
+    assert polyline.ticks == [1, 4, 4]
+
+
+def test_truncate():
+    polyline = TracePolyline("e1", "Name1", (0, 0), (0, 1), 1)
+    polyline.append((0, 1), (0, 2), 2)
+    polyline.append((0, 2), (0, 3), 3)
+
+    assert not polyline.truncate(5)
+
+    assert polyline.truncate(3)
+    assert polyline.line.points == [(0, 0), (0, 1), (0, 2)]
+    assert polyline.ticks == [1, 2]
+
+    polyline.append((0, 2), (0, 5), 4)
+    assert polyline.line.points == [(0, 0), (0, 1), (0, 2), (0, 5)]
+
+    assert polyline.truncate(1)
+    assert polyline.is_empty()
+
+
+def test_get_geometry_simplifies_only_with_tolerance(mocker):
+    m_geometry = mocker.patch("custom.business.trace_polyline.QgsGeometry")
+    polyline = TracePolyline("e1", "Name1", (0, 0), (0, 1), 1)
+
+    assert polyline.get_geometry() is m_geometry.return_value
+    assert m_geometry.call_args[0][0] is not polyline.line
+    m_geometry.return_value.simplify.assert_not_called()
+
+    geometry = polyline.get_geometry(0.5)
+
+    m_geometry.return_value.simplify.assert_called_once_with(0.5)
+    assert geometry is m_geometry.return_value.simplify.return_value
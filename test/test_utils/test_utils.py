@@ -24,6 +24,15 @@ def test_calculate_azimuth():
     # on sait que c'est dans [0,360], on peut juste vérifier que ça tourne bien
     assert 0 <= az <= 360
 
+def test_haversine_distance():
+    # distance d'un point à lui-même = 0
+    assert Utils.haversine_distance(43.0, 6.0, 43.0, 6.0) == 0
+    # un degré de latitude ~ 111 km
+    assert pytest.approx(Utils.haversine_distance(0, 0, 1, 0), 0.001) == 111195
+    # cohérent avec destination_point
+    lat, lon = Utils.destination_point(43.0, 6.0, 45, 500)
+    assert pytest.approx(Utils.haversine_distance(43.0, 6.0, lat, lon), 0.0001) == 500
+
 def test_rotating_position():
     # Au start_tick, azimuth = 0
     lat1, lon1 = Utils.rotating_position(0, 10, 0, 0, 0, 1000)
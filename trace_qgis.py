@@ -415,6 +415,10 @@ class TraceQGIS:
             self.layerTraceQGIS.signal_tick_reset.disconnect(self.dock.set_max_tickSlider)
             self.layerTraceQGIS.signal_timer_changed.disconnect(self.dock.set_timer_on)
             self.layerTraceQGIS.signal_entities_updated.disconnect(self.dock.refresh_radio_buttons)
+            self.layerTraceQGIS.signal_playback_stats.disconnect(self.dock.set_playback_stats)
+            self.layerTraceQGIS.signal_profiling_updated.disconnect(self.dock.set_profiling_stats)
+            self.layerTraceQGIS.signal_frame_export_progress.disconnect(self.dock.set_frame_export_progress)
+            self.layerTraceQGIS.signal_frame_export_finished.disconnect(self.dock.set_frame_export_finished)
 
             self.dlg.signal_lauch_demo.disconnect(self.launch_demo)
             self.dlg.signal_launch.disconnect(self.launch)
@@ -425,6 +429,20 @@ class TraceQGIS:
             self.dock.signal_toggle_show_info_name.disconnect(self.layerTraceQGIS.toggle_show_information_name)
             self.dock.signal_toggle_show_info_position.disconnect(self.layerTraceQGIS.toggle_show_information_position)
             self.dock.signal_speed_changed.disconnect(self.layerTraceQGIS.change_interval_timer)
+            self.dock.signal_step_backward.disconnect(self.layerTraceQGIS.step_backward)
+            self.dock.signal_toggle_reverse.disconnect(self.layerTraceQGIS.toggle_reverse)
+            self.dock.signal_toggle_timeline.disconnect(self.layerTraceQGIS.set_timeline_enabled)
+            self.dock.signal_timeline_workers_changed.disconnect(self.layerTraceQGIS.set_timeline_workers)
+            self.dock.signal_trace_decimation_changed.disconnect(self.layerTraceQGIS.set_trace_decimation)
+            self.dock.signal_trace_mode_changed.disconnect(self.layerTraceQGIS.set_trace_mode)
+            self.dock.signal_toggle_data_defined.disconnect(self.layerTraceQGIS.toggle_data_defined_renderer)
+            self.dock.signal_toggle_native_labels.disconnect(self.layerTraceQGIS.toggle_native_labels)
+            self.dock.signal_toggle_profiling.disconnect(self.layerTraceQGIS.set_profiling_enabled)
+            self.dock.signal_reset_profiling.disconnect(self.layerTraceQGIS.reset_profiling)
+            self.dock.signal_export_profiling.disconnect(self.layerTraceQGIS.export_profiling)
+            self.dock.signal_export_temporal.disconnect(self.layerTraceQGIS.export_temporal_layers)
+            self.dock.signal_export_frames.disconnect(self.layerTraceQGIS.export_frames)
+            self.dock.signal_cancel_frame_export.disconnect(self.layerTraceQGIS.cancel_frame_export)
 
             self.layerTraceQGIS = None
 
@@ -457,6 +475,10 @@ class TraceQGIS:
             self.layerTraceQGIS.signal_tick_reset.connect(self.dock.set_max_tickSlider)
             self.layerTraceQGIS.signal_timer_changed.connect(self.dock.set_timer_on)
             self.layerTraceQGIS.signal_entities_updated.connect(self.dock.refresh_radio_buttons)
+            self.layerTraceQGIS.signal_playback_stats.connect(self.dock.set_playback_stats)
+            self.layerTraceQGIS.signal_profiling_updated.connect(self.dock.set_profiling_stats)
+            self.layerTraceQGIS.signal_frame_export_progress.connect(self.dock.set_frame_export_progress)
+            self.layerTraceQGIS.signal_frame_export_finished.connect(self.dock.set_frame_export_finished)
 
             self.dlg.signal_lauch_demo.connect(self.launch_demo)
             self.dlg.signal_launch.connect(self.launch)
@@ -467,6 +489,20 @@ class TraceQGIS:
             self.dock.signal_toggle_show_info_name.connect(self.layerTraceQGIS.toggle_show_information_name)
             self.dock.signal_toggle_show_info_position.connect(self.layerTraceQGIS.toggle_show_information_position)
             self.dock.signal_speed_changed.connect(self.layerTraceQGIS.change_interval_timer)
+            self.dock.signal_step_backward.connect(self.layerTraceQGIS.step_backward)
+            self.dock.signal_toggle_reverse.connect(self.layerTraceQGIS.toggle_reverse)
+            self.dock.signal_toggle_timeline.connect(self.layerTraceQGIS.set_timeline_enabled)
+            self.dock.signal_timeline_workers_changed.connect(self.layerTraceQGIS.set_timeline_workers)
+            self.dock.signal_trace_decimation_changed.connect(self.layerTraceQGIS.set_trace_decimation)
+            self.dock.signal_trace_mode_changed.connect(self.layerTraceQGIS.set_trace_mode)
+            self.dock.signal_toggle_data_defined.connect(self.layerTraceQGIS.toggle_data_defined_renderer)
+            self.dock.signal_toggle_native_labels.connect(self.layerTraceQGIS.toggle_native_labels)
+            self.dock.signal_toggle_profiling.connect(self.layerTraceQGIS.set_profiling_enabled)
+            self.dock.signal_reset_profiling.connect(self.layerTraceQGIS.reset_profiling)
+            self.dock.signal_export_profiling.connect(self.layerTraceQGIS.export_profiling)
+            self.dock.signal_export_temporal.connect(self.layerTraceQGIS.export_temporal_layers)
+            self.dock.signal_export_frames.connect(self.layerTraceQGIS.export_frames)
+            self.dock.signal_cancel_frame_export.connect(self.layerTraceQGIS.cancel_frame_export)
 
     def launch_demo(self, demo: bool):
         self.layerTraceQGIS.reset(self.demo_generate_entity(), self.demo_generate_action())